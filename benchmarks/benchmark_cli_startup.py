@@ -0,0 +1,132 @@
+"""
+Benchmarks for CLI startup time.
+
+Each case runs in a fresh interpreter, so module imports are part of the
+measured time:
+- ``import foobara_py`` (connectors and numpy are loaded lazily)
+- ``foob --help``
+- ``--help`` of a generated app with many commands, registered eagerly,
+  lazily through a cold command index, and lazily through a warm index
+
+Run with: python -m benchmarks.benchmark_cli_startup
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+COMMAND_TEMPLATE = '''
+
+class Inputs{n}(BaseModel):
+    value: int = {n}
+
+
+class Command{n}(Command[Inputs{n}, int]):
+    """Generated command {n}"""
+
+    def execute(self) -> int:
+        return self.inputs.value
+'''
+
+APP_TEMPLATE = """
+import sys
+
+from foobara_py.connectors.cli import CLIConnector
+
+mode = sys.argv.pop(1)
+if mode == "eager":
+    import bench_cli_commands
+
+    cli = CLIConnector()
+    for n in range({count}):
+        cli.register(getattr(bench_cli_commands, f"Command{{n}}"))
+else:
+    cli = CLIConnector(index_cache={index!r}).register_module("bench_cli_commands")
+cli.run()
+"""
+
+
+def write_app(directory: Path, count: int) -> Path:
+    module = "from pydantic import BaseModel\n\nfrom foobara_py import Command\n"
+    module += "".join(COMMAND_TEMPLATE.format(n=n) for n in range(count))
+    (directory / "bench_cli_commands.py").write_text(module)
+    app = directory / "bench_cli_app.py"
+    app.write_text(APP_TEMPLATE.format(count=count, index=str(directory / "index.json")))
+    return app
+
+
+def timed_runs(name: str, argv: List[str], runs: int, cwd: str = None, before=None) -> Dict:
+    samples = []
+    for _ in range(runs):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        subprocess.run(argv, cwd=cwd, check=True, capture_output=True)
+        samples.append(time.perf_counter() - start)
+    result = {
+        "runs": runs,
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+    }
+    print(f"{name:<32} {result['median_ms']:9.1f} ms median   {result['min_ms']:9.1f} ms min")
+    return result
+
+
+def run_all_benchmarks(
+    commands: int = 300, runs: int = 5, save_to_file: bool = True
+) -> Dict[str, Any]:
+    print("\n" + "=" * 60)
+    print("CLI STARTUP BENCHMARKS")
+    print("=" * 60)
+    print(f"Generated commands: {commands}, runs per case: {runs}\n")
+
+    python = sys.executable
+    results: Dict[str, Any] = {}
+    results["python"] = timed_runs("python -c pass", [python, "-c", "pass"], runs)
+    results["import_foobara_py"] = timed_runs(
+        "import foobara_py", [python, "-c", "import foobara_py"], runs
+    )
+    foob = [python, "-c", "from foobara_py.cli.foob import main; main()", "--help"]
+    results["foob_help"] = timed_runs("foob --help", foob, runs)
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = str(write_app(Path(directory), commands))
+        index = Path(directory) / "index.json"
+        results["app_help_eager"] = timed_runs(
+            "app --help (eager)", [python, app, "eager", "--help"], runs, cwd=directory
+        )
+        results["app_help_lazy_cold"] = timed_runs(
+            "app --help (lazy, cold index)",
+            [python, app, "lazy", "--help"],
+            runs,
+            cwd=directory,
+            before=lambda: index.unlink(missing_ok=True),
+        )
+        results["app_help_lazy_warm"] = timed_runs(
+            "app --help (lazy, warm index)", [python, app, "lazy", "--help"], runs, cwd=directory
+        )
+        results["app_run_lazy_warm"] = timed_runs(
+            "app command0 (lazy, warm index)",
+            [python, app, "lazy", "command0"],
+            runs,
+            cwd=directory,
+        )
+
+    if save_to_file:
+        output_dir = Path(__file__).parent / "results"
+        output_dir.mkdir(exist_ok=True)
+        output_file = output_dir / "benchmark_results_cli_startup_python.json"
+        with open(output_file, "w") as f:
+            json.dump({"timestamp": time.time(), "benchmarks": results}, f, indent=2)
+        print(f"\nResults saved to: {output_file}")
+
+    return results
+
+
+if __name__ == "__main__":
+    run_all_benchmarks()
@@ -0,0 +1,114 @@
+"""
+Benchmarks for background job execution: LocalJobConnector vs Celery eager mode.
+
+Measures end-to-end throughput (submit N jobs, wait for all results) of:
+- LocalJobConnector with thread, asyncio and process workers
+- LocalJobConnector with SQLite persistence
+- CeleryConnector with task_always_eager (skipped when celery is missing)
+
+Celery eager mode runs each task inline in the caller, so it is the lower
+bound for Celery's own per-job overhead without any broker round trip.
+
+Run with: python -m benchmarks.benchmark_local_jobs
+"""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from pydantic import BaseModel
+
+from foobara_py.connectors.local_jobs import LocalJobConfig, LocalJobConnector
+from foobara_py.core.command import Command
+from foobara_py.core.registry import CommandRegistry
+
+
+class SquareInputs(BaseModel):
+    value: int
+
+
+class Square(Command[SquareInputs, int]):
+    """Tiny job: the case where per-job overhead dominates"""
+
+    def execute(self) -> int:
+        return self.inputs.value * self.inputs.value
+
+
+def make_registry() -> CommandRegistry:
+    registry = CommandRegistry()
+    registry.register(Square)
+    return registry
+
+
+def timed(name: str, jobs: int, func: Callable[[], None]) -> Dict[str, float]:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    result = {"jobs": jobs, "seconds": elapsed, "jobs_per_sec": jobs / elapsed}
+    print(f"{name:<28} {elapsed * 1000:9.1f} ms   {result['jobs_per_sec']:>10,.0f} jobs/sec")
+    return result
+
+
+def run_local(jobs: int, **config: Any) -> None:
+    with LocalJobConnector(make_registry(), LocalJobConfig(**config)) as connector:
+        submitted = [connector.execute_async("Square", {"value": n}) for n in range(jobs)]
+        for job in submitted:
+            connector.wait(job.job_id)
+
+
+def run_celery_eager(jobs: int) -> None:
+    from foobara_py.connectors.celery_connector import CeleryConfig, CeleryConnector
+
+    connector = CeleryConnector(
+        make_registry(),
+        CeleryConfig(broker_url="memory://", result_backend="cache+memory://"),
+    )
+    connector.get_celery_app().conf.task_always_eager = True
+    task = connector.task_factory.create_task(Square)
+    results = [task.apply_async(args=[{"value": n}]) for n in range(jobs)]
+    for result in results:
+        result.get()
+
+
+def run_all_benchmarks(jobs: int = 5000, save_to_file: bool = True) -> Dict[str, Any]:
+    print("\n" + "=" * 60)
+    print("BACKGROUND JOB BENCHMARKS")
+    print("=" * 60)
+    print(f"Jobs: {jobs:,}\n")
+
+    results: Dict[str, Any] = {}
+    results["local_thread"] = timed("local (thread x4)", jobs, lambda: run_local(jobs))
+    results["local_asyncio"] = timed(
+        "local (asyncio x4)", jobs, lambda: run_local(jobs, executor="asyncio")
+    )
+    results["local_process"] = timed(
+        "local (process x4)", jobs, lambda: run_local(jobs, executor="process")
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(Path(directory) / "jobs.db")
+        results["local_thread_sqlite"] = timed(
+            "local (thread x4, sqlite)", jobs, lambda: run_local(jobs, persistence_path=path)
+        )
+
+    try:
+        import celery  # noqa: F401
+    except ImportError:
+        print("celery eager                 skipped (celery is not installed)")
+    else:
+        results["celery_eager"] = timed("celery eager", jobs, lambda: run_celery_eager(jobs))
+
+    if save_to_file:
+        output_dir = Path(__file__).parent / "results"
+        output_dir.mkdir(exist_ok=True)
+        output_file = output_dir / "benchmark_results_local_jobs_python.json"
+        with open(output_file, "w") as f:
+            json.dump({"timestamp": time.time(), "benchmarks": results}, f, indent=2)
+        print(f"\nResults saved to: {output_file}")
+
+    return results
+
+
+if __name__ == "__main__":
+    run_all_benchmarks()
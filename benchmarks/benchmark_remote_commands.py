@@ -0,0 +1,164 @@
+"""
+Benchmarks for remote command latency: one client per call vs pooled clients.
+
+Runs a keep-alive JSON stub server on localhost and measures per-call
+latency of:
+- a new httpx.Client per call (what RemoteCommand used to do)
+- RemoteCommand with the pooled keep-alive client
+- the same pair for AsyncRemoteCommand / httpx.AsyncClient
+
+Loopback has no network round trip and no TLS handshake, so the gap here
+is the TCP connect plus client construction alone (httpx builds a TLS
+context for every new client, even for http URLs). Across real networks
+each new connection also pays a round trip, plus a TLS handshake for
+https.
+
+Run with: python -m benchmarks.benchmark_remote_commands
+"""
+
+import asyncio
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import httpx
+from pydantic import BaseModel
+
+from foobara_py.remote import AsyncRemoteCommand, RemoteClientPool, RemoteCommand
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1  # one write per response
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        data = json.dumps({"result": json.loads(body)}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class EchoInputs(BaseModel):
+    value: int
+
+
+def summarize(name: str, samples: List[float]) -> Dict[str, float]:
+    samples = sorted(samples)
+    result = {
+        "calls": len(samples),
+        "mean_ms": statistics.mean(samples) * 1000,
+        "p50_ms": samples[len(samples) // 2] * 1000,
+        "p99_ms": samples[int(len(samples) * 0.99)] * 1000,
+    }
+    print(
+        f"{name:<30} mean {result['mean_ms']:7.3f} ms   "
+        f"p50 {result['p50_ms']:7.3f} ms   p99 {result['p99_ms']:7.3f} ms"
+    )
+    return result
+
+
+def sample(calls: int, func: Callable[[int], Any]) -> List[float]:
+    samples = []
+    for n in range(calls):
+        start = time.perf_counter()
+        func(n)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def sample_async(calls: int, func: Callable[[int], Any]) -> List[float]:
+    samples = []
+    for n in range(calls):
+        start = time.perf_counter()
+        await func(n)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run_all_benchmarks(calls: int = 1000, save_to_file: bool = True) -> Dict[str, Any]:
+    print("\n" + "=" * 60)
+    print("REMOTE COMMAND BENCHMARKS")
+    print("=" * 60)
+    print(f"Sequential calls per case: {calls:,}\n")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    url = f"{base_url}/run/Echo"
+    pool = RemoteClientPool()
+
+    class Echo(RemoteCommand[EchoInputs, dict]):
+        _remote_url = base_url
+        _command_name = "Echo"
+        _client_pool = pool
+
+    class AsyncEcho(AsyncRemoteCommand[EchoInputs, dict]):
+        _remote_url = base_url
+        _command_name = "Echo"
+        _client_pool = pool
+
+    def client_per_call(n: int) -> None:
+        with httpx.Client(timeout=30.0) as client:
+            client.post(url, json={"value": n}).json()
+
+    async def async_client_per_call(n: int) -> None:
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            (await client.post(url, json={"value": n})).json()
+
+    async def async_pooled(n: int) -> None:
+        await AsyncEcho.run(value=n)
+
+    async def async_cases() -> Dict[str, List[float]]:
+        per_call = await sample_async(calls, async_client_per_call)
+        pooled = await sample_async(calls, async_pooled)
+        await pool.aclose()
+        return {"per_call": per_call, "pooled": pooled}
+
+    results: Dict[str, Any] = {}
+    try:
+        results["sync_client_per_call"] = summarize(
+            "sync: client per call", sample(calls, client_per_call)
+        )
+        results["sync_pooled"] = summarize(
+            "sync: pooled client", sample(calls, lambda n: Echo.run(value=n))
+        )
+        async_samples = asyncio.run(async_cases())
+        results["async_client_per_call"] = summarize(
+            "async: client per call", async_samples["per_call"]
+        )
+        results["async_pooled"] = summarize("async: pooled client", async_samples["pooled"])
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+    for mode in ("sync", "async"):
+        per_call, pooled = results[f"{mode}_client_per_call"], results[f"{mode}_pooled"]
+        speedup = per_call["mean_ms"] / pooled["mean_ms"]
+        print(f"{mode} speedup: {speedup:.1f}x")
+
+    if save_to_file:
+        output_dir = Path(__file__).parent / "results"
+        output_dir.mkdir(exist_ok=True)
+        output_file = output_dir / "benchmark_results_remote_commands_python.json"
+        with open(output_file, "w") as f:
+            json.dump({"timestamp": time.time(), "benchmarks": results}, f, indent=2)
+        print(f"\nResults saved to: {output_file}")
+
+    return results
+
+
+if __name__ == "__main__":
+    run_all_benchmarks()
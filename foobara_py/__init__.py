@@ -40,143 +40,128 @@ Basic Usage:
 
 __version__ = "0.2.0"
 
-# Core - New high-performance implementation
-# Caching
-from foobara_py.caching import (
-    CacheBackend,
-    CacheStats,
-    InMemoryCache,
-    cache_key,
-    cached,
-    generate_cache_key,
-    get_default_cache,
-    set_default_cache,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Connectors
-from foobara_py.connectors.mcp import (
-    MCPConnector,
-    create_mcp_server,
-)
-from foobara_py.core.command import (
-    AsyncCommand,
-    Command,
-    async_command,
-    command,
-)
-from foobara_py.core.errors import (
-    DataError,  # Backward compatibility alias
-    ErrorCollection,
-    FoobaraError,
-)
-from foobara_py.core.errors import (
-    Symbols as ErrorSymbols,
-)
-from foobara_py.core.outcome import (
-    CommandOutcome,
-    Failure,
-    Outcome,
-    Success,
-)
-
-# Registry
-from foobara_py.core.registry import (
-    CommandRegistry,
-    DomainRegistry,
-    TypeRegistry,
-    get_default_registry,
-    register,
-)
-from foobara_py.core.state_machine import (
-    CommandState,
-    CommandStateMachine,
-    Halt,
-)
-from foobara_py.core.transactions import (
-    TransactionConfig,
-    TransactionContext,
-    TransactionRegistry,
-    transaction,
-)
-
-# Domain
-from foobara_py.domain.domain import (
-    Domain,
-    DomainDependencyError,
-    GlobalDomain,
-    Organization,
-    create_domain,
-    foobara_domain,
-    foobara_organization,
-    get_domain,
-    get_organization,
-)
-
-# Drivers
-from foobara_py.drivers import (
-    LocalFilesDriver,
-)
-
-# Persistence
-from foobara_py.persistence import (
-    DetachedEntity,
-    Entity,
-    EntityBase,
-    EntityCallbackRegistry,
+# Public names and the modules defining them ("module:attr" when renamed).
+# They are imported on first access, so importing foobara_py (for example by
+# the ``foob`` CLI) only loads the parts that are actually used.
+_EXPORTS = {
+    # Core Command
+    "Command": "foobara_py.core.command",
+    "AsyncCommand": "foobara_py.core.command",
+    "command": "foobara_py.core.command",
+    "async_command": "foobara_py.core.command",
+    # Outcome
+    "CommandOutcome": "foobara_py.core.outcome",
+    "Success": "foobara_py.core.outcome",
+    "Failure": "foobara_py.core.outcome",
+    "Outcome": "foobara_py.core.outcome",
+    # Errors
+    "FoobaraError": "foobara_py.core.errors",
+    "DataError": "foobara_py.core.errors",
+    "ErrorCollection": "foobara_py.core.errors",
+    "ErrorSymbols": "foobara_py.core.errors:Symbols",
+    # State Machine
+    "CommandState": "foobara_py.core.state_machine",
+    "CommandStateMachine": "foobara_py.core.state_machine",
+    "Halt": "foobara_py.core.state_machine",
+    # Streaming
+    "StreamingResult": "foobara_py.core.streaming",
+    # Admission control
+    "AdmissionConfig": "foobara_py.core.admission",
+    "AdmissionController": "foobara_py.core.admission",
+    "AdmissionRejectedError": "foobara_py.core.admission",
+    # Transactions
+    "TransactionContext": "foobara_py.core.transactions",
+    "TransactionConfig": "foobara_py.core.transactions",
+    "TransactionRegistry": "foobara_py.core.transactions",
+    "transaction": "foobara_py.core.transactions",
+    # Domain
+    "Domain": "foobara_py.domain.domain",
+    "Organization": "foobara_py.domain.domain",
+    "GlobalDomain": "foobara_py.domain.domain",
+    "DomainDependencyError": "foobara_py.domain.domain",
+    "foobara_domain": "foobara_py.domain.domain",
+    "foobara_organization": "foobara_py.domain.domain",
+    "create_domain": "foobara_py.domain.domain",
+    "get_domain": "foobara_py.domain.domain",
+    "get_organization": "foobara_py.domain.domain",
+    # Registry
+    "CommandRegistry": "foobara_py.core.registry",
+    "TypeRegistry": "foobara_py.core.registry",
+    "DomainRegistry": "foobara_py.core.registry",
+    "get_default_registry": "foobara_py.core.registry",
+    "register": "foobara_py.core.registry",
+    # Connectors
+    "MCPConnector": "foobara_py.connectors.mcp",
+    "create_mcp_server": "foobara_py.connectors.mcp",
+    # Persistence
+    "Entity": "foobara_py.persistence",
+    "EntityBase": "foobara_py.persistence",
+    "Model": "foobara_py.persistence",
+    "MutableModel": "foobara_py.persistence",
+    "PrimaryKey": "foobara_py.persistence",
+    "entity": "foobara_py.persistence",
+    "load": "foobara_py.persistence",
+    "LoadSpec": "foobara_py.persistence",
+    "EntityRegistry": "foobara_py.persistence",
+    "register_entity": "foobara_py.persistence",
+    "DetachedEntity": "foobara_py.persistence",
+    "detached_entity": "foobara_py.persistence",
+    "Repository": "foobara_py.persistence",
+    "RepositoryProtocol": "foobara_py.persistence",
+    "InMemoryRepository": "foobara_py.persistence",
+    "TransactionalInMemoryRepository": "foobara_py.persistence",
+    "RepositoryTransaction": "foobara_py.persistence",
+    "RepositoryRegistry": "foobara_py.persistence",
     # Entity callbacks
-    EntityLifecycle,
-    EntityRegistry,
-    InMemoryRepository,
-    LoadSpec,
-    Model,
-    MutableModel,
-    PrimaryKey,
-    Repository,
-    RepositoryProtocol,
-    RepositoryRegistry,
-    RepositoryTransaction,
-    TransactionalInMemoryRepository,
-    after_create,
-    after_delete,
-    after_save,
-    after_update,
-    after_validation,
-    before_create,
-    before_delete,
-    before_save,
-    before_update,
-    before_validation,
-    detached_entity,
-    entity,
-    load,
-    register_entity,
-)
-
-# Remote Imports
-from foobara_py.remote import (
-    AsyncRemoteCommand,
-    ManifestCache,
-    RemoteCommand,
-    RemoteImporter,
-    RemoteNamespace,
-    get_manifest_cache,
-    import_remote,
-    set_manifest_cache,
-)
-
-# Types
-from foobara_py.types import (
-    APIKey,
-    BearerToken,
-    Password,
-    SecretToken,
-    Sensitive,
-    SensitiveModel,
-    SensitiveStr,
-    get_sensitive_fields,
-    is_sensitive,
-    redact_dict,
-)
+    "EntityLifecycle": "foobara_py.persistence",
+    "EntityCallbackRegistry": "foobara_py.persistence",
+    "before_validation": "foobara_py.persistence",
+    "after_validation": "foobara_py.persistence",
+    "before_create": "foobara_py.persistence",
+    "after_create": "foobara_py.persistence",
+    "before_save": "foobara_py.persistence",
+    "after_save": "foobara_py.persistence",
+    "before_update": "foobara_py.persistence",
+    "after_update": "foobara_py.persistence",
+    "before_delete": "foobara_py.persistence",
+    "after_delete": "foobara_py.persistence",
+    # Drivers
+    "LocalFilesDriver": "foobara_py.drivers",
+    # Types
+    "Sensitive": "foobara_py.types",
+    "SensitiveStr": "foobara_py.types",
+    "Password": "foobara_py.types",
+    "APIKey": "foobara_py.types",
+    "SecretToken": "foobara_py.types",
+    "BearerToken": "foobara_py.types",
+    "SensitiveModel": "foobara_py.types",
+    "is_sensitive": "foobara_py.types",
+    "get_sensitive_fields": "foobara_py.types",
+    "redact_dict": "foobara_py.types",
+    # Caching
+    "CacheBackend": "foobara_py.caching",
+    "InMemoryCache": "foobara_py.caching",
+    "get_default_cache": "foobara_py.caching",
+    "set_default_cache": "foobara_py.caching",
+    "cached": "foobara_py.caching",
+    "cache_key": "foobara_py.caching",
+    "generate_cache_key": "foobara_py.caching",
+    "CacheStats": "foobara_py.caching",
+    # Remote Imports
+    "RemoteCommand": "foobara_py.remote",
+    "AsyncRemoteCommand": "foobara_py.remote",
+    "RemoteImporter": "foobara_py.remote",
+    "RemoteNamespace": "foobara_py.remote",
+    "import_remote": "foobara_py.remote",
+    "ManifestCache": "foobara_py.remote",
+    "get_manifest_cache": "foobara_py.remote",
+    "set_manifest_cache": "foobara_py.remote",
+    "RemoteClientPool": "foobara_py.remote",
+    "RemoteClientConfig": "foobara_py.remote",
+}
 
 __all__ = [
     # Version
@@ -200,6 +185,12 @@ __all__ = [
     "CommandState",
     "CommandStateMachine",
     "Halt",
+    # Streaming
+    "StreamingResult",
+    # Admission control
+    "AdmissionConfig",
+    "AdmissionController",
+    "AdmissionRejectedError",
     # Transactions
     "TransactionContext",
     "TransactionConfig",
@@ -287,4 +278,169 @@ __all__ = [
     "ManifestCache",
     "get_manifest_cache",
     "set_manifest_cache",
+    "RemoteClientPool",
+    "RemoteClientConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        target = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module, _, attr = target.partition(":")
+    value = getattr(importlib.import_module(module), attr or name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if TYPE_CHECKING:
+    # Core - New high-performance implementation
+    # Caching
+    from foobara_py.caching import (
+        CacheBackend,
+        CacheStats,
+        InMemoryCache,
+        cache_key,
+        cached,
+        generate_cache_key,
+        get_default_cache,
+        set_default_cache,
+    )
+
+    # Connectors
+    from foobara_py.connectors.mcp import (
+        MCPConnector,
+        create_mcp_server,
+    )
+    from foobara_py.core.admission import (
+        AdmissionConfig,
+        AdmissionController,
+        AdmissionRejectedError,
+    )
+    from foobara_py.core.command import (
+        AsyncCommand,
+        Command,
+        async_command,
+        command,
+    )
+    from foobara_py.core.errors import (
+        DataError,  # Backward compatibility alias
+        ErrorCollection,
+        FoobaraError,
+    )
+    from foobara_py.core.errors import (
+        Symbols as ErrorSymbols,
+    )
+    from foobara_py.core.outcome import (
+        CommandOutcome,
+        Failure,
+        Outcome,
+        Success,
+    )
+
+    # Registry
+    from foobara_py.core.registry import (
+        CommandRegistry,
+        DomainRegistry,
+        TypeRegistry,
+        get_default_registry,
+        register,
+    )
+    from foobara_py.core.state_machine import (
+        CommandState,
+        CommandStateMachine,
+        Halt,
+    )
+    from foobara_py.core.streaming import StreamingResult
+    from foobara_py.core.transactions import (
+        TransactionConfig,
+        TransactionContext,
+        TransactionRegistry,
+        transaction,
+    )
+
+    # Domain
+    from foobara_py.domain.domain import (
+        Domain,
+        DomainDependencyError,
+        GlobalDomain,
+        Organization,
+        create_domain,
+        foobara_domain,
+        foobara_organization,
+        get_domain,
+        get_organization,
+    )
+
+    # Drivers
+    from foobara_py.drivers import (
+        LocalFilesDriver,
+    )
+
+    # Persistence
+    from foobara_py.persistence import (
+        DetachedEntity,
+        Entity,
+        EntityBase,
+        EntityCallbackRegistry,
+        # Entity callbacks
+        EntityLifecycle,
+        EntityRegistry,
+        InMemoryRepository,
+        LoadSpec,
+        Model,
+        MutableModel,
+        PrimaryKey,
+        Repository,
+        RepositoryProtocol,
+        RepositoryRegistry,
+        RepositoryTransaction,
+        TransactionalInMemoryRepository,
+        after_create,
+        after_delete,
+        after_save,
+        after_update,
+        after_validation,
+        before_create,
+        before_delete,
+        before_save,
+        before_update,
+        before_validation,
+        detached_entity,
+        entity,
+        load,
+        register_entity,
+    )
+
+    # Remote Imports
+    from foobara_py.remote import (
+        AsyncRemoteCommand,
+        ManifestCache,
+        RemoteClientConfig,
+        RemoteClientPool,
+        RemoteCommand,
+        RemoteImporter,
+        RemoteNamespace,
+        get_manifest_cache,
+        import_remote,
+        set_manifest_cache,
+    )
+
+    # Types
+    from foobara_py.types import (
+        APIKey,
+        BearerToken,
+        Password,
+        SecretToken,
+        Sensitive,
+        SensitiveModel,
+        SensitiveStr,
+        get_sensitive_fields,
+        is_sensitive,
+        redact_dict,
+    )
@@ -1,54 +1,66 @@
-"""Connectors for exposing commands via various protocols"""
+"""
+Connectors for exposing commands via various protocols
 
-from foobara_py.connectors.request import Request
-from foobara_py.connectors.cli import (
-    CLIAppConfig,
-    CLIConfig,
-    CLIConnector,
-    CommandCLI,
-    OutputFormat,
-    create_cli_app,
-)
-from foobara_py.connectors.http import (
-    AuthConfig,
-    CommandRoute,
-    HTTPConnector,
-    HTTPStatus,
-    RouteConfig,
-    create_http_app,
-)
-from foobara_py.connectors.mcp import MCPConnector
-from foobara_py.connectors.graphql import (
-    GraphQLConfig,
-    GraphQLConnector,
-    GraphQLFieldConfig,
-    GraphQLOperationType,
-    GraphQLSchemaGenerator,
-    create_ariadne_schema,
-    create_strawberry_types,
-    generate_graphql_schema,
-)
-from foobara_py.connectors.websocket import (
-    Subscription,
-    WebSocketConfig,
-    WebSocketConnection,
-    WebSocketConnector,
-    WebSocketMessage,
-    WebSocketMessageType,
-    create_fastapi_websocket_handler,
-    create_starlette_websocket_handler,
-)
-from foobara_py.connectors.celery_connector import (
-    CeleryConfig,
-    CeleryConnector,
-    CeleryScheduler,
-    CeleryTaskFactory,
-    JobResult,
-    JobStatus,
-    ScheduleConfig,
-    create_celery_app,
-    execute_async,
-)
+Connectors are imported on first use, so ``import foobara_py`` does not pay
+for FastAPI, Typer or Celery until one of their connectors is needed.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+_EXPORTS = {
+    "Request": "foobara_py.connectors.request",
+    "MCPConnector": "foobara_py.connectors.mcp",
+    "HTTPConnector": "foobara_py.connectors.http",
+    "HTTPStatus": "foobara_py.connectors.http",
+    "RouteConfig": "foobara_py.connectors.http",
+    "AuthConfig": "foobara_py.connectors.http",
+    "BatchConfig": "foobara_py.connectors.http",
+    "CommandRoute": "foobara_py.connectors.http",
+    "SyncWorkerPool": "foobara_py.connectors.http",
+    "WorkerPoolConfig": "foobara_py.connectors.http",
+    "create_http_app": "foobara_py.connectors.http",
+    "CLIConnector": "foobara_py.connectors.cli",
+    "CLIConfig": "foobara_py.connectors.cli",
+    "CLIAppConfig": "foobara_py.connectors.cli",
+    "CommandCLI": "foobara_py.connectors.cli",
+    "CommandIndex": "foobara_py.connectors.cli",
+    "OutputFormat": "foobara_py.connectors.cli",
+    "create_cli_app": "foobara_py.connectors.cli",
+    "GraphQLConnector": "foobara_py.connectors.graphql",
+    "GraphQLConfig": "foobara_py.connectors.graphql",
+    "GraphQLFieldConfig": "foobara_py.connectors.graphql",
+    "GraphQLOperationType": "foobara_py.connectors.graphql",
+    "GraphQLSchemaGenerator": "foobara_py.connectors.graphql",
+    "create_ariadne_schema": "foobara_py.connectors.graphql",
+    "create_strawberry_types": "foobara_py.connectors.graphql",
+    "generate_graphql_schema": "foobara_py.connectors.graphql",
+    "WebSocketConnector": "foobara_py.connectors.websocket",
+    "WebSocketConfig": "foobara_py.connectors.websocket",
+    "WebSocketConnection": "foobara_py.connectors.websocket",
+    "WebSocketMessage": "foobara_py.connectors.websocket",
+    "WebSocketMessageType": "foobara_py.connectors.websocket",
+    "Subscription": "foobara_py.connectors.websocket",
+    "create_fastapi_websocket_handler": "foobara_py.connectors.websocket",
+    "create_starlette_websocket_handler": "foobara_py.connectors.websocket",
+    "CeleryConnector": "foobara_py.connectors.celery_connector",
+    "CeleryConfig": "foobara_py.connectors.celery_connector",
+    "CeleryScheduler": "foobara_py.connectors.celery_connector",
+    "CeleryTaskFactory": "foobara_py.connectors.celery_connector",
+    "JobResult": "foobara_py.connectors.celery_connector",
+    "JobStatus": "foobara_py.connectors.celery_connector",
+    "BatchJob": "foobara_py.connectors.celery_connector",
+    "ResultCodec": "foobara_py.connectors.celery_connector",
+    "ResultStore": "foobara_py.connectors.celery_connector",
+    "LocalResultStore": "foobara_py.connectors.celery_connector",
+    "ScheduleConfig": "foobara_py.connectors.celery_connector",
+    "create_celery_app": "foobara_py.connectors.celery_connector",
+    "execute_async": "foobara_py.connectors.celery_connector",
+    "LocalJobConnector": "foobara_py.connectors.local_jobs",
+    "LocalJobConfig": "foobara_py.connectors.local_jobs",
+    "LocalScheduler": "foobara_py.connectors.local_jobs",
+    "SQLiteJobStore": "foobara_py.connectors.local_jobs",
+}
 
 __all__ = [
     "Request",
@@ -57,12 +69,16 @@ __all__ = [
     "HTTPStatus",
     "RouteConfig",
     "AuthConfig",
+    "BatchConfig",
     "CommandRoute",
+    "SyncWorkerPool",
+    "WorkerPoolConfig",
     "create_http_app",
     "CLIConnector",
     "CLIConfig",
     "CLIAppConfig",
     "CommandCLI",
+    "CommandIndex",
     "OutputFormat",
     "create_cli_app",
     "GraphQLConnector",
@@ -87,7 +103,95 @@ __all__ = [
     "CeleryTaskFactory",
     "JobResult",
     "JobStatus",
+    "BatchJob",
+    "ResultCodec",
+    "ResultStore",
+    "LocalResultStore",
     "ScheduleConfig",
     "create_celery_app",
     "execute_async",
+    "LocalJobConnector",
+    "LocalJobConfig",
+    "LocalScheduler",
+    "SQLiteJobStore",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from foobara_py.connectors.celery_connector import (
+        BatchJob,
+        CeleryConfig,
+        CeleryConnector,
+        CeleryScheduler,
+        CeleryTaskFactory,
+        JobResult,
+        JobStatus,
+        LocalResultStore,
+        ResultCodec,
+        ResultStore,
+        ScheduleConfig,
+        create_celery_app,
+        execute_async,
+    )
+    from foobara_py.connectors.cli import (
+        CLIAppConfig,
+        CLIConfig,
+        CLIConnector,
+        CommandCLI,
+        CommandIndex,
+        OutputFormat,
+        create_cli_app,
+    )
+    from foobara_py.connectors.graphql import (
+        GraphQLConfig,
+        GraphQLConnector,
+        GraphQLFieldConfig,
+        GraphQLOperationType,
+        GraphQLSchemaGenerator,
+        create_ariadne_schema,
+        create_strawberry_types,
+        generate_graphql_schema,
+    )
+    from foobara_py.connectors.http import (
+        AuthConfig,
+        BatchConfig,
+        CommandRoute,
+        HTTPConnector,
+        HTTPStatus,
+        RouteConfig,
+        SyncWorkerPool,
+        WorkerPoolConfig,
+        create_http_app,
+    )
+    from foobara_py.connectors.local_jobs import (
+        LocalJobConfig,
+        LocalJobConnector,
+        LocalScheduler,
+        SQLiteJobStore,
+    )
+    from foobara_py.connectors.mcp import MCPConnector
+    from foobara_py.connectors.request import Request
+    from foobara_py.connectors.websocket import (
+        Subscription,
+        WebSocketConfig,
+        WebSocketConnection,
+        WebSocketConnector,
+        WebSocketMessage,
+        WebSocketMessageType,
+        create_fastapi_websocket_handler,
+        create_starlette_websocket_handler,
+    )
@@ -3,20 +3,40 @@ Celery Connector for Foobara commands.
 
 Provides async job execution for Foobara commands using Celery,
 similar to Ruby's Resque connector.
+
+For large numbers of small jobs, ``execute_many`` groups inputs into chunk
+tasks so broker overhead is paid once per chunk rather than once per input.
+Chunk results are encoded compactly (msgpack and zstd when installed) and
+large ones are spilled to a ``ResultStore`` instead of the result backend.
 """
 
 from __future__ import annotations
 
+import base64
 import json
+import os
+import tempfile
+import uuid
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
-from pydantic import BaseModel
-
+from foobara_py.core.admission import AdmissionController, AdmissionRejectedError
 from foobara_py.core.command import Command
 from foobara_py.core.registry import CommandRegistry
+from foobara_py.serializers.outcome_encoder import default_outcome_encoder, dumps
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is optional
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
 
 
 class JobStatus(Enum):
@@ -61,6 +81,157 @@ class JobResult:
         }
 
 
+@dataclass
+class BatchJob:
+    """Chunk tasks dispatched by ``CeleryConnector.execute_many``."""
+
+    command_name: str
+    inputs_list: List[Dict[str, Any]]
+    job_ids: List[str] = field(default_factory=list)
+    chunk_sizes: List[int] = field(default_factory=list)
+    # AsyncResult handles of this process (EagerResult in eager mode)
+    _async_results: List[Any] = field(default_factory=list, repr=False)
+
+
+class ResultStore(ABC):
+    """Storage for chunk results too large for the Celery result backend.
+
+    Workers and clients must share the store (e.g. a mounted directory or
+    an object store bucket).
+    """
+
+    @abstractmethod
+    def put(self, data: bytes) -> str:
+        """Store data and return a reference to it."""
+        pass
+
+    @abstractmethod
+    def get(self, ref: str) -> bytes:
+        """Load data by reference."""
+        pass
+
+    @abstractmethod
+    def delete(self, ref: str) -> None:
+        """Remove stored data."""
+        pass
+
+
+class LocalResultStore(ResultStore):
+    """Stores spilled results as files in a directory."""
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or tempfile.mkdtemp(prefix="foobara-results-")
+        os.makedirs(self.directory, exist_ok=True)
+
+    def put(self, data: bytes) -> str:
+        ref = uuid.uuid4().hex
+        with open(os.path.join(self.directory, ref), "wb") as f:
+            f.write(data)
+        return ref
+
+    def get(self, ref: str) -> bytes:
+        with open(self._path(ref), "rb") as f:
+            return f.read()
+
+    def delete(self, ref: str) -> None:
+        try:
+            os.remove(self._path(ref))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, ref: str) -> str:
+        # References are generated hex names; refuse anything else
+        if not ref.isalnum():
+            raise ValueError(f"Invalid result reference: {ref}")
+        return os.path.join(self.directory, ref)
+
+
+class ResultCodec:
+    """Compact encoding for chunk results.
+
+    Values are packed with msgpack (compact JSON when msgpack is missing),
+    compressed with zstd above ``compress_min_size`` when zstandard is
+    installed, and spilled to ``store`` above ``spill_threshold`` bytes.
+    Encoded payloads are small dicts that any Celery serializer can carry.
+    """
+
+    def __init__(
+        self,
+        compress: bool = True,
+        compress_min_size: int = 1024,
+        spill_threshold: int = 1024 * 1024,
+        store: Optional[ResultStore] = None,
+    ):
+        self.compress = compress and zstandard is not None
+        self.compress_min_size = compress_min_size
+        self.spill_threshold = spill_threshold
+        self.store = store
+
+    def encode(self, value: Any) -> Dict[str, str]:
+        """Encode a JSON-compatible value."""
+        codec, body = "json", None
+        if msgpack is not None:
+            try:
+                codec, body = "msgpack", msgpack.packb(value, use_bin_type=True)
+            except TypeError:
+                # Values msgpack cannot pack natively go through the JSON encoder
+                codec = "json"
+        if body is None:
+            body = dumps(value)
+        if self.compress and len(body) >= self.compress_min_size:
+            codec, body = codec + "+zstd", zstandard.ZstdCompressor().compress(body)
+        if self.store is not None and len(body) > self.spill_threshold:
+            return {"codec": codec, "ref": self.store.put(body)}
+        return {"codec": codec, "data": base64.b64encode(body).decode("ascii")}
+
+    def decode(self, payload: Dict[str, str]) -> Any:
+        """Decode a payload produced by ``encode``, removing spilled data."""
+        codec = payload["codec"]
+        if "ref" in payload:
+            if self.store is None:
+                raise ValueError("Result was spilled but no result store is configured")
+            body = self.store.get(payload["ref"])
+            self.store.delete(payload["ref"])
+        else:
+            body = base64.b64decode(payload["data"])
+
+        if codec.endswith("+zstd"):
+            if zstandard is None:
+                raise ImportError("zstandard is required to decode this result")
+            codec, body = codec[:-5], zstandard.ZstdDecompressor().decompress(body)
+        if codec == "msgpack":
+            if msgpack is None:
+                raise ImportError("msgpack is required to decode this result")
+            return msgpack.unpackb(body, raw=False)
+        return json.loads(body)
+
+
+def run_many(
+    command_class: Type[Command],
+    inputs_list: List[Dict[str, Any]],
+) -> List[List[Any]]:
+    """Run a command once per inputs dict, returning compact entries.
+
+    Each entry is ``[True, result]`` or ``[False, [[symbol, message], ...]]``;
+    one failing input does not stop the rest of the chunk.
+    """
+    entries = []
+    for inputs in inputs_list:
+        try:
+            outcome = command_class.run(**inputs)
+        except Exception as e:
+            entries.append([False, [["error", str(e)]]])
+            continue
+        if outcome.is_success():
+            entries.append([True, default_outcome_encoder.to_jsonable(command_class, outcome.result)])
+        else:
+            entries.append([False, [
+                [str(getattr(err, "symbol", "error")), getattr(err, "message", None) or str(err)]
+                for err in (outcome.errors or [])
+            ]])
+    return entries
+
+
 @dataclass
 class CeleryConfig:
     """Configuration for Celery connector."""
@@ -104,6 +275,17 @@ class CeleryConfig:
     # Worker prefetch multiplier
     worker_prefetch_multiplier: int = 1
 
+    # Inputs per chunk task in execute_many
+    chunk_size: int = 100
+
+    # Chunk result encoding: zstd above result_compress_min_size bytes (when
+    # zstandard is installed), spilled to result_store above
+    # result_spill_threshold bytes (never spilled without a store)
+    result_compression: bool = True
+    result_compress_min_size: int = 1024
+    result_spill_threshold: int = 1024 * 1024
+    result_store: Optional[ResultStore] = None
+
 
 @dataclass
 class ScheduleConfig:
@@ -136,15 +318,24 @@ class CeleryTaskFactory:
         self,
         registry: Optional[CommandRegistry] = None,
         config: Optional[CeleryConfig] = None,
+        admission: Optional[AdmissionController] = None,
     ):
         """Initialize the task factory.
 
         Args:
             registry: Command registry to use.
             config: Celery configuration.
+            admission: Admission limits applied before commands run.
         """
         self.registry = registry or CommandRegistry()
         self.config = config or CeleryConfig()
+        self.admission = admission or AdmissionController()
+        self.codec = ResultCodec(
+            compress=self.config.result_compression,
+            compress_min_size=self.config.result_compress_min_size,
+            spill_threshold=self.config.result_spill_threshold,
+            store=self.config.result_store,
+        )
         self._tasks: Dict[str, Callable] = {}
         self._celery_app = None
 
@@ -211,6 +402,7 @@ class CeleryTaskFactory:
         task_name = name or f"foobara.{command_class.__name__}"
         task_queue = queue or self.config.default_queue
         task_max_retries = max_retries if max_retries is not None else self.config.max_retries
+        admission = self.admission
 
         @app.task(
             name=task_name,
@@ -229,15 +421,17 @@ class CeleryTaskFactory:
                 Command result or error information.
             """
             try:
-                outcome = command_class.run(**inputs)
+                with admission.admit(command_class):
+                    outcome = command_class.run(**inputs)
 
                 if outcome.is_success():
-                    result = outcome.result
-                    if isinstance(result, BaseModel):
-                        result = result.model_dump()
+                    # Celery's serializer encodes the task result; hand it
+                    # JSON-ready values produced by the cached result adapter
                     return {
                         "status": "success",
-                        "result": result,
+                        "result": default_outcome_encoder.to_jsonable(
+                            command_class, outcome.result
+                        ),
                     }
                 else:
                     return {
@@ -250,6 +444,9 @@ class CeleryTaskFactory:
                             for err in (outcome.errors or [])
                         ],
                     }
+            except AdmissionRejectedError as exc:
+                # Shed under load: requeue after the suggested back-off
+                raise self.retry(exc=exc, countdown=exc.retry_after)
             except Exception as exc:
                 # Retry on transient errors
                 raise self.retry(exc=exc)
@@ -257,6 +454,58 @@ class CeleryTaskFactory:
         self._tasks[task_name] = execute_command
         return execute_command
 
+    def create_chunk_task(
+        self,
+        command_class: Type[Command],
+        name: Optional[str] = None,
+        queue: Optional[str] = None,
+        max_retries: Optional[int] = None,
+    ) -> Callable:
+        """Create a Celery task running a command for a chunk of inputs.
+
+        Args:
+            command_class: The command class to wrap.
+            name: Optional task name. Defaults to ``foobara.<Command>.chunk``.
+            queue: Optional queue name. Defaults to config default.
+            max_retries: Optional max retries. Defaults to config value.
+
+        Returns:
+            Celery task function returning an encoded list of entries
+            (see ``run_many``).
+        """
+        app = self.get_celery_app()
+        task_name = name or f"foobara.{command_class.__name__}.chunk"
+        task_max_retries = max_retries if max_retries is not None else self.config.max_retries
+        admission = self.admission
+        codec = self.codec
+
+        @app.task(
+            name=task_name,
+            bind=True,
+            max_retries=task_max_retries,
+            default_retry_delay=self.config.retry_delay,
+            queue=queue or self.config.default_queue,
+        )
+        def execute_chunk(self, inputs_list: List[Dict[str, Any]]) -> Dict[str, str]:
+            """Execute the Foobara command for each inputs dict.
+
+            Args:
+                inputs_list: Command inputs, one dict per run.
+
+            Returns:
+                Encoded result entries.
+            """
+            try:
+                # The chunk runs sequentially, so it holds a single slot
+                with admission.admit(command_class):
+                    entries = run_many(command_class, inputs_list)
+            except AdmissionRejectedError as exc:
+                raise self.retry(exc=exc, countdown=exc.retry_after)
+            return codec.encode(entries)
+
+        self._tasks[task_name] = execute_chunk
+        return execute_chunk
+
     def create_all_tasks(self) -> Dict[str, Callable]:
         """Create Celery tasks for all registered commands.
 
@@ -303,16 +552,18 @@ class CeleryConnector:
         self,
         registry: Optional[CommandRegistry] = None,
         config: Optional[CeleryConfig] = None,
+        admission: Optional[AdmissionController] = None,
     ):
         """Initialize the Celery connector.
 
         Args:
             registry: Command registry to use.
             config: Celery configuration.
+            admission: Admission limits applied by workers before commands run.
         """
         self.registry = registry or CommandRegistry()
         self.config = config or CeleryConfig()
-        self.task_factory = CeleryTaskFactory(registry, config)
+        self.task_factory = CeleryTaskFactory(registry, config, admission)
         self._tasks_created = False
 
     def _ensure_tasks(self):
@@ -382,6 +633,99 @@ class CeleryConnector:
             inputs=inputs,
         )
 
+    def execute_many(
+        self,
+        command_name: str,
+        inputs_list: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None,
+        queue: Optional[str] = None,
+        priority: Optional[int] = None,
+    ) -> BatchJob:
+        """Execute a command for many inputs using one task per chunk.
+
+        Args:
+            command_name: Name of the command to execute.
+            inputs_list: Command inputs, one dict per run.
+            chunk_size: Inputs per task. Defaults to config value.
+            queue: Optional queue name.
+            priority: Task priority (0-9, higher = more important).
+
+        Returns:
+            BatchJob to pass to ``get_many_results``.
+
+        Raises:
+            ValueError: If command not found.
+        """
+        task_name = f"foobara.{command_name}.chunk"
+        task = self.task_factory.get_task(task_name)
+        if not task:
+            command_class = self.registry.get(command_name)
+            if not command_class:
+                raise ValueError(f"Command not found: {command_name}")
+            task = self.task_factory.create_chunk_task(command_class, name=task_name)
+
+        apply_kwargs = {}
+        if queue:
+            apply_kwargs["queue"] = queue
+        if priority is not None:
+            apply_kwargs["priority"] = priority
+
+        size = max(1, chunk_size or self.config.chunk_size)
+        batch = BatchJob(command_name=command_name, inputs_list=inputs_list)
+        for start in range(0, len(inputs_list), size):
+            chunk = inputs_list[start:start + size]
+            async_result = task.apply_async(args=[chunk], **apply_kwargs)
+            batch.job_ids.append(async_result.id)
+            batch.chunk_sizes.append(len(chunk))
+            batch._async_results.append(async_result)
+        return batch
+
+    def get_many_results(
+        self,
+        batch: BatchJob,
+        timeout: Optional[float] = None,
+    ) -> List[JobResult]:
+        """Wait for a batch and return one JobResult per input, in order.
+
+        Args:
+            batch: Batch returned by ``execute_many``.
+            timeout: Seconds to wait for each chunk.
+
+        Returns:
+            JobResults whose job_id is the id of the input's chunk task.
+            Failed runs have status FAILURE and ``error`` set to a JSON list
+            of ``{"key", "message"}`` dicts.
+        """
+        app = self.task_factory.get_celery_app()
+        results: List[JobResult] = []
+        offset = 0
+        for index, job_id in enumerate(batch.job_ids):
+            if index < len(batch._async_results):
+                async_result = batch._async_results[index]
+            else:
+                async_result = app.AsyncResult(job_id)
+            entries = self.task_factory.codec.decode(async_result.get(timeout=timeout))
+            for ok, value in entries:
+                inputs = batch.inputs_list[offset]
+                offset += 1
+                if ok:
+                    results.append(JobResult(
+                        job_id=job_id,
+                        status=JobStatus.SUCCESS,
+                        command_name=batch.command_name,
+                        inputs=inputs,
+                        result=value,
+                    ))
+                else:
+                    results.append(JobResult(
+                        job_id=job_id,
+                        status=JobStatus.FAILURE,
+                        command_name=batch.command_name,
+                        inputs=inputs,
+                        error=json.dumps([{"key": key, "message": message} for key, message in value]),
+                    ))
+        return results
+
     def get_result(self, job_id: str) -> JobResult:
         """Get the result of an async job.
 
@@ -10,6 +10,8 @@ Features:
 - Multiple output formats (table, JSON, plain)
 - Automatic help generation from command metadata
 - Domain/organization grouping as command groups
+- Lazy registration: commands are listed by name and only imported when
+  invoked, with an optional on-disk index of module commands
 
 Usage:
     from foobara_py.connectors.cli import CLIConnector, create_cli_app
@@ -24,6 +26,10 @@ Usage:
     # Or register a domain
     cli.register_domain(users_domain)
 
+    # Or register without importing until invoked
+    cli.register_lazy("myapp.commands:ExportUsers", name="export-users")
+    CLIConnector(index_cache="~/.cache/myapp/cli.json").register_module("myapp.commands")
+
     # Run CLI
     cli.run()
 
@@ -32,15 +38,21 @@ Usage:
     app()
 """
 
+import importlib
+import importlib.util
+import inspect
 import json
 import logging
+import os
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Type,
@@ -50,9 +62,13 @@ from typing import (
     get_type_hints,
 )
 
+from pydantic_core import PydanticUndefined
+
 from foobara_py.core.command import AsyncCommand, Command
 from foobara_py.core.outcome import CommandOutcome
+from foobara_py.core.streaming import as_stream
 from foobara_py.domain.domain import Domain, Organization
+from foobara_py.serializers.outcome_encoder import default_outcome_encoder
 
 logger = logging.getLogger(__name__)
 
@@ -128,8 +144,33 @@ class CommandCLI:
 
     def execute(self, **inputs: Any) -> Any:
         """Execute the command and return result"""
+        return "\n".join(self.stream(**inputs))
+
+    def stream(self, **inputs: Any) -> Iterator[str]:
+        """
+        Execute the command and yield output.
+
+        Streaming results (iterators, async generators) yield one line per
+        item as they are produced; other results yield a single block.
+        """
         outcome = self.command_class.run(**inputs)
-        return self._format_output(outcome)
+        stream = as_stream(outcome.result) if outcome.is_success() else None
+        if stream is None:
+            yield self._format_output(outcome)
+            return
+        try:
+            for item in stream:
+                yield self._format_line(item)
+        finally:
+            stream.close()
+
+    def _format_line(self, item: Any) -> str:
+        """Format one streamed item as a single line (JSON lines, or plain text)"""
+        if self.output_format == OutputFormat.JSON:
+            return default_outcome_encoder.encode_result(None, item).decode()
+        if hasattr(item, "model_dump"):
+            return ", ".join(f"{k}: {v}" for k, v in item.model_dump().items())
+        return str(item)
 
     def _format_output(self, outcome: CommandOutcome) -> str:
         """Format command outcome for CLI output"""
@@ -276,6 +317,218 @@ class CommandCLI:
         }
 
 
+# Annotations Typer can parse from the command line; other inputs are read as JSON
+_CLI_TYPES = (str, int, float, bool, Path)
+
+
+def _cli_annotation(annotation: Any) -> Optional[Any]:
+    """The annotation itself if Typer can parse it, else None"""
+    if isinstance(annotation, type) and (
+        issubclass(annotation, _CLI_TYPES) or issubclass(annotation, Enum)
+    ):
+        return annotation
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        if args and _cli_annotation(args[0]) is not None:
+            return annotation
+    return None
+
+
+def _make_handler(cmd_cli: CommandCLI) -> Callable:
+    """Typer callback with one option per command input"""
+    import typer
+
+    json_inputs = set()
+    parameters = []
+    for param in cmd_cli.get_typer_params():
+        annotation = _cli_annotation(param["annotation"])
+        default = param["default"]
+        if annotation is None:
+            json_inputs.add(param["name"])
+            annotation = str
+            if default is not ...:
+                default = None
+        elif default is not ... and (default is PydanticUndefined or isinstance(default, list)):
+            default = None  # Let the inputs model fill it in
+        parameters.append(
+            inspect.Parameter(
+                param["name"],
+                inspect.Parameter.KEYWORD_ONLY,
+                default=typer.Option(default, help=param["help"]),
+                annotation=annotation,
+            )
+        )
+
+    def handler(**kwargs):
+        inputs = {}
+        for name, value in kwargs.items():
+            if value is None:
+                continue
+            if name in json_inputs:
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    pass  # Leave it to input validation
+            inputs[name] = value
+        try:
+            for output in cmd_cli.stream(**inputs):
+                typer.echo(output)
+        except Exception as e:
+            typer.echo(f"Error: {e}", err=True)
+            raise typer.Exit(1)
+
+    handler.__signature__ = inspect.Signature(parameters)
+    handler.__annotations__ = {p.name: p.annotation for p in parameters}
+    return handler
+
+
+def _is_command_class(obj: Any) -> bool:
+    return (
+        isinstance(obj, type)
+        and issubclass(obj, (Command, AsyncCommand))
+        and obj.execute not in (Command.execute, AsyncCommand.execute)
+    )
+
+
+def _describe_command(command_class: Type[Command]) -> Dict[str, Any]:
+    config = CommandCLI._default_config(command_class)
+    return {
+        "class": command_class.__name__,
+        "name": command_class.full_name(),
+        "cli_name": config.name,
+        "help": config.help,
+    }
+
+
+def _source_mtime(module_name: str) -> Optional[int]:
+    """mtime (ns) of a module's source file, found without importing the module"""
+    module = sys.modules.get(module_name)
+    origin = getattr(module, "__file__", None)
+    if origin is None:
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            return None
+        origin = spec.origin if spec else None
+    try:
+        return os.stat(origin).st_mtime_ns if origin else None
+    except OSError:
+        return None  # built-in or frozen
+
+
+class CommandIndex:
+    """
+    CLI names and help texts of the commands defined in modules.
+
+    Describing a module imports it. With a ``path`` the descriptions are
+    cached in a JSON file keyed by module name and source mtime, so later
+    startups list commands without importing anything until a module
+    changes.
+    """
+
+    __slots__ = ("path", "_modules")
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path).expanduser() if path else None
+        self._modules: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def describe(self, module_name: str) -> List[Dict[str, Any]]:
+        """``{"class", "name", "cli_name", "help"}`` for each command in a module"""
+        modules = self._load()
+        mtime = _source_mtime(module_name)
+        cached = modules.get(module_name)
+        if cached is not None and mtime is not None and cached["mtime"] == mtime:
+            return cached["commands"]
+
+        module = importlib.import_module(module_name)
+        commands = [
+            _describe_command(obj)
+            for obj in vars(module).values()
+            if _is_command_class(obj) and obj.__module__ == module_name
+        ]
+        modules[module_name] = {"mtime": mtime, "commands": commands}
+        self._save()
+        return commands
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._modules is None:
+            self._modules = {}
+            if self.path is not None and self.path.exists():
+                try:
+                    data = json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    data = {}
+                if data.get("version") == self.VERSION:
+                    self._modules = data["modules"]
+        return self._modules
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = json.dumps({"version": self.VERSION, "modules": self._modules})
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            temp_path.write_text(data, encoding="utf-8")
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.debug(f"Could not write CLI command index {self.path}: {e}")
+
+
+@dataclass(slots=True)
+class _LazyEntry:
+    """A command known by CLI name until it is invoked"""
+
+    import_path: str  # "package.module:ClassName"
+    cli_name: str
+    help: Optional[str] = None
+    full_name: Optional[str] = None
+    click_command: Any = None
+
+
+def _lazy_group_class(connector: "CLIConnector") -> type:
+    """Typer group that lists lazy entries by name and builds them on use"""
+    import click
+    from typer.core import TyperGroup
+
+    class LazyCommand(click.Command):
+        """Stands in for a lazy command in listings; resolved when invoked"""
+
+        def __init__(self, entry: _LazyEntry):
+            super().__init__(entry.cli_name, help=entry.help)
+            self.entry = entry
+
+        def _resolve(self) -> click.Command:
+            return connector._load_lazy(self.entry)
+
+        def make_context(self, info_name, args, parent=None, **extra):
+            return self._resolve().make_context(info_name, args, parent=parent, **extra)
+
+        def invoke(self, ctx):
+            return self._resolve().invoke(ctx)
+
+        def get_params(self, ctx):
+            return self._resolve().get_params(ctx)
+
+        def shell_complete(self, ctx, incomplete):
+            return self._resolve().shell_complete(ctx, incomplete)
+
+    class LazyTyperGroup(TyperGroup):
+        def list_commands(self, ctx):
+            names = super().list_commands(ctx)
+            return names + [name for name in connector._lazy if name not in self.commands]
+
+        def get_command(self, ctx, cmd_name):
+            command = super().get_command(ctx, cmd_name)
+            if command is None and cmd_name in connector._lazy:
+                command = LazyCommand(connector._lazy[cmd_name])
+            return command
+
+    return LazyTyperGroup
+
+
 class CLIConnector:
     """
     Typer CLI Connector for exposing commands as CLI commands.
@@ -293,13 +546,14 @@ class CLIConnector:
         cli.run()
     """
 
-    __slots__ = ("_app", "_commands", "_groups", "_config", "_output_format")
+    __slots__ = ("_app", "_commands", "_groups", "_config", "_output_format", "_lazy", "_index")
 
     def __init__(
         self,
         app: Any = None,  # Typer instance
         config: Optional[CLIAppConfig] = None,
         output_format: OutputFormat = OutputFormat.JSON,
+        index_cache: Optional[Union[str, Path]] = None,
     ):
         """
         Initialize CLI connector.
@@ -308,11 +562,15 @@ class CLIConnector:
             app: Optional Typer application instance
             config: CLI application configuration
             output_format: Default output format
+            index_cache: JSON file caching the command index of lazily
+                registered modules (see register_lazy / register_module)
         """
         self._config = config or CLIAppConfig()
         self._output_format = output_format
         self._commands: Dict[str, CommandCLI] = {}
         self._groups: Dict[str, Any] = {}  # Domain -> Typer group
+        self._lazy: Dict[str, _LazyEntry] = {}  # CLI name -> lazily registered command
+        self._index = CommandIndex(index_cache)
 
         if app is None:
             self._app = self._create_app()
@@ -333,6 +591,7 @@ class CLIConnector:
                 no_args_is_help=self._config.no_args_is_help,
                 pretty_exceptions_enable=self._config.pretty_exceptions_enable,
                 pretty_exceptions_short=self._config.pretty_exceptions_short,
+                cls=_lazy_group_class(self),
             )
             return app
 
@@ -462,36 +721,94 @@ class CLIConnector:
         logger.debug(f"Registered organization: {org.name}")
         return self
 
-    def _add_command(self, cmd_cli: CommandCLI) -> None:
-        """Add command to the main app"""
-        try:
-            import typer
+    def register_lazy(
+        self, import_path: str, name: Optional[str] = None, help: Optional[str] = None
+    ) -> "CLIConnector":
+        """
+        Register a command by import path without importing it.
+
+        The command's module is imported, and its parameters are built, only
+        when the command is invoked. With ``name`` nothing is imported up
+        front. Without it, the CLI name and help text come from the command
+        index (see ``index_cache``).
 
-            inputs_type = cmd_cli.command_class.inputs_type()
+        Args:
+            import_path: ``"package.module:ClassName"``
+            name: CLI command name
+            help: Help text shown in the command list
+
+        Returns:
+            Self for chaining
+        """
+        module_name, _, class_name = import_path.partition(":")
+        if not class_name:
+            raise ValueError(f"Expected 'module:ClassName', got {import_path!r}")
+
+        if name is None:
+            for info in self._index.describe(module_name):
+                if info["class"] == class_name:
+                    break
+            else:
+                raise ValueError(f"No command {class_name} in {module_name}")
+            entry = _LazyEntry(import_path, info["cli_name"], help or info["help"], info["name"])
+        else:
+            entry = _LazyEntry(import_path, name, help)
 
-            # Build the command function dynamically
-            def make_handler(cli: CommandCLI):
-                def handler(**kwargs):
-                    try:
-                        output = cli.execute(**kwargs)
-                        typer.echo(output)
-                    except Exception as e:
-                        typer.echo(f"Error: {e}", err=True)
-                        raise typer.Exit(1)
+        self._lazy[entry.cli_name] = entry
+        logger.debug(f"Registered lazy CLI command: {import_path} as {entry.cli_name}")
+        return self
 
-                return handler
+    def register_module(self, module_name: str) -> "CLIConnector":
+        """
+        Lazily register every command defined in a module.
 
-            handler = make_handler(cmd_cli)
+        The module is imported once to list its commands; with ``index_cache``
+        later runs read the list from the cache until the module changes.
 
-            # Add Typer decorations for parameters
-            for param in cmd_cli.get_typer_params():
-                if param["required"]:
-                    handler.__annotations__[param["name"]] = param["annotation"]
-                else:
-                    default = param["default"]
-                    if default is None:
-                        default = typer.Option(None, help=param["help"])
-                    handler.__annotations__[param["name"]] = param["annotation"]
+        Returns:
+            Self for chaining
+        """
+        for info in self._index.describe(module_name):
+            self._lazy[info["cli_name"]] = _LazyEntry(
+                f"{module_name}:{info['class']}", info["cli_name"], info["help"], info["name"]
+            )
+        return self
+
+    def _load_lazy(self, entry: _LazyEntry) -> Any:
+        """Import a lazily registered command and build its click command"""
+        if entry.click_command is None:
+            import typer
+
+            module_name, _, class_name = entry.import_path.partition(":")
+            command_class = getattr(importlib.import_module(module_name), class_name)
+            cmd_cli = CommandCLI(
+                command_class, CLIConfig(name=entry.cli_name, help=entry.help), self._output_format
+            )
+            entry.full_name = command_class.full_name()
+            self._commands[entry.full_name] = cmd_cli
+
+            single = typer.Typer()
+            single.command(name=entry.cli_name, help=entry.help)(_make_handler(cmd_cli))
+            entry.click_command = typer.main.get_command(single)
+        return entry.click_command
+
+    def _lazy_entry(self, name: str) -> Optional[_LazyEntry]:
+        """Lazy entry by CLI name or full command name"""
+        entry = self._lazy.get(name)
+        if entry is None:
+            for candidate in self._lazy.values():
+                if candidate.full_name == name:
+                    return candidate
+        return entry
+
+    def _load_all_lazy(self) -> None:
+        for entry in self._lazy.values():
+            self._load_lazy(entry)
+
+    def _add_command(self, cmd_cli: CommandCLI) -> None:
+        """Add command to the main app"""
+        try:
+            handler = _make_handler(cmd_cli)
 
             # Register with Typer
             self._app.command(
@@ -507,24 +824,7 @@ class CLIConnector:
     def _add_command_to_group(self, cmd_cli: CommandCLI, group: Any) -> None:
         """Add command to a group (Typer instance)"""
         try:
-            import typer
-
-            def make_handler(cli: CommandCLI):
-                def handler(**kwargs):
-                    try:
-                        output = cli.execute(**kwargs)
-                        typer.echo(output)
-                    except Exception as e:
-                        typer.echo(f"Error: {e}", err=True)
-                        raise typer.Exit(1)
-
-                return handler
-
-            handler = make_handler(cmd_cli)
-
-            # Add type annotations for parameters
-            for param in cmd_cli.get_typer_params():
-                handler.__annotations__[param["name"]] = param["annotation"]
+            handler = _make_handler(cmd_cli)
 
             # Use simple command name within group
             simple_name = cmd_cli.command_class.__name__.lower()
@@ -564,6 +864,11 @@ class CLIConnector:
             Formatted output string
         """
         cmd_cli = self._commands.get(command_name)
+        if not cmd_cli:
+            entry = self._lazy_entry(command_name)
+            if entry is not None:
+                self._load_lazy(entry)
+                cmd_cli = self._commands.get(entry.full_name)
         if not cmd_cli:
             return json.dumps(
                 {"success": False, "errors": [{"message": f"Command not found: {command_name}"}]}
@@ -574,9 +879,12 @@ class CLIConnector:
         """
         Generate manifest of all registered CLI commands.
 
+        Lazily registered commands are imported to describe their inputs.
+
         Returns:
             Dict with command metadata for CLI discovery
         """
+        self._load_all_lazy()
         commands = {}
         for name, cmd_cli in self._commands.items():
             cmd = cmd_cli.command_class
@@ -601,14 +909,16 @@ class CLIConnector:
 
     @property
     def commands(self) -> Dict[str, CommandCLI]:
-        """Get all registered commands"""
+        """Get all registered commands (imports lazily registered ones)"""
+        self._load_all_lazy()
         return self._commands.copy()
 
     def __len__(self) -> int:
-        return len(self._commands)
+        unloaded = sum(1 for entry in self._lazy.values() if entry.click_command is None)
+        return len(self._commands) + unloaded
 
     def __contains__(self, name: str) -> bool:
-        return name in self._commands
+        return name in self._commands or self._lazy_entry(name) is not None
 
 
 def create_cli_app(
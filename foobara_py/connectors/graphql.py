@@ -3,20 +3,52 @@ GraphQL Connector for Foobara commands.
 
 Exposes Foobara commands as GraphQL queries and mutations with automatic
 schema generation and type conversion.
+
+Execution uses graphql-core when it is installed: the schema and resolvers
+are built once, validated documents are cached, and belongs-to associations
+of entities are loaded in batches (one ``find_many`` per entity class and
+nesting level) instead of one lookup per item.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
+import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from foobara_py.caching.cache_backends import CacheBackend, get_default_cache
 from foobara_py.core.command import AsyncCommand, Command
 from foobara_py.core.registry import CommandRegistry
+from foobara_py.serializers.outcome_encoder import default_outcome_encoder
+
+try:
+    import graphql as graphql_core
+    from graphql import (
+        DocumentNode,
+        FieldNode,
+        FragmentSpreadNode,
+        GraphQLError,
+        NoSchemaIntrospectionCustomRule,
+        OperationDefinitionNode,
+        OperationType,
+        SelectionSetNode,
+        ValidationRule,
+        build_schema,
+        parse,
+        specified_rules,
+        validate,
+    )
+    from graphql import execute as graphql_execute
+except ImportError:  # pragma: no cover - graphql-core is optional
+    graphql_core = None
 
 
 class GraphQLOperationType(Enum):
@@ -56,12 +88,41 @@ class GraphQLConfig:
     # Enable introspection
     enable_introspection: bool = True
 
-    # Max query depth
+    # Max query depth (nesting of selected fields; introspection is not counted)
     max_depth: Optional[int] = None
 
+    # Max query complexity (number of selected fields, fragments expanded)
+    max_complexity: Optional[int] = None
+
+    # Parsed and validated documents kept per connector (LRU, keyed by SHA-256)
+    document_cache_size: int = 256
+
+    # Accept automatic persisted queries (hash-only requests)
+    persisted_queries: bool = True
+
+    # Query commands whose results are cached, by command name -> TTL in seconds
+    # (None: no expiry). Keys include the document hash, variables and auth scope.
+    # Requires cache_scope.
+    cacheable_queries: Dict[str, Optional[int]] = field(default_factory=dict)
+
+    # Result cache backend (default: the process-wide default cache)
+    result_cache: Optional[CacheBackend] = None
+
+    # Auth scope of a request's context for result cache keys; cached results
+    # are never shared across scopes. Requests whose scope is None are not
+    # cached. Return a constant (e.g. "public") for results every caller may see.
+    cache_scope: Optional[Callable[[Dict[str, Any]], Any]] = None
+
     # Enable batching
     enable_batching: bool = True
 
+    def __post_init__(self):
+        if self.cacheable_queries and self.cache_scope is None:
+            raise ValueError(
+                "cacheable_queries requires cache_scope, so cached results are not "
+                "shared between callers"
+            )
+
 
 def python_type_to_graphql(python_type: Any, nullable: bool = True) -> str:
     """Convert Python type annotation to GraphQL type string."""
@@ -122,6 +183,33 @@ def python_type_to_graphql(python_type: Any, nullable: bool = True) -> str:
     return gql_type if nullable else f"{gql_type}!"
 
 
+def _is_entity(model: Any) -> bool:
+    from foobara_py.persistence.entity import EntityBase
+
+    return isinstance(model, type) and issubclass(model, EntityBase)
+
+
+def _is_association(value: Any) -> bool:
+    from foobara_py.persistence.associations import AssociationDescriptor
+
+    return isinstance(value, AssociationDescriptor)
+
+
+def _belongs_to_associations(entity_class: type) -> List[Tuple[str, Any]]:
+    """(name, descriptor) pairs of an entity's belongs-to associations"""
+    from foobara_py.persistence.associations import BelongsTo
+
+    found: Dict[str, Any] = {}
+    for klass in reversed(entity_class.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, BelongsTo):
+                found[name] = value
+    for name, field_info in entity_class.model_fields.items():
+        if isinstance(field_info.default, BelongsTo):
+            found[name] = field_info.default
+    return list(found.items())
+
+
 class GraphQLSchemaGenerator:
     """Generates GraphQL schema from Foobara commands."""
 
@@ -139,6 +227,9 @@ class GraphQLSchemaGenerator:
         self.registry = registry or CommandRegistry()
         self.config = config or GraphQLConfig()
         self._type_definitions: Dict[str, str] = {}
+        self._pending_types: Set[str] = set()
+        # (type name, field name) -> BelongsTo descriptor, for the connector's resolvers
+        self.associations: Dict[Tuple[str, str], Any] = {}
 
     def _command_to_field_name(self, command_class: Type[Command]) -> str:
         """Convert command class name to GraphQL field name."""
@@ -164,56 +255,96 @@ class GraphQLSchemaGenerator:
     def _generate_input_type(self, command_class: Type[Command]) -> Optional[str]:
         """Generate GraphQL input type for command inputs."""
         inputs_type = getattr(command_class, "Inputs", None)
-        if not inputs_type:
+        if not (isinstance(inputs_type, type) and issubclass(inputs_type, BaseModel)):
             return None
 
-        type_name = f"{command_class.__name__}Input"
-
-        if isinstance(inputs_type, type) and issubclass(inputs_type, BaseModel):
-            fields = []
-            for field_name, field_info in inputs_type.model_fields.items():
-                annotation = field_info.annotation
-                gql_type = python_type_to_graphql(
-                    annotation,
-                    nullable=not field_info.is_required()
-                )
-                description = field_info.description or ""
-                if description:
-                    fields.append(f'  """{description}"""\n  {field_name}: {gql_type}')
-                else:
-                    fields.append(f"  {field_name}: {gql_type}")
-
-            if fields:
-                self._type_definitions[type_name] = (
-                    f"input {type_name} {{\n" + "\n".join(fields) + "\n}"
-                )
-                return type_name
-
-        return None
+        type_name = self._object_type(
+            inputs_type, as_input=True, name=f"{command_class.__name__}Input"
+        )
+        return None if type_name == "JSON" else type_name
 
     def _generate_output_type(self, command_class: Type[Command]) -> str:
         """Generate GraphQL output type for command result."""
         result_type = getattr(command_class, "Result", None)
-        type_name = f"{command_class.__name__}Result"
-
-        if result_type and isinstance(result_type, type) and issubclass(result_type, BaseModel):
-            fields = []
-            for field_name, field_info in result_type.model_fields.items():
-                annotation = field_info.annotation
-                gql_type = python_type_to_graphql(annotation)
-                description = field_info.description or ""
-                if description:
-                    fields.append(f'  """{description}"""\n  {field_name}: {gql_type}')
-                else:
-                    fields.append(f"  {field_name}: {gql_type}")
+        if not (isinstance(result_type, type) and issubclass(result_type, BaseModel)):
+            result_type = command_class.result_type()
+            if getattr(result_type, "__origin__", None) is list:
+                return self._field_type(result_type)
+            if not (isinstance(result_type, type) and issubclass(result_type, BaseModel)):
+                return "JSON"
+
+        if _is_entity(result_type):
+            return self._object_type(result_type)
+        return self._object_type(result_type, name=f"{command_class.__name__}Result")
+
+    def _field_type(self, annotation: Any, nullable: bool = True, as_input: bool = False) -> str:
+        """GraphQL type for a field annotation, defining nested model types as needed."""
+        origin = getattr(annotation, "__origin__", None)
+        args = getattr(annotation, "__args__", ())
+
+        if origin is Union:
+            non_none_args = [a for a in args if a is not type(None)]
+            if len(non_none_args) == 1:
+                return self._field_type(non_none_args[0], True, as_input)
+        elif origin is list and args:
+            gql_type = f"[{self._field_type(args[0], True, as_input)}]"
+            return gql_type if nullable else f"{gql_type}!"
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            gql_type = self._object_type(annotation, as_input)
+            return gql_type if nullable or gql_type == "JSON" else f"{gql_type}!"
 
-            if fields:
-                self._type_definitions[type_name] = (
-                    f"type {type_name} {{\n" + "\n".join(fields) + "\n}"
-                )
-                return type_name
+        return python_type_to_graphql(annotation, nullable)
 
-        return "JSON"
+    def _object_type(
+        self,
+        model: Type[BaseModel],
+        as_input: bool = False,
+        name: Optional[str] = None,
+    ) -> str:
+        """Define an object (or input) type for a model and return its name.
+
+        Nested models get types of their own. Entities also expose their
+        belongs-to associations as fields, resolved by the connector.
+        """
+        type_name = name or (f"{model.__name__}Input" if as_input else model.__name__)
+        if type_name in self._type_definitions or type_name in self._pending_types:
+            return type_name
+        # Self-referencing models resolve to the name while it is being built
+        self._pending_types.add(type_name)
+
+        fields = []
+        for field_name, field_info in model.model_fields.items():
+            if _is_association(field_info.default):
+                continue
+            gql_type = self._field_type(
+                field_info.annotation,
+                nullable=not (as_input and field_info.is_required()),
+                as_input=as_input,
+            )
+            description = field_info.description or ""
+            if description:
+                fields.append(f'  """{description}"""\n  {field_name}: {gql_type}')
+            else:
+                fields.append(f"  {field_name}: {gql_type}")
+
+        if not as_input and _is_entity(model):
+            for field_name, association in _belongs_to_associations(model):
+                try:
+                    target = association._get_entity_class()
+                except ValueError:
+                    continue  # target entity not registered yet
+                fields.append(f"  {field_name}: {self._object_type(target)}")
+                self.associations[(type_name, field_name)] = association
+
+        self._pending_types.discard(type_name)
+        if not fields:
+            return "JSON"
+
+        kind = "input" if as_input else "type"
+        self._type_definitions[type_name] = (
+            f"{kind} {type_name} {{\n" + "\n".join(fields) + "\n}"
+        )
+        return type_name
 
     def _generate_field(self, command_class: Type[Command]) -> str:
         """Generate GraphQL field definition for a command."""
@@ -249,6 +380,7 @@ class GraphQLSchemaGenerator:
             GraphQL schema definition language (SDL) string.
         """
         self._type_definitions.clear()
+        self.associations.clear()
 
         if commands is None:
             commands = self.registry.list_commands()
@@ -311,11 +443,79 @@ class GraphQLSchemaGenerator:
         return "\n".join(parts)
 
 
+class EntityLoader:
+    """Batches primary-key lookups of one entity class (the DataLoader pattern).
+
+    Every ``load`` made during one tick of the event loop is collected and
+    answered by a single ``find_many`` call, so resolving an association on
+    every item of a list costs one query instead of one per item. Results
+    are cached for the lifetime of the loader, i.e. one request.
+    """
+
+    def __init__(self, entity_class: type):
+        self.entity_class = entity_class
+        self.batches = 0
+        self._futures: Dict[Any, asyncio.Future] = {}
+        self._queue: List[Any] = []
+
+    def load(self, pk: Any) -> asyncio.Future:
+        """Future for the entity with primary key pk (None if missing)"""
+        future = self._futures.get(pk)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = self._futures[pk] = loop.create_future()
+            if not self._queue:
+                loop.call_soon(self._dispatch)
+            self._queue.append(pk)
+        return future
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        asyncio.ensure_future(self._load_batch(keys))
+
+    async def _load_batch(self, keys: List[Any]) -> None:
+        self.batches += 1
+        loop = asyncio.get_running_loop()
+        try:
+            found = await loop.run_in_executor(None, self.entity_class.find_many, keys)
+        except Exception as e:
+            for key in keys:
+                self._futures[key].set_exception(e)
+            return
+        for key in keys:
+            self._futures[key].set_result(found.get(key))
+
+
+class EntityLoaders:
+    """Per-request EntityLoader for each entity class"""
+
+    def __init__(self):
+        self._loaders: Dict[type, EntityLoader] = {}
+
+    def for_class(self, entity_class: type) -> EntityLoader:
+        loader = self._loaders.get(entity_class)
+        if loader is None:
+            loader = self._loaders[entity_class] = EntityLoader(entity_class)
+        return loader
+
+    @property
+    def batches(self) -> int:
+        """Number of find_many calls made so far"""
+        return sum(loader.batches for loader in self._loaders.values())
+
+
 class GraphQLConnector:
     """GraphQL connector for Foobara commands.
 
     Provides GraphQL execution capabilities for Foobara commands.
     Can be integrated with any GraphQL server (Ariadne, Strawberry, etc.)
+
+    With graphql-core installed, ``execute`` runs queries against an
+    executable schema built once per set of registered commands. Parsed and
+    validated documents are kept in an LRU cache, root query fields run
+    concurrently (sync commands in the default executor), and entity
+    associations are batched per request through ``EntityLoader``.
+    Without graphql-core a minimal single-field executor is used.
     """
 
     def __init__(
@@ -332,7 +532,14 @@ class GraphQLConnector:
         self.registry = registry or CommandRegistry()
         self.config = config or GraphQLConfig()
         self.schema_generator = GraphQLSchemaGenerator(registry, config)
-        self._resolvers: Dict[str, Callable] = {}
+        self._resolvers: Dict[str, Dict[str, Callable]] = {}
+        self._resolvers_for: Optional[tuple] = None
+        self._schema: Any = None
+        self._schema_for: Optional[tuple] = None
+        self._validation_rules: List[Any] = []
+        self._documents: "OrderedDict[str, _PreparedDocument]" = OrderedDict()
+        self._cache_ttls: Dict[str, Optional[int]] = {}
+        self._documents_lock = threading.Lock()
 
     def get_schema(self) -> str:
         """Get the GraphQL schema SDL."""
@@ -346,13 +553,20 @@ class GraphQLConnector:
     def register_resolvers(self) -> Dict[str, Dict[str, Callable]]:
         """Generate resolvers for all registered commands.
 
+        Resolvers are built once and reused until the registered commands
+        change.
+
         Returns:
             Dictionary mapping operation types to field resolvers.
         """
+        commands = tuple(self.registry.list_commands())
+        if self._resolvers_for == commands:
+            return self._resolvers
+
         queries: Dict[str, Callable] = {}
         mutations: Dict[str, Callable] = {}
 
-        for command_class in self.registry.list_commands():
+        for command_class in commands:
             field_name = self._command_to_field_name(command_class)
             resolver = self._create_resolver(command_class)
             op_type = self.schema_generator._get_operation_type(command_class)
@@ -362,10 +576,12 @@ class GraphQLConnector:
             else:
                 mutations[field_name] = resolver
 
-        return {
+        self._resolvers = {
             "Query": queries,
             "Mutation": mutations,
         }
+        self._resolvers_for = commands
+        return self._resolvers
 
     def _create_resolver(
         self,
@@ -373,41 +589,24 @@ class GraphQLConnector:
     ) -> Callable:
         """Create a resolver function for a command.
 
+        The resolver returns the result as plain data, or an ``errors`` dict
+        when the command fails, for use with external GraphQL servers.
+
         Args:
             command_class: The command class to create resolver for.
 
         Returns:
             Resolver function.
         """
-        is_async = issubclass(command_class, AsyncCommand)
-
-        if is_async:
+        if issubclass(command_class, AsyncCommand):
             async def async_resolver(
                 root: Any,
                 info: Any,
                 input: Optional[Dict[str, Any]] = None,
             ) -> Dict[str, Any]:
                 """Async resolver for command execution."""
-                inputs = input or {}
-                outcome = await command_class.run_async(**inputs)
-                if outcome.is_success():
-                    result = outcome.result
-                    if isinstance(result, BaseModel):
-                        return result.model_dump()
-                    return result
-                else:
-                    # Return errors in GraphQL format
-                    return {
-                        "errors": [
-                            {
-                                "key": str(err.symbol) if hasattr(err, "symbol") else "error",
-                                "message": str(err),
-                                "path": getattr(err, "path", None),
-                                "category": getattr(err, "category", None),
-                            }
-                            for err in (outcome.errors or [])
-                        ]
-                    }
+                outcome = await command_class.run_async(**(input or {}))
+                return _resolver_value(command_class, outcome)
             return async_resolver
         else:
             def sync_resolver(
@@ -416,55 +615,252 @@ class GraphQLConnector:
                 input: Optional[Dict[str, Any]] = None,
             ) -> Dict[str, Any]:
                 """Sync resolver for command execution."""
-                inputs = input or {}
-                outcome = command_class.run(**inputs)
-                if outcome.is_success():
-                    result = outcome.result
-                    if isinstance(result, BaseModel):
-                        return result.model_dump()
-                    return result
-                else:
-                    return {
-                        "errors": [
-                            {
-                                "key": str(err.symbol) if hasattr(err, "symbol") else "error",
-                                "message": str(err),
-                                "path": getattr(err, "path", None),
-                                "category": getattr(err, "category", None),
-                            }
-                            for err in (outcome.errors or [])
-                        ]
-                    }
+                outcome = command_class.run(**(input or {}))
+                return _resolver_value(command_class, outcome)
             return sync_resolver
 
+    def _executable_schema(self) -> Any:
+        """graphql-core schema with resolvers attached, rebuilt when commands change."""
+        commands = tuple(self.registry.list_commands())
+        if self._schema is not None and self._schema_for == commands:
+            return self._schema
+
+        generator = self.schema_generator
+        schema = build_schema(generator.generate_schema(list(commands)))
+        cache_ttls: Dict[str, Optional[int]] = {}
+        for command_class in commands:
+            field_name = self._command_to_field_name(command_class)
+            if generator._get_operation_type(command_class) == GraphQLOperationType.QUERY:
+                root = schema.query_type
+                if command_class.__name__ in self.config.cacheable_queries:
+                    cache_ttls[field_name] = self.config.cacheable_queries[command_class.__name__]
+            else:
+                root = schema.mutation_type
+            root.fields[field_name].resolve = _field_resolver(command_class)
+        for (type_name, field_name), association in generator.associations.items():
+            schema.get_type(type_name).fields[field_name].resolve = _association_resolver(
+                association
+            )
+
+        rules = list(specified_rules)
+        if not self.config.enable_introspection:
+            rules.append(NoSchemaIntrospectionCustomRule)
+        if self.config.max_depth is not None or self.config.max_complexity is not None:
+            rules.append(_query_cost_rule(self.config.max_depth, self.config.max_complexity))
+
+        with self._documents_lock:
+            self._documents.clear()
+        self._validation_rules = rules
+        self._cache_ttls = cache_ttls
+        self._schema = schema
+        self._schema_for = commands
+        return schema
+
+    def _prepare(self, schema: Any, query: str, query_hash: str) -> "_PreparedDocument":
+        """Parsed, validated and planned document for a query (LRU cached by hash)."""
+        prepared = self._persisted(query_hash)
+        if prepared is not None:
+            return prepared
+
+        try:
+            document = parse(query)
+        except GraphQLError as e:
+            prepared = _PreparedDocument(query_hash, None, [e])
+        else:
+            errors = validate(schema, document, self._validation_rules)
+            if errors:
+                prepared = _PreparedDocument(query_hash, None, errors)
+            else:
+                prepared = _PreparedDocument(query_hash, document, [], *self._plan(document))
+
+        with self._documents_lock:
+            self._documents[query_hash] = prepared
+            while len(self._documents) > self.config.document_cache_size:
+                self._documents.popitem(last=False)
+        return prepared
+
+    def _persisted(self, query_hash: str) -> Optional["_PreparedDocument"]:
+        with self._documents_lock:
+            prepared = self._documents.get(query_hash)
+            if prepared is not None:
+                self._documents.move_to_end(query_hash)
+            return prepared
+
+    def _plan(self, document: Any) -> Tuple[List[Optional[str]], Dict[Optional[str], "_CachePlan"]]:
+        """Operation names and, per query operation, its cacheable root fields."""
+        operations: List[Optional[str]] = []
+        plans: Dict[Optional[str], _CachePlan] = {}
+        for definition in document.definitions:
+            if not isinstance(definition, OperationDefinitionNode):
+                continue
+            name = definition.name.value if definition.name else None
+            operations.append(name)
+            if definition.operation != OperationType.QUERY or not self._cache_ttls:
+                continue
+            ttls: Dict[str, Optional[int]] = {}
+            order: List[str] = []
+            complete = True
+            for selection in definition.selection_set.selections:
+                if isinstance(selection, FieldNode):
+                    order.append(_response_key(selection))
+                if (
+                    isinstance(selection, FieldNode)
+                    and not selection.directives
+                    and selection.name.value in self._cache_ttls
+                ):
+                    ttls[_response_key(selection)] = self._cache_ttls[selection.name.value]
+                else:
+                    complete = False
+            if ttls:
+                plans[name] = _CachePlan(ttls, complete, order)
+        return operations, plans
+
+    def _result_cache_keys(
+        self,
+        prepared: "_PreparedDocument",
+        plan: "_CachePlan",
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> Optional[Dict[str, str]]:
+        """
+        Cache key per cacheable root field: document hash, variables and auth scope.
+
+        None when the request has no auth scope, so its results are not cached.
+        """
+        if self.config.cache_scope is None:
+            return None
+        scope = self.config.cache_scope(context or {})
+        if scope is None:
+            return None
+        request = json.dumps(
+            [prepared.hash, operation_name, variables or {}, scope], sort_keys=True, default=str
+        )
+        digest = hashlib.sha256(request.encode()).hexdigest()
+        return {key: f"foobara:graphql:{digest}:{key}" for key in plan.ttls}
+
     async def execute(
         self,
-        query: str,
+        query: Optional[str] = None,
         variables: Optional[Dict[str, Any]] = None,
         operation_name: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
+        extensions: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Execute a GraphQL query.
 
-        This is a simple executor for basic use cases. For production,
-        consider using a full GraphQL library like Ariadne or Strawberry.
+        Supports automatic persisted queries: with a
+        ``{"persistedQuery": {"version": 1, "sha256Hash": ...}}`` extension
+        the query text may be omitted once the server has seen it. Unknown
+        hashes answer with a ``PERSISTED_QUERY_NOT_FOUND`` error, and the
+        client retries with the full query.
+
+        Resolvers can reach the request's entity loaders through
+        ``info.context["loaders"]``.
 
         Args:
-            query: GraphQL query string.
+            query: GraphQL query string (optional for persisted queries).
             variables: Query variables.
             operation_name: Name of operation to execute.
             context: Execution context.
+            extensions: Request extensions (``persistedQuery``).
 
         Returns:
             GraphQL result dictionary.
         """
+        if graphql_core is None:
+            if query is None:
+                return _request_error("Must provide a query", "BAD_REQUEST")
+            return await self._execute_simple(query, variables, context)
+
+        schema = self._executable_schema()
+        persisted = (extensions or {}).get("persistedQuery")
+        if persisted and self.config.persisted_queries:
+            query_hash = persisted.get("sha256Hash")
+            if query is None:
+                prepared = self._persisted(query_hash) if query_hash else None
+                if prepared is None:
+                    return _request_error("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            elif _query_hash(query) != query_hash:
+                return _request_error("provided sha does not match query", "BAD_REQUEST")
+            else:
+                prepared = self._prepare(schema, query, query_hash)
+        elif persisted:
+            return _request_error("PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED")
+        elif query is None:
+            return _request_error("Must provide a query", "BAD_REQUEST")
+        else:
+            prepared = self._prepare(schema, query, _query_hash(query))
+
+        if prepared.errors:
+            return {"errors": [error.formatted for error in prepared.errors]}
+
+        if operation_name is None and len(prepared.operations) == 1:
+            operation = prepared.operations[0]
+        else:
+            operation = operation_name
+        plan = prepared.plans.get(operation)
+        keys = None
+        hits: Dict[str, Any] = {}
+        if plan is not None:
+            keys = self._result_cache_keys(prepared, plan, variables, operation_name, context)
+        if keys is not None:
+            cache = self.config.result_cache or get_default_cache()
+            for key, cache_key in keys.items():
+                hit = cache.get(cache_key)
+                if hit is not None:
+                    hits[key] = hit[0]
+            if plan.complete and len(hits) == len(keys):
+                return {"data": {key: hits[key] for key in plan.order}}
+
+        # Cached root fields are served as they are; only the rest is executed
+        document = prepared.document
+        if hits:
+            document = _without_root_fields(document, operation, set(hits))
+
+        context_value = dict(context or {})
+        context_value["loaders"] = EntityLoaders()
+        result = graphql_execute(
+            schema,
+            document,
+            variable_values=variables,
+            operation_name=operation_name,
+            context_value=context_value,
+        )
+        if inspect.isawaitable(result):
+            result = await result
+
+        if keys is not None and result.data is not None:
+            failed = {error.path[0] for error in result.errors or [] if error.path}
+            for key, cache_key in keys.items():
+                if key in result.data and key not in failed:
+                    # Wrapped so that a cached null is told apart from a miss
+                    cache.set(cache_key, [result.data[key]], plan.ttls[key])
+
+        formatted = result.formatted
+        if hits and result.data is not None:
+            data = {}
+            for key in plan.order:
+                if key in hits:
+                    data[key] = hits[key]
+                elif key in result.data:
+                    data[key] = result.data[key]
+            data.update(result.data)  # root fields from fragments follow
+            formatted["data"] = data
+        return formatted
+
+    async def _execute_simple(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Single-field executor used when graphql-core is not installed."""
         import re
 
         variables = variables or {}
         context = context or {}
 
-        # Simple query parser (for basic cases)
-        # For production, use graphql-core or similar
         try:
             # Extract operation type and fields
             mutation_match = re.search(
@@ -498,7 +894,6 @@ class GraphQLConnector:
 
             field_name = field_match.group(1)
 
-            # Get resolver
             resolvers = self.register_resolvers()
             resolver = resolvers.get(operation_type, {}).get(field_name)
 
@@ -520,6 +915,202 @@ class GraphQLConnector:
             return {"errors": [{"message": str(e)}]}
 
 
+@dataclass
+class _CachePlan:
+    """Cacheable root fields of a query operation, by response key"""
+
+    ttls: Dict[str, Optional[int]]
+    # Every root selection is cacheable, so a full cache hit skips execution
+    complete: bool
+    # Response keys of all root fields, in query order
+    order: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _PreparedDocument:
+    """A parsed and validated query with its per-operation cache plans"""
+
+    hash: str
+    document: Any
+    errors: List[Any]
+    operations: List[Optional[str]] = field(default_factory=list)
+    plans: Dict[Optional[str], _CachePlan] = field(default_factory=dict)
+
+
+def _query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def _response_key(selection: Any) -> str:
+    return selection.alias.value if selection.alias else selection.name.value
+
+
+def _without_root_fields(document: Any, operation: Optional[str], keys: Set[str]) -> Any:
+    """Copy of a document whose operation no longer selects the given root fields."""
+    definitions = []
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode) and (
+            (definition.name.value if definition.name else None) == operation
+        ):
+            # Nodes are immutable in graphql-core 3.3, so the operation is rebuilt
+            attributes = {key: getattr(definition, key) for key in definition.keys}
+            attributes["selection_set"] = SelectionSetNode(
+                selections=tuple(
+                    selection
+                    for selection in definition.selection_set.selections
+                    if not (isinstance(selection, FieldNode) and _response_key(selection) in keys)
+                )
+            )
+            definition = OperationDefinitionNode(**attributes)
+        definitions.append(definition)
+    return DocumentNode(definitions=tuple(definitions))
+
+
+def _request_error(message: str, code: str) -> Dict[str, Any]:
+    return {"errors": [{"message": message, "extensions": {"code": code}}]}
+
+
+def _error_dicts(outcome: Any) -> List[Dict[str, Any]]:
+    return [
+        {
+            "key": str(err.symbol) if hasattr(err, "symbol") else "error",
+            "message": getattr(err, "message", None) or str(err),
+            "path": getattr(err, "path", None),
+            "category": getattr(err, "category", None),
+        }
+        for err in (outcome.errors or [])
+    ]
+
+
+def _resolver_value(command_class: Type[Command], outcome: Any) -> Any:
+    """Result as plain data, or an errors dict (external-server resolvers)"""
+    if outcome.is_success():
+        result = outcome.result
+        if isinstance(result, BaseModel):
+            return result.model_dump()
+        return result
+    return {"errors": _error_dicts(outcome)}
+
+
+def _field_value(command_class: Type[Command], outcome: Any) -> Any:
+    """JSON-compatible result, or GraphQLError carrying the command's errors"""
+    if outcome.is_success():
+        return default_outcome_encoder.to_jsonable(command_class, outcome.result)
+    errors = _error_dicts(outcome)
+    message = errors[0]["message"] if errors else f"{command_class.__name__} failed"
+    code = errors[0]["key"] if errors else "error"
+    raise GraphQLError(message, extensions={"code": code, "errors": errors})
+
+
+def _field_resolver(command_class: Type[Command]) -> Callable:
+    """Root field resolver; sync commands run in the default executor."""
+    if issubclass(command_class, AsyncCommand):
+        async def resolve_async(
+            root: Any, info: Any, input: Optional[Dict[str, Any]] = None
+        ) -> Any:
+            outcome = await command_class.run_async(**(input or {}))
+            return _field_value(command_class, outcome)
+        return resolve_async
+
+    def run(inputs: Dict[str, Any]) -> Any:
+        return _field_value(command_class, command_class.run(**inputs))
+
+    def resolve(root: Any, info: Any, input: Optional[Dict[str, Any]] = None) -> Any:
+        return asyncio.get_running_loop().run_in_executor(None, run, input or {})
+
+    return resolve
+
+
+def _association_resolver(association: Any) -> Callable:
+    """
+    Resolve a belongs-to field through the request's entity loader.
+
+    Parent values arrive JSON-encoded, so the foreign key is converted back
+    to the target's primary key type (UUID, datetime, ...) before loading.
+    """
+    foreign_key = association.foreign_key
+    pk_adapters: List[TypeAdapter] = []
+
+    def resolve(source: Any, info: Any) -> Any:
+        if isinstance(source, dict):
+            pk = source.get(foreign_key)
+        else:
+            pk = getattr(source, foreign_key, None)
+        if pk is None:
+            return None
+        entity_class = association._get_entity_class()
+        if not pk_adapters:
+            pk_field = entity_class.model_fields[entity_class._primary_key_field]
+            pk_adapters.append(TypeAdapter(pk_field.annotation))
+        try:
+            pk = pk_adapters[0].validate_python(pk)
+        except ValidationError:
+            return None
+        loader = info.context["loaders"].for_class(entity_class)
+        return _dump_entity(loader.load(pk))
+
+    return resolve
+
+
+async def _dump_entity(future: asyncio.Future) -> Optional[Dict[str, Any]]:
+    entity = await future
+    return None if entity is None else entity.model_dump(mode="json")
+
+
+def _selection_cost(
+    selection_set: Any, context: Any, depth: int, fragments: frozenset
+) -> Tuple[int, int]:
+    """(depth, field count) of a selection set, following fragments; skips introspection."""
+    deepest, count = 0, 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if selection.name.value.startswith("__"):
+                continue
+            count += 1
+            deepest = max(deepest, depth)
+            if selection.selection_set is not None:
+                sub_depth, sub_count = _selection_cost(
+                    selection.selection_set, context, depth + 1, fragments
+                )
+                deepest, count = max(deepest, sub_depth), count + sub_count
+            continue
+        if isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = context.get_fragment(name)
+            if fragment is None or name in fragments:
+                continue
+            sub_depth, sub_count = _selection_cost(
+                fragment.selection_set, context, depth, fragments | {name}
+            )
+        else:  # InlineFragmentNode
+            sub_depth, sub_count = _selection_cost(
+                selection.selection_set, context, depth, fragments
+            )
+        deepest, count = max(deepest, sub_depth), count + sub_count
+    return deepest, count
+
+
+def _query_cost_rule(max_depth: Optional[int], max_complexity: Optional[int]) -> type:
+    """Validation rule rejecting operations over the depth or complexity limit."""
+
+    class QueryCostRule(ValidationRule):
+        def enter_operation_definition(self, node: Any, *args: Any) -> None:
+            depth, complexity = _selection_cost(node.selection_set, self.context, 1, frozenset())
+            if max_depth is not None and depth > max_depth:
+                self.report_error(
+                    GraphQLError(f"Query depth {depth} exceeds the maximum of {max_depth}", node)
+                )
+            if max_complexity is not None and complexity > max_complexity:
+                self.report_error(
+                    GraphQLError(
+                        f"Query complexity {complexity} exceeds the maximum of {max_complexity}",
+                        node,
+                    )
+                )
+
+    return QueryCostRule
+
+
 def create_ariadne_schema(
     registry: Optional[CommandRegistry] = None,
     config: Optional[GraphQLConfig] = None,
@@ -11,6 +11,10 @@ Features:
 - Error handling with proper HTTP status codes
 - Command manifest endpoint
 - Authentication middleware support
+- Sync commands run on a bounded worker pool, off the event loop
+- Optional batch endpoint running many commands in one request
+- Iterator / async generator results streamed as NDJSON or chunked JSON
+- Admission control: overloaded commands are shed with 429/503 and Retry-After
 
 Usage:
     from fastapi import FastAPI
@@ -29,16 +33,29 @@ Usage:
     # Run with: uvicorn myapp:app
 """
 
+import asyncio
 import json
 import logging
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack, ExitStack
 from dataclasses import dataclass, field
 from enum import IntEnum
 from functools import wraps
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
 
+from foobara_py.core.admission import AdmissionController, AdmissionRejectedError
 from foobara_py.core.command import AsyncCommand, Command
 from foobara_py.core.outcome import CommandOutcome
+from foobara_py.core.streaming import StreamingResult, as_stream
 from foobara_py.domain.domain import Domain, Organization
+from foobara_py.serializers.outcome_encoder import (
+    default_outcome_encoder,
+    format_error,
+    merge_json,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,8 +70,11 @@ class HTTPStatus(IntEnum):
     UNAUTHORIZED = 401
     FORBIDDEN = 403
     NOT_FOUND = 404
+    PAYLOAD_TOO_LARGE = 413
     UNPROCESSABLE_ENTITY = 422
+    TOO_MANY_REQUESTS = 429
     INTERNAL_SERVER_ERROR = 500
+    SERVICE_UNAVAILABLE = 503
 
 
 @dataclass(slots=True)
@@ -69,6 +89,11 @@ class RouteConfig:
     operation_id: Optional[str] = None
     deprecated: bool = False
     include_in_schema: bool = True
+    max_concurrency: Optional[int] = None
+    # Safe to run concurrently with other items of a batch request
+    independent: bool = False
+    # Wire format for iterator results: "ndjson" or "json" (chunked array)
+    stream_format: str = "ndjson"
 
 
 @dataclass(slots=True)
@@ -80,6 +105,255 @@ class AuthConfig:
     scopes: List[str] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class BatchConfig:
+    """
+    Configuration for the ``POST {prefix}/batch`` endpoint.
+
+    The request body is a JSON array of ``{"command", "inputs", "id"}`` items.
+    Async commands and commands whose RouteConfig is marked ``independent``
+    run concurrently; the rest run one after another in request order.
+    """
+
+    enabled: bool = True
+    path: str = "/batch"
+    max_batch_size: int = 50
+    timeout: Optional[float] = 30.0  # Total time budget in seconds
+
+
+@dataclass(slots=True)
+class WorkerPoolConfig:
+    """
+    How sync (non-async) commands are executed.
+
+    Modes:
+        - "pool": run on a bounded thread pool owned by the connector, with
+          per-route concurrency limits and queue-depth metrics (default)
+        - "starlette": register plain ``def`` handlers so Starlette's own
+          threadpool runs them
+        - "inline": run on the event loop (only for trivially cheap commands)
+    """
+
+    mode: str = "pool"
+    max_workers: Optional[int] = None
+    max_concurrency: Optional[int] = None
+    thread_name_prefix: str = "foobara-http"
+
+
+@dataclass(slots=True)
+class RouteWorkerStats:
+    """Worker pool counters for a single route"""
+
+    limit: Optional[int] = None
+    queued: int = 0
+    in_flight: int = 0
+    completed: int = 0
+    max_queued: int = 0
+
+
+class SyncWorkerPool:
+    """
+    Bounded thread pool for running sync commands from async handlers.
+
+    Each route may cap how many of its calls run at once; calls over the cap
+    wait on an asyncio semaphore without holding a worker thread. A call
+    counts as queued from the moment it is submitted until a worker thread
+    picks it up.
+    """
+
+    __slots__ = (
+        "max_workers",
+        "max_concurrency",
+        "thread_name_prefix",
+        "_executor",
+        "_stats",
+        "_semaphores",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        thread_name_prefix: str = "foobara-http",
+    ):
+        # Same default as ThreadPoolExecutor, resolved here so metrics can report it
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_concurrency = max_concurrency
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats: Dict[str, RouteWorkerStats] = {}
+        # asyncio semaphores are bound to the loop they first wait on
+        self._semaphores: "weakref.WeakKeyDictionary[Any, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: WorkerPoolConfig) -> "SyncWorkerPool":
+        return cls(config.max_workers, config.max_concurrency, config.thread_name_prefix)
+
+    def add_route(self, name: str, limit: Optional[int] = None) -> None:
+        """Declare a route and its concurrency limit (falls back to the pool default)"""
+        with self._lock:
+            stats = self._stats.setdefault(name, RouteWorkerStats())
+            stats.limit = limit if limit is not None else self.max_concurrency
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix,
+                    )
+        return self._executor
+
+    def _semaphore_for(self, name: str, limit: Optional[int]) -> Optional[asyncio.Semaphore]:
+        if not limit:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            per_loop = self._semaphores.setdefault(loop, {})
+            semaphore = per_loop.get(name)
+            if semaphore is None:
+                semaphore = per_loop[name] = asyncio.Semaphore(limit)
+        return semaphore
+
+    async def run(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) on a worker thread, honoring the route's limit"""
+        with self._lock:
+            stats = self._stats.setdefault(name, RouteWorkerStats(limit=self.max_concurrency))
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+        dequeued = False
+
+        def leave_queue() -> bool:
+            nonlocal dequeued
+            with self._lock:
+                if dequeued:
+                    return False
+                dequeued = True
+                stats.queued -= 1
+                return True
+
+        def call() -> Any:
+            leave_queue()
+            with self._lock:
+                stats.in_flight += 1
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    stats.in_flight -= 1
+                    stats.completed += 1
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore_for(name, stats.limit)
+        try:
+            if semaphore is None:
+                return await loop.run_in_executor(self._get_executor(), call)
+            async with semaphore:
+                return await loop.run_in_executor(self._get_executor(), call)
+        finally:
+            # Cancelled before a worker picked it up
+            leave_queue()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of pool size and per-route queue depth / in-flight counts"""
+        with self._lock:
+            routes = {
+                name: {
+                    "limit": stats.limit,
+                    "queued": stats.queued,
+                    "in_flight": stats.in_flight,
+                    "completed": stats.completed,
+                    "max_queued": stats.max_queued,
+                }
+                for name, stats in self._stats.items()
+            }
+        return {
+            "max_workers": self.max_workers,
+            "queued": sum(route["queued"] for route in routes.values()),
+            "in_flight": sum(route["in_flight"] for route in routes.values()),
+            "routes": routes,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads; the pool restarts lazily on next use"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def stream_response(
+    stream: StreamingResult,
+    stream_format: str = "ndjson",
+    run_sync: Optional[Callable[..., Awaitable[Any]]] = None,
+    held: Optional[Union[ExitStack, AsyncExitStack]] = None,
+) -> Any:
+    """
+    Build a StreamingResponse for a streaming command result.
+
+    Items are encoded as they are produced, as NDJSON (one JSON value per
+    line) or as a chunked JSON array. Starlette awaits each write, so the next
+    chunk is only pulled from the source once the client has taken the last.
+
+    ``held`` (e.g. an admission slot) is closed once the body is done.
+    """
+    from fastapi.responses import StreamingResponse
+
+    encode = default_outcome_encoder.encode_result
+    as_array = stream_format == "json"
+
+    async def body():
+        first = True
+        try:
+            if as_array:
+                yield b"["
+            async for chunk in stream.aiter_chunks(run_sync=run_sync):
+                encoded = [encode(None, item) for item in chunk]
+                if as_array:
+                    yield (b"" if first else b",") + b",".join(encoded)
+                    first = False
+                else:
+                    yield b"\n".join(encoded) + b"\n"
+            if as_array:
+                yield b"]"
+        finally:
+            stream.close()
+            if isinstance(held, AsyncExitStack):
+                await held.aclose()
+            elif held is not None:
+                held.close()
+
+    media_type = "application/json" if as_array else "application/x-ndjson"
+    return StreamingResponse(body(), media_type=media_type)
+
+
+def _inline_schema(model: Type[Any]) -> Dict[str, Any]:
+    """JSON schema for model with local $defs inlined (route-level OpenAPI has no $defs)"""
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def resolve(node: Any, expanding: tuple) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                name = ref[len("#/$defs/"):]
+                if name in expanding:
+                    # Recursive model: stop expanding
+                    return {"type": "object", "title": name}
+                return resolve(defs[name], expanding + (name,))
+            return {key: resolve(value, expanding) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(item, expanding) for item in node]
+        return node
+
+    return resolve(schema, ())
+
+
 class CommandRoute:
     """
     Wrapper for a command exposed as an HTTP route.
@@ -132,6 +406,56 @@ class CommandRoute:
             logger.exception(f"Error executing {self.command_class.full_name()}")
             return {"success": False, "errors": [{"message": str(e), "symbol": "internal_error"}]}
 
+    def execute_encoded(self, inputs: Dict[str, Any]) -> Tuple[bool, bytes]:
+        """Execute the command and return (success, encoded JSON response body)"""
+        try:
+            outcome = self.command_class.run(**inputs)
+            return outcome.is_success(), self._encode_response(outcome)
+        except Exception as e:
+            logger.exception(f"Error executing {self.command_class.full_name()}")
+            return False, self._encode_internal_error(e)
+
+    async def execute_encoded_async(self, inputs: Dict[str, Any]) -> Tuple[bool, bytes]:
+        """Async variant of execute_encoded()"""
+        try:
+            if issubclass(self.command_class, AsyncCommand):
+                outcome = await self.command_class.run(**inputs)
+            else:
+                outcome = self.command_class.run(**inputs)
+            return outcome.is_success(), self._encode_response(outcome)
+        except Exception as e:
+            logger.exception(f"Error executing {self.command_class.full_name()}")
+            return False, self._encode_internal_error(e)
+
+    def execute_json(self, body: Union[str, bytes]) -> Tuple[bool, Union[bytes, StreamingResult]]:
+        """
+        Execute the command from a raw JSON body (validated once).
+
+        Returns:
+            (success, encoded JSON response body), or (True, StreamingResult)
+            when the command returned an iterator
+        """
+        try:
+            outcome = self.command_class.run_json(body)
+            return outcome.is_success(), self._encode_or_stream(outcome)
+        except Exception as e:
+            logger.exception(f"Error executing {self.command_class.full_name()}")
+            return False, self._encode_internal_error(e)
+
+    async def execute_json_async(
+        self, body: Union[str, bytes]
+    ) -> Tuple[bool, Union[bytes, StreamingResult]]:
+        """Async variant of execute_json()"""
+        try:
+            if issubclass(self.command_class, AsyncCommand):
+                outcome = await self.command_class.run_json(body)
+            else:
+                outcome = self.command_class.run_json(body)
+            return outcome.is_success(), self._encode_or_stream(outcome)
+        except Exception as e:
+            logger.exception(f"Error executing {self.command_class.full_name()}")
+            return False, self._encode_internal_error(e)
+
     async def execute_async(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Execute async command and return response dict"""
         try:
@@ -156,16 +480,25 @@ class CommandRoute:
 
             return {"success": True, "result": result}
         else:
-            errors = []
-            for error in outcome.errors:
-                err_dict = {"symbol": getattr(error, "symbol", "error"), "message": str(error)}
-                if hasattr(error, "path") and error.path:
-                    err_dict["path"] = error.path
-                if hasattr(error, "context") and error.context:
-                    err_dict["context"] = error.context
-                errors.append(err_dict)
+            return {"success": False, "errors": [format_error(error) for error in outcome.errors]}
+
+    def _encode_response(self, outcome: CommandOutcome) -> bytes:
+        """Encode command outcome straight to JSON bytes (same shape as _format_response)"""
+        return default_outcome_encoder.encode_outcome(self.command_class, outcome)
 
-            return {"success": False, "errors": errors}
+    def _encode_or_stream(self, outcome: CommandOutcome) -> Union[bytes, StreamingResult]:
+        """Encode the outcome, or hand back a streaming result untouched"""
+        if outcome.is_success():
+            stream = as_stream(outcome.result)
+            if stream is not None:
+                return stream
+        return self._encode_response(outcome)
+
+    @staticmethod
+    def _encode_internal_error(error: Exception) -> bytes:
+        return default_outcome_encoder.encode_errors(
+            [{"message": str(error), "symbol": "internal_error"}]
+        )
 
 
 class HTTPConnector:
@@ -214,6 +547,10 @@ class HTTPConnector:
         "_middleware",
         "_manifest_enabled",
         "_health_enabled",
+        "_worker_config",
+        "_worker_pool",
+        "_batch_config",
+        "_admission",
     )
 
     def __init__(
@@ -223,6 +560,9 @@ class HTTPConnector:
         auth_config: Optional[AuthConfig] = None,
         manifest_enabled: bool = True,
         health_enabled: bool = True,
+        worker_pool: Optional[WorkerPoolConfig] = None,
+        batch: Optional[BatchConfig] = None,
+        admission: Optional[AdmissionController] = None,
     ):
         """
         Initialize HTTP connector.
@@ -233,6 +573,9 @@ class HTTPConnector:
             auth_config: Default authentication config for all routes
             manifest_enabled: Enable /manifest endpoint
             health_enabled: Enable /health endpoint
+            worker_pool: How sync commands are run (defaults to a bounded pool)
+            batch: Enable the batch endpoint (disabled when None)
+            admission: Admission limits applied before commands run
         """
         self._app = app
         self._routes: Dict[str, CommandRoute] = {}
@@ -241,6 +584,12 @@ class HTTPConnector:
         self._middleware: List[Callable] = []
         self._manifest_enabled = manifest_enabled
         self._health_enabled = health_enabled
+        self._worker_config = worker_pool or WorkerPoolConfig()
+        if self._worker_config.mode not in ("pool", "starlette", "inline"):
+            raise ValueError(f"Unknown worker pool mode: {self._worker_config.mode}")
+        self._worker_pool = SyncWorkerPool.from_config(self._worker_config)
+        self._batch_config = batch
+        self._admission = admission or AdmissionController()
 
         if app is not None:
             self._setup_builtin_routes()
@@ -268,6 +617,8 @@ class HTTPConnector:
         route = CommandRoute(command_class, config, effective_auth)
         name = command_class.full_name()
         self._routes[name] = route
+        if not issubclass(command_class, AsyncCommand):
+            self._worker_pool.add_route(name, route.config.max_concurrency)
 
         if self._app is not None:
             self._add_route(route)
@@ -335,10 +686,13 @@ class HTTPConnector:
         return self
 
     def _setup_builtin_routes(self) -> None:
-        """Setup built-in routes (manifest, health)"""
+        """Setup built-in routes (manifest, health, batch)"""
         if self._manifest_enabled:
             self._add_manifest_routes()
 
+        if self._batch_config is not None and self._batch_config.enabled:
+            self._add_batch_route()
+
         if self._health_enabled:
             self._add_health_route()
 
@@ -393,37 +747,263 @@ class HTTPConnector:
         except ImportError:
             logger.warning("FastAPI not installed, skipping health route")
 
+    def _add_batch_route(self) -> None:
+        """Add the batch endpoint, authenticated once with the connector's auth config"""
+        try:
+            from fastapi import Depends, Request
+            from fastapi.responses import Response
+
+            config = self._batch_config
+            dependencies = []
+            auth = self._auth_config
+            if auth and auth.enabled and auth.dependency:
+                dependencies.append(Depends(auth.dependency))
+
+            async def batch_handler(request: Request) -> Response:
+                """Execute several commands in one request"""
+                try:
+                    items = json.loads(await request.body())
+                except ValueError as e:
+                    return self._batch_error(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+                if not isinstance(items, list):
+                    return self._batch_error(HTTPStatus.BAD_REQUEST, "Batch must be a JSON array")
+                if len(items) > config.max_batch_size:
+                    return self._batch_error(
+                        HTTPStatus.PAYLOAD_TOO_LARGE,
+                        f"Batch has {len(items)} items, max is {config.max_batch_size}",
+                    )
+
+                results = await self._run_batch(items)
+                return Response(
+                    content=b'{"results":[' + b",".join(results) + b"]}",
+                    media_type="application/json",
+                )
+
+            self._app.post(
+                f"{self._prefix}{config.path}",
+                tags=["Batch"],
+                summary="Execute a batch of commands",
+                dependencies=dependencies or None,
+                openapi_extra={
+                    "requestBody": {
+                        "required": True,
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "maxItems": config.max_batch_size,
+                                    "items": {
+                                        "type": "object",
+                                        "required": ["command"],
+                                        "properties": {
+                                            "command": {"type": "string"},
+                                            "inputs": {"type": "object"},
+                                            "id": {},
+                                        },
+                                    },
+                                }
+                            }
+                        },
+                    }
+                },
+            )(batch_handler)
+
+        except ImportError:
+            logger.warning("FastAPI not installed, skipping batch route")
+
+    @staticmethod
+    def _overloaded_response(error: AdmissionRejectedError) -> Any:
+        from fastapi.responses import Response
+
+        return Response(
+            content=default_outcome_encoder.encode_errors([error.to_error()]),
+            status_code=error.status,
+            headers={"Retry-After": error.retry_after_header},
+            media_type="application/json",
+        )
+
+    @staticmethod
+    def _batch_error(status: int, message: str) -> Any:
+        from fastapi.responses import Response
+
+        body = default_outcome_encoder.encode_errors([{"message": message, "symbol": "invalid_batch"}])
+        return Response(content=body, status_code=status, media_type="application/json")
+
+    async def _run_batch(self, items: List[Any]) -> List[bytes]:
+        """
+        Run batch items and return one encoded result object per item, in order.
+
+        Items that do not finish within the time budget report a timeout error.
+        """
+        results: List[Optional[bytes]] = [None] * len(items)
+        concurrent: List[Any] = []
+        sequential: List[Any] = []
+
+        for index, item in enumerate(items):
+            item_id = item.get("id", index) if isinstance(item, dict) else index
+            route, error = self._batch_route_for(item)
+            if error is not None:
+                results[index] = self._batch_item(item_id, item, error)
+            elif issubclass(route.command_class, AsyncCommand) or route.config.independent:
+                concurrent.append((index, item_id, item, route))
+            else:
+                sequential.append((index, item_id, item, route))
+
+        async def run_item(index: int, item_id: Any, item: Dict[str, Any], route: CommandRoute):
+            inputs = item.get("inputs") or {}
+            try:
+                async with self._admission.admit_async(route.command_class):
+                    if issubclass(route.command_class, AsyncCommand):
+                        _, body = await route.execute_encoded_async(inputs)
+                    elif self._worker_config.mode == "inline":
+                        _, body = route.execute_encoded(inputs)
+                    else:
+                        name = route.command_class.full_name()
+                        _, body = await self._worker_pool.run(name, route.execute_encoded, inputs)
+            except AdmissionRejectedError as e:
+                body = default_outcome_encoder.encode_errors([e.to_error()])
+            results[index] = self._batch_item(item_id, item, body)
+
+        async def run_sequential():
+            for entry in sequential:
+                await run_item(*entry)
+
+        tasks = [asyncio.ensure_future(run_item(*entry)) for entry in concurrent]
+        if sequential:
+            tasks.append(asyncio.ensure_future(run_sequential()))
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self._batch_config.timeout)
+            for task in pending:
+                task.cancel()
+
+        timeout_error = default_outcome_encoder.encode_errors(
+            [{"message": "Batch time budget exceeded", "symbol": "timeout"}]
+        )
+        return [
+            result if result is not None else self._batch_item(
+                items[index].get("id", index), items[index], timeout_error
+            )
+            for index, result in enumerate(results)
+        ]
+
+    def _batch_route_for(self, item: Any) -> Tuple[Optional[CommandRoute], Optional[bytes]]:
+        """Resolve an item to its route, or an encoded error"""
+
+        def error(symbol: str, message: str) -> Tuple[None, bytes]:
+            return None, default_outcome_encoder.encode_errors(
+                [{"message": message, "symbol": symbol}]
+            )
+
+        if not isinstance(item, dict) or not isinstance(item.get("command"), str):
+            return error("invalid_request", "Batch items need a command name")
+        if not isinstance(item.get("inputs", {}), (dict, type(None))):
+            return error("invalid_request", "Batch item inputs must be an object")
+
+        route = self._routes.get(item["command"])
+        if route is None:
+            return error("not_found", f"Command not found: {item['command']}")
+
+        # The batch is authenticated once with the connector's auth config;
+        # routes guarded by a different dependency must be called directly
+        auth = route.auth_config
+        default = self._auth_config
+        if auth and auth.enabled and auth.dependency:
+            if not (default and default.enabled and default.dependency is auth.dependency):
+                return error("forbidden", f"{item['command']} cannot be called in a batch")
+        return route, None
+
+    @staticmethod
+    def _batch_item(item_id: Any, item: Any, body: bytes) -> bytes:
+        command = item.get("command") if isinstance(item, dict) else None
+        return merge_json({"id": item_id, "command": command}, body)
+
     def _add_route(self, route: CommandRoute) -> None:
         """Add a command route to the FastAPI app"""
         try:
-            from fastapi import APIRouter, Depends
-            from fastapi.responses import JSONResponse
-            from pydantic import BaseModel
+            from fastapi import Depends, Request
+            from fastapi.responses import JSONResponse, Response
 
             config = route.config
             path = f"{self._prefix}{config.path}"
 
-            # Create request model from command inputs
+            # The body is validated once, by the command, so FastAPI only sees
+            # raw bytes; the inputs schema is still published for OpenAPI
             inputs_type = route.command_class.inputs_type()
 
+            async def read_body(request: Request) -> bytes:
+                return await request.body()
+
+            if self._worker_config.mode == "pool":
+                pool = self._worker_pool
+                name = route.command_class.full_name()
+
+                async def run_sync(func: Callable[..., Any], *args: Any) -> Any:
+                    return await pool.run(name, func, *args)
+            else:
+                run_sync = None
+
+            command_class = route.command_class
+            admission = self._admission
+
+            def json_response(
+                slot: Union[ExitStack, AsyncExitStack],
+                success: bool,
+                payload: Union[bytes, StreamingResult],
+            ) -> Response:
+                if isinstance(payload, StreamingResult):
+                    # The admission slot stays taken until the body is sent
+                    held = slot.pop_all()
+                    return stream_response(payload, config.stream_format, run_sync, held)
+                # Payload is already encoded; skip JSONResponse's json.dumps
+                status = HTTPStatus.OK if success else HTTPStatus.UNPROCESSABLE_ENTITY
+                return Response(content=payload, status_code=status, media_type="application/json")
+
             # Build dependencies list
             dependencies = []
             if route.auth_config and route.auth_config.enabled and route.auth_config.dependency:
                 dependencies.append(Depends(route.auth_config.dependency))
 
             # Create the endpoint handler
-            if issubclass(route.command_class, AsyncCommand):
-
-                async def handler(inputs: inputs_type, _route=route) -> JSONResponse:
-                    result = await _route.execute_async(inputs.model_dump())
-                    status = HTTPStatus.OK if result["success"] else HTTPStatus.UNPROCESSABLE_ENTITY
-                    return JSONResponse(content=result, status_code=status)
+            # Admission happens before a worker thread is taken, so queued
+            # requests wait on the event loop rather than in the pool
+            if issubclass(command_class, AsyncCommand):
+
+                async def handler(body: bytes = Depends(read_body), _route=route) -> Response:
+                    try:
+                        async with AsyncExitStack() as slot:
+                            await slot.enter_async_context(admission.admit_async(command_class))
+                            return json_response(slot, *await _route.execute_json_async(body))
+                    except AdmissionRejectedError as e:
+                        return self._overloaded_response(e)
+            elif self._worker_config.mode == "starlette":
+
+                def handler(body: bytes = Depends(read_body), _route=route) -> Response:
+                    try:
+                        with ExitStack() as slot:
+                            slot.enter_context(admission.admit(command_class))
+                            return json_response(slot, *_route.execute_json(body))
+                    except AdmissionRejectedError as e:
+                        return self._overloaded_response(e)
+            elif self._worker_config.mode == "inline":
+
+                async def handler(body: bytes = Depends(read_body), _route=route) -> Response:
+                    try:
+                        async with AsyncExitStack() as slot:
+                            await slot.enter_async_context(admission.admit_async(command_class))
+                            return json_response(slot, *_route.execute_json(body))
+                    except AdmissionRejectedError as e:
+                        return self._overloaded_response(e)
             else:
 
-                async def handler(inputs: inputs_type, _route=route) -> JSONResponse:
-                    result = _route.execute(inputs.model_dump())
-                    status = HTTPStatus.OK if result["success"] else HTTPStatus.UNPROCESSABLE_ENTITY
-                    return JSONResponse(content=result, status_code=status)
+                async def handler(body: bytes = Depends(read_body), _route=route) -> Response:
+                    try:
+                        async with AsyncExitStack() as slot:
+                            await slot.enter_async_context(admission.admit_async(command_class))
+                            result = await pool.run(name, _route.execute_json, body)
+                            return json_response(slot, *result)
+                    except AdmissionRejectedError as e:
+                        return self._overloaded_response(e)
 
             # Add route based on method
             method = config.method.upper()
@@ -437,6 +1017,12 @@ class HTTPConnector:
                 "deprecated": config.deprecated,
                 "include_in_schema": config.include_in_schema,
                 "dependencies": dependencies or None,
+                "openapi_extra": {
+                    "requestBody": {
+                        "required": True,
+                        "content": {"application/json": {"schema": _inline_schema(inputs_type)}},
+                    }
+                },
             }
 
             if method == "POST":
@@ -530,7 +1116,11 @@ class HTTPConnector:
                     {"message": f"Command not found: {command_name}", "symbol": "not_found"}
                 ],
             }
-        return route.execute(inputs)
+        try:
+            with self._admission.admit(route.command_class):
+                return route.execute(inputs)
+        except AdmissionRejectedError as e:
+            return {"success": False, "errors": [e.to_error()]}
 
     async def execute_async(self, command_name: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -551,7 +1141,34 @@ class HTTPConnector:
                     {"message": f"Command not found: {command_name}", "symbol": "not_found"}
                 ],
             }
-        return await route.execute_async(inputs)
+        try:
+            async with self._admission.admit_async(route.command_class):
+                if self._worker_config.mode == "pool" and not issubclass(
+                    route.command_class, AsyncCommand
+                ):
+                    return await self._worker_pool.run(command_name, route.execute, inputs)
+                return await route.execute_async(inputs)
+        except AdmissionRejectedError as e:
+            return {"success": False, "errors": [e.to_error()]}
+
+    def worker_metrics(self) -> Dict[str, Any]:
+        """
+        Get worker pool metrics for sync commands.
+
+        Returns:
+            Dict with pool size, total queued/in-flight calls and per-route
+            counters (limit, queued, in_flight, completed, max_queued)
+        """
+        return self._worker_pool.metrics()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the sync worker pool (e.g. from an app shutdown hook)"""
+        self._worker_pool.shutdown(wait=wait)
+
+    @property
+    def admission(self) -> AdmissionController:
+        """Admission limits for registered commands (configure with ``limit()``)"""
+        return self._admission
 
     @property
     def routes(self) -> Dict[str, CommandRoute]:
@@ -0,0 +1,807 @@
+"""
+Local job connector for Foobara commands.
+
+Runs commands in the background without Celery or a broker: jobs go into an
+in-process priority queue and are executed by a thread pool, a process pool
+or asyncio workers. The surface mirrors ``CeleryConnector`` (execute_async,
+get_result, revoke) and ``CeleryScheduler`` (schedule, unschedule,
+list_schedules), so code can move between the two.
+
+Failed runs are retried with ``RetryConfig`` back-off when one of their
+errors is retryable under that config; exceptions escaping the command
+itself are always retried. Jobs can be persisted to a SQLite file so queued
+work survives a restart.
+
+Usage:
+    connector = LocalJobConnector(registry, LocalJobConfig(workers=8))
+    job = connector.execute_async("SendEmail", {"to": "ann@example.com"}, priority=5)
+    result = connector.wait(job.job_id, timeout=10)
+
+    LocalScheduler(connector).schedule("CleanupExpiredSessions", interval=3600)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import json
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Type, Union
+
+from foobara_py.connectors.celery_connector import JobResult, JobStatus, ScheduleConfig
+from foobara_py.core.command import AsyncCommand, Command
+from foobara_py.core.error_recovery import RetryConfig
+from foobara_py.core.errors import FoobaraError
+from foobara_py.core.registry import CommandRegistry
+from foobara_py.serializers.outcome_encoder import default_outcome_encoder
+
+_UNFINISHED = (JobStatus.PENDING, JobStatus.STARTED, JobStatus.RETRY)
+
+
+@dataclass
+class LocalJobConfig:
+    """Configuration for the local job connector."""
+
+    # Worker kind: "thread", "process" or "asyncio"
+    executor: str = "thread"
+
+    # Jobs running at once
+    workers: int = 4
+
+    # Retry attempts and back-off for failed runs
+    retry: RetryConfig = field(default_factory=RetryConfig)
+
+    # SQLite file for durable jobs (None keeps jobs in memory only)
+    persistence_path: Optional[str] = None
+
+    # Finished jobs kept in memory for get_result
+    max_finished_jobs: int = 10_000
+
+
+class _Job:
+    """A queued job and its scheduling state."""
+
+    __slots__ = ("result", "priority", "eta", "expires", "done")
+
+    def __init__(
+        self,
+        result: JobResult,
+        priority: int = 0,
+        eta: float = 0.0,
+        expires: Optional[float] = None,
+    ):
+        self.result = result
+        self.priority = priority
+        self.eta = eta
+        self.expires = expires
+        self.done = threading.Event()
+
+
+@dataclass
+class _Schedule:
+    name: str
+    command_name: str
+    config: ScheduleConfig
+    next_run: float
+
+
+class SQLiteJobStore:
+    """Durable job records in a SQLite file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS foobara_jobs (
+                job_id TEXT PRIMARY KEY,
+                command_name TEXT NOT NULL,
+                inputs TEXT NOT NULL,
+                status TEXT NOT NULL,
+                priority INTEGER NOT NULL,
+                eta REAL NOT NULL,
+                expires REAL,
+                result TEXT,
+                error TEXT,
+                traceback TEXT,
+                retries INTEGER NOT NULL,
+                started_at TEXT,
+                completed_at TEXT
+            )
+            """
+        )
+
+    def save(self, job: _Job) -> None:
+        """Insert or update a job record."""
+        r = job.result
+        row = (
+            r.job_id,
+            r.command_name,
+            json.dumps(r.inputs),
+            r.status.value,
+            job.priority,
+            job.eta,
+            job.expires,
+            json.dumps(r.result),
+            r.error,
+            r.traceback,
+            r.retries,
+            r.started_at.isoformat() if r.started_at else None,
+            r.completed_at.isoformat() if r.completed_at else None,
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO foobara_jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+
+    def load(self, job_id: str) -> Optional[_Job]:
+        """Load one job, or None if it is unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM foobara_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return None if row is None else self._job(row)
+
+    def unfinished(self) -> List[_Job]:
+        """Jobs that were queued, retrying or running when the process stopped."""
+        statuses = [status.value for status in _UNFINISHED]
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM foobara_jobs WHERE status IN (?, ?, ?)", statuses
+            ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _job(row: Tuple[Any, ...]) -> _Job:
+        (job_id, command_name, inputs, status, priority, eta, expires,
+         result, error, tb, retries, started_at, completed_at) = row
+        return _Job(
+            JobResult(
+                job_id=job_id,
+                status=JobStatus(status),
+                command_name=command_name,
+                inputs=json.loads(inputs),
+                result=json.loads(result) if result is not None else None,
+                error=error,
+                traceback=tb,
+                started_at=datetime.fromisoformat(started_at) if started_at else None,
+                completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+                retries=retries,
+            ),
+            priority=priority,
+            eta=eta,
+            expires=expires,
+        )
+
+
+def _execute_job(
+    command_class: Type[Command],
+    inputs: Dict[str, Any],
+    retry: RetryConfig,
+) -> Tuple[bool, Any, bool, Optional[str]]:
+    """Run a command in a worker thread or process.
+
+    Returns (success, result or error, retryable, traceback).
+    """
+    try:
+        outcome = command_class.run(**inputs)
+        if asyncio.iscoroutine(outcome):
+            outcome = asyncio.run(outcome)
+    except Exception as e:
+        return False, str(e), True, traceback.format_exc()
+    return _outcome_entry(command_class, outcome, retry)
+
+
+async def _execute_job_async(
+    command_class: Type[Command],
+    inputs: Dict[str, Any],
+    retry: RetryConfig,
+) -> Tuple[bool, Any, bool, Optional[str]]:
+    """Run a command on the worker event loop; sync commands use its executor."""
+    try:
+        if issubclass(command_class, AsyncCommand):
+            outcome = await command_class.run(**inputs)
+        else:
+            loop = asyncio.get_running_loop()
+            outcome = await loop.run_in_executor(None, partial(command_class.run, **inputs))
+    except Exception as e:
+        return False, str(e), True, traceback.format_exc()
+    return _outcome_entry(command_class, outcome, retry)
+
+
+def _outcome_entry(
+    command_class: Type[Command],
+    outcome: Any,
+    retry: RetryConfig,
+) -> Tuple[bool, Any, bool, Optional[str]]:
+    if outcome.is_success():
+        return True, default_outcome_encoder.to_jsonable(command_class, outcome.result), False, None
+    errors = outcome.errors or []
+    retryable = any(isinstance(err, FoobaraError) and retry.is_retryable(err) for err in errors)
+    return False, [
+        {
+            "key": str(getattr(err, "symbol", "error")),
+            "message": getattr(err, "message", None) or str(err),
+        }
+        for err in errors
+    ], retryable, None
+
+
+class LocalJobConnector:
+    """In-process job connector with the CeleryConnector surface.
+
+    Jobs wait in a priority queue (higher priority first, FIFO within a
+    priority) and a dispatcher thread hands them to the workers, never
+    more than ``workers`` at a time so priorities hold under load.
+
+    Example:
+        connector = LocalJobConnector(registry)
+
+        job = connector.execute_async("CreateUser", {"name": "John"})
+        result = connector.wait(job.job_id)
+        print(result.status, result.result)
+    """
+
+    def __init__(
+        self,
+        registry: Optional[CommandRegistry] = None,
+        config: Optional[LocalJobConfig] = None,
+    ):
+        """Initialize the connector.
+
+        Args:
+            registry: Command registry to use.
+            config: Local job configuration.
+
+        Raises:
+            ValueError: If the executor kind is unknown.
+        """
+        self.registry = registry or CommandRegistry()
+        self.config = config or LocalJobConfig()
+        if self.config.executor not in ("thread", "process", "asyncio"):
+            raise ValueError(f"Unknown executor: {self.config.executor}")
+
+        self._cond = threading.Condition()
+        self._jobs: Dict[str, _Job] = {}
+        self._finished: Deque[str] = deque()
+        self._ready: List[Tuple[int, int, str]] = []  # (-priority, seq, job_id)
+        self._delayed: List[Tuple[float, int, str]] = []  # (eta, seq, job_id)
+        self._seq = itertools.count()
+        self._schedules: Dict[str, _Schedule] = {}
+        self._slots = threading.Semaphore(self.config.workers)
+        self._active = 0
+        self._executor: Optional[Union[ThreadPoolExecutor, ProcessPoolExecutor]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        self._running = False
+
+        self._store: Optional[SQLiteJobStore] = None
+        if self.config.persistence_path:
+            self._store = SQLiteJobStore(self.config.persistence_path)
+            self._recover()
+
+    def __enter__(self) -> "LocalJobConnector":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+    def start(self) -> None:
+        """Start the workers; called on first use."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+
+        kind = self.config.executor
+        if kind == "thread":
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.workers, thread_name_prefix="foobara-jobs"
+            )
+        elif kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=self.config.workers)
+        else:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name="foobara-jobs-loop", daemon=True
+            )
+            self._loop_thread.start()
+
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="foobara-jobs-dispatcher", daemon=True
+        )
+        self._dispatcher.start()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop dispatching; queued jobs stay queued (and persisted).
+
+        Args:
+            wait: Wait for running jobs to finish.
+        """
+        with self._cond:
+            if not self._running:
+                if self._store is not None and wait:
+                    self._store.close()
+                    self._store = None
+                return
+            self._running = False
+            self._cond.notify_all()
+
+        if self._dispatcher is not None and wait:
+            self._dispatcher.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        if self._loop is not None:
+            if wait:
+                # Drain the jobs still running on the loop
+                with self._cond:
+                    self._cond.wait_for(lambda: self._active == 0)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+        if self._store is not None and wait:
+            self._store.close()
+            self._store = None
+
+    def execute_async(
+        self,
+        command_name: str,
+        inputs: Dict[str, Any],
+        queue: Optional[str] = None,
+        countdown: Optional[int] = None,
+        eta: Optional[datetime] = None,
+        expires: Optional[Union[int, datetime]] = None,
+        priority: Optional[int] = None,
+    ) -> JobResult:
+        """Queue a command for background execution.
+
+        Args:
+            command_name: Name of the command to execute.
+            inputs: Command inputs.
+            queue: Accepted for CeleryConnector compatibility; there is one
+                local queue.
+            countdown: Execute after X seconds.
+            eta: Execute at specific time.
+            expires: Seconds (or a time) after which a job that has not
+                started is revoked.
+            priority: Job priority (0-9, higher = more important).
+
+        Returns:
+            JobResult with job ID and initial status.
+
+        Raises:
+            ValueError: If command not found.
+        """
+        if self.registry.get(command_name) is None:
+            raise ValueError(f"Command not found: {command_name}")
+
+        now = time.time()
+        run_at = now
+        if eta is not None:
+            run_at = eta.timestamp()
+        elif countdown:
+            run_at = now + countdown
+        expires_at = None
+        if isinstance(expires, datetime):
+            expires_at = expires.timestamp()
+        elif expires:
+            expires_at = now + expires
+
+        job = _Job(
+            JobResult(
+                job_id=str(uuid.uuid4()),
+                status=JobStatus.PENDING,
+                command_name=command_name,
+                inputs=inputs,
+            ),
+            priority=priority or 0,
+            eta=run_at,
+            expires=expires_at,
+        )
+        self.start()
+        with self._cond:
+            self._jobs[job.result.job_id] = job
+            self._persist(job)
+            self._enqueue(job, now)
+        return replace(job.result)
+
+    def get_result(self, job_id: str) -> JobResult:
+        """Get the current state of a job.
+
+        Args:
+            job_id: The job ID.
+
+        Returns:
+            JobResult snapshot; unknown jobs are reported as PENDING, like
+            Celery does.
+        """
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                return replace(job.result)
+            stored = self._store.load(job_id) if self._store is not None else None
+        if stored is not None:
+            return stored.result
+        return JobResult(job_id=job_id, status=JobStatus.PENDING, command_name="", inputs={})
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> JobResult:
+        """Wait until a job has finished (or timeout) and return its state."""
+        with self._cond:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            job.done.wait(timeout)
+        return self.get_result(job_id)
+
+    def revoke(
+        self,
+        job_id: str,
+        terminate: bool = False,
+        signal: str = "SIGTERM",
+    ) -> bool:
+        """Revoke a job that has not started yet.
+
+        Args:
+            job_id: The job ID to revoke.
+            terminate: Accepted for CeleryConnector compatibility; running
+                jobs cannot be interrupted.
+            signal: Accepted for CeleryConnector compatibility.
+
+        Returns:
+            True if the job was revoked.
+        """
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None or job.result.status not in (JobStatus.PENDING, JobStatus.RETRY):
+                return False
+            self._finish_locked(job, JobStatus.REVOKED)
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of queued, delayed and running jobs."""
+        with self._cond:
+            return {
+                "ready": len(self._ready),
+                "delayed": len(self._delayed),
+                "running": self._active,
+                "schedules": len(self._schedules),
+            }
+
+    # Scheduling (used by LocalScheduler)
+
+    def _add_schedule(self, name: str, command_name: str, config: ScheduleConfig) -> None:
+        schedule = _Schedule(name, command_name, config, 0.0)
+        schedule.next_run = _next_run(config, time.time())
+        self.start()
+        with self._cond:
+            self._schedules[name] = schedule
+            self._cond.notify()
+
+    def _remove_schedule(self, name: str) -> bool:
+        with self._cond:
+            return self._schedules.pop(name, None) is not None
+
+    # Dispatching
+
+    def _enqueue(self, job: _Job, now: float) -> None:
+        """Queue a job; called with the lock held."""
+        if job.eta > now:
+            heapq.heappush(self._delayed, (job.eta, next(self._seq), job.result.job_id))
+        else:
+            heapq.heappush(self._ready, (-job.priority, next(self._seq), job.result.job_id))
+        self._cond.notify()
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            # Take a worker slot first so a job is only dequeued when it can
+            # run; anything queued meanwhile still competes on priority
+            self._slots.acquire()
+            job = self._next_job()
+            if job is None:
+                self._slots.release()
+                return
+            try:
+                future = self._submit(job)
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+            future.add_done_callback(partial(self._finished_run, job))
+
+    def _next_job(self) -> Optional[_Job]:
+        """Block until a job is due; None once shut down."""
+        with self._cond:
+            while self._running:
+                now = time.time()
+                self._promote(now)
+                while self._ready:
+                    _, _, job_id = heapq.heappop(self._ready)
+                    job = self._jobs.get(job_id)
+                    if job is None or job.result.status not in (JobStatus.PENDING, JobStatus.RETRY):
+                        continue  # revoked while queued
+                    if job.expires is not None and now > job.expires:
+                        self._finish_locked(job, JobStatus.REVOKED)
+                        continue
+                    job.result.status = JobStatus.STARTED
+                    job.result.started_at = datetime.now()
+                    self._persist(job)
+                    self._active += 1
+                    return job
+                self._cond.wait(self._wait_time(now))
+            return None
+
+    def _promote(self, now: float) -> None:
+        """Move due delayed jobs to the ready queue and fire due schedules."""
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, job_id = heapq.heappop(self._delayed)
+            job = self._jobs.get(job_id)
+            if job is not None:
+                heapq.heappush(self._ready, (-job.priority, next(self._seq), job_id))
+        for schedule in self._schedules.values():
+            if schedule.next_run <= now:
+                schedule.next_run = _next_run(schedule.config, now)
+                options = schedule.config.options
+                job = _Job(
+                    JobResult(
+                        job_id=str(uuid.uuid4()),
+                        status=JobStatus.PENDING,
+                        command_name=schedule.command_name,
+                        inputs=dict(schedule.config.inputs),
+                    ),
+                    priority=options.get("priority") or 0,
+                    eta=now,
+                )
+                self._jobs[job.result.job_id] = job
+                self._persist(job)
+                heapq.heappush(self._ready, (-job.priority, next(self._seq), job.result.job_id))
+
+    def _wait_time(self, now: float) -> Optional[float]:
+        deadlines = [schedule.next_run for schedule in self._schedules.values()]
+        if self._delayed:
+            deadlines.append(self._delayed[0][0])
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - now)
+
+    def _submit(self, job: _Job) -> Future:
+        command_class = self.registry.get(job.result.command_name)
+        if command_class is None:
+            raise ValueError(f"Command not found: {job.result.command_name}")
+        args = (command_class, job.result.inputs, self.config.retry)
+        if self._loop is not None:
+            return asyncio.run_coroutine_threadsafe(_execute_job_async(*args), self._loop)
+        return self._executor.submit(_execute_job, *args)
+
+    def _finished_run(self, job: _Job, future: Future) -> None:
+        self._slots.release()
+        try:
+            success, value, retryable, tb = future.result()
+        except BaseException as e:
+            # The worker itself failed (e.g. a broken process pool)
+            success, value, retryable, tb = False, str(e), True, None
+
+        retry = self.config.retry
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+            r = job.result
+            if success:
+                r.result = value
+                self._finish_locked(job, JobStatus.SUCCESS)
+                return
+
+            r.error = value if isinstance(value, str) else json.dumps(value)
+            r.traceback = tb
+            if retryable and r.retries + 1 < retry.max_attempts:
+                r.retries += 1
+                r.status = JobStatus.RETRY
+                now = time.time()
+                job.eta = now + retry.get_delay(r.retries)
+                self._persist(job)
+                self._enqueue(job, now)
+                return
+            self._finish_locked(job, JobStatus.FAILURE)
+
+    def _finish_locked(self, job: _Job, status: JobStatus) -> None:
+        job.result.status = status
+        job.result.completed_at = datetime.now()
+        self._persist(job)
+        job.done.set()
+        # Keep a bounded number of finished jobs in memory
+        self._finished.append(job.result.job_id)
+        while len(self._finished) > self.config.max_finished_jobs:
+            self._jobs.pop(self._finished.popleft(), None)
+
+    def _persist(self, job: _Job) -> None:
+        if self._store is not None:
+            self._store.save(job)
+
+    def _recover(self) -> None:
+        """Requeue jobs left unfinished by a previous process (at least once)."""
+        now = time.time()
+        with self._cond:
+            for job in self._store.unfinished():
+                if job.result.status == JobStatus.STARTED:
+                    job.result.status = JobStatus.PENDING
+                    job.result.started_at = None
+                self._jobs[job.result.job_id] = job
+                self._enqueue(job, now)
+        if self._ready or self._delayed:
+            self.start()
+
+
+class LocalScheduler:
+    """Periodic command execution on a LocalJobConnector.
+
+    Mirrors CeleryScheduler; schedules are fired by the connector's
+    dispatcher thread instead of Celery Beat.
+
+    Example:
+        scheduler = LocalScheduler(connector)
+        scheduler.schedule("CleanupExpiredSessions", interval=3600)
+        scheduler.schedule("GenerateDailyReport", crontab={"hour": 0, "minute": 0})
+    """
+
+    def __init__(self, connector: LocalJobConnector):
+        """Initialize the scheduler.
+
+        Args:
+            connector: Local job connector instance.
+        """
+        self.connector = connector
+        self._schedules: Dict[str, ScheduleConfig] = {}
+
+    def schedule(
+        self,
+        command_name: str,
+        inputs: Optional[Dict[str, Any]] = None,
+        interval: Optional[float] = None,
+        crontab: Optional[Dict[str, Any]] = None,
+        name: Optional[str] = None,
+        **options,
+    ) -> str:
+        """Schedule a command for periodic execution.
+
+        Args:
+            command_name: Name of the command to schedule.
+            inputs: Command inputs.
+            interval: Run every X seconds.
+            crontab: Crontab schedule dict with keys:
+                     minute, hour, day_of_week, day_of_month, month_of_year.
+                     Values are ints, ``"*"``, ``"*/n"``, ``"a-b"`` or
+                     comma separated lists; day_of_week 0 is Sunday.
+            name: Optional schedule name.
+            **options: Job options (``priority``).
+
+        Returns:
+            Schedule name/ID.
+
+        Raises:
+            ValueError: If neither interval nor crontab provided, or the
+                command is not registered.
+        """
+        if not interval and not crontab:
+            raise ValueError("Either interval or crontab must be provided")
+        if self.connector.registry.get(command_name) is None:
+            raise ValueError(f"Command not found: {command_name}")
+
+        schedule_name = name or f"{command_name}_schedule"
+        config = ScheduleConfig(
+            crontab=crontab,
+            interval=interval,
+            inputs=inputs or {},
+            options=options,
+        )
+        self._schedules[schedule_name] = config
+        self.connector._add_schedule(schedule_name, command_name, config)
+        return schedule_name
+
+    def unschedule(self, schedule_name: str) -> bool:
+        """Remove a scheduled task.
+
+        Args:
+            schedule_name: Name of the schedule to remove.
+
+        Returns:
+            True if schedule was removed.
+        """
+        if schedule_name in self._schedules:
+            del self._schedules[schedule_name]
+            return self.connector._remove_schedule(schedule_name)
+        return False
+
+    def list_schedules(self) -> Dict[str, ScheduleConfig]:
+        """List all scheduled tasks.
+
+        Returns:
+            Dictionary of schedule names to configurations.
+        """
+        return self._schedules.copy()
+
+
+def _next_run(config: ScheduleConfig, after: float) -> float:
+    """Timestamp of the next run of a schedule after ``after``."""
+    if config.interval:
+        return after + config.interval
+    return _next_cron_time(config.crontab or {}, after)
+
+
+_CRON_FIELDS = {
+    "minute": (0, 59),
+    "hour": (0, 23),
+    "day_of_week": (0, 6),
+    "day_of_month": (1, 31),
+    "month_of_year": (1, 12),
+}
+
+
+def _cron_values(spec: Any, low: int, high: int) -> Set[int]:
+    """Expand a crontab field (int, "*", "*/n", "a-b", "a,b") to its values."""
+    if spec is None or spec == "*":
+        return set(range(low, high + 1))
+    if isinstance(spec, int):
+        return {spec}
+    if isinstance(spec, (list, tuple, set)):
+        return set().union(*(_cron_values(part, low, high) for part in spec))
+    values: Set[int] = set()
+    for part in str(spec).split(","):
+        part = part.strip()
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+        if part in ("*", ""):
+            start, end = low, high
+        elif "-" in part:
+            start, end = (int(bound) for bound in part.split("-", 1))
+        else:
+            start = end = int(part)
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def _next_cron_time(crontab: Dict[str, Any], after: float) -> float:
+    """Next local time after ``after`` matching every crontab field."""
+    unknown = set(crontab) - set(_CRON_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown crontab fields: {sorted(unknown)}")
+    allowed = {
+        name: _cron_values(crontab.get(name), low, high)
+        for name, (low, high) in _CRON_FIELDS.items()
+    }
+    t = datetime.fromtimestamp(after).replace(second=0, microsecond=0) + timedelta(minutes=1)
+    # Skip whole months / days / hours that cannot match
+    for _ in range(100_000):
+        if t.month not in allowed["month_of_year"]:
+            t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+        elif (
+            t.day not in allowed["day_of_month"]
+            or (t.weekday() + 1) % 7 not in allowed["day_of_week"]
+        ):
+            t = t.replace(hour=0, minute=0) + timedelta(days=1)
+        elif t.hour not in allowed["hour"]:
+            t = t.replace(minute=0) + timedelta(hours=1)
+        elif t.minute not in allowed["minute"]:
+            t += timedelta(minutes=1)
+        else:
+            return t.timestamp()
+    raise ValueError(f"Crontab never matches: {crontab}")
@@ -2,25 +2,42 @@
 Enhanced MCP Connector with full Ruby Foobara parity.
 
 Features:
-- Full batch request support (JSON-RPC 2.0 compliant)
+- Full batch request support (JSON-RPC 2.0 compliant), entries run concurrently
 - Notification handling
 - Ping support
 - Session management with capabilities
 - Enhanced error handling
 - Resource and prompt support (MCP spec)
 - High-performance JSON processing
+- Admission control: overloaded tools are rejected with a retry hint
+- Pipelined asyncio stdio transport with request cancellation
 """
 
+import asyncio
 import json
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import partial
 from io import StringIO
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
+from foobara_py.core.admission import AdmissionController, AdmissionRejectedError
 from foobara_py.core.command import AsyncCommand, Command
 from foobara_py.core.outcome import CommandOutcome
 from foobara_py.domain.domain import Domain, Organization
+from foobara_py.serializers.outcome_encoder import (
+    RawJSON,
+    default_outcome_encoder,
+    dumps,
+    splice_json,
+)
+
+
+# Longest request line accepted by the async stdio transport
+_STDIO_LINE_LIMIT = 16 * 1024 * 1024
 
 
 class JsonRpcErrorCode(IntEnum):
@@ -37,7 +54,8 @@ class JsonRpcErrorCode(IntEnum):
     NOT_ALLOWED = 403
     NOT_FOUND = 404
 
-
+    # Implementation-defined server error: command shed by admission control
+    OVERLOADED = -32000
 
 
 @dataclass(slots=True)
@@ -55,24 +73,44 @@ class CommandRegistry:
     """
     High-performance command registry for MCP.
 
-    Uses dict for O(1) lookups and maintains insertion order.
+    Uses dicts for O(1) lookups by full name, class name or command symbol,
+    and maintains insertion order. Each tool entry (including its JSON
+    Schema) is built once, the first time it is listed, and the encoded
+    tools/list payload is rebuilt only after the registry changes.
     """
 
-    __slots__ = ("_commands", "_name")
+    __slots__ = ("_commands", "_name", "_aliases", "_tools", "_tools_json")
 
     def __init__(self, name: str = "default"):
         self._name = name
         self._commands: Dict[str, Type[Command]] = {}
+        self._aliases: Dict[str, str] = {}
+        self._tools: Dict[str, Optional[Tuple[Dict[str, Any], bytes]]] = {}
+        self._tools_json: Optional[bytes] = None
 
     def register(self, command_class: Type[Command]) -> None:
         """Register a command class"""
         name = command_class.full_name()
         self._commands[name] = command_class
+        # First registration wins when short names collide across domains
+        for alias in (command_class.__name__, command_class.full_command_symbol()):
+            self._aliases.setdefault(alias, name)
+        # Built on first listing, so a command whose schema cannot be
+        # generated still registers (and can be called) like before
+        self._tools[name] = None
+        self._tools_json = None
 
     def get(self, name: str) -> Optional[Type[Command]]:
         """Get command by full name"""
         return self._commands.get(name)
 
+    def find(self, name: str) -> Optional[Type[Command]]:
+        """Get command by full name, class name or full command symbol"""
+        command_class = self._commands.get(name)
+        if command_class is None and name in self._aliases:
+            command_class = self._commands.get(self._aliases[name])
+        return command_class
+
     def execute(self, name: str, inputs: Dict[str, Any]) -> CommandOutcome:
         """Execute command by name"""
         cmd_class = self.get(name)
@@ -80,16 +118,33 @@ class CommandRegistry:
             raise KeyError(f"Command not found: {name}")
         return cmd_class.run(**inputs)
 
+    def list_commands(self) -> List[Type[Command]]:
+        """Registered command classes in registration order"""
+        return list(self._commands.values())
+
+    def _tool(self, name: str) -> Tuple[Dict[str, Any], bytes]:
+        """Cached tool entry and its encoding"""
+        entry = self._tools.get(name)
+        if entry is None:
+            command_class = self._commands[name]
+            tool = {
+                "name": name,
+                "description": command_class.description(),
+                "inputSchema": command_class.inputs_schema(),
+            }
+            entry = self._tools[name] = (tool, dumps(tool))
+        return entry
+
     def list_tools(self) -> List[Dict[str, Any]]:
         """Generate MCP tools list"""
-        return [
-            {
-                "name": cmd.full_name(),
-                "description": cmd.description(),
-                "inputSchema": cmd.inputs_schema(),
-            }
-            for cmd in self._commands.values()
-        ]
+        return [dict(self._tool(name)[0]) for name in self._commands]
+
+    def tools_json(self) -> bytes:
+        """The tools/list result, ``{"tools": [...]}``, as encoded JSON"""
+        if self._tools_json is None:
+            encoded = b",".join(self._tool(name)[1] for name in self._commands)
+            self._tools_json = b'{"tools":[' + encoded + b"]}"
+        return self._tools_json
 
     def __len__(self) -> int:
         return len(self._commands)
@@ -134,6 +189,9 @@ class MCPConnector:
         "_session",
         "_resources",
         "_prompts",
+        "admission",
+        "max_workers",
+        "_executor",
     )
 
     def __init__(
@@ -142,6 +200,8 @@ class MCPConnector:
         version: str = "0.1.0",
         instructions: str = None,
         capture_unknown_error: bool = True,
+        admission: Optional[AdmissionController] = None,
+        max_workers: Optional[int] = None,
     ):
         self.name = name
         self.version = version
@@ -151,6 +211,9 @@ class MCPConnector:
         self._session: Optional[MCPSession] = None
         self._resources: Dict[str, Dict[str, Any]] = {}
         self._prompts: Dict[str, Dict[str, Any]] = {}
+        self.admission = admission or AdmissionController()
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     # ==================== Connection ====================
 
@@ -219,20 +282,54 @@ class MCPConnector:
         try:
             request = json.loads(json_string)
         except json.JSONDecodeError as e:
-            return self._error_response(None, JsonRpcErrorCode.PARSE_ERROR, f"Invalid JSON: {e}")
+            return self._encode(
+                self._error_response(None, JsonRpcErrorCode.PARSE_ERROR, f"Invalid JSON: {e}")
+            )
 
         # Handle batch requests
         if isinstance(request, list):
-            return self._handle_batch(request)
+            return self._encode(self._handle_batch(request))
 
         # Handle single request
-        return self._handle_single(request)
+        return self._encode(self._handle_single(request))
 
-    def _handle_batch(self, requests: List[Any]) -> Optional[str]:
+    async def run_async(self, json_string: str) -> Optional[str]:
+        """
+        Async variant of run() for servers that already run an event loop.
+
+        Async commands are awaited on the loop; sync tool calls run on the
+        connector's thread pool so they never block it.
+        """
+        try:
+            request = json.loads(json_string)
+        except json.JSONDecodeError as e:
+            return self._encode(
+                self._error_response(None, JsonRpcErrorCode.PARSE_ERROR, f"Invalid JSON: {e}")
+            )
+
+        if isinstance(request, list):
+            return self._encode(await self._handle_batch_async(request))
+        return self._encode(await self._handle_single_async(request))
+
+    @staticmethod
+    def _encode(response: Union[Dict[str, Any], List[Dict[str, Any]], None]) -> Optional[str]:
+        """Serialise response dict(s) once, at the edge"""
+        if response is None:
+            return None
+        if isinstance(response, list):
+            return "[" + ",".join(MCPConnector._encode(item) for item in response) + "]"
+        result = response.get("result")
+        if isinstance(result, RawJSON):
+            # Pre-encoded results (tools/list) are spliced in as-is
+            fields = {key: value for key, value in response.items() if key != "result"}
+            return splice_json(fields, "result", result).decode()
+        return dumps(response).decode()
+
+    def _handle_batch(self, requests: List[Any]) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
         """
         Handle batch requests (JSON-RPC 2.0 batch).
 
-        Returns array of responses, excluding notifications.
+        Returns array of responses in request order, excluding notifications.
         Returns None if all requests are notifications.
         """
         if not requests:
@@ -240,21 +337,73 @@ class MCPConnector:
                 None, JsonRpcErrorCode.INVALID_REQUEST, "Empty batch request"
             )
 
-        responses = []
-        for req in requests:
-            response = self._handle_single(req)
-            if response is not None:
-                # Parse response to include in batch array
-                responses.append(json.loads(response))
+        if sum(1 for req in requests if _is_tool_call(req)) > 1:
+            # One slow tool should not delay the rest: run entries on the
+            # pool, map() keeps the responses in request order
+            responses = list(self._get_executor().map(self._handle_single, requests))
+        else:
+            responses = [self._handle_single(req) for req in requests]
+
+        return [response for response in responses if response is not None] or None
 
-        if not responses:
-            return None  # All were notifications
+    async def _handle_batch_async(
+        self, requests: List[Any]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+        """Handle a batch with every entry running concurrently"""
+        if not requests:
+            return self._error_response(
+                None, JsonRpcErrorCode.INVALID_REQUEST, "Empty batch request"
+            )
 
-        return json.dumps(responses, separators=(",", ":"))
+        responses = await asyncio.gather(*(self._handle_single_async(req) for req in requests))
+        return [response for response in responses if response is not None] or None
 
-    def _handle_single(self, request: Any) -> Optional[str]:
+    def _handle_single(self, request: Any) -> Optional[Dict[str, Any]]:
         """Handle a single JSON-RPC request"""
-        # Validate structure
+        invalid = self._check_request(request)
+        if invalid is not None:
+            return invalid
+
+        request_id = request.get("id")
+        try:
+            result = self._dispatch(request["method"], request.get("params", {}))
+        except Exception as e:
+            return self._exception_response(request_id, e)
+
+        # Notifications have no id
+        if request_id is None:
+            return None
+        return self._success_response(request_id, result)
+
+    async def _handle_single_async(self, request: Any) -> Optional[Dict[str, Any]]:
+        """Handle a single request without blocking the event loop"""
+        if not _is_tool_call(request):
+            # Everything but tool calls is cheap and answered inline
+            return self._handle_single(request)
+
+        params = request.get("params")
+        name = params.get("name") if isinstance(params, dict) else None
+        command_class = self._registry.get(name) if isinstance(name, str) else None
+        if command_class is None or not issubclass(command_class, AsyncCommand):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self._handle_single, request)
+
+        invalid = self._check_request(request)
+        if invalid is not None:
+            return invalid
+
+        request_id = request.get("id")
+        try:
+            result = await self._handle_tools_call_async(params)
+        except Exception as e:
+            return self._exception_response(request_id, e)
+
+        if request_id is None:
+            return None
+        return self._success_response(request_id, result)
+
+    def _check_request(self, request: Any) -> Optional[Dict[str, Any]]:
+        """Validate request structure and count it; an error response if invalid"""
         if not isinstance(request, dict):
             return self._error_response(
                 None, JsonRpcErrorCode.INVALID_REQUEST, "Request must be an object"
@@ -274,38 +423,43 @@ class MCPConnector:
                 request.get("id"), JsonRpcErrorCode.INVALID_REQUEST, "Missing or invalid method"
             )
 
-        params = request.get("params", {})
-        request_id = request.get("id")
-
         # Track session metrics
         if self._session:
             self._session.request_count += 1
+        return None
 
-        # Notifications have no id
-        is_notification = request_id is None
-
-        try:
-            result = self._dispatch(method, params)
-
-            if is_notification:
-                return None
-
-            return self._success_response(request_id, result)
+    def _exception_response(self, request_id: Any, exc: Exception) -> Optional[Dict[str, Any]]:
+        """Map a handler exception to an error response (None for notifications)"""
+        if request_id is None:
+            return None
+        if isinstance(exc, AdmissionRejectedError):
+            return self._error_response(
+                request_id,
+                JsonRpcErrorCode.OVERLOADED,
+                str(exc),
+                {"symbol": exc.symbol, "reason": exc.reason, "retry_after": exc.retry_after},
+            )
+        if isinstance(exc, KeyError):
+            return self._error_response(request_id, JsonRpcErrorCode.NOT_FOUND, str(exc))
+        if isinstance(exc, ValueError):
+            return self._error_response(request_id, JsonRpcErrorCode.INVALID_PARAMS, str(exc))
+        if self.capture_unknown_error:
+            return self._error_response(request_id, JsonRpcErrorCode.INTERNAL_ERROR, str(exc))
+        raise exc
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for sync tool calls, created on first use"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="foobara-mcp"
+            )
+        return self._executor
 
-        except KeyError as e:
-            if is_notification:
-                return None
-            return self._error_response(request_id, JsonRpcErrorCode.NOT_FOUND, str(e))
-        except ValueError as e:
-            if is_notification:
-                return None
-            return self._error_response(request_id, JsonRpcErrorCode.INVALID_PARAMS, str(e))
-        except Exception as e:
-            if is_notification:
-                return None
-            if self.capture_unknown_error:
-                return self._error_response(request_id, JsonRpcErrorCode.INTERNAL_ERROR, str(e))
-            raise
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the tool-call thread pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
 
     # ==================== Method Dispatch ====================
 
@@ -384,10 +538,33 @@ class MCPConnector:
         """Handle tools/list request"""
         cursor = params.get("cursor")
         # TODO: Implement pagination with cursor if needed
-        return {"tools": self._registry.list_tools()}
+        return RawJSON(self._registry.tools_json())
 
     def _handle_tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/call request"""
+        command_class, arguments = self._resolve_tool_call(params)
+
+        if issubclass(command_class, AsyncCommand):
+            outcome = _run_coroutine(self._run_async_tool(command_class, arguments))
+        else:
+            with self.admission.admit(command_class):
+                outcome = command_class.run(**arguments)
+
+        return self._tool_result(command_class, outcome)
+
+    async def _handle_tools_call_async(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle tools/call for an async command on the running loop"""
+        command_class, arguments = self._resolve_tool_call(params)
+        outcome = await self._run_async_tool(command_class, arguments)
+        return self._tool_result(command_class, outcome)
+
+    async def _run_async_tool(
+        self, command_class: Type[AsyncCommand], arguments: Dict[str, Any]
+    ) -> CommandOutcome:
+        async with self.admission.admit_async(command_class):
+            return await command_class.run(**arguments)
+
+    def _resolve_tool_call(self, params: Dict[str, Any]) -> Tuple[Type[Any], Dict[str, Any]]:
         name = params.get("name")
         arguments = params.get("arguments", {})
 
@@ -397,27 +574,22 @@ class MCPConnector:
         if not isinstance(arguments, dict):
             raise ValueError("Arguments must be an object")
 
-        # Execute command
-        outcome = self._registry.execute(name, arguments)
+        command_class = self._registry.get(name)
+        if command_class is None:
+            raise KeyError(f"Command not found: {name}")
+        return command_class, arguments
 
-        # Format response
+    @staticmethod
+    def _tool_result(command_class: Type[Any], outcome: CommandOutcome) -> Dict[str, Any]:
+        """Format a command outcome as tools/call content"""
         if outcome.is_success():
-            result = outcome.result
-            # Handle Pydantic models
-            if hasattr(result, "model_dump"):
-                result = result.model_dump()
-            return {
-                "content": [
-                    {"type": "text", "text": json.dumps(result, default=str, separators=(",", ":"))}
-                ]
-            }
+            text = default_outcome_encoder.encode_result(command_class, outcome.result)
+            return {"content": [{"type": "text", "text": text.decode()}]}
         else:
             # Format errors
             errors = [e.to_dict() if hasattr(e, "to_dict") else str(e) for e in outcome.errors]
             return {
-                "content": [
-                    {"type": "text", "text": json.dumps({"errors": errors}, separators=(",", ":"))}
-                ],
+                "content": [{"type": "text", "text": dumps({"errors": errors}).decode()}],
                 "isError": True,
             }
 
@@ -487,7 +659,7 @@ class MCPConnector:
 
             manifest = RootManifest()
             # Add all registered commands
-            for cmd_class in self._registry._commands.values():
+            for cmd_class in self._registry.list_commands():
                 manifest.add_command(cmd_class)
             return json.dumps(manifest.to_dict(), indent=2)
 
@@ -497,10 +669,7 @@ class MCPConnector:
 
     def _get_command_by_name(self, name: str):
         """Get command class by name from registered commands"""
-        for cmd_class in self._registry._commands.values():
-            if cmd_class.__name__ == name or cmd_class.full_command_symbol() == name:
-                return cmd_class
-        return None
+        return self._registry.find(name)
 
     def _handle_prompts_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle prompts/list request"""
@@ -657,19 +826,19 @@ class MCPConnector:
 
     # ==================== Response Building ====================
 
-    def _success_response(self, request_id: Any, result: Any) -> str:
+    def _success_response(self, request_id: Any, result: Any) -> Dict[str, Any]:
         """Build JSON-RPC success response"""
-        response = {"jsonrpc": "2.0", "id": request_id, "result": result}
-        return json.dumps(response, default=str, separators=(",", ":"))
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
 
-    def _error_response(self, request_id: Any, code: int, message: str, data: Any = None) -> str:
+    def _error_response(
+        self, request_id: Any, code: int, message: str, data: Any = None
+    ) -> Dict[str, Any]:
         """Build JSON-RPC error response"""
         error = {"code": int(code), "message": message}
         if data is not None:
             error["data"] = data
 
-        response = {"jsonrpc": "2.0", "id": request_id, "error": error}
-        return json.dumps(response, default=str, separators=(",", ":"))
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
 
     # ==================== Server Runners ====================
 
@@ -697,11 +866,175 @@ class MCPConnector:
                 io_err.write(f"Error: {e}\n")
                 io_err.flush()
 
+    async def run_stdio_async(
+        self,
+        reader: Optional[asyncio.StreamReader] = None,
+        writer: Any = None,
+        io_err=None,
+        max_concurrency: int = 16,
+    ) -> None:
+        """
+        Run MCP server on stdin/stdout with pipelined request handling.
+
+        Requests are read continuously. Tool calls and batches run
+        concurrently, up to max_concurrency at a time, and each response is
+        written as soon as it is ready, so a slow tool never holds up pings,
+        tools/list or other calls. A ``notifications/cancelled`` message
+        cancels the matching in-flight request, which then sends no response
+        (a sync tool already running on the pool finishes in the background).
+
+        Args:
+            reader: StreamReader to read requests from (default stdin)
+            writer: Object with write(bytes) and an optional async drain(),
+                e.g. a StreamWriter (default stdout)
+            io_err: Text stream for transport errors (default stderr)
+            max_concurrency: Max tool calls / batches running at once
+        """
+        io_err = io_err or sys.stderr
+        if reader is None or writer is None:
+            reader, writer = await _stdio_streams(reader, writer)
+
+        limit = asyncio.Semaphore(max_concurrency)
+        in_flight: Dict[Any, asyncio.Task] = {}
+        tasks: Set[asyncio.Task] = set()
+
+        async def write(response: Optional[str]) -> None:
+            if response:
+                writer.write(response.encode() + b"\n")
+                drain = getattr(writer, "drain", None)
+                if drain is not None:
+                    await drain()
+
+        def report(error: Exception) -> None:
+            io_err.write(f"Error: {error}\n")
+            io_err.flush()
+
+        async def run_request(request: Any) -> None:
+            try:
+                async with limit:
+                    if isinstance(request, list):
+                        response = await self._handle_batch_async(request)
+                    else:
+                        response = await self._handle_single_async(request)
+                await write(self._encode(response))
+            except asyncio.CancelledError:
+                pass  # cancelled requests get no response
+            except Exception as e:
+                report(e)
+
+        def finished(request_id: Any, task: asyncio.Task) -> None:
+            tasks.discard(task)
+            if in_flight.get(request_id) is task:
+                del in_flight[request_id]
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    await write(self._encode(self._error_response(
+                        None, JsonRpcErrorCode.PARSE_ERROR, f"Invalid JSON: {e}"
+                    )))
+                    continue
+
+                if isinstance(request, dict) and request.get("method") == "notifications/cancelled":
+                    params = request.get("params")
+                    task = in_flight.get(params.get("requestId")) if isinstance(params, dict) else None
+                    if task is not None:
+                        task.cancel()
+                    continue
+
+                if isinstance(request, list) or _is_tool_call(request):
+                    request_id = request.get("id") if isinstance(request, dict) else None
+                    task = asyncio.ensure_future(run_request(request))
+                    tasks.add(task)
+                    if request_id is not None:
+                        in_flight[request_id] = task
+                    task.add_done_callback(partial(finished, request_id))
+                    continue
+
+                # Everything else is cheap; answer inline, in arrival order
+                try:
+                    await write(self._encode(self._handle_single(request)))
+                except Exception as e:
+                    report(e)
+
+            # End of input: let running requests finish and respond
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def run_once(self, request: str) -> Optional[str]:
         """Process a single request (for testing)"""
         return self.run(request)
 
 
+def _is_tool_call(request: Any) -> bool:
+    return isinstance(request, dict) and request.get("method") == "tools/call"
+
+
+async def _stdio_streams(reader: Optional[asyncio.StreamReader], writer: Any) -> Tuple[Any, Any]:
+    """Wrap the process's stdin/stdout in asyncio streams"""
+    loop = asyncio.get_running_loop()
+    if reader is None:
+        reader = asyncio.StreamReader(limit=_STDIO_LINE_LIMIT)
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        except ValueError:
+            # Regular files cannot be watched by the loop; read them on a thread
+            threading.Thread(
+                target=_pump_file, args=(loop, reader, sys.stdin.buffer), daemon=True
+            ).start()
+    if writer is None:
+        try:
+            transport, protocol = await loop.connect_write_pipe(
+                asyncio.streams.FlowControlMixin, sys.stdout
+            )
+            writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+        except ValueError:
+            writer = _FileWriter(sys.stdout.buffer)
+    return reader, writer
+
+
+def _pump_file(loop: asyncio.AbstractEventLoop, reader: asyncio.StreamReader, source: Any) -> None:
+    for line in source:
+        loop.call_soon_threadsafe(reader.feed_data, line)
+    loop.call_soon_threadsafe(reader.feed_eof)
+
+
+class _FileWriter:
+    """Blocking writer for stdout redirected to a regular file"""
+
+    __slots__ = ("_file",)
+
+    def __init__(self, file: Any):
+        self._file = file
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._file.flush()
+
+
+def _run_coroutine(coro: Any) -> Any:
+    """Run a coroutine to completion from sync code"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside a running loop: use a helper thread with its own loop
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
 # ==================== Convenience Functions ====================
 
 
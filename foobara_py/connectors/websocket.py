@@ -3,6 +3,16 @@ WebSocket Connector for Foobara commands.
 
 Provides real-time bidirectional communication for command execution,
 streaming results, and subscriptions.
+
+Subscriptions are shared: every subscriber to the same command with the same
+inputs is served by one execution, and a result is only pushed when it
+differs from the previous one. Commands can be re-run on entity changes
+(``watch_entities``) instead of on a timer.
+
+Pushed messages (broadcasts and subscription results) go through a bounded
+per-connection queue drained by a writer task, so one slow client never
+stalls delivery to the others. ``slow_consumer_policy`` decides what happens
+when a client's queue is full.
 """
 
 from __future__ import annotations
@@ -10,14 +20,22 @@ from __future__ import annotations
 import asyncio
 import json
 import uuid
+import weakref
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Type
-
-from pydantic import BaseModel
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple, Type
 
+from foobara_py.core.admission import AdmissionController, AdmissionRejectedError
 from foobara_py.core.command import AsyncCommand, Command
 from foobara_py.core.registry import CommandRegistry
+from foobara_py.core.streaming import StreamingResult, as_stream
+from foobara_py.serializers.outcome_encoder import (
+    RawJSON,
+    default_outcome_encoder,
+    dumps,
+    splice_json,
+)
 
 
 class WebSocketMessageType(Enum):
@@ -33,6 +51,7 @@ class WebSocketMessageType(Enum):
     RESULT = "result"  # Command result
     ERROR = "error"  # Error message
     STREAM = "stream"  # Streaming data
+    STREAM_END = "stream_end"  # End of a streamed command result
     SUBSCRIBED = "subscribed"  # Subscription confirmed
     UNSUBSCRIBED = "unsubscribed"  # Unsubscription confirmed
     PONG = "pong"  # Keep-alive pong
@@ -61,7 +80,8 @@ class WebSocketMessage:
         if self.inputs:
             data["inputs"] = self.inputs
         if self.result is not None:
-            data["result"] = self.result
+            result = self.result
+            data["result"] = json.loads(result) if isinstance(result, RawJSON) else result
         if self.error:
             data["error"] = self.error
         if self.subscription_id:
@@ -70,6 +90,11 @@ class WebSocketMessage:
 
     def to_json(self) -> str:
         """Convert to JSON string."""
+        if isinstance(self.result, RawJSON):
+            # Splice the pre-encoded result in rather than decoding it
+            data = self.to_dict()
+            del data["result"]
+            return splice_json(data, "result", self.result).decode()
         return json.dumps(self.to_dict())
 
     @classmethod
@@ -107,6 +132,16 @@ class WebSocketConfig:
     # Subscription settings
     enable_subscriptions: bool = True
     max_subscriptions_per_connection: int = 100
+    subscription_interval: float = 1.0  # Seconds between polls of a shared subscription
+
+    # Outbound queue for pushed messages (broadcasts, subscription results)
+    send_queue_size: int = 256  # Max queued messages per connection
+    # When a connection's queue is full:
+    #   "drop"       - drop the new message
+    #   "coalesce"   - replace a queued message for the same subscription,
+    #                  otherwise drop the oldest queued message
+    #   "disconnect" - close the connection
+    slow_consumer_policy: str = "drop"
 
     # Security
     require_auth: bool = False
@@ -129,30 +164,107 @@ class Subscription:
         self.interval = interval
         self.active = True
         self._task: Optional[asyncio.Task] = None
+        self._shared: Optional[SharedSubscription] = None
 
     def cancel(self):
         """Cancel the subscription."""
         self.active = False
         if self._task and not self._task.done():
             self._task.cancel()
+        if self._shared is not None:
+            self._shared.remove(self.subscription_id)
+            self._shared = None
+
+
+class SharedSubscription:
+    """One command execution serving every subscriber with the same inputs.
+
+    Polls every ``interval`` seconds, or, when change driven, waits until
+    ``notify()`` reports a change to a watched entity. Results are pushed
+    only when the encoded result differs from the last one pushed.
+    """
+
+    def __init__(
+        self,
+        key: Tuple[str, str],
+        command_class: Type[Command],
+        inputs: Dict[str, Any],
+        interval: float,
+        change_driven: bool = False,
+        on_empty: Optional[Callable[["SharedSubscription"], None]] = None,
+    ):
+        self.key = key
+        self.command_class = command_class
+        self.inputs = inputs
+        self.interval = interval
+        self.change_driven = change_driven
+        self.subscribers: Dict[str, Tuple[WebSocketConnection, Subscription]] = {}
+        self.last_result: Optional[RawJSON] = None
+        self._on_empty = on_empty
+        self._changed = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, connection: "WebSocketConnection", subscription: Subscription) -> None:
+        self.subscribers[subscription.subscription_id] = (connection, subscription)
+        subscription._shared = self
+
+    def remove(self, subscription_id: str) -> None:
+        self.subscribers.pop(subscription_id, None)
+        if not self.subscribers:
+            if self._task and not self._task.done():
+                self._task.cancel()
+            if self._on_empty is not None:
+                self._on_empty(self)
+
+    def notify(self) -> None:
+        """Request a re-run; safe to call from any thread."""
+        try:
+            self._loop.call_soon_threadsafe(self._changed.set)
+        except RuntimeError:
+            pass  # loop already closed
+
+    async def wait(self) -> None:
+        """Wait until the next run is due."""
+        if self.change_driven:
+            await self._changed.wait()
+        else:
+            await asyncio.sleep(self.interval)
+        self._changed.clear()
 
 
 class WebSocketConnection:
-    """Represents a WebSocket connection."""
+    """Represents a WebSocket connection.
+
+    Replies to the client's own requests are sent directly. Pushed messages
+    are queued with ``enqueue()`` and written by a per-connection writer
+    task, started on first use.
+    """
 
     def __init__(
         self,
         connection_id: str,
         send_func: Callable[[str], Any],
         config: WebSocketConfig,
+        close_func: Optional[Callable[[], Awaitable[Any]]] = None,
     ):
         self.connection_id = connection_id
         self.send = send_func
+        self.close_func = close_func
         self.config = config
         self.authenticated = not config.require_auth
         self.user: Optional[Dict[str, Any]] = None
         self.subscriptions: Dict[str, Subscription] = {}
+        self.topics: Set[str] = set()
+        self.closed = False
+        self.dropped = 0
         self._pending_commands: Set[str] = set()
+        # Queued [key, data] boxes; boxes with a key are indexed for coalescing
+        self._outbox: Deque[List[Any]] = deque()
+        self._coalescing: Dict[str, List[Any]] = {}
+        self._outbox_ready: Optional[asyncio.Event] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._on_overflow: Optional[Callable[[WebSocketConnection], Any]] = None
 
     async def send_message(self, message: WebSocketMessage):
         """Send a message to the client."""
@@ -176,6 +288,92 @@ class WebSocketConnection:
         )
         await self.send_message(msg)
 
+    @property
+    def queued(self) -> int:
+        """Number of pushed messages waiting to be written."""
+        return len(self._outbox)
+
+    def enqueue(self, data: str, key: Optional[str] = None) -> bool:
+        """Queue an encoded message for the writer task.
+
+        Args:
+            data: Encoded message, shared between recipients.
+            key: Coalescing key (e.g. subscription ID); with the "coalesce"
+                policy a queued message with the same key is replaced.
+
+        Returns:
+            False if the message was not queued.
+        """
+        if self.closed:
+            return False
+        policy = self.config.slow_consumer_policy
+        coalesce = key is not None and policy == "coalesce"
+        if coalesce:
+            box = self._coalescing.get(key)
+            if box is not None:
+                # The client only needs the newest value
+                box[1] = data
+                return True
+
+        if len(self._outbox) >= self.config.send_queue_size:
+            if policy == "disconnect":
+                self._overflow()
+                return False
+            self.dropped += 1
+            if policy != "coalesce":
+                return False
+            self._forget(self._outbox.popleft())
+
+        box = [key, data]
+        self._outbox.append(box)
+        if coalesce:
+            self._coalescing[key] = box
+        self._wake_writer()
+        return True
+
+    def _forget(self, box: List[Any]) -> None:
+        if box[0] is not None and self._coalescing.get(box[0]) is box:
+            del self._coalescing[box[0]]
+
+    def _wake_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            self._outbox_ready = asyncio.Event()
+            self._writer = asyncio.ensure_future(self._write_loop())
+        self._outbox_ready.set()
+
+    async def _write_loop(self) -> None:
+        """Write queued messages in order until the connection closes."""
+        ready = self._outbox_ready
+        while not self.closed:
+            if not self._outbox:
+                ready.clear()
+                await ready.wait()
+                continue
+            box = self._outbox.popleft()
+            self._forget(box)
+            try:
+                await self.send(box[1])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Client went away; stop pushing to it
+                self._overflow()
+                return
+
+    def _overflow(self) -> None:
+        """Give up on the client: stop queuing and let the connector evict it."""
+        self._discard_outbox()
+        if self._on_overflow is not None:
+            on_overflow, self._on_overflow = self._on_overflow, None
+            asyncio.ensure_future(on_overflow(self))
+
+    def _discard_outbox(self) -> None:
+        self.closed = True
+        self._outbox.clear()
+        self._coalescing.clear()
+        if self._outbox_ready is not None:
+            self._outbox_ready.set()
+
     def add_subscription(self, subscription: Subscription):
         """Add a subscription."""
         if len(self.subscriptions) >= self.config.max_subscriptions_per_connection:
@@ -193,6 +391,9 @@ class WebSocketConnection:
         for sub in self.subscriptions.values():
             sub.cancel()
         self.subscriptions.clear()
+        self._discard_outbox()
+        if self._writer is not None and not self._writer.done():
+            self._writer.cancel()
 
 
 class WebSocketConnector:
@@ -214,6 +415,7 @@ class WebSocketConnector:
             connection = await connector.connect(
                 connection_id=str(uuid.uuid4()),
                 send_func=websocket.send_text,
+                close_func=websocket.close,
             )
             try:
                 while True:
@@ -227,32 +429,42 @@ class WebSocketConnector:
         self,
         registry: Optional[CommandRegistry] = None,
         config: Optional[WebSocketConfig] = None,
+        admission: Optional[AdmissionController] = None,
     ):
         """Initialize the WebSocket connector.
 
         Args:
             registry: Command registry to use.
             config: WebSocket configuration.
+            admission: Admission limits applied before commands run.
         """
         self.registry = registry or CommandRegistry()
         self.config = config or WebSocketConfig()
+        self.admission = admission or AdmissionController()
         self._connections: Dict[str, WebSocketConnection] = {}
+        self._shared: Dict[Tuple[str, str], SharedSubscription] = {}
+        self._watches: Dict[type, Set[str]] = {}
+        self._topics: Dict[str, Dict[str, WebSocketConnection]] = {}
 
     async def connect(
         self,
         connection_id: str,
         send_func: Callable[[str], Any],
+        close_func: Optional[Callable[[], Awaitable[Any]]] = None,
     ) -> WebSocketConnection:
         """Register a new WebSocket connection.
 
         Args:
             connection_id: Unique connection identifier.
             send_func: Async function to send messages to client.
+            close_func: Async function closing the socket, used to evict
+                slow consumers.
 
         Returns:
             WebSocketConnection instance.
         """
-        connection = WebSocketConnection(connection_id, send_func, self.config)
+        connection = WebSocketConnection(connection_id, send_func, self.config, close_func)
+        connection._on_overflow = self._evict
         self._connections[connection_id] = connection
         return connection
 
@@ -265,6 +477,31 @@ class WebSocketConnector:
         connection.close()
         if connection.connection_id in self._connections:
             del self._connections[connection.connection_id]
+        for topic in list(connection.topics):
+            self.leave_topic(connection, topic)
+
+    async def _evict(self, connection: WebSocketConnection):
+        """Disconnect a client that stopped keeping up or went away."""
+        await self.disconnect(connection)
+        if connection.close_func is not None:
+            try:
+                await connection.close_func()
+            except Exception:
+                pass  # Socket may already be closed
+
+    def join_topic(self, connection: WebSocketConnection, topic: str):
+        """Add a connection to a topic for ``broadcast_to(topic=...)``."""
+        connection.topics.add(topic)
+        self._topics.setdefault(topic, {})[connection.connection_id] = connection
+
+    def leave_topic(self, connection: WebSocketConnection, topic: str):
+        """Remove a connection from a topic."""
+        connection.topics.discard(topic)
+        members = self._topics.get(topic)
+        if members is not None:
+            members.pop(connection.connection_id, None)
+            if not members:
+                del self._topics[topic]
 
     async def handle_message(
         self,
@@ -331,21 +568,23 @@ class WebSocketConnector:
         try:
             inputs = message.inputs or {}
 
-            if issubclass(command_class, AsyncCommand):
-                outcome = await command_class.run_async(**inputs)
-            else:
-                # Run sync command in thread pool
-                loop = asyncio.get_event_loop()
-                outcome = await loop.run_in_executor(
-                    None,
-                    lambda: command_class.run(**inputs)
-                )
-
-            if outcome.is_success():
-                result = outcome.result
-                if isinstance(result, BaseModel):
-                    result = result.model_dump()
-                await connection.send_result(message.id, result)
+            async with self.admission.admit_async(command_class):
+                if issubclass(command_class, AsyncCommand):
+                    outcome = await command_class.run_async(**inputs)
+                else:
+                    # Run sync command in thread pool
+                    loop = asyncio.get_event_loop()
+                    outcome = await loop.run_in_executor(
+                        None,
+                        lambda: command_class.run(**inputs)
+                    )
+
+            stream = as_stream(outcome.result) if outcome.is_success() else None
+            if stream is not None:
+                await self._send_stream(connection, message.id, stream)
+            elif outcome.is_success():
+                result = default_outcome_encoder.encode_result(command_class, outcome.result)
+                await connection.send_result(message.id, RawJSON(result))
             else:
                 errors = [
                     {
@@ -355,13 +594,40 @@ class WebSocketConnector:
                     }
                     for err in (outcome.errors or [])
                 ]
-                await connection.send_error(message.id, json.dumps(errors))
+                await connection.send_error(message.id, dumps(errors).decode())
 
+        except AdmissionRejectedError as e:
+            error = {"key": e.symbol, "message": str(e), "retry_after": e.retry_after}
+            await connection.send_error(message.id, dumps([error]).decode())
         except Exception as e:
             await connection.send_error(message.id, str(e))
         finally:
             connection._pending_commands.discard(message.id)
 
+    async def _send_stream(
+        self,
+        connection: WebSocketConnection,
+        message_id: str,
+        stream: StreamingResult,
+    ):
+        """Send a streaming result as STREAM messages followed by STREAM_END."""
+        encode = default_outcome_encoder.encode_result
+        try:
+            async for chunk in stream.aiter_chunks():
+                for item in chunk:
+                    # Awaiting each send keeps a slow client from buffering the whole stream
+                    await connection.send_message(WebSocketMessage(
+                        type=WebSocketMessageType.STREAM,
+                        id=message_id,
+                        result=RawJSON(encode(None, item)),
+                    ))
+        finally:
+            stream.close()
+        await connection.send_message(WebSocketMessage(
+            type=WebSocketMessageType.STREAM_END,
+            id=message_id,
+        ))
+
     async def _handle_subscribe(
         self,
         connection: WebSocketConnection,
@@ -392,6 +658,7 @@ class WebSocketConnector:
             subscription_id=subscription_id,
             command_name=message.command,
             inputs=message.inputs or {},
+            interval=self.config.subscription_interval,
         )
 
         try:
@@ -400,10 +667,9 @@ class WebSocketConnector:
             await connection.send_error(message.id, str(e))
             return
 
-        # Start subscription task
-        subscription._task = asyncio.create_task(
-            self._run_subscription(connection, subscription, command_class)
-        )
+        # Join the shared execution for this command and inputs
+        shared = self._shared_subscription(command_class, subscription)
+        shared.add(connection, subscription)
 
         # Confirm subscription
         await connection.send_message(WebSocketMessage(
@@ -412,43 +678,132 @@ class WebSocketConnector:
             subscription_id=subscription_id,
         ))
 
-    async def _run_subscription(
-        self,
-        connection: WebSocketConnection,
-        subscription: Subscription,
-        command_class: Type[Command],
-    ):
-        """Run a subscription loop."""
-        while subscription.active:
+        # Late joiners get the current result straight away
+        if shared.last_result is not None:
+            await connection.send_message(WebSocketMessage(
+                type=WebSocketMessageType.STREAM,
+                subscription_id=subscription_id,
+                result=shared.last_result,
+            ))
+
+    def _shared_subscription(
+        self, command_class: Type[Command], subscription: Subscription
+    ) -> SharedSubscription:
+        """Find or start the shared execution for a subscription."""
+        canonical_inputs = json.dumps(
+            subscription.inputs, sort_keys=True, separators=(",", ":"), default=str
+        )
+        key = (subscription.command_name, canonical_inputs)
+        shared = self._shared.get(key)
+        if shared is None:
+            change_driven = any(
+                subscription.command_name in names for names in self._watches.values()
+            )
+            shared = SharedSubscription(
+                key,
+                command_class,
+                subscription.inputs,
+                subscription.interval,
+                change_driven=change_driven,
+                on_empty=self._drop_shared,
+            )
+            self._shared[key] = shared
+            shared._task = asyncio.create_task(self._run_shared(shared))
+        return shared
+
+    def _drop_shared(self, shared: SharedSubscription) -> None:
+        if self._shared.get(shared.key) is shared:
+            del self._shared[shared.key]
+
+    async def _run_shared(self, shared: SharedSubscription):
+        """Run a shared subscription, pushing results that changed."""
+        command_class = shared.command_class
+        while shared.subscribers:
             try:
                 # Execute command
-                if issubclass(command_class, AsyncCommand):
-                    outcome = await command_class.run_async(**subscription.inputs)
-                else:
-                    loop = asyncio.get_event_loop()
-                    outcome = await loop.run_in_executor(
-                        None,
-                        lambda: command_class.run(**subscription.inputs)
-                    )
+                async with self.admission.admit_async(command_class):
+                    if issubclass(command_class, AsyncCommand):
+                        outcome = await command_class.run_async(**shared.inputs)
+                    else:
+                        loop = asyncio.get_event_loop()
+                        outcome = await loop.run_in_executor(
+                            None,
+                            lambda: command_class.run(**shared.inputs)
+                        )
 
                 if outcome.is_success():
-                    result = outcome.result
-                    if isinstance(result, BaseModel):
-                        result = result.model_dump()
+                    result = default_outcome_encoder.encode_result(command_class, outcome.result)
+                    if result != shared.last_result:
+                        shared.last_result = RawJSON(result)
+                        self._fan_out(shared)
 
-                    await connection.send_message(WebSocketMessage(
-                        type=WebSocketMessageType.STREAM,
-                        subscription_id=subscription.subscription_id,
-                        result=result,
-                    ))
-
-                await asyncio.sleep(subscription.interval)
+                await shared.wait()
 
             except asyncio.CancelledError:
                 break
+            except AdmissionRejectedError as e:
+                # Shed this run; try again once the command has capacity
+                await asyncio.sleep(max(shared.interval, e.retry_after))
             except Exception:
                 # Log error but continue subscription
-                await asyncio.sleep(subscription.interval)
+                await shared.wait()
+
+    def _fan_out(self, shared: SharedSubscription):
+        """Queue the shared result for every subscriber."""
+        for subscription_id, (connection, _) in list(shared.subscribers.items()):
+            message = WebSocketMessage(
+                type=WebSocketMessageType.STREAM,
+                subscription_id=subscription_id,
+                result=shared.last_result,
+            )
+            connection.enqueue(message.to_json(), key=subscription_id)
+
+    def watch_entities(self, command: Any, *entity_classes: type) -> "WebSocketConnector":
+        """Re-run subscriptions to a command when entities change, instead of polling.
+
+        Args:
+            command: Command class or name.
+            entity_classes: Entity classes whose after_save / after_delete
+                events trigger a re-run.
+
+        Returns:
+            Self for chaining.
+        """
+        from foobara_py.persistence.entity_callbacks import (
+            EntityCallbackRegistry,
+            EntityLifecycle,
+        )
+
+        command_name = command if isinstance(command, str) else command.full_name()
+        for entity_class in entity_classes:
+            if entity_class not in self._watches:
+                self._watches[entity_class] = set()
+                # Weak reference so the callback registry does not keep the
+                # connector alive
+                changed = weakref.WeakMethod(self._entity_changed)
+
+                def callback(entity, changed=changed):
+                    method = changed()
+                    if method is not None:
+                        method(entity)
+
+                EntityCallbackRegistry.register(entity_class, EntityLifecycle.AFTER_SAVE, callback)
+                EntityCallbackRegistry.register(entity_class, EntityLifecycle.AFTER_DELETE, callback)
+            self._watches[entity_class].add(command_name)
+
+        for shared in self._shared.values():
+            if shared.key[0] == command_name:
+                shared.change_driven = True
+        return self
+
+    def _entity_changed(self, entity: Any) -> None:
+        """Entity callback; may run on any thread."""
+        names = self._watches.get(type(entity))
+        if not names:
+            return
+        for shared in list(self._shared.values()):
+            if shared.key[0] in names:
+                shared.notify()
 
     async def _handle_unsubscribe(
         self,
@@ -491,17 +846,80 @@ class WebSocketConnector:
         """Get all active connections."""
         return list(self._connections.values())
 
-    async def broadcast(self, message: WebSocketMessage):
+    async def broadcast(self, message: WebSocketMessage) -> int:
         """Broadcast a message to all connections.
 
+        The message is encoded once and queued for every connection; slow
+        clients are handled by ``slow_consumer_policy``.
+
         Args:
             message: Message to broadcast.
+
+        Returns:
+            Number of connections the message was queued for.
         """
-        for connection in self._connections.values():
-            try:
-                await connection.send_message(message)
-            except Exception:
-                pass  # Connection may be closed
+        return await self._push(message, self._connections.values())
+
+    async def broadcast_to(
+        self,
+        message: WebSocketMessage,
+        *,
+        topic: Optional[str] = None,
+        command: Optional[str] = None,
+        where: Optional[Callable[[WebSocketConnection], bool]] = None,
+    ) -> int:
+        """Broadcast a message to a subset of connections.
+
+        ``topic`` and ``command`` are looked up in indexes rather than by
+        scanning every connection; ``where`` filters the remaining ones.
+
+        Args:
+            message: Message to broadcast.
+            topic: Only connections that joined this topic.
+            command: Only connections subscribed to this command.
+            where: Predicate a connection must satisfy.
+
+        Returns:
+            Number of connections the message was queued for.
+        """
+        if topic is not None:
+            candidates: Dict[str, WebSocketConnection] = dict(self._topics.get(topic, {}))
+            if command is not None:
+                subscribed = self._subscribed_to(command)
+                candidates = {cid: c for cid, c in candidates.items() if cid in subscribed}
+        elif command is not None:
+            candidates = self._subscribed_to(command)
+        else:
+            candidates = self._connections
+
+        recipients: Iterable[WebSocketConnection] = candidates.values()
+        if where is not None:
+            recipients = [c for c in recipients if where(c)]
+        return await self._push(message, recipients)
+
+    def _subscribed_to(self, command: str) -> Dict[str, WebSocketConnection]:
+        """Connections subscribed to a command, from the shared subscription index."""
+        connections: Dict[str, WebSocketConnection] = {}
+        for key, shared in self._shared.items():
+            if key[0] == command:
+                for connection, _ in shared.subscribers.values():
+                    connections[connection.connection_id] = connection
+        return connections
+
+    async def _push(
+        self,
+        message: WebSocketMessage,
+        connections: Iterable[WebSocketConnection],
+    ) -> int:
+        data = message.to_json()
+        queued = 0
+        for connection in list(connections):
+            if connection.enqueue(data):
+                queued += 1
+        # Let the writer tasks run, so clients that keep up have the message
+        # by the time this returns
+        await asyncio.sleep(0)
+        return queued
 
 
 def create_fastapi_websocket_handler(
@@ -531,6 +949,7 @@ def create_fastapi_websocket_handler(
         connection = await connector.connect(
             connection_id=connection_id,
             send_func=websocket.send_text,
+            close_func=websocket.close,
         )
 
         try:
@@ -1,5 +1,11 @@
 """Core components: Command, Outcome, Errors, Error Recovery"""
 
+from foobara_py.core.admission import (
+    AdmissionConfig,
+    AdmissionController,
+    AdmissionLimiter,
+    AdmissionRejectedError,
+)
 from foobara_py.core.command import (
     AsyncCommand,
     AsyncSimpleCommand,
@@ -36,6 +42,7 @@ from foobara_py.core.error_recovery import (
 )
 from foobara_py.core.outcome import CommandOutcome, Failure, Outcome, Success
 from foobara_py.core.registry import CommandRegistry, get_default_registry, register
+from foobara_py.core.streaming import StreamingResult, as_stream
 
 __all__ = [
     # Outcome types
@@ -78,4 +85,12 @@ __all__ = [
     "CommandRegistry",
     "get_default_registry",
     "register",
+    # Streaming
+    "StreamingResult",
+    "as_stream",
+    # Admission control
+    "AdmissionConfig",
+    "AdmissionController",
+    "AdmissionLimiter",
+    "AdmissionRejectedError",
 ]
@@ -0,0 +1,368 @@
+"""
+Admission control and load shedding for command execution.
+
+When a downstream dependency slows down, requests keep arriving while the
+ones in flight take longer to finish. Without a bound they pile up in the
+connectors until the process runs out of workers or memory. Admission
+control caps the number of concurrent runs per command (or per domain),
+queues a bounded number of callers for a bounded time, and rejects the rest
+immediately so clients can back off and retry.
+
+Limits can optionally adapt to observed latency (AIMD): each run that
+finishes within the latency target grows the limit by ``1 / limit``, each
+slower run shrinks it by ``backoff``, so concurrency settles at what the
+dependency can actually serve.
+
+Usage:
+    admission = AdmissionController()
+    admission.limit("Billing", AdmissionConfig(max_in_flight=8, max_queue=16))
+    admission.limit(SendEmail, AdmissionConfig(max_in_flight=4, adaptive=True))
+
+    outcome = admission.run(ChargeCard, amount=100)   # may raise AdmissionRejectedError
+
+    connector = HTTPConnector(app, admission=admission)
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional, Type, Union
+
+from foobara_py.core.errors import Symbols
+
+
+@dataclass
+class AdmissionConfig:
+    """Admission limits for one command or domain"""
+
+    max_in_flight: int = 32
+    max_queue: int = 64
+    queue_timeout: float = 1.0  # seconds a caller may wait for a slot
+    retry_after: float = 1.0  # seconds suggested to rejected callers
+
+    # Adaptive (AIMD) limit between min_limit and max_limit (default max_in_flight)
+    adaptive: bool = False
+    min_limit: int = 1
+    max_limit: Optional[int] = None
+    target_latency: Optional[float] = None  # default: tolerance * lowest observed latency
+    tolerance: float = 2.0
+    backoff: float = 0.9
+
+
+class AdmissionRejectedError(Exception):
+    """
+    Raised when a run is shed instead of admitted.
+
+    ``reason`` is ``"queue_full"`` (status 429: too many concurrent requests
+    for this command) or ``"queue_timeout"`` (status 503: no slot freed up in
+    time).
+    """
+
+    def __init__(self, name: str, reason: str, retry_after: float):
+        self.name = name
+        self.reason = reason
+        self.retry_after = retry_after
+        if reason == "queue_full":
+            message = f"Too many concurrent requests for {name}"
+        else:
+            message = f"{name} is overloaded, no capacity freed up in time"
+        super().__init__(message)
+
+    @property
+    def status(self) -> int:
+        return 429 if self.reason == "queue_full" else 503
+
+    @property
+    def symbol(self) -> str:
+        if self.reason == "queue_full":
+            return Symbols.RATE_LIMIT_EXCEEDED
+        return Symbols.SERVICE_UNAVAILABLE
+
+    @property
+    def retry_after_header(self) -> str:
+        """Retry-After header value (whole seconds, at least 1)"""
+        return str(max(1, math.ceil(self.retry_after)))
+
+    def to_error(self) -> Dict[str, Any]:
+        """Error dict in the shape connectors use for command errors"""
+        return {
+            "symbol": self.symbol,
+            "message": str(self),
+            "context": {"reason": self.reason, "retry_after": self.retry_after},
+        }
+
+
+class _Waiter:
+    """A queued caller; woken from whichever thread releases a slot"""
+
+    __slots__ = ("granted", "_event", "_loop", "_future")
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.granted = False
+        self._loop = loop
+        if loop is None:
+            self._event = threading.Event()
+            self._future = None
+        else:
+            self._event = None
+            self._future = loop.create_future()
+
+    def wake(self) -> None:
+        self.granted = True
+        if self._event is not None:
+            self._event.set()
+        else:
+            self._loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self._future.done():
+            self._future.set_result(None)
+
+
+class AdmissionLimiter:
+    """
+    Concurrency limit with a bounded FIFO wait queue.
+
+    Safe to share between threads and event loops: sync callers wait on an
+    event, async callers on a future of their own loop, and a released slot
+    is handed directly to the oldest waiter.
+    """
+
+    __slots__ = (
+        "name",
+        "config",
+        "_lock",
+        "_in_flight",
+        "_waiters",
+        "_limit",
+        "_min_latency",
+        "_admitted",
+        "_rejected",
+        "_timed_out",
+    )
+
+    def __init__(self, config: AdmissionConfig, name: str = ""):
+        self.name = name
+        self.config = config
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._limit = float(config.max_in_flight)
+        self._min_latency: Optional[float] = None
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit (changes over time when adaptive)"""
+        return max(1, int(self._limit))
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """Hold a slot for the duration of the block, blocking while queued"""
+        self._enter()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._exit(time.perf_counter() - start)
+
+    @asynccontextmanager
+    async def acquire_async(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block, awaiting while queued"""
+        await self._enter_async()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._exit(time.perf_counter() - start)
+
+    def _try_enter(self, waiter_loop: Any) -> Optional[_Waiter]:
+        """Take a free slot (None) or enqueue a waiter; raise when the queue is full"""
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                self._in_flight += 1
+                self._admitted += 1
+                return None
+            if len(self._waiters) >= self.config.max_queue:
+                self._rejected += 1
+                raise AdmissionRejectedError(self.name, "queue_full", self.config.retry_after)
+            waiter = _Waiter(waiter_loop)
+            self._waiters.append(waiter)
+            return waiter
+
+    def _leave_queue(self, waiter: _Waiter) -> bool:
+        """After waiting: True if the waiter was granted a slot, else dequeue it"""
+        with self._lock:
+            if waiter.granted:
+                self._admitted += 1
+                return True
+            self._waiters.remove(waiter)
+            self._timed_out += 1
+            return False
+
+    def _enter(self) -> None:
+        waiter = self._try_enter(None)
+        if waiter is None:
+            return
+        waiter._event.wait(self.config.queue_timeout)
+        if not self._leave_queue(waiter):
+            raise AdmissionRejectedError(self.name, "queue_timeout", self.config.retry_after)
+
+    async def _enter_async(self) -> None:
+        waiter = self._try_enter(asyncio.get_running_loop())
+        if waiter is None:
+            return
+        try:
+            await asyncio.wait_for(waiter._future, self.config.queue_timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            if self._leave_queue(waiter):
+                self._exit(None)
+            raise
+        if not self._leave_queue(waiter):
+            raise AdmissionRejectedError(self.name, "queue_timeout", self.config.retry_after)
+
+    def _exit(self, latency: Optional[float]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if latency is not None and self.config.adaptive:
+                self._adapt(latency)
+            # Hand freed slots straight to the oldest waiters
+            while self._waiters and self._in_flight < self.limit:
+                waiter = self._waiters.popleft()
+                self._in_flight += 1
+                waiter.wake()
+
+    def _adapt(self, latency: float) -> None:
+        """AIMD step; called with the lock held"""
+        config = self.config
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        else:
+            # Let the baseline drift up slowly so it follows lasting changes
+            self._min_latency *= 1.01
+        target = config.target_latency or self._min_latency * config.tolerance
+        max_limit = config.max_limit or config.max_in_flight
+        if latency > target:
+            self._limit = max(float(config.min_limit), self._limit * config.backoff)
+        else:
+            self._limit = min(float(max_limit), self._limit + 1.0 / self._limit)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of limit, in-flight/queued counts and admission counters"""
+        with self._lock:
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "queued": len(self._waiters),
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+            }
+
+
+class AdmissionController:
+    """
+    Admission limits keyed by command or domain, shared by connectors.
+
+    A command is limited by its own config if one was set, else by its
+    domain's (one limiter shared by every command in the domain), else by
+    the default config (one limiter per command). Commands without any
+    config are admitted without bookkeeping.
+    """
+
+    __slots__ = ("_default", "_configs", "_limiters", "_resolved", "_lock")
+
+    def __init__(self, default: Optional[AdmissionConfig] = None):
+        self._default = default
+        self._configs: Dict[str, AdmissionConfig] = {}
+        self._limiters: Dict[str, AdmissionLimiter] = {}
+        self._resolved: Dict[type, Optional[AdmissionLimiter]] = {}
+        self._lock = threading.Lock()
+
+    def limit(self, target: Union[str, type, Any], config: AdmissionConfig) -> "AdmissionController":
+        """
+        Set limits for a command class, a domain, or a full command/domain name.
+
+        Returns self for chaining.
+        """
+        if isinstance(target, type):
+            key = target.full_name()
+        elif isinstance(target, str):
+            key = target
+        else:
+            key = target.full_name()  # Domain
+        with self._lock:
+            self._configs[key] = config
+            self._limiters.pop(key, None)
+            self._resolved.clear()
+        return self
+
+    def limiter_for(self, command_class: type) -> Optional[AdmissionLimiter]:
+        """Limiter guarding command_class, or None when it is unlimited"""
+        try:
+            return self._resolved[command_class]
+        except KeyError:
+            pass
+
+        with self._lock:
+            limiter = None
+            for key in _lookup_keys(command_class):
+                if key in self._configs:
+                    limiter = self._limiter_locked(key, self._configs[key])
+                    break
+            else:
+                if self._default is not None:
+                    limiter = self._limiter_locked(command_class.full_name(), self._default)
+            self._resolved[command_class] = limiter
+        return limiter
+
+    def _limiter_locked(self, key: str, config: AdmissionConfig) -> AdmissionLimiter:
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            limiter = self._limiters[key] = AdmissionLimiter(config, key)
+        return limiter
+
+    def admit(self, command_class: type):
+        """Sync context manager holding command_class's slot (no-op if unlimited)"""
+        limiter = self.limiter_for(command_class)
+        return nullcontext() if limiter is None else limiter.acquire()
+
+    def admit_async(self, command_class: type):
+        """Async context manager holding command_class's slot (no-op if unlimited)"""
+        limiter = self.limiter_for(command_class)
+        return nullcontext() if limiter is None else limiter.acquire_async()
+
+    def run(self, command_class: Type[Any], **inputs) -> Any:
+        """Run a command once admitted; raises AdmissionRejectedError when shed"""
+        with self.admit(command_class):
+            return command_class.run(**inputs)
+
+    async def run_async(self, command_class: Type[Any], **inputs) -> Any:
+        """Run an async command once admitted; raises AdmissionRejectedError when shed"""
+        async with self.admit_async(command_class):
+            return await command_class.run(**inputs)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-limiter metrics keyed by command or domain name"""
+        with self._lock:
+            limiters = list(self._limiters.items())
+        return {key: limiter.metrics() for key, limiter in limiters}
+
+
+def _lookup_keys(command_class: type) -> Iterator[str]:
+    """Config keys to try for a command: its full name, then its domain"""
+    yield command_class.full_name()
+    domain = getattr(command_class, "_domain", None)
+    if domain:
+        organization = getattr(command_class, "_organization", None)
+        if organization:
+            yield f"{organization}::{domain}"
+        yield domain
@@ -8,7 +8,7 @@ Uses simplified execution flow (no transactions by default).
 from abc import ABC, abstractmethod
 from typing import Any, ClassVar, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 
 from foobara_py.core.callbacks_enhanced import EnhancedCallbackRegistry
 from foobara_py.core.errors import ErrorCollection, FoobaraError, Symbols
@@ -154,23 +154,8 @@ class AsyncCommand(
         Returns:
             True if validation succeeded, False if errors occurred.
         """
-        try:
-            inputs_class = self.inputs_type()
-            self._inputs = inputs_class(**self._raw_inputs)
-            return True
-        except ValidationError as e:
-            for error in e.errors():
-                path = tuple(str(p) for p in error["loc"])
-                self.add_error(
-                    FoobaraError(
-                        category="data",
-                        symbol=error["type"],
-                        path=path,
-                        message=error["msg"],
-                        context={"input": error.get("input")},
-                    )
-                )
-            return False
+        self.cast_and_validate_inputs()
+        return self._inputs is not None
 
     async def before_execute(self) -> None:
         """Async lifecycle hook called before execute()."""
@@ -272,6 +257,19 @@ class AsyncCommand(
         instance = cls(**inputs)
         return await instance.run_instance()
 
+    @classmethod
+    async def run_validated(cls, inputs: InputT) -> CommandOutcome[ResultT]:
+        """Run async command with an already-validated inputs model"""
+        return await cls._for_validated_inputs(inputs).run_instance()
+
+    @classmethod
+    async def run_json(cls, body: Union[str, bytes]) -> CommandOutcome[ResultT]:
+        """Run async command with a raw JSON document, validated in one pass"""
+        return await cls._for_json_inputs(body).run_instance()
+
+    # Connectors call run_async() on async commands
+    run_async = run
+
     @classmethod
     def manifest(cls) -> dict:
         """
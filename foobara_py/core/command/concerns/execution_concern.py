@@ -11,7 +11,10 @@ Pattern: Ruby Foobara's Runtime concern
 """
 
 from abc import abstractmethod
-from typing import Generic, Optional, TypeVar
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from foobara_py.core.outcome import CommandOutcome
 
 ResultT = TypeVar("ResultT")
 
@@ -75,3 +78,36 @@ class ExecutionConcern(Generic[ResultT]):
         """
         instance = cls(**inputs)
         return instance.run_instance()
+
+    @classmethod
+    def run_validated(cls, inputs) -> "CommandOutcome[ResultT]":
+        """
+        Run command with an already-validated inputs model.
+
+        Inputs are not validated again, e.g. when a connector or caller has
+        already built the model.
+
+        Args:
+            inputs: Instance of the command's inputs_type()
+
+        Returns:
+            CommandOutcome with result or errors
+        """
+        return cls._for_validated_inputs(inputs).run_instance()
+
+    @classmethod
+    def run_json(cls, body) -> "CommandOutcome[ResultT]":
+        """
+        Run command with a raw JSON document as inputs.
+
+        The body is parsed and validated in one pass with
+        inputs_type().model_validate_json(); validation failures become
+        data errors on the outcome, as with run().
+
+        Args:
+            body: JSON object as str or bytes
+
+        Returns:
+            CommandOutcome with result or errors
+        """
+        return cls._for_json_inputs(body).run_instance()
@@ -3,14 +3,14 @@ InputsConcern - Input handling and validation for commands.
 
 Handles:
 - Raw input storage
-- Pydantic validation
+- Pydantic validation (from kwargs, raw JSON, or a pre-validated model)
 - Validated input access
 - Error collection from validation
 
 Pattern: Ruby Foobara's Inputs concern
 """
 
-from typing import Any, Dict, Generic, Optional, TypeVar
+from typing import Any, Dict, Generic, Optional, TypeVar, Union
 
 from pydantic import BaseModel, ValidationError
 
@@ -24,9 +24,36 @@ class InputsConcern(Generic[InputT]):
     """Mixin for input handling and validation."""
 
     # Instance attributes (defined in __slots__ in Command)
-    _raw_inputs: Dict[str, Any]
+    _raw_inputs: Union[Dict[str, Any], str, bytes]
     _inputs: Optional[InputT]
 
+    @classmethod
+    def _for_validated_inputs(cls, inputs: InputT) -> "InputsConcern":
+        """
+        Build an instance around an inputs model that is already validated.
+
+        Raises:
+            TypeError: If inputs is not an instance of inputs_type()
+        """
+        inputs_type = cls.inputs_type()
+        if not isinstance(inputs, inputs_type):
+            raise TypeError(
+                f"{cls.__name__} expects {inputs_type.__name__} inputs, "
+                f"got {type(inputs).__name__}"
+            )
+        instance = cls()
+        # Shallow field mapping; nested models are not dumped
+        instance._raw_inputs = dict(inputs)
+        instance._inputs = inputs
+        return instance
+
+    @classmethod
+    def _for_json_inputs(cls, body: Union[str, bytes]) -> "InputsConcern":
+        """Build an instance whose raw inputs are a JSON document"""
+        instance = cls()
+        instance._raw_inputs = body
+        return instance
+
     @property
     def inputs(self) -> InputT:
         """
@@ -56,18 +83,34 @@ class InputsConcern(Generic[InputT]):
         Note:
             Runs automatically during command execution before execute().
             Override inputs_type() to customize the validation model.
+            Raw JSON inputs are parsed and validated in a single pass, and
+            inputs built by _for_validated_inputs() are not validated again.
         """
+        if self._inputs is not None:
+            return
         try:
-            self._inputs = validate_with_model(self.inputs_type(), self._raw_inputs)
+            raw = self._raw_inputs
+            if isinstance(raw, (str, bytes)):
+                self._inputs = self.inputs_type().model_validate_json(raw)
+            else:
+                self._inputs = validate_with_model(self.inputs_type(), raw)
         except ValidationError as e:
-            for error in e.errors():
-                path = tuple(str(p) for p in error["loc"])
-                self.add_error(
-                    FoobaraError(
-                        category="data",
-                        symbol=error["type"],
-                        path=path,
-                        message=error["msg"],
-                        context={"input": error.get("input")},
-                    )
+            self._add_validation_errors(e)
+
+    def _add_validation_errors(self, exc: ValidationError) -> None:
+        """Map Pydantic validation errors to FoobaraErrors on this command"""
+        for error in exc.errors():
+            path = tuple(str(p) for p in error["loc"])
+            value = error.get("input")
+            if isinstance(value, bytes):
+                # Malformed JSON bodies report the raw bytes as input
+                value = value.decode("utf-8", errors="replace")
+            self.add_error(
+                FoobaraError(
+                    category="data",
+                    symbol=error["type"],
+                    path=path,
+                    message=error["msg"],
+                    context={"input": value},
                 )
+            )
@@ -0,0 +1,127 @@
+"""
+Streaming command results.
+
+A command may return an iterator, generator or async generator instead of a
+fully materialised list. Connectors recognise such results and send them
+item by item (NDJSON over HTTP, STREAM messages over WebSocket, one line per
+item in the CLI) instead of building one large response.
+
+Items are produced lazily, after the command's run (and any transaction it
+opened) has finished, so generators should open their own resources - e.g.
+a cursor via ``iter_all()`` - rather than rely on the command's transaction.
+
+Usage:
+    class ExportOrders(Command[ExportInputs, Iterator[Order]]):
+        def execute(self) -> Iterator[Order]:
+            return Order.each(batch_size=500)
+
+    outcome = ExportOrders.run()
+    for order in as_stream(outcome.result):
+        ...
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, AsyncIterator as AsyncIteratorT, Callable, Iterable, List, Optional, Union
+
+DEFAULT_STREAM_CHUNK_SIZE = 64
+
+
+class StreamingResult:
+    """
+    Lazily produced result wrapping a sync or async iterable of items.
+
+    Connectors consume it with ``aiter_chunks()``, which pulls sync sources on
+    a worker thread a chunk at a time so a slow generator never blocks the
+    event loop, and only pulls the next chunk once the previous one has been
+    sent.
+    """
+
+    __slots__ = ("_source",)
+
+    def __init__(self, source: Union[Iterable[Any], AsyncIteratorT[Any]]):
+        self._source = source
+
+    @property
+    def is_async(self) -> bool:
+        return hasattr(self._source, "__aiter__")
+
+    def __iter__(self) -> Iterator:
+        if not self.is_async:
+            yield from self._source
+            return
+
+        # Drive the async source on a private loop (CLI and other sync callers)
+        iterator = self._source.__aiter__()
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            loop.close()
+
+    async def aiter_chunks(
+        self,
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        run_sync: Optional[Callable[..., Any]] = None,
+    ) -> AsyncIteratorT[List[Any]]:
+        """
+        Yield lists of up to chunk_size items.
+
+        Args:
+            chunk_size: Max items per chunk
+            run_sync: Coroutine function used to call a sync function off the
+                event loop, ``run_sync(func, *args)``. Defaults to the loop's
+                default executor.
+        """
+        if self.is_async:
+            chunk: List[Any] = []
+            async for item in self._source:
+                chunk.append(item)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+            return
+
+        if run_sync is None:
+            loop = asyncio.get_running_loop()
+
+            async def run_sync(func: Callable[..., Any], *args: Any) -> Any:
+                return await loop.run_in_executor(None, func, *args)
+
+        iterator = iter(self._source)
+        while True:
+            chunk = await run_sync(_next_chunk, iterator, chunk_size)
+            if chunk:
+                yield chunk
+            if len(chunk) < chunk_size:
+                return
+
+    def close(self) -> None:
+        """Close the underlying generator, if it supports it"""
+        close = getattr(self._source, "close", None)
+        if callable(close):
+            close()
+
+
+def _next_chunk(iterator: Iterator, size: int) -> List[Any]:
+    chunk = []
+    for item in iterator:
+        chunk.append(item)
+        if len(chunk) >= size:
+            break
+    return chunk
+
+
+def as_stream(result: Any) -> Optional[StreamingResult]:
+    """Wrap iterator / async iterator results; None for ordinary values"""
+    if isinstance(result, StreamingResult):
+        return result
+    if isinstance(result, (Iterator, AsyncIterator)):
+        return StreamingResult(result)
+    return None
@@ -15,6 +15,12 @@ from typing import Any, List, Optional, Type
 import yaml
 
 from foobara_py.persistence.entity import EntityBase, PrimaryKey
+from foobara_py.persistence.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
 from foobara_py.persistence.repository import Repository
 
 
@@ -181,6 +187,49 @@ class LocalFilesDriver(Repository):
 
         return entities
 
+    def find_page(
+        self,
+        entity_class: Type[EntityBase],
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[EntityBase]:
+        """
+        Find one page of entities by offset into the sorted file index.
+
+        Only the files on the requested page are read. Ordering by a field
+        requires reading every file, so it falls back to the default
+        implementation.
+        """
+        if order_by is not None:
+            return super().find_page(entity_class, cursor, limit, order_by)
+
+        state = decode_cursor(cursor, None)
+        offset = state.get("offset", 0)
+        ext_pattern = "*.yml" if self.format == "yaml" else "*.json"
+
+        def sort_key(file_path: Path):
+            stem = file_path.stem
+            return (0, int(stem), "") if stem.isdigit() else (1, 0, stem)
+
+        index = sorted(self._entity_dir(entity_class).glob(ext_pattern), key=sort_key)
+
+        entities = []
+        for file_path in index[offset : offset + limit]:
+            try:
+                content = file_path.read_text(encoding="utf-8")
+                data = self._deserialize(content)
+                entities.append(entity_class.from_persisted(**data))
+            except Exception as e:
+                # Log error but continue processing other files
+                print(f"Error loading {file_path}: {e}")
+                continue
+
+        next_cursor = None
+        if offset + limit < len(index):
+            next_cursor = encode_cursor({"order_by": None, "offset": offset + limit})
+        return Page(entities, next_cursor)
+
     def save(self, entity: EntityBase) -> EntityBase:
         """
         Save entity (create or update).
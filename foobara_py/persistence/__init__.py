@@ -13,6 +13,7 @@ from foobara_py.persistence.associations import (
     has_many,
     has_one,
 )
+from foobara_py.persistence.columnar import ColumnBatch
 from foobara_py.persistence.crud_driver import (
     CannotCrudError,
     CannotDeleteError,
@@ -60,6 +61,10 @@ from foobara_py.persistence.local_files_driver import (
     LocalFilesCRUDDriver,
     LocalFilesCRUDTable,
 )
+from foobara_py.persistence.pagination import (
+    InvalidCursorError,
+    Page,
+)
 from foobara_py.persistence.postgresql_driver import (
     PostgreSQLCRUDDriver,
     PostgreSQLCRUDTable,
@@ -76,6 +81,12 @@ from foobara_py.persistence.repository import (
     RepositoryTransaction,
     TransactionalInMemoryRepository,
 )
+from foobara_py.persistence.routing_driver import (
+    RoutingCRUDDriver,
+    RoutingCRUDTable,
+    RoutingTransactionHandler,
+    ShardedCRUDTable,
+)
 
 __all__ = [
     "Entity",
@@ -117,6 +128,9 @@ __all__ = [
     "after_delete",
     "CRUDDriver",
     "CRUDTable",
+    "ColumnBatch",
+    "Page",
+    "InvalidCursorError",
     "CannotCrudError",
     "CannotFindError",
     "CannotInsertError",
@@ -130,4 +144,8 @@ __all__ = [
     "LocalFilesCRUDTable",
     "PostgreSQLCRUDDriver",
     "PostgreSQLCRUDTable",
+    "RoutingCRUDDriver",
+    "RoutingCRUDTable",
+    "ShardedCRUDTable",
+    "RoutingTransactionHandler",
 ]
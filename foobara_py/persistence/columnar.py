@@ -0,0 +1,243 @@
+"""
+Columnar export of entity collections for foobara-py.
+
+Builds column-oriented batches directly from driver rows, without constructing
+entity instances, so analytics code can aggregate with vectorised NumPy
+operations instead of looping over Pydantic objects.
+
+Numeric fields (int, float, bool) become NumPy arrays when NumPy is installed;
+every other field is returned as a plain Python list. ``to_arrow()`` converts
+the batch to a pyarrow ``Table`` when pyarrow is installed.
+
+Usage:
+    table = driver.table_for(Order)
+    batch = table.select_columnar(["total", "status"], where={"paid": True})
+
+    revenue = batch["total"].sum()
+    arrow_table = batch.to_arrow()
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+_numpy: Any = None
+
+
+def _load_numpy() -> Any:
+    """numpy module, or False when it is not installed (imported on first use)"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - numpy is optional
+            numpy = False
+        _numpy = numpy
+    return _numpy
+
+
+NUMERIC_DTYPES = {
+    int: "int64",
+    float: "float64",
+    bool: "bool",
+}
+
+
+def numeric_dtype_for(entity_class: Optional[Type], field: str) -> Optional[str]:
+    """Return the NumPy dtype name for a numeric entity field, or None"""
+    model_fields = getattr(entity_class, "model_fields", None) or {}
+    field_info = model_fields.get(field)
+    if field_info is None:
+        return None
+
+    py_type = field_info.annotation
+    if get_origin(py_type) is Union:
+        args = [arg for arg in get_args(py_type) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        py_type = args[0]
+
+    return NUMERIC_DTYPES.get(py_type)
+
+
+def _to_column(values: List[Any], dtype: Optional[str]) -> Any:
+    """Convert collected values to a NumPy array (numeric fields) or keep the list"""
+    if dtype is None:
+        return values
+    np = _load_numpy()
+    if not np:
+        return values
+
+    if None in values:
+        # Missing ints/floats become NaN; nullable bools have no native dtype
+        if dtype == "bool":
+            return np.array(values, dtype=object)
+        return np.array(values, dtype="float64")
+
+    try:
+        return np.array(values, dtype=dtype)
+    except (TypeError, ValueError):
+        return np.array(values, dtype=object)
+
+
+class ColumnBatch:
+    """
+    Column-oriented batch of records.
+
+    Maps field name to a column (NumPy array for numeric fields, list otherwise).
+    All columns have the same length.
+    """
+
+    __slots__ = ("columns", "num_rows")
+
+    def __init__(self, columns: Dict[str, Any], num_rows: int):
+        self.columns = columns
+        self.num_rows = num_rows
+
+    @property
+    def field_names(self) -> List[str]:
+        """Names of the columns in this batch"""
+        return list(self.columns.keys())
+
+    def __getitem__(self, field: str) -> Any:
+        return self.columns[field]
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.columns
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert back to row-oriented dicts (mostly useful for debugging/tests)"""
+        names = self.field_names
+        columns = [self.columns[name] for name in names]
+        return [
+            {name: column[i] for name, column in zip(names, columns)}
+            for i in range(self.num_rows)
+        ]
+
+    def to_arrow(self) -> Any:
+        """
+        Convert to a pyarrow Table.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for ColumnBatch.to_arrow(). Install with: pip install pyarrow"
+            )
+
+        return pa.table({name: pa.array(column) for name, column in self.columns.items()})
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Dict[str, Any]],
+        fields: Optional[Sequence[str]] = None,
+        entity_class: Optional[Type] = None,
+    ) -> "ColumnBatch":
+        """
+        Build a batch from attribute dicts as returned by CRUDTable methods.
+
+        If fields is None, the entity's model fields are used (or the keys of
+        the first row when no entity class is given).
+        """
+        rows = iter(rows)
+        if fields is None:
+            fields = _default_fields(entity_class)
+            if fields is None:
+                first = next(rows, None)
+                if first is None:
+                    return cls({}, 0)
+                fields = list(first.keys())
+                rows = _prepend(first, rows)
+
+        return cls._collect(rows, fields, entity_class, lambda row, field: row.get(field))
+
+    @classmethod
+    def from_tuples(
+        cls,
+        rows: Iterable[Sequence[Any]],
+        fields: Sequence[str],
+        entity_class: Optional[Type] = None,
+    ) -> "ColumnBatch":
+        """Build a batch from positional rows whose values follow ``fields`` order"""
+        values: List[List[Any]] = [[] for _ in fields]
+        num_rows = 0
+        for row in rows:
+            for column, value in zip(values, row):
+                column.append(value)
+            num_rows += 1
+
+        columns = {
+            field: _to_column(column, numeric_dtype_for(entity_class, field))
+            for field, column in zip(fields, values)
+        }
+        return cls(columns, num_rows)
+
+    @classmethod
+    def from_entities(
+        cls,
+        entities: Iterable[Any],
+        fields: Optional[Sequence[str]] = None,
+        entity_class: Optional[Type] = None,
+    ) -> "ColumnBatch":
+        """Build a batch by reading attributes from already-loaded entities"""
+        if fields is None:
+            fields = _default_fields(entity_class) or []
+        return cls._collect(entities, fields, entity_class, getattr)
+
+    @classmethod
+    def _collect(
+        cls,
+        rows: Iterable[Any],
+        fields: Sequence[str],
+        entity_class: Optional[Type],
+        get: Callable[[Any, str], Any],
+    ) -> "ColumnBatch":
+        values: Dict[str, List[Any]] = {field: [] for field in fields}
+        appenders = [(values[field].append, field) for field in fields]
+        num_rows = 0
+        for row in rows:
+            for append, field in appenders:
+                append(get(row, field))
+            num_rows += 1
+
+        columns = {
+            field: _to_column(column, numeric_dtype_for(entity_class, field))
+            for field, column in values.items()
+        }
+        return cls(columns, num_rows)
+
+    def __repr__(self) -> str:
+        return f"ColumnBatch(fields={self.field_names!r}, num_rows={self.num_rows})"
+
+
+def _default_fields(entity_class: Optional[Type]) -> Optional[List[str]]:
+    model_fields = getattr(entity_class, "model_fields", None)
+    if not model_fields:
+        return None
+    return list(model_fields.keys())
+
+
+def _prepend(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    yield first
+    yield from rest
@@ -7,7 +7,16 @@ CRUD drivers provide a low-level abstraction for storage technologies
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Type, Union
+
+from foobara_py.persistence.columnar import ColumnBatch
+from foobara_py.persistence.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    parse_order_by,
+)
 
 
 class CannotCrudError(Exception):
@@ -122,6 +131,68 @@ class CRUDTable(ABC):
         """Select records matching criteria"""
         pass
 
+    def select_columnar(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> ColumnBatch:
+        """
+        Select records matching criteria as a column-oriented batch.
+
+        Builds columns straight from driver rows without constructing entity
+        instances. Numeric fields are NumPy arrays when NumPy is installed.
+        Drivers that can project columns natively should override this.
+        """
+        rows = self.select(where=where, order_by=order_by, limit=limit, offset=offset)
+        return ColumnBatch.from_rows(rows, fields, self.entity_class)
+
+    def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[Dict[str, Any]]:
+        """
+        Return one page of records and an opaque cursor for the next page.
+
+        Records are ordered by order_by ("field" or "-field"), with the primary
+        key as tie-breaker, or by primary key when order_by is None.
+
+        This default implementation pages with select() offsets. Drivers
+        should override it with a native strategy (keyset, scan cursors, ...).
+        """
+        state = decode_cursor(cursor, order_by)
+        offset = state.get("offset", 0)
+        pk_field = self._primary_key_name()
+        field, descending = parse_order_by(order_by)
+        pk_order = f"-{pk_field}" if descending else pk_field
+        ordering = [order_by, pk_order] if field and field != pk_field else [pk_order]
+
+        rows = list(self.select(order_by=ordering, limit=limit + 1, offset=offset))
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor({"order_by": order_by, "offset": offset + limit})
+        return Page(rows[:limit], next_cursor)
+
+    def iter_all(
+        self, batch_size: int = DEFAULT_PAGE_SIZE, order_by: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all records, fetching batch_size records at a time"""
+        cursor = None
+        while True:
+            page = self.find_page(cursor, limit=batch_size, order_by=order_by)
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def _primary_key_name(self) -> str:
+        """Name of the primary key attribute"""
+        return getattr(self.entity_class, "_primary_key_field", "id")
+
     def exists(self, record_id: Any) -> bool:
         """Check if record exists"""
         return self.find(record_id) is not None
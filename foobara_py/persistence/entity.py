@@ -17,6 +17,8 @@ from typing import (
     ClassVar,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -28,6 +30,7 @@ from typing import (
 )
 
 if TYPE_CHECKING:
+    from foobara_py.persistence.pagination import Page
     from foobara_py.persistence.repository import RepositoryProtocol
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -72,6 +75,9 @@ class EntityMeta(type(BaseModel)):
         # Store primary key field name
         cls._primary_key_field = primary_key_field
 
+        # Precompute field names for snapshot-based dirty tracking
+        cls._tracked_fields = tuple(getattr(cls, "model_fields", None) or ())
+
         # Re-add association descriptors to the class after Pydantic setup
         # and ensure __set_name__ is called
         for key, descriptor in associations.items():
@@ -106,7 +112,7 @@ class EntityBase(BaseModel, metaclass=EntityMeta):
 
     Entities are database-backed models with:
     - Primary key tracking
-    - Dirty attribute tracking
+    - Dirty attribute tracking (snapshot on load, diff on read)
     - Load/save lifecycle
     - Serialization to primary key
 
@@ -134,17 +140,21 @@ class EntityBase(BaseModel, metaclass=EntityMeta):
     # Class-level configuration
     _primary_key_field: ClassVar[str] = "id"
     _repository: ClassVar[Optional["RepositoryProtocol"]] = None
+    _tracked_fields: ClassVar[Tuple[str, ...]] = ()
 
     # Instance tracking
+    # Attribute writes are plain Pydantic assignments; dirty attributes are
+    # computed by diffing field values against the snapshot taken when the
+    # entity was loaded or saved.
     _persisted: bool = PrivateAttr(default=False)
     _dirty_attributes: Set[str] = PrivateAttr(default_factory=set)
-    _original_values: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    _snapshot: Optional[Tuple[Any, ...]] = PrivateAttr(default=None)
 
     def __init__(self, **data):
         super().__init__(**data)
         self._persisted = False
         self._dirty_attributes = set()
-        self._original_values = {}
+        self._snapshot = None
 
     @property
     def primary_key(self) -> Any:
@@ -164,44 +174,70 @@ class EntityBase(BaseModel, metaclass=EntityMeta):
     @property
     def is_dirty(self) -> bool:
         """Check if entity has unsaved changes"""
-        return len(self._dirty_attributes) > 0
+        if self._dirty_attributes:
+            return True
+        snapshot = self._snapshot
+        if snapshot is None:
+            return False
+        values = self.__dict__
+        for name, original in zip(self._tracked_fields, snapshot):
+            current = values.get(name)
+            if current is not original and current != original:
+                return True
+        return False
 
     @property
     def dirty_attributes(self) -> Set[str]:
         """Get set of dirty attribute names"""
-        return self._dirty_attributes.copy()
+        dirty = set(self._dirty_attributes)
+        snapshot = self._snapshot
+        if snapshot is not None:
+            values = self.__dict__
+            for name, original in zip(self._tracked_fields, snapshot):
+                current = values.get(name)
+                if current is not original and current != original:
+                    dirty.add(name)
+        return dirty
+
+    @property
+    def original_values(self) -> Dict[str, Any]:
+        """Get the persisted values of attributes that have changed since load/save"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {}
+        dirty = self.dirty_attributes
+        return {
+            name: original
+            for name, original in zip(self._tracked_fields, snapshot)
+            if name in dirty
+        }
 
     def mark_persisted(self) -> None:
         """Mark entity as persisted"""
         self._persisted = True
         self._dirty_attributes.clear()
-        self._original_values.clear()
+        self._take_snapshot()
 
     def mark_dirty(self, *attrs: str) -> None:
         """Mark attributes as dirty"""
         for attr in attrs:
             self._dirty_attributes.add(attr)
 
+    def _take_snapshot(self) -> None:
+        """Record current field values as the persisted baseline"""
+        values = self.__dict__
+        self._snapshot = tuple([values.get(name) for name in self._tracked_fields])
+
     def to_primary_key(self) -> Any:
         """Serialize to primary key only (for API responses)"""
         return self.primary_key
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        # Track dirty attributes (only for model fields)
-        # Access model_fields from class, not instance (Pydantic v2.11+)
-        if name in self.__class__.model_fields and self._persisted:
-            current = getattr(self, name, None)
-            if current != value:
-                if name not in self._original_values:
-                    self._original_values[name] = current
-                self._dirty_attributes.add(name)
-        super().__setattr__(name, value)
-
     @classmethod
     def from_persisted(cls, **data) -> "EntityBase":
         """Create entity instance marked as persisted"""
         instance = cls(**data)
         instance._persisted = True
+        instance._take_snapshot()
         return instance
 
     # ==================== CRUD Instance Methods ====================
@@ -274,10 +310,10 @@ class EntityBase(BaseModel, metaclass=EntityMeta):
         if not fresh:
             raise ValueError(f"{type(self).__name__} with pk={self.primary_key} not found")
         # Update all fields from fresh data
-        for field in self.__class__.model_fields:
+        for field in self._tracked_fields:
             setattr(self, field, getattr(fresh, field))
         self._dirty_attributes.clear()
-        self._original_values.clear()
+        self._take_snapshot()
         return self
 
     # ==================== CRUD Class Methods ====================
@@ -313,6 +349,22 @@ class EntityBase(BaseModel, metaclass=EntityMeta):
             raise ValueError(f"No repository configured for {cls.__name__}")
         return repo.find(cls, pk)
 
+    @classmethod
+    def find_many(cls, pks: Iterable[Any]) -> Dict[Any, "EntityBase"]:
+        """
+        Find several entities by primary key, keyed by primary key.
+
+        Usage:
+            users = User.find_many([1, 2, 3])
+            author = users.get(post.user_id)
+        """
+        from foobara_py.persistence.repository import RepositoryRegistry
+
+        repo = cls._repository or RepositoryRegistry.get(cls)
+        if not repo:
+            raise ValueError(f"No repository configured for {cls.__name__}")
+        return repo.find_many(cls, pks)
+
     @classmethod
     def find_all(cls) -> List["EntityBase"]:
         """
@@ -330,6 +382,43 @@ class EntityBase(BaseModel, metaclass=EntityMeta):
             raise ValueError(f"No repository configured for {cls.__name__}")
         return repo.find_all(cls)
 
+    @classmethod
+    def find_page(
+        cls, cursor: Optional[str] = None, limit: int = 100, order_by: Optional[str] = None
+    ) -> "Page[EntityBase]":
+        """
+        Find one page of entities and an opaque cursor for the next page.
+
+        Usage:
+            page = User.find_page(limit=50)
+            while page.has_more:
+                page = User.find_page(page.next_cursor, limit=50)
+        """
+        from foobara_py.persistence.repository import RepositoryRegistry
+
+        repo = cls._repository or RepositoryRegistry.get(cls)
+        if not repo:
+            raise ValueError(f"No repository configured for {cls.__name__}")
+        return repo.find_page(cls, cursor, limit, order_by)
+
+    @classmethod
+    def each(
+        cls, batch_size: int = 100, order_by: Optional[str] = None
+    ) -> Iterator["EntityBase"]:
+        """
+        Iterate over all entities of this type, loading batch_size at a time.
+
+        Usage:
+            for user in User.each(batch_size=500):
+                send_newsletter(user)
+        """
+        from foobara_py.persistence.repository import RepositoryRegistry
+
+        repo = cls._repository or RepositoryRegistry.get(cls)
+        if not repo:
+            raise ValueError(f"No repository configured for {cls.__name__}")
+        return repo.iter_all(cls, batch_size, order_by)
+
     @classmethod
     def find_by(cls, **criteria) -> List["EntityBase"]:
         """
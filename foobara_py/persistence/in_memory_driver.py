@@ -13,6 +13,15 @@ from foobara_py.persistence.crud_driver import (
     CRUDDriver,
     CRUDTable,
 )
+from foobara_py.persistence.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    keyset_slice,
+    keyset_sort_key,
+    parse_order_by,
+)
 
 
 class InMemoryCRUDTable(CRUDTable):
@@ -27,6 +36,7 @@ class InMemoryCRUDTable(CRUDTable):
         self._data: Dict[Any, Dict[str, Any]] = {}
         self._lock = threading.RLock()
         self._auto_increment = 0
+        self._sorted_keys: Optional[List[Any]] = None
 
     def find(self, record_id: Any) -> Optional[Dict[str, Any]]:
         with self._lock:
@@ -53,6 +63,7 @@ class InMemoryCRUDTable(CRUDTable):
                 raise CannotInsertError(record_id, "already exists")
 
             self._data[record_id] = attributes.copy()
+            self._sorted_keys = None
             return self._data[record_id]
 
     def update(self, record_id: Any, attributes: Dict[str, Any]) -> Dict[str, Any]:
@@ -67,6 +78,7 @@ class InMemoryCRUDTable(CRUDTable):
         with self._lock:
             if record_id in self._data:
                 del self._data[record_id]
+                self._sorted_keys = None
                 return True
             return False
 
@@ -99,6 +111,42 @@ class InMemoryCRUDTable(CRUDTable):
             end = start + limit if limit else None
             return results[start:end]
 
+    def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[Dict[str, Any]]:
+        """Keyset pagination over sorted primary keys (or sorted (field, pk) pairs)"""
+        state = decode_cursor(cursor, order_by)
+        field, descending = parse_order_by(order_by)
+        pk_field = self._primary_key_name()
+
+        with self._lock:
+            if field is None or field == pk_field:
+                if self._sorted_keys is None:
+                    self._sorted_keys = sorted(self._data)
+                keys = self._sorted_keys
+                after = state.get("after")
+                page_keys, has_more = keyset_slice(keys, after, limit, descending)
+                items = [self._data[key] for key in page_keys]
+                last = page_keys[-1] if page_keys else None
+            else:
+                keys = sorted(
+                    keyset_sort_key(record.get(field), pk) for pk, record in self._data.items()
+                )
+                after = state.get("after")
+                if after is not None:
+                    after = keyset_sort_key(*after)
+                page_keys, has_more = keyset_slice(keys, after, limit, descending)
+                items = [self._data[key[2]] for key in page_keys]
+                last = [page_keys[-1][1], page_keys[-1][2]] if page_keys else None
+
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor({"order_by": order_by, "after": last})
+        return Page(items, next_cursor)
+
 
 class InMemoryCRUDDriver(CRUDDriver):
     """
@@ -18,6 +18,12 @@ from foobara_py.persistence.crud_driver import (
     CRUDDriver,
     CRUDTable,
 )
+from foobara_py.persistence.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
 
 
 class LocalFilesCRUDDriver(CRUDDriver):
@@ -122,6 +128,48 @@ class LocalFilesCRUDTable(CRUDTable):
 
         return records
 
+    def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[Dict[str, Any]]:
+        """
+        Page through the sorted record file index by offset.
+
+        Only the files on the requested page are read. Ordering by a field
+        requires reading every record, so it falls back to the generic
+        select()-based implementation.
+        """
+        if order_by is not None:
+            return super().find_page(cursor, limit, order_by)
+
+        state = decode_cursor(cursor, None)
+        offset = state.get("offset", 0)
+        index = self._record_index()
+
+        items = []
+        for file_path in index[offset : offset + limit]:
+            try:
+                with open(file_path, "r") as f:
+                    items.append(json.load(f))
+            except (json.JSONDecodeError, IOError):
+                continue
+
+        next_cursor = None
+        if offset + limit < len(index):
+            next_cursor = encode_cursor({"order_by": None, "offset": offset + limit})
+        return Page(items, next_cursor)
+
+    def _record_index(self) -> List[Path]:
+        """Record files sorted by id (numeric ids in numeric order)"""
+
+        def sort_key(file_path: Path):
+            stem = file_path.stem
+            return (0, int(stem), "") if stem.isdigit() else (1, 0, stem)
+
+        return sorted(self.table_dir.glob("*.json"), key=sort_key)
+
     def insert(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """Insert a new record"""
         # Get primary key field
@@ -79,8 +79,13 @@ def entity_to_sqlalchemy_table(
     columns = []
     pk_field = entity_class._primary_key_field
 
-    # Use get_type_hints to resolve any ForwardRefs
-    type_hints = get_type_hints(entity_class)
+    # Use get_type_hints to resolve any ForwardRefs. Pydantic has already resolved
+    # field annotations, so fall back to those when unrelated ClassVar forward
+    # refs (e.g. EntityBase._repository) cannot be evaluated.
+    try:
+        type_hints = get_type_hints(entity_class)
+    except NameError:
+        type_hints = {}
 
     for field_name, field_info in entity_class.model_fields.items():
         py_type = type_hints.get(field_name, field_info.annotation)
@@ -0,0 +1,168 @@
+"""
+Cursor pagination helpers for foobara-py persistence.
+
+Drivers and repositories return a Page of records plus an opaque continuation
+cursor. Cursors are URL-safe base64 JSON documents whose contents are driver
+specific (keyset values, scan cursors, index offsets), so callers must treat
+them as opaque strings and pass them back unchanged. Keyset values that JSON
+cannot represent (datetimes, UUIDs, decimals, bytes) are stored with a type
+tag and decoded back to the same type.
+
+Usage:
+    page = table.find_page(limit=100, order_by="created_at")
+    while True:
+        process(page.items)
+        if not page.has_more:
+            break
+        page = table.find_page(page.next_cursor, limit=100, order_by="created_at")
+
+    # Or simply
+    for record in table.iter_all(batch_size=100):
+        process(record)
+"""
+
+import base64
+import json
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal
+from uuid import UUID
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or used with a different ordering"""
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """
+    One page of results.
+
+    next_cursor is None when there are no further pages.
+    """
+
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        """Check if another page is available"""
+        return self.next_cursor is not None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+# Keyset value types that JSON cannot represent, tagged by name in cursors
+_CURSOR_TYPES = {
+    "datetime": (datetime, datetime.isoformat, datetime.fromisoformat),
+    "date": (date, date.isoformat, date.fromisoformat),
+    "time": (time, time.isoformat, time.fromisoformat),
+    "uuid": (UUID, str, UUID),
+    "decimal": (Decimal, str, Decimal),
+    "bytes": (bytes, lambda v: base64.b64encode(v).decode("ascii"), base64.b64decode),
+}
+
+_CURSOR_TYPE_TAG = "$type"
+
+
+def _encode_cursor_value(value: Any) -> Dict[str, str]:
+    # datetime is checked before its base class date
+    for name, (cls, encode, _) in _CURSOR_TYPES.items():
+        if isinstance(value, cls):
+            return {_CURSOR_TYPE_TAG: name, "value": encode(value)}
+    raise TypeError(f"Cannot store {type(value).__name__} in a pagination cursor")
+
+
+def _decode_cursor_value(obj: Dict[str, Any]) -> Any:
+    name = obj.get(_CURSOR_TYPE_TAG)
+    if name is None or set(obj) != {_CURSOR_TYPE_TAG, "value"}:
+        return obj
+    if name not in _CURSOR_TYPES:
+        raise ValueError(f"unknown cursor value type {name!r}")
+    return _CURSOR_TYPES[name][2](obj["value"])
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode driver-specific cursor state as an opaque string"""
+    raw = json.dumps(state, separators=(",", ":"), default=_encode_cursor_value).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], order_by: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Decode an opaque cursor back into driver-specific state.
+
+    Returns an empty dict when cursor is None (first page).
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or was issued for a
+            different order_by
+    """
+    if cursor is None:
+        return {}
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(
+            base64.urlsafe_b64decode(padded.encode("ascii")), object_hook=_decode_cursor_value
+        )
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {e}")
+
+    if not isinstance(state, dict):
+        raise InvalidCursorError("Malformed cursor")
+    if state.get("order_by") != order_by:
+        raise InvalidCursorError(
+            f"Cursor was issued for order_by={state.get('order_by')!r}, not {order_by!r}"
+        )
+    return state
+
+
+def parse_order_by(order_by: Optional[str]) -> Tuple[Optional[str], bool]:
+    """Split "field" / "-field" into (field, descending)"""
+    if not order_by:
+        return None, False
+    if order_by.startswith("-"):
+        return order_by[1:], True
+    return order_by, False
+
+
+def keyset_sort_key(value: Any, pk: Any) -> Tuple[Any, ...]:
+    """Sort key for (order value, primary key) pairs that places None values last"""
+    return (value is None, value, pk)
+
+
+def keyset_slice(
+    sorted_keys: Sequence[Any], after: Any, limit: int, descending: bool = False
+) -> Tuple[List[Any], bool]:
+    """
+    Take the next page of keys from an ascending sorted sequence.
+
+    Args:
+        sorted_keys: Keys sorted ascending
+        after: Last key of the previous page, or None for the first page
+        limit: Page size
+        descending: Walk the keys from the end
+
+    Returns:
+        (page keys, has_more)
+    """
+    if descending:
+        end = bisect_left(sorted_keys, after) if after is not None else len(sorted_keys)
+        start = max(0, end - limit - 1)
+        chunk = list(reversed(sorted_keys[start:end]))
+    else:
+        start = bisect_right(sorted_keys, after) if after is not None else 0
+        chunk = list(sorted_keys[start : start + limit + 1])
+
+    return chunk[:limit], len(chunk) > limit
@@ -27,8 +27,9 @@ Usage:
     table.delete(user_attrs["id"])
 """
 
-from typing import Any, Dict, Iterable, List, Optional, Type
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Type
 
+from foobara_py.persistence.columnar import ColumnBatch
 from foobara_py.persistence.crud_driver import (
     CannotDeleteError,
     CannotFindError,
@@ -37,6 +38,14 @@ from foobara_py.persistence.crud_driver import (
     CRUDDriver,
     CRUDTable,
 )
+from foobara_py.persistence.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    parse_order_by,
+)
+from foobara_py.persistence.statement_cache import StatementCache, statement_shape
 
 
 class PostgreSQLCRUDTable(CRUDTable):
@@ -44,6 +53,10 @@ class PostgreSQLCRUDTable(CRUDTable):
     PostgreSQL implementation of CRUDTable.
 
     Uses psycopg3 for database operations with connection pooling.
+
+    SQL strings are built once per operation shape (operation, where fields,
+    order_by, limit/offset presence) and executed as server-side prepared
+    statements. Result column names are cached per statement as well.
     """
 
     def __init__(
@@ -55,68 +68,83 @@ class PostgreSQLCRUDTable(CRUDTable):
     ):
         super().__init__(entity_class, driver, table_name)
         self.primary_key_field = primary_key_field
+        self.statements = StatementCache()
+        self._columns: Dict[Hashable, List[str]] = {}
 
     def _get_connection(self):
         """Get a connection from the pool"""
         return self.driver.pool.connection()
 
+    def _execute(self, cur: Any, key: Hashable, build: Callable[[], str], values: Any) -> None:
+        """Execute the cached SQL for key as a prepared statement"""
+        sql = self.statements.get_or_build(key, build)
+        cur.execute(sql, values, prepare=self.driver.prepare)
+
+    def _columns_for(self, key: Hashable, cur: Any) -> List[str]:
+        """Column names for a statement's result, read from cur.description once"""
+        columns = self._columns.get(key)
+        if columns is None:
+            columns = [desc[0] for desc in cur.description]
+            self._columns[key] = columns
+        return columns
+
+    def clear_statement_cache(self) -> None:
+        """Drop cached SQL and column lists (call after altering the table)"""
+        self.statements.clear()
+        self._columns.clear()
+
     def find(self, record_id: Any) -> Optional[Dict[str, Any]]:
         """Find record by primary key"""
-        sql = f"SELECT * FROM {self.table_name} WHERE {self.primary_key_field} = %s"
+        key = ("find",)
 
         with self._get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (record_id,))
+                self._execute(
+                    cur,
+                    key,
+                    lambda: f"SELECT * FROM {self.table_name} WHERE {self.primary_key_field} = %s",
+                    (record_id,),
+                )
                 row = cur.fetchone()
 
                 if row is None:
                     return None
 
                 # Convert row to dict using column names
-                columns = [desc[0] for desc in cur.description]
-                return dict(zip(columns, row))
+                return dict(zip(self._columns_for(key, cur), row))
 
     def all(self, page_size: Optional[int] = None) -> Iterable[Dict[str, Any]]:
         """Return all records in the table"""
-        sql = f"SELECT * FROM {self.table_name}"
-        if page_size:
-            sql += f" LIMIT {page_size}"
-
-        with self._get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql)
-                columns = [desc[0] for desc in cur.description]
-
-                for row in cur:
-                    yield dict(zip(columns, row))
+        return self.select(limit=page_size or None)
 
     def insert(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """Insert a new record and return its attributes (including generated PK)"""
         if not attributes:
             raise CannotInsertError(None, "No attributes provided")
 
-        columns = list(attributes.keys())
-        placeholders = ["%s"] * len(columns)
+        columns = tuple(attributes.keys())
         values = [attributes[col] for col in columns]
+        key = ("insert", columns)
 
-        sql = f"""
-            INSERT INTO {self.table_name} ({", ".join(columns)})
-            VALUES ({", ".join(placeholders)})
-            RETURNING *
-        """
+        def build() -> str:
+            placeholders = ["%s"] * len(columns)
+            return f"""
+                INSERT INTO {self.table_name} ({", ".join(columns)})
+                VALUES ({", ".join(placeholders)})
+                RETURNING *
+            """
 
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(sql, values)
+                    self._execute(cur, key, build, values)
                     row = cur.fetchone()
 
                     if row is None:
                         raise CannotInsertError(None, "INSERT did not return a row")
 
                     # Convert row to dict
-                    result_columns = [desc[0] for desc in cur.description]
-                    result = dict(zip(result_columns, row))
+                    result = dict(zip(self._columns_for(key, cur), row))
 
                     # Commit the transaction
                     conn.commit()
@@ -131,30 +159,32 @@ class PostgreSQLCRUDTable(CRUDTable):
         if not attributes:
             raise CannotUpdateError(record_id, "No attributes provided")
 
-        # Build SET clause
-        set_parts = [f"{col} = %s" for col in attributes.keys()]
+        columns = tuple(attributes.keys())
         values = list(attributes.values())
         values.append(record_id)  # For WHERE clause
-
-        sql = f"""
-            UPDATE {self.table_name}
-            SET {", ".join(set_parts)}
-            WHERE {self.primary_key_field} = %s
-            RETURNING *
-        """
+        key = ("update", columns)
+
+        def build() -> str:
+            # Build SET clause
+            set_parts = [f"{col} = %s" for col in columns]
+            return f"""
+                UPDATE {self.table_name}
+                SET {", ".join(set_parts)}
+                WHERE {self.primary_key_field} = %s
+                RETURNING *
+            """
 
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(sql, values)
+                    self._execute(cur, key, build, values)
                     row = cur.fetchone()
 
                     if row is None:
                         raise CannotUpdateError(record_id, "Record not found or update failed")
 
                     # Convert row to dict
-                    columns = [desc[0] for desc in cur.description]
-                    result = dict(zip(columns, row))
+                    result = dict(zip(self._columns_for(key, cur), row))
 
                     # Commit the transaction
                     conn.commit()
@@ -168,12 +198,15 @@ class PostgreSQLCRUDTable(CRUDTable):
 
     def delete(self, record_id: Any) -> bool:
         """Delete a record by primary key, return True if deleted"""
-        sql = f"DELETE FROM {self.table_name} WHERE {self.primary_key_field} = %s"
-
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute(sql, (record_id,))
+                    self._execute(
+                        cur,
+                        ("delete",),
+                        lambda: f"DELETE FROM {self.table_name} WHERE {self.primary_key_field} = %s",
+                        (record_id,),
+                    )
                     deleted_count = cur.rowcount
 
                     # Commit the transaction
@@ -186,11 +219,11 @@ class PostgreSQLCRUDTable(CRUDTable):
 
     def count(self) -> int:
         """Count total records in the table"""
-        sql = f"SELECT COUNT(*) FROM {self.table_name}"
-
         with self._get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql)
+                self._execute(
+                    cur, ("count",), lambda: f"SELECT COUNT(*) FROM {self.table_name}", ()
+                )
                 result = cur.fetchone()
                 return result[0] if result else 0
 
@@ -202,14 +235,143 @@ class PostgreSQLCRUDTable(CRUDTable):
         offset: Optional[int] = None,
     ) -> Iterable[Dict[str, Any]]:
         """Select records matching criteria"""
-        sql = f"SELECT * FROM {self.table_name}"
-        values = []
+        key = statement_shape("select", where, order_by, limit, offset)
+        values = self._select_values(where, limit, offset)
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                self._execute(
+                    cur,
+                    key,
+                    lambda: self._build_select_sql("*", where, order_by, limit, offset),
+                    values,
+                )
+                columns = self._columns_for(key, cur)
+
+                for row in cur:
+                    yield dict(zip(columns, row))
+
+    def select_columnar(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str | List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> ColumnBatch:
+        """Select only the requested columns and build the batch from raw row tuples"""
+        fields = tuple(fields) if fields else None
+        key = (statement_shape("select", where, order_by, limit, offset), fields)
+        projection = ", ".join(fields) if fields else "*"
+        values = self._select_values(where, limit, offset)
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                self._execute(
+                    cur,
+                    key,
+                    lambda: self._build_select_sql(projection, where, order_by, limit, offset),
+                    values,
+                )
+                columns = list(fields) if fields else self._columns_for(key, cur)
+                return ColumnBatch.from_tuples(cur.fetchall(), columns, self.entity_class)
+
+    def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[Dict[str, Any]]:
+        """
+        Keyset pagination: WHERE (order_col, pk) > (last_value, last_pk)
+
+        NULL order values sort last (first when descending), matching
+        keyset_sort_key in the in-memory drivers.
+        """
+        state = decode_cursor(cursor, order_by)
+        field, descending = parse_order_by(order_by)
+        pk = self.primary_key_field
+        order_col = field or pk
+        after = state.get("after")
+        # None: first page; otherwise whether the last order value was NULL
+        after_null = None if after is None else after[0] is None
+        key = ("find_page", order_by, after_null)
+
+        def build() -> str:
+            op = "<" if descending else ">"
+            sql = f"SELECT * FROM {self.table_name}"
+            if after_null is not None:
+                if order_col == pk:
+                    sql += f" WHERE {pk} {op} %s"
+                elif after_null and descending:
+                    sql += f" WHERE ({order_col} IS NOT NULL OR {pk} < %s)"
+                elif after_null:
+                    sql += f" WHERE {order_col} IS NULL AND {pk} > %s"
+                elif descending:
+                    sql += f" WHERE ({order_col}, {pk}) < (%s, %s)"
+                else:
+                    sql += f" WHERE (({order_col}, {pk}) > (%s, %s) OR {order_col} IS NULL)"
+            if order_col == pk:
+                sql += f" ORDER BY {pk} {'DESC' if descending else 'ASC'}"
+            elif descending:
+                sql += f" ORDER BY {order_col} DESC NULLS FIRST, {pk} DESC"
+            else:
+                sql += f" ORDER BY {order_col} ASC NULLS LAST, {pk} ASC"
+            return sql + " LIMIT %s"
+
+        values: List[Any] = []
+        if after is not None:
+            last_value, last_pk = after
+            if order_col == pk or after_null:
+                values.append(last_pk)
+            else:
+                values.extend([last_value, last_pk])
+        values.append(limit + 1)
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                self._execute(cur, key, build, values)
+                columns = self._columns_for(key, cur)
+                rows = [dict(zip(columns, row)) for row in cur.fetchall()]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(
+                {"order_by": order_by, "after": [last[order_col], last[pk]]}
+            )
+        return Page(rows, next_cursor)
+
+    def _select_values(
+        self, where: Optional[Dict[str, Any]], limit: Optional[int], offset: Optional[int]
+    ) -> List[Any]:
+        """Bound values for a statement built by _build_select_sql"""
+        values = [value for value in where.values() if value is not None] if where else []
+        if limit is not None:
+            values.append(limit)
+        if offset is not None:
+            values.append(offset)
+        return values
+
+    def _build_select_sql(
+        self,
+        projection: str,
+        where: Optional[Dict[str, Any]],
+        order_by: Optional[str | List[str]],
+        limit: Optional[int],
+        offset: Optional[int],
+    ) -> str:
+        """Build a parameterized SELECT statement for the given query shape"""
+        sql = f"SELECT {projection} FROM {self.table_name}"
 
         # Build WHERE clause
         if where:
-            conditions = [f"{col} = %s" for col in where.keys()]
+            conditions = [
+                f"{col} IS NULL" if value is None else f"{col} = %s"
+                for col, value in where.items()
+            ]
             sql += f" WHERE {' AND '.join(conditions)}"
-            values.extend(where.values())
 
         # Build ORDER BY clause
         if order_by:
@@ -218,19 +380,13 @@ class PostgreSQLCRUDTable(CRUDTable):
             else:
                 sql += f" ORDER BY {', '.join(order_by)}"
 
-        # Add LIMIT and OFFSET
+        # Add LIMIT and OFFSET as parameters so the statement can be reused
         if limit is not None:
-            sql += f" LIMIT {limit}"
+            sql += " LIMIT %s"
         if offset is not None:
-            sql += f" OFFSET {offset}"
-
-        with self._get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql, values)
-                columns = [desc[0] for desc in cur.description]
+            sql += " OFFSET %s"
 
-                for row in cur:
-                    yield dict(zip(columns, row))
+        return sql
 
 
 class PostgreSQLCRUDDriver(CRUDDriver):
@@ -243,6 +399,7 @@ class PostgreSQLCRUDDriver(CRUDDriver):
     - Connection pooling for performance
     - Transaction support
     - SQL injection protection via parameterized queries
+    - Cached, server-side prepared statements
     - Automatic table name derivation
 
     Usage:
@@ -264,6 +421,7 @@ class PostgreSQLCRUDDriver(CRUDDriver):
         pool_size: int = 10,
         table_prefix: Optional[str] = None,
         primary_key_field: str = "id",
+        prepare: Optional[bool] = True,
     ):
         """
         Initialize PostgreSQL CRUD driver.
@@ -274,6 +432,10 @@ class PostgreSQLCRUDDriver(CRUDDriver):
             pool_size: Maximum number of connections in the pool
             table_prefix: Optional prefix for table names
             primary_key_field: Default primary key field name
+            prepare: Passed to psycopg's ``execute(prepare=...)``. True prepares
+                every statement server-side on first use; None leaves it to
+                psycopg's prepare_threshold; False disables preparation
+                (e.g. behind PgBouncer in transaction mode)
         """
         super().__init__(connection_string, table_prefix)
 
@@ -288,6 +450,7 @@ class PostgreSQLCRUDDriver(CRUDDriver):
         self.connection_string = connection_string
         self.pool_size = pool_size
         self.primary_key_field = primary_key_field
+        self.prepare = prepare
 
         # Create connection pool
         self.pool = ConnectionPool(
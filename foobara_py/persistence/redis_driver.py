@@ -16,6 +16,12 @@ from foobara_py.persistence.crud_driver import (
     CRUDDriver,
     CRUDTable,
 )
+from foobara_py.persistence.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
 
 
 class RedisCRUDTable(CRUDTable):
@@ -83,7 +89,10 @@ class RedisCRUDTable(CRUDTable):
         if not data:
             return None
 
-        # Deserialize all values
+        return self._decode_record(data)
+
+    def _decode_record(self, data: Dict[Any, Any]) -> Dict[str, Any]:
+        """Deserialize all values of a raw Redis hash"""
         result = {}
         for field, value in data.items():
             field_name = field.decode("utf-8") if isinstance(field, bytes) else field
@@ -109,6 +118,50 @@ class RedisCRUDTable(CRUDTable):
 
         return results
 
+    def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[Dict[str, Any]]:
+        """
+        Page through the id index with SSCAN.
+
+        Unordered pages walk the index set incrementally without loading all
+        ids. SSCAN gives no ordering guarantees, so ordered pages fall back to
+        the generic select()-based implementation.
+        """
+        if order_by is not None:
+            return super().find_page(cursor, limit, order_by)
+
+        state = decode_cursor(cursor, None)
+        scan_cursor = state.get("scan", 0)
+        ids: List[str] = state.get("pending", [])
+
+        # scan_cursor is None once SSCAN has wrapped around to 0
+        while len(ids) < limit and scan_cursor is not None:
+            scan_cursor, batch = self.redis.sscan(self._index_key, cursor=scan_cursor, count=limit)
+            for record_id in batch:
+                rid = record_id.decode("utf-8") if isinstance(record_id, bytes) else record_id
+                if rid not in ids:
+                    ids.append(rid)
+            if scan_cursor == 0:
+                scan_cursor = None
+
+        page_ids, pending = ids[:limit], ids[limit:]
+
+        pipe = self.redis.pipeline()
+        for record_id in page_ids:
+            pipe.hgetall(self._record_key(record_id))
+        items = [self._decode_record(data) for data in pipe.execute() if data]
+
+        next_cursor = None
+        if pending or scan_cursor is not None:
+            next_cursor = encode_cursor(
+                {"order_by": None, "scan": scan_cursor, "pending": pending}
+            )
+        return Page(items, next_cursor)
+
     def insert(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """Insert a new record"""
         pk_field = self.entity_class._primary_key_field
@@ -203,7 +256,10 @@ class RedisCRUDTable(CRUDTable):
             for field in reversed(order_by):
                 reverse = field.startswith("-")
                 key_field = field[1:] if reverse else field
-                results.sort(key=lambda x: x.get(key_field) or "", reverse=reverse)
+                # None sorts last; falsy values like 0 keep their own type
+                results.sort(
+                    key=lambda x: (x.get(key_field) is None, x.get(key_field)), reverse=reverse
+                )
 
         start = offset or 0
         end = start + limit if limit else None
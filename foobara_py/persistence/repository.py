@@ -11,6 +11,8 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterable,
+    Iterator,
     List,
     Optional,
     Protocol,
@@ -19,7 +21,17 @@ from typing import (
     runtime_checkable,
 )
 
+from foobara_py.persistence.columnar import ColumnBatch
 from foobara_py.persistence.entity import EntityBase, PrimaryKey
+from foobara_py.persistence.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    keyset_slice,
+    keyset_sort_key,
+    parse_order_by,
+)
 
 
 @runtime_checkable
@@ -79,6 +91,23 @@ class Repository(ABC):
         """Check if entity exists (default implementation)"""
         return self.find(entity_class, pk) is not None
 
+    def find_many(
+        self, entity_class: Type[EntityBase], pks: Iterable[PrimaryKey]
+    ) -> Dict[PrimaryKey, EntityBase]:
+        """
+        Find several entities by primary key in one call.
+
+        Returns a dict of the entities found, keyed by primary key; missing
+        keys are left out. The default implementation calls find() per key;
+        override it to load the batch with a single query.
+        """
+        found = {}
+        for pk in pks:
+            entity = self.find(entity_class, pk)
+            if entity is not None:
+                found[pk] = entity
+        return found
+
     def find_by(self, entity_class: Type[EntityBase], **criteria) -> List[EntityBase]:
         """
         Find entities matching criteria.
@@ -118,6 +147,112 @@ class Repository(ABC):
         """Count entities of a type"""
         return len(self.find_all(entity_class))
 
+    def find_page(
+        self,
+        entity_class: Type[EntityBase],
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[EntityBase]:
+        """
+        Return one page of entities and an opaque cursor for the next page.
+
+        Entities are ordered by order_by ("field" or "-field"), with the
+        primary key as tie-breaker, or by primary key when order_by is None.
+
+        Default implementation is a fallback: every page loads and sorts all
+        entities from find_all(), so walking N entities costs O(N^2).
+        Repositories are expected to override it with an index or a keyset
+        query that loads one page at a time (see InMemoryRepository).
+
+        Usage:
+            page = repo.find_page(User, limit=50, order_by="-created_at")
+            next_page = repo.find_page(User, page.next_cursor, 50, "-created_at")
+        """
+        state = decode_cursor(cursor, order_by)
+        field, descending = parse_order_by(order_by)
+
+        entries = {}
+        for entity in self.find_all(entity_class):
+            value = getattr(entity, field, None) if field else None
+            entries[keyset_sort_key(value, entity.primary_key)] = entity
+
+        page_keys, has_more = self._keyset_page(sorted(entries), state, limit, descending)
+        next_cursor = self._next_cursor(order_by, page_keys, has_more)
+        return Page([entries[key] for key in page_keys], next_cursor)
+
+    @staticmethod
+    def _keyset_page(
+        sorted_keys: List[tuple], state: Dict[str, Any], limit: int, descending: bool
+    ) -> tuple:
+        """Slice the next page of keyset_sort_key tuples after the cursor state"""
+        after = state.get("after")
+        if after is not None:
+            after = keyset_sort_key(*after)
+        return keyset_slice(sorted_keys, after, limit, descending)
+
+    @staticmethod
+    def _next_cursor(
+        order_by: Optional[str], page_keys: List[tuple], has_more: bool
+    ) -> Optional[str]:
+        if not has_more:
+            return None
+        last = page_keys[-1]
+        return encode_cursor({"order_by": order_by, "after": [last[1], last[2]]})
+
+    def iter_all(
+        self,
+        entity_class: Type[EntityBase],
+        batch_size: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Iterator[EntityBase]:
+        """
+        Iterate over all entities of a type, one page at a time.
+
+        Usage:
+            for user in repo.iter_all(User, batch_size=500):
+                send_newsletter(user)
+        """
+        cursor = None
+        while True:
+            page = self.find_page(entity_class, cursor, limit=batch_size, order_by=order_by)
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def scan_columns(
+        self,
+        entity_class: Type[EntityBase],
+        fields: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> ColumnBatch:
+        """
+        Scan entities into a column-oriented batch for vectorised aggregation.
+
+        Numeric fields are returned as NumPy arrays (when NumPy is installed),
+        other fields as lists. Repositories backed by a CRUDTable should
+        override this to use ``CRUDTable.select_columnar`` and skip entity
+        construction entirely.
+
+        Usage:
+            batch = repo.scan_columns(Order, ["total"], where={"status": "paid"})
+            revenue = batch["total"].sum()
+
+        Args:
+            entity_class: Entity type to scan
+            fields: Fields to include (defaults to all model fields)
+            where: Field/value pairs to match
+
+        Returns:
+            ColumnBatch with one column per field
+        """
+        if where:
+            entities = self.find_by(entity_class, **where)
+        else:
+            entities = self.find_all(entity_class)
+        return ColumnBatch.from_entities(entities, fields, entity_class)
+
 
 class InMemoryRepository(Repository):
     """
@@ -125,14 +260,20 @@ class InMemoryRepository(Repository):
 
     Stores entities in memory using a dict keyed by (entity_class, pk).
     Thread-safe for concurrent access.
+
+    find_page() keeps sorted keyset indexes per entity type and ordering,
+    built on first use and dropped when that type is saved or deleted, so
+    paging through unchanged data costs O(log n + limit) per page.
     """
 
-    __slots__ = ("_storage", "_lock", "_auto_increment")
+    __slots__ = ("_storage", "_lock", "_auto_increment", "_sorted_index")
 
     def __init__(self):
         self._storage: Dict[tuple, EntityBase] = {}
         self._lock = threading.RLock()
         self._auto_increment: Dict[Type[EntityBase], int] = {}
+        # entity type name -> order field (None for primary key) -> sorted keyset keys
+        self._sorted_index: Dict[str, Dict[Optional[str], List[tuple]]] = {}
 
     def find(self, entity_class: Type[EntityBase], pk: PrimaryKey) -> Optional[EntityBase]:
         """Find entity by primary key"""
@@ -140,6 +281,17 @@ class InMemoryRepository(Repository):
             key = (entity_class.__name__, pk)
             return self._storage.get(key)
 
+    def find_many(
+        self, entity_class: Type[EntityBase], pks: Iterable[PrimaryKey]
+    ) -> Dict[PrimaryKey, EntityBase]:
+        """Find several entities by primary key under a single lock"""
+        name = entity_class.__name__
+        with self._lock:
+            storage = self._storage
+            return {
+                pk: storage[(name, pk)] for pk in pks if (name, pk) in storage
+            }
+
     def find_all(self, entity_class: Type[EntityBase]) -> List[EntityBase]:
         """Find all entities of a type"""
         with self._lock:
@@ -149,6 +301,34 @@ class InMemoryRepository(Repository):
                 if cls_name == entity_class.__name__
             ]
 
+    def find_page(
+        self,
+        entity_class: Type[EntityBase],
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[EntityBase]:
+        """Keyset pagination over a sorted index of (order value, pk) keys"""
+        state = decode_cursor(cursor, order_by)
+        field, descending = parse_order_by(order_by)
+        if field == entity_class._primary_key_field:
+            field = None
+        name = entity_class.__name__
+
+        with self._lock:
+            indexes = self._sorted_index.setdefault(name, {})
+            keys = indexes.get(field)
+            if keys is None:
+                keys = indexes[field] = sorted(
+                    keyset_sort_key(getattr(entity, field, None) if field else None, pk)
+                    for (cls_name, pk), entity in self._storage.items()
+                    if cls_name == name
+                )
+            page_keys, has_more = self._keyset_page(keys, state, limit, descending)
+            items = [self._storage[(name, key[2])] for key in page_keys]
+
+        return Page(items, self._next_cursor(order_by, page_keys, has_more))
+
     def save(self, entity: EntityBase) -> EntityBase:
         """Save entity (create or update)"""
         from foobara_py.persistence.entity_callbacks import EntityCallbackRegistry, EntityLifecycle
@@ -177,6 +357,14 @@ class InMemoryRepository(Repository):
 
             # Perform the save
             key = (entity_class.__name__, pk)
+            indexes = self._sorted_index.get(entity_class.__name__)
+            if indexes:
+                if key in self._storage:
+                    # Primary keys are unchanged, attribute values may not be
+                    indexes = {None: indexes[None]} if None in indexes else {}
+                    self._sorted_index[entity_class.__name__] = indexes
+                else:
+                    del self._sorted_index[entity_class.__name__]
             self._storage[key] = entity
             entity.mark_persisted()
 
@@ -205,6 +393,7 @@ class InMemoryRepository(Repository):
 
             # Perform the delete
             del self._storage[key]
+            self._sorted_index.pop(key[0], None)
 
             # Run after_delete callbacks
             EntityCallbackRegistry.run_callbacks(entity, EntityLifecycle.AFTER_DELETE)
@@ -229,6 +418,7 @@ class InMemoryRepository(Repository):
         with self._lock:
             self._storage.clear()
             self._auto_increment.clear()
+            self._sorted_index.clear()
 
     def count_all(self) -> int:
         """Count all entities across all types"""
@@ -383,6 +573,7 @@ class TransactionalInMemoryRepository(InMemoryRepository):
                     # Restore deleted entity
                     self._storage[key] = entry["previous"]
 
+            self._sorted_index.clear()
             self._transaction_log = []
             self._in_transaction = False
 
@@ -416,6 +607,7 @@ class TransactionalInMemoryRepository(InMemoryRepository):
                 )
 
                 self._storage[key] = entity
+                self._sorted_index.pop(key[0], None)
                 entity.mark_persisted()
                 return entity
             else:
@@ -433,6 +625,7 @@ class TransactionalInMemoryRepository(InMemoryRepository):
                         {"action": "delete", "key": key, "previous": previous}
                     )
                     del self._storage[key]
+                    self._sorted_index.pop(key[0], None)
                     return True
                 return False
             else:
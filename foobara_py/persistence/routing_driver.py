@@ -0,0 +1,392 @@
+"""
+Read/write splitting and sharding router for CRUD drivers.
+
+RoutingCRUDDriver wraps several CRUDDrivers behind the regular CRUDDriver
+interface:
+
+- Writes always go to the primary driver.
+- Reads go to a replica (round-robin or least-loaded) unless the current
+  thread has written inside an open transaction, in which case reads are
+  pinned to the primary so they see their own writes.
+- Sharded entity classes are routed by a shard-key function to one of several
+  shard drivers. Shard drivers can themselves be RoutingCRUDDrivers, giving
+  each shard its own primary and replicas.
+
+Usage:
+    router = RoutingCRUDDriver(primary, replicas=[replica1, replica2])
+    router.shard(Order, {"eu": eu_driver, "us": us_driver}, key=lambda r: r["region"])
+
+    users = router.table_for(User)
+    users.insert({"name": "John"})   # primary
+    users.find(1)                    # replica
+
+    # Pin reads after writes for the duration of a command
+    class CreateUser(Command[...]):
+        _transaction_config = TransactionConfig.with_handler(router.transaction_handler)
+"""
+
+import itertools
+import threading
+import zlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+from foobara_py.core.transactions import get_current_transaction
+from foobara_py.persistence.columnar import ColumnBatch
+from foobara_py.persistence.crud_driver import CRUDDriver, CRUDTable
+from foobara_py.persistence.pagination import DEFAULT_PAGE_SIZE, Page
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+
+
+class RoutingCRUDTable(CRUDTable):
+    """
+    CRUDTable that sends writes to the primary and reads to a replica.
+    """
+
+    def __init__(self, entity_class: Type, driver: "RoutingCRUDDriver"):
+        super().__init__(entity_class, driver, driver.primary.table_for(entity_class).table_name)
+
+    def _read(self, method: str, *args, **kwargs) -> Any:
+        return self.driver._call_read(self.entity_class, method, *args, **kwargs)
+
+    def _write(self, method: str, *args, **kwargs) -> Any:
+        self.driver._record_write()
+        return getattr(self.driver.primary.table_for(self.entity_class), method)(*args, **kwargs)
+
+    # Reads
+
+    def find(self, record_id: Any) -> Optional[Dict[str, Any]]:
+        return self._read("find", record_id)
+
+    def all(self, page_size: Optional[int] = None) -> Iterable[Dict[str, Any]]:
+        return self._read("all", page_size)
+
+    def count(self) -> int:
+        return self._read("count")
+
+    def select(
+        self,
+        where: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterable[Dict[str, Any]]:
+        return self._read("select", where=where, order_by=order_by, limit=limit, offset=offset)
+
+    def select_columnar(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> ColumnBatch:
+        return self._read(
+            "select_columnar", fields, where=where, order_by=order_by, limit=limit, offset=offset
+        )
+
+    def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[Dict[str, Any]]:
+        return self._read("find_page", cursor, limit, order_by)
+
+    def exists(self, record_id: Any) -> bool:
+        return self._read("exists", record_id)
+
+    def find_by(self, **criteria) -> Optional[Dict[str, Any]]:
+        return self._read("find_by", **criteria)
+
+    def find_all_by(self, **criteria) -> List[Dict[str, Any]]:
+        return self._read("find_all_by", **criteria)
+
+    # Writes
+
+    def insert(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        return self._write("insert", attributes)
+
+    def update(self, record_id: Any, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        return self._write("update", record_id, attributes)
+
+    def delete(self, record_id: Any) -> bool:
+        return self._write("delete", record_id)
+
+
+class ShardedCRUDTable(CRUDTable):
+    """
+    CRUDTable that routes records to one of several shard drivers.
+
+    Inserts are routed by key(attributes). Primary key operations are routed
+    by pk_key(record_id) when given, otherwise they are tried on each shard.
+    Scans (all/select/count) fan out to every shard and merge the results.
+    """
+
+    def __init__(
+        self,
+        entity_class: Type,
+        driver: "RoutingCRUDDriver",
+        shards: Mapping[str, CRUDDriver],
+        key: Callable[[Dict[str, Any]], Any],
+        pk_key: Optional[Callable[[Any], Any]] = None,
+    ):
+        super().__init__(entity_class, driver)
+        self.shards = dict(shards)
+        self.key = key
+        self.pk_key = pk_key
+        self._shard_names = sorted(self.shards)
+
+    def shard_name_for(self, shard_key: Any) -> str:
+        """Map a shard-key value to a shard name (by name, else by stable hash)"""
+        if shard_key in self.shards:
+            return shard_key
+        index = zlib.crc32(str(shard_key).encode("utf-8")) % len(self._shard_names)
+        return self._shard_names[index]
+
+    def _table(self, shard_name: str) -> CRUDTable:
+        return self.shards[shard_name].table_for(self.entity_class)
+
+    def _tables(self) -> Iterator[CRUDTable]:
+        for name in self._shard_names:
+            yield self._table(name)
+
+    def _tables_for_pk(self, record_id: Any) -> Iterator[CRUDTable]:
+        if self.pk_key is not None:
+            yield self._table(self.shard_name_for(self.pk_key(record_id)))
+        else:
+            yield from self._tables()
+
+    def find(self, record_id: Any) -> Optional[Dict[str, Any]]:
+        for table in self._tables_for_pk(record_id):
+            record = table.find(record_id)
+            if record is not None:
+                return record
+        return None
+
+    def all(self, page_size: Optional[int] = None) -> Iterable[Dict[str, Any]]:
+        records = []
+        for table in self._tables():
+            records.extend(table.all(page_size))
+            if page_size and len(records) >= page_size:
+                return records[:page_size]
+        return records
+
+    def insert(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        return self._table(self.shard_name_for(self.key(attributes))).insert(attributes)
+
+    def update(self, record_id: Any, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        tables = list(self._tables_for_pk(record_id))
+        for table in tables[:-1]:
+            if table.exists(record_id):
+                return table.update(record_id, attributes)
+        return tables[-1].update(record_id, attributes)
+
+    def delete(self, record_id: Any) -> bool:
+        return any(table.delete(record_id) for table in self._tables_for_pk(record_id))
+
+    def count(self) -> int:
+        return sum(table.count() for table in self._tables())
+
+    def select(
+        self,
+        where: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Iterable[Dict[str, Any]]:
+        # Each shard returns its first offset+limit rows; the merged window is
+        # then sorted and sliced once.
+        shard_limit = (offset or 0) + limit if limit else None
+        records = []
+        for table in self._tables():
+            records.extend(table.select(where=where, order_by=order_by, limit=shard_limit))
+
+        if order_by:
+            fields = [order_by] if isinstance(order_by, str) else order_by
+            for field in reversed(fields):
+                reverse = field.startswith("-")
+                key_field = field[1:] if reverse else field
+                records.sort(
+                    key=lambda r: (r.get(key_field) is None, r.get(key_field)), reverse=reverse
+                )
+
+        start = offset or 0
+        end = start + limit if limit else None
+        return records[start:end]
+
+
+class RoutingCRUDDriver(CRUDDriver):
+    """
+    CRUDDriver that splits reads and writes across several drivers.
+
+    Args:
+        primary: Driver that receives all writes (and pinned reads)
+        replicas: Drivers that serve reads; defaults to reading from primary
+        strategy: "round_robin" or "least_loaded" replica selection
+
+    Reads after a write are pinned to the primary while a transaction is
+    open, either one begun through this driver (begin_transaction or
+    transaction_handler) or a foobara_py ``transaction()`` context.
+    """
+
+    def __init__(
+        self,
+        primary: CRUDDriver,
+        replicas: Optional[Sequence[CRUDDriver]] = None,
+        strategy: str = ROUND_ROBIN,
+        table_prefix: Optional[str] = None,
+    ):
+        super().__init__(connection_info=None, table_prefix=table_prefix)
+        if strategy not in (ROUND_ROBIN, LEAST_LOADED):
+            raise ValueError(f"Unknown replica strategy: {strategy!r}")
+
+        self.primary = primary
+        self.replicas = list(replicas or [])
+        self.strategy = strategy
+        self._shards: Dict[str, Dict[str, Any]] = {}
+        self._round_robin = itertools.cycle(range(len(self.replicas)))
+        self._in_flight = [0] * len(self.replicas)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def shard(
+        self,
+        entity_class: Type,
+        shards: Mapping[str, CRUDDriver],
+        key: Callable[[Dict[str, Any]], Any],
+        pk_key: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        """
+        Shard an entity class across several drivers.
+
+        Args:
+            entity_class: Entity class to shard
+            shards: Shard name to driver
+            key: Returns the shard key for a record's attributes. A key equal
+                to a shard name selects that shard; other values are hashed.
+            pk_key: Optional shard key for a primary key. Without it, primary
+                key operations are tried on every shard.
+        """
+        if not shards:
+            raise ValueError("At least one shard is required")
+        self._shards[entity_class.__name__] = {"shards": shards, "key": key, "pk_key": pk_key}
+        self._tables.pop(entity_class.__name__, None)
+
+    def table_for(self, entity_class: Type) -> CRUDTable:
+        entity_name = entity_class.__name__
+        if entity_name not in self._tables:
+            sharding = self._shards.get(entity_name)
+            if sharding:
+                self._tables[entity_name] = ShardedCRUDTable(entity_class, self, **sharding)
+            else:
+                self._tables[entity_name] = RoutingCRUDTable(entity_class, self)
+        return self._tables[entity_name]
+
+    # Read routing
+
+    @property
+    def reads_pinned_to_primary(self) -> bool:
+        """Check if the current thread must read from the primary"""
+        if not self.replicas:
+            return True
+        local = self._local
+        if getattr(local, "depth", 0) > 0 and getattr(local, "wrote", False):
+            return True
+        ctx = get_current_transaction()
+        return ctx is not None and ctx.is_active and getattr(local, "pinned_context", None) is ctx
+
+    def _record_write(self) -> None:
+        local = self._local
+        if getattr(local, "depth", 0) > 0:
+            local.wrote = True
+        ctx = get_current_transaction()
+        if ctx is not None and ctx.is_active:
+            local.pinned_context = ctx
+
+    def _call_read(self, entity_class: Type, method: str, *args, **kwargs) -> Any:
+        if self.reads_pinned_to_primary:
+            return getattr(self.primary.table_for(entity_class), method)(*args, **kwargs)
+
+        index = self._choose_replica()
+        try:
+            return getattr(self.replicas[index].table_for(entity_class), method)(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight[index] -= 1
+
+    def _choose_replica(self) -> int:
+        with self._lock:
+            if self.strategy == LEAST_LOADED:
+                index = min(range(len(self.replicas)), key=self._in_flight.__getitem__)
+            else:
+                index = next(self._round_robin)
+            self._in_flight[index] += 1
+            return index
+
+    # Transactions (primary only)
+
+    def begin_transaction(self) -> Any:
+        local = self._local
+        local.depth = getattr(local, "depth", 0) + 1
+        return self.primary.begin_transaction()
+
+    def commit_transaction(self, raw_tx: Any) -> None:
+        try:
+            self.primary.commit_transaction(raw_tx)
+        finally:
+            self._end_transaction()
+
+    def rollback_transaction(self, raw_tx: Any) -> None:
+        try:
+            self.primary.rollback_transaction(raw_tx)
+        finally:
+            self._end_transaction()
+
+    def _end_transaction(self) -> None:
+        local = self._local
+        local.depth = max(0, getattr(local, "depth", 0) - 1)
+        if local.depth == 0:
+            local.wrote = False
+
+    def transaction_handler(self) -> "RoutingTransactionHandler":
+        """Create a TransactionHandler for use with TransactionConfig.with_handler"""
+        return RoutingTransactionHandler(self)
+
+
+class RoutingTransactionHandler:
+    """
+    TransactionHandler that opens a transaction on a RoutingCRUDDriver.
+
+    While it is open, reads issued after a write are pinned to the primary.
+    """
+
+    __slots__ = ("_driver", "_raw_tx")
+
+    def __init__(self, driver: RoutingCRUDDriver):
+        self._driver = driver
+        self._raw_tx = None
+
+    def begin(self) -> None:
+        self._raw_tx = self._driver.begin_transaction()
+
+    def commit(self) -> None:
+        self._driver.commit_transaction(self._raw_tx)
+        self._raw_tx = None
+
+    def rollback(self) -> None:
+        self._driver.rollback_transaction(self._raw_tx)
+        self._raw_tx = None
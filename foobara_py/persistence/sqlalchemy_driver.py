@@ -2,7 +2,7 @@
 SQLAlchemy implementation of CRUDDriver for foobara-py.
 """
 
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union
 
 from sqlalchemy import (
     Column,
@@ -10,16 +10,20 @@ from sqlalchemy import (
     Engine,
     MetaData,
     Table,
+    and_,
+    bindparam,
     create_engine,
     delete,
     func,
     insert,
     inspect,
+    or_,
     select,
     update,
 )
 from sqlalchemy.schema import CreateTable
 
+from foobara_py.persistence.columnar import ColumnBatch
 from foobara_py.persistence.crud_driver import (
     CannotDeleteError,
     CannotFindError,
@@ -29,11 +33,23 @@ from foobara_py.persistence.crud_driver import (
     CRUDTable,
 )
 from foobara_py.persistence.mapping import entity_to_sqlalchemy_table
+from foobara_py.persistence.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    parse_order_by,
+)
+from foobara_py.persistence.statement_cache import StatementCache, statement_shape
 
 
 class SQLAlchemyTable(CRUDTable):
     """
     CRUDTable implementation using SQLAlchemy.
+
+    Statements are built once per operation shape and cached in
+    ``self.statements``; values are always bound parameters, so repeated
+    calls also reuse SQLAlchemy's compiled cache entry.
     """
 
     def __init__(
@@ -44,7 +60,8 @@ class SQLAlchemyTable(CRUDTable):
         sa_table: Optional[Table] = None,
     ):
         super().__init__(entity_class, driver, table_name)
-        self.sa_table = sa_table or self._reflect_or_create_table()
+        self.sa_table = sa_table if sa_table is not None else self._reflect_or_create_table()
+        self.statements = StatementCache()
 
     def _reflect_or_create_table(self) -> Table:
         """Reflect existing table or create a new one based on entity fields"""
@@ -62,40 +79,34 @@ class SQLAlchemyTable(CRUDTable):
         return entity_to_sqlalchemy_table(self.entity_class, metadata, self.table_name)
 
     def find(self, record_id: Any) -> Optional[Dict[str, Any]]:
-        pk_col = self.sa_table.primary_key.columns[0]
-        stmt = select(self.sa_table).where(pk_col == record_id)
+        stmt = self.statements.get_or_build(("find",), self._build_find)
         with self.driver.engine.connect() as conn:
-            result = conn.execute(stmt).mappings().first()
+            result = conn.execute(stmt, {"_pk": record_id}).mappings().first()
             return dict(result) if result else None
 
     def all(self, page_size: Optional[int] = None) -> Iterable[Dict[str, Any]]:
-        stmt = select(self.sa_table)
-        if page_size:
-            stmt = stmt.limit(page_size)
-
-        with self.driver.engine.connect() as conn:
-            results = conn.execute(stmt).mappings().all()
-            return [dict(r) for r in results]
+        return self.select(limit=page_size)
 
     def insert(self, attributes: Dict[str, Any]) -> Dict[str, Any]:
-        stmt = insert(self.sa_table).values(**attributes).returning(self.sa_table)
+        # Values come from the execute() parameters, so one statement serves
+        # every insert regardless of which columns are provided
+        stmt = self.statements.get_or_build(
+            ("insert",), lambda: insert(self.sa_table).returning(self.sa_table)
+        )
         with self.driver.engine.connect() as conn:
-            result = conn.execute(stmt).mappings().first()
+            result = conn.execute(stmt, attributes).mappings().first()
             conn.commit()
             if not result:
                 raise CannotInsertError(None, "Insert failed")
             return dict(result)
 
     def update(self, record_id: Any, attributes: Dict[str, Any]) -> Dict[str, Any]:
-        pk_col = self.sa_table.primary_key.columns[0]
-        stmt = (
-            update(self.sa_table)
-            .where(pk_col == record_id)
-            .values(**attributes)
-            .returning(self.sa_table)
-        )
+        fields = tuple(attributes)
+        stmt = self.statements.get_or_build(("update", fields), lambda: self._build_update(fields))
+        params = {f"v_{field}": value for field, value in attributes.items()}
+        params["_pk"] = record_id
         with self.driver.engine.connect() as conn:
-            result = conn.execute(stmt).mappings().first()
+            result = conn.execute(stmt, params).mappings().first()
             conn.commit()
             if not result:
                 raise CannotUpdateError(record_id, "Update failed or record not found")
@@ -103,14 +114,18 @@ class SQLAlchemyTable(CRUDTable):
 
     def delete(self, record_id: Any) -> bool:
         pk_col = self.sa_table.primary_key.columns[0]
-        stmt = delete(self.sa_table).where(pk_col == record_id)
+        stmt = self.statements.get_or_build(
+            ("delete",), lambda: delete(self.sa_table).where(pk_col == bindparam("_pk"))
+        )
         with self.driver.engine.connect() as conn:
-            result = conn.execute(stmt)
+            result = conn.execute(stmt, {"_pk": record_id})
             conn.commit()
             return result.rowcount > 0
 
     def count(self) -> int:
-        stmt = select(func.count()).select_from(self.sa_table)
+        stmt = self.statements.get_or_build(
+            ("count",), lambda: select(func.count()).select_from(self.sa_table)
+        )
         with self.driver.engine.connect() as conn:
             return conn.execute(stmt).scalar() or 0
 
@@ -121,12 +136,167 @@ class SQLAlchemyTable(CRUDTable):
         limit: Optional[int] = None,
         offset: Optional[int] = None,
     ) -> Iterable[Dict[str, Any]]:
+        stmt, params = self._cached_select(None, where, order_by, limit, offset)
+
+        with self.driver.engine.connect() as conn:
+            results = conn.execute(stmt, params).mappings().all()
+            return [dict(r) for r in results]
+
+    def select_columnar(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        order_by: Optional[Union[str, List[str]]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> ColumnBatch:
+        """Select only the requested columns and build the batch from raw row tuples"""
+        if fields is None:
+            fields = [col.name for col in self.sa_table.columns]
+        stmt, params = self._cached_select(tuple(fields), where, order_by, limit, offset)
+
+        with self.driver.engine.connect() as conn:
+            rows = conn.execute(stmt, params).all()
+            return ColumnBatch.from_tuples(rows, fields, self.entity_class)
+
+    def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Optional[str] = None,
+    ) -> Page[Dict[str, Any]]:
+        """
+        Keyset pagination: WHERE (order_col, pk) > (last_value, last_pk)
+
+        NULL order values sort last (first when descending), matching
+        keyset_sort_key in the in-memory drivers.
+        """
+        state = decode_cursor(cursor, order_by)
+        field, descending = parse_order_by(order_by)
+        pk_col = self.sa_table.primary_key.columns[0]
+        order_col = self.sa_table.c[field] if field else pk_col
+        after = state.get("after")
+        # None: first page; otherwise whether the last order value was NULL
+        after_null = None if after is None else after[0] is None
+
+        key = ("find_page", order_by, after_null)
+        stmt = self.statements.get_or_build(
+            key, lambda: self._build_page(order_col, pk_col, descending, after_null)
+        )
+        params = {"_limit": limit + 1}
+        if after is not None:
+            params["_after_pk"] = after[1]
+            if not after_null:
+                params["_after_value"] = after[0]
+
+        with self.driver.engine.connect() as conn:
+            rows = [dict(r) for r in conn.execute(stmt, params).mappings().all()]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(
+                {"order_by": order_by, "after": [last[order_col.name], last[pk_col.name]]}
+            )
+        return Page(rows, next_cursor)
+
+    def clear_statement_cache(self) -> None:
+        """Drop cached statements (call after altering the underlying table)"""
+        self.statements.clear()
+
+    def _cached_select(
+        self,
+        fields: Optional[Tuple[str, ...]],
+        where: Optional[Dict[str, Any]],
+        order_by: Optional[Union[str, List[str]]],
+        limit: Optional[int],
+        offset: Optional[int],
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Look up (or build) the select statement for this shape and bind its values"""
+        # A limit/offset of 0 means "not set", matching the other drivers
+        limit = limit or None
+        offset = offset or None
+        key = (statement_shape("select", where, order_by, limit, offset), fields)
+
+        def build():
+            if fields is None:
+                stmt = select(self.sa_table)
+            else:
+                stmt = select(*[self.sa_table.c[field] for field in fields])
+            return self._build_select(stmt, where, order_by, limit, offset)
+
+        stmt = self.statements.get_or_build(key, build)
+
+        params = {
+            f"w_{field}": value for field, value in (where or {}).items() if value is not None
+        }
+        if limit is not None:
+            params["_limit"] = limit
+        if offset is not None:
+            params["_offset"] = offset
+        return stmt, params
+
+    def _build_find(self) -> Any:
+        pk_col = self.sa_table.primary_key.columns[0]
+        return select(self.sa_table).where(pk_col == bindparam("_pk"))
+
+    def _build_update(self, fields: Tuple[str, ...]) -> Any:
+        pk_col = self.sa_table.primary_key.columns[0]
+        return (
+            update(self.sa_table)
+            .where(pk_col == bindparam("_pk"))
+            .values({field: bindparam(f"v_{field}") for field in fields})
+            .returning(self.sa_table)
+        )
+
+    def _build_page(
+        self, order_col: Any, pk_col: Any, descending: bool, after_null: Optional[bool]
+    ) -> Any:
+        keyed_by_pk = order_col is pk_col
         stmt = select(self.sa_table)
+        if after_null is not None:
+            last_pk = bindparam("_after_pk")
+            past_pk = pk_col < last_pk if descending else pk_col > last_pk
+            if keyed_by_pk:
+                stmt = stmt.where(past_pk)
+            elif after_null:
+                # Past the last NULL: later NULLs, then (descending) every value
+                past_nulls = and_(order_col.is_(None), past_pk)
+                if descending:
+                    past_nulls = or_(past_nulls, order_col.is_not(None))
+                stmt = stmt.where(past_nulls)
+            else:
+                last_value = bindparam("_after_value")
+                past_value = order_col < last_value if descending else order_col > last_value
+                past = or_(past_value, and_(order_col == last_value, past_pk))
+                # Ascending pages reach the NULLs after every value
+                stmt = stmt.where(past if descending else or_(past, order_col.is_(None)))
 
+        if keyed_by_pk:
+            stmt = stmt.order_by(pk_col.desc() if descending else pk_col.asc())
+        elif descending:
+            stmt = stmt.order_by(order_col.desc().nulls_first(), pk_col.desc())
+        else:
+            stmt = stmt.order_by(order_col.asc().nulls_last(), pk_col.asc())
+        return stmt.limit(bindparam("_limit"))
+
+    def _build_select(
+        self,
+        stmt: Any,
+        where: Optional[Dict[str, Any]],
+        order_by: Optional[Union[str, List[str]]],
+        limit: Optional[int],
+        offset: Optional[int],
+    ) -> Any:
+        """Apply where/order_by/limit/offset clauses as bound parameters"""
         if where:
             for field, value in where.items():
                 col = self.sa_table.c[field]
-                stmt = stmt.where(col == value)
+                if value is None:
+                    stmt = stmt.where(col.is_(None))
+                else:
+                    stmt = stmt.where(col == bindparam(f"w_{field}"))
 
         if order_by:
             if isinstance(order_by, str):
@@ -139,13 +309,11 @@ class SQLAlchemyTable(CRUDTable):
                     stmt = stmt.order_by(self.sa_table.c[field].asc())
 
         if limit:
-            stmt = stmt.limit(limit)
+            stmt = stmt.limit(bindparam("_limit"))
         if offset:
-            stmt = stmt.offset(offset)
+            stmt = stmt.offset(bindparam("_offset"))
 
-        with self.driver.engine.connect() as conn:
-            results = conn.execute(stmt).mappings().all()
-            return [dict(r) for r in results]
+        return stmt
 
 
 class SQLAlchemyDriver(CRUDDriver):
@@ -0,0 +1,85 @@
+"""
+Statement cache for SQL-backed CRUD tables.
+
+Statements are cached by operation shape rather than by values: the
+operation name, the set of where fields (and which of them are matched
+against None, i.e. ``IS NULL``), the order_by fields and whether a
+limit/offset is present. Other values are always passed as bound
+parameters, so one cached statement serves every call with the same shape.
+
+Usage:
+    cache = StatementCache(max_size=256)
+    key = ("select", ("email",), (), ("name",), True, False)
+    stmt = cache.get_or_build(key, lambda: build_select(...))
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+DEFAULT_STATEMENT_CACHE_SIZE = 256
+
+
+def statement_shape(
+    operation: str,
+    where: Optional[Dict[str, Any]] = None,
+    order_by: Optional[Union[str, List[str]]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> Tuple[Hashable, ...]:
+    """Build a cache key describing the shape (not the values) of a query"""
+    if isinstance(order_by, str):
+        order_by = [order_by]
+    return (
+        operation,
+        tuple(where) if where else (),
+        tuple(field for field, value in where.items() if value is None) if where else (),
+        tuple(order_by) if order_by else (),
+        limit is not None,
+        offset is not None,
+    )
+
+
+class StatementCache:
+    """
+    Thread-safe LRU cache of built statements keyed by operation shape.
+    """
+
+    __slots__ = ("max_size", "_entries", "_lock", "hits", "misses")
+
+    def __init__(self, max_size: int = DEFAULT_STATEMENT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the cached statement for key, building it on first use"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = build()
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached statements (e.g. after a schema change)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
@@ -31,8 +31,21 @@ Usage:
     # Method 3: Import entities as DetachedEntity
     User = importer.import_entity("User")
     user = User.from_remote({"id": 1, "name": "John"}, source="api.example.com")
+
+    # Send calls made in a block as one batch request
+    with remote.batch():
+        outcomes = [remote.GetUser.run(id=user_id) for user_id in user_ids]
+
+    # Calls reuse one keep-alive client per remote origin; tune it per origin
+    get_client_pool().configure("https://api.example.com", RemoteClientConfig(http2=True))
 """
 
+from foobara_py.remote.batching import (
+    PendingOutcome,
+    RemoteBatch,
+    RemoteBatchConfig,
+    RemoteBatcher,
+)
 from foobara_py.remote.cache import (
     CacheEntry,
     FileManifestCache,
@@ -40,6 +53,12 @@ from foobara_py.remote.cache import (
     get_manifest_cache,
     set_manifest_cache,
 )
+from foobara_py.remote.client_pool import (
+    RemoteClientConfig,
+    RemoteClientPool,
+    get_client_pool,
+    set_client_pool,
+)
 from foobara_py.remote.importer import (
     CommandNotFoundError,
     ManifestFetchError,
@@ -48,6 +67,7 @@ from foobara_py.remote.importer import (
     RemoteNamespace,
     import_remote,
 )
+from foobara_py.remote.models import RemoteModelFactory
 from foobara_py.remote.remote_command import (
     AsyncRemoteCommand,
     RemoteCommand,
@@ -68,10 +88,21 @@ __all__ = [
     "ManifestFetchError",
     "CommandNotFoundError",
     "import_remote",
+    "RemoteModelFactory",
     # Cache
     "ManifestCache",
     "FileManifestCache",
     "CacheEntry",
     "get_manifest_cache",
     "set_manifest_cache",
+    # Connection pooling
+    "RemoteClientPool",
+    "RemoteClientConfig",
+    "get_client_pool",
+    "set_client_pool",
+    # Batching
+    "RemoteBatcher",
+    "RemoteBatchConfig",
+    "RemoteBatch",
+    "PendingOutcome",
 ]
@@ -0,0 +1,410 @@
+"""
+Client-side request batching for remote commands.
+
+A command that calls the same remote service in a loop pays one HTTP round
+trip per call. RemoteBatcher sends calls to one service as a single request
+to its batch endpoint and hands each caller its own outcome.
+
+Calls are batched in two ways:
+
+- Inside ``with importer.batch():`` (or ``namespace.batch()``) sync calls
+  return a PendingOutcome straight away. All pending calls are sent together
+  when the block exits or when any pending outcome is first read. Async calls
+  made in the block are batched by time window as below.
+- With ``RemoteImporter(..., batching=RemoteBatchConfig(window=0.005))`` (or a
+  ``_batcher`` on a command class) every call waits up to ``window`` seconds
+  for calls from other threads or tasks to join it before the batch is sent.
+
+Two batch protocols are supported:
+
+- ``"http"``: HTTPConnector's ``POST {prefix}/batch`` endpoint, a JSON array of
+  ``{"command", "inputs", "id"}`` items answered by ``{"results": [...]}``
+- ``"jsonrpc"``: a JSON-RPC 2.0 batch of ``tools/call`` requests, as served by
+  MCPConnector
+
+Usage:
+    remote = RemoteImporter("https://users.example.com/manifest").as_namespace()
+
+    with remote.batch():
+        outcomes = [remote.GetUser.run(id=user_id) for user_id in user_ids]
+    users = [outcome.unwrap() for outcome in outcomes]   # one HTTP request
+"""
+
+import asyncio
+import json
+import threading
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from foobara_py.core.errors import FoobaraError
+from foobara_py.core.outcome import CommandOutcome
+from foobara_py.remote.client_pool import RemoteClientPool, _httpx, get_client_pool
+from foobara_py.remote.remote_command import (
+    RemoteCommandError,
+    RemoteConnectionError,
+    _result_from_item,
+)
+
+PROTOCOLS = ("http", "jsonrpc")
+
+
+@dataclass
+class RemoteBatchConfig:
+    """How calls to one remote service are batched"""
+
+    protocol: str = "http"  # "http" (HTTPConnector) or "jsonrpc" (MCPConnector)
+    path: str = "/batch"  # batch endpoint, relative to the service's base URL
+    window: float = 0.005  # seconds a call waits for others to join its batch
+    max_batch_size: int = 50  # larger batches are split (HTTPConnector's default limit)
+
+    def __post_init__(self):
+        if self.protocol not in PROTOCOLS:
+            raise ValueError(
+                f"Unknown batch protocol {self.protocol!r}, expected one of {PROTOCOLS}"
+            )
+
+
+class _Call:
+    """One remote command call waiting for its batch"""
+
+    __slots__ = ("command", "inputs", "item", "error", "done")
+
+    def __init__(self, command: str, inputs: Dict[str, Any]):
+        self.command = command
+        self.inputs = inputs
+        self.item: Optional[Dict[str, Any]] = None  # {"success", "result" | "errors"}
+        self.error: Optional[Exception] = None
+        self.done = threading.Event()
+
+    def resolve(self, item: Optional[Dict[str, Any]], error: Optional[Exception]) -> None:
+        self.item = item
+        self.error = error
+        self.done.set()
+
+    def value(self) -> Dict[str, Any]:
+        """The call's result item; raises the batch's error"""
+        if self.error is not None:
+            raise self.error
+        return self.item
+
+
+class _Window:
+    """Calls collected during one batching window"""
+
+    __slots__ = ("calls", "full")
+
+    def __init__(self):
+        self.calls: List[_Call] = []
+        self.full = threading.Event()
+
+
+class _AsyncWindow:
+    __slots__ = ("calls", "futures", "handle")
+
+    def __init__(self):
+        self.calls: List[_Call] = []
+        self.futures: List[asyncio.Future] = []
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+
+class RemoteBatcher:
+    """
+    Sends calls to one remote service as batch requests.
+
+    Thread-safe; async calls are batched per event loop.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        config: Optional[RemoteBatchConfig] = None,
+        client_pool: Optional[RemoteClientPool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30.0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.config = config or RemoteBatchConfig()
+        self.client_pool = client_pool
+        self.headers = headers or {}
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._window: Optional[_Window] = None
+        self._async_windows: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @property
+    def url(self) -> str:
+        return f"{self.base_url}{self.config.path}"
+
+    def accepts(self, command_class: type) -> bool:
+        """Whether calls of command_class go to this batcher's service"""
+        return getattr(command_class, "_remote_url", "").rstrip("/") == self.base_url
+
+    @contextmanager
+    def batch(self) -> Iterator["RemoteBatch"]:
+        """Collect this service's calls made in the block into one request"""
+        batch = RemoteBatch(self)
+        token = _active_batch.set(batch)
+        try:
+            yield batch
+        finally:
+            _active_batch.reset(token)
+            batch.flush()
+
+    # ------------------------------------------------------------------ sync
+
+    def call(self, command: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one call in the current window's batch; blocks until it is answered"""
+        call = _Call(command, inputs)
+        with self._lock:
+            window = self._window
+            leader = window is None
+            if leader:
+                window = self._window = _Window()
+            window.calls.append(call)
+            if len(window.calls) >= self.config.max_batch_size:
+                self._window = None
+                window.full.set()
+
+        if leader:
+            window.full.wait(self.config.window)
+            with self._lock:
+                if self._window is window:
+                    self._window = None
+            self.send(window.calls)
+        else:
+            call.done.wait()
+        return call.value()
+
+    def send(self, calls: List[_Call]) -> None:
+        """Send calls in batches of at most max_batch_size and resolve them"""
+        httpx = _httpx()
+        pool = self.client_pool or get_client_pool()
+        size = self.config.max_batch_size
+        for start in range(0, len(calls), size):
+            chunk = calls[start : start + size]
+            try:
+                response = pool.client(self.url).post(
+                    self.url,
+                    json=self._encode(chunk),
+                    headers=self.headers,
+                    timeout=pool.timeout_for(self.url, self.timeout),
+                )
+                items = self._decode(response, len(chunk))
+            except httpx.ConnectError as e:
+                self._fail(chunk, RemoteConnectionError(f"Failed to connect: {e}", url=self.url))
+            except httpx.TimeoutException as e:
+                self._fail(chunk, RemoteCommandError(f"Request timed out: {e}", "timeout_error"))
+            except RemoteCommandError as e:
+                self._fail(chunk, e)
+            except Exception as e:
+                self._fail(chunk, RemoteCommandError(str(e), "batch_error"))
+            else:
+                for call, item in zip(chunk, items):
+                    call.resolve(item, None)
+
+    # ----------------------------------------------------------------- async
+
+    async def call_async(self, command: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one call in the running loop's current window; awaits its answer"""
+        loop = asyncio.get_running_loop()
+        window = self._async_windows.get(loop)
+        if window is None:
+            window = self._async_windows[loop] = _AsyncWindow()
+            window.handle = loop.call_later(self.config.window, self._close_async, loop, window)
+        call = _Call(command, inputs)
+        future = loop.create_future()
+        window.calls.append(call)
+        window.futures.append(future)
+        if len(window.calls) >= self.config.max_batch_size:
+            window.handle.cancel()
+            self._close_async(loop, window)
+        await future
+        return call.value()
+
+    def _close_async(self, loop: asyncio.AbstractEventLoop, window: _AsyncWindow) -> None:
+        if self._async_windows.get(loop) is window:
+            del self._async_windows[loop]
+        loop.create_task(self._send_async(window))
+
+    async def _send_async(self, window: _AsyncWindow) -> None:
+        httpx = _httpx()
+        pool = self.client_pool or get_client_pool()
+        try:
+            client = await pool.async_client(self.url)
+            response = await client.post(
+                self.url,
+                json=self._encode(window.calls),
+                headers=self.headers,
+                timeout=pool.timeout_for(self.url, self.timeout),
+            )
+            items = self._decode(response, len(window.calls))
+        except httpx.ConnectError as e:
+            self._fail(window.calls, RemoteConnectionError(f"Failed to connect: {e}", url=self.url))
+        except httpx.TimeoutException as e:
+            self._fail(window.calls, RemoteCommandError(f"Request timed out: {e}", "timeout_error"))
+        except RemoteCommandError as e:
+            self._fail(window.calls, e)
+        except Exception as e:
+            self._fail(window.calls, RemoteCommandError(str(e), "batch_error"))
+        else:
+            for call, item in zip(window.calls, items):
+                call.resolve(item, None)
+        for future in window.futures:
+            if not future.done():
+                future.set_result(None)
+
+    # -------------------------------------------------------------- protocol
+
+    def _encode(self, calls: List[_Call]) -> List[Dict[str, Any]]:
+        if self.config.protocol == "jsonrpc":
+            return [
+                {
+                    "jsonrpc": "2.0",
+                    "id": index,
+                    "method": "tools/call",
+                    "params": {"name": call.command, "arguments": call.inputs},
+                }
+                for index, call in enumerate(calls)
+            ]
+        return [
+            {"id": index, "command": call.command, "inputs": call.inputs}
+            for index, call in enumerate(calls)
+        ]
+
+    def _decode(self, response: Any, count: int) -> List[Dict[str, Any]]:
+        """Per-call ``{"success", "result" | "errors"}`` items, in call order"""
+        if response.status_code >= 400:
+            try:
+                errors = response.json().get("errors", [])
+            except Exception:
+                errors = []
+            message = errors[0].get("message") if errors else response.text
+            raise RemoteCommandError(
+                message=f"Batch request failed: {message}",
+                symbol="remote_error",
+                status_code=response.status_code,
+                remote_errors=errors,
+            )
+        try:
+            data = response.json()
+        except Exception as e:
+            raise RemoteCommandError(f"Failed to parse batch response: {e}", "parse_error")
+
+        if self.config.protocol == "jsonrpc":
+            entries = data if isinstance(data, list) else [data]
+            by_id = {entry.get("id"): _jsonrpc_item(entry) for entry in entries}
+        else:
+            by_id = {item.get("id"): item for item in data.get("results", [])}
+
+        missing = {"success": False, "errors": [{"message": "No response for batch item"}]}
+        return [by_id.get(index, missing) for index in range(count)]
+
+    @staticmethod
+    def _fail(calls: List[_Call], error: Exception) -> None:
+        for call in calls:
+            call.resolve(None, error)
+
+
+def _jsonrpc_item(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalise a JSON-RPC tools/call response to a batch result item"""
+    if "error" in entry:
+        error = entry["error"]
+        return {
+            "success": False,
+            "errors": [{"symbol": "jsonrpc_error", "message": error.get("message"), **error}],
+        }
+    result = entry.get("result") or {}
+    text = "".join(
+        part.get("text", "") for part in result.get("content", []) if part.get("type") == "text"
+    )
+    try:
+        value = json.loads(text) if text else None
+    except ValueError:
+        value = text
+    if result.get("isError"):
+        errors = value.get("errors", []) if isinstance(value, dict) else [{"message": value}]
+        return {"success": False, "errors": errors}
+    return {"success": True, "result": value}
+
+
+class RemoteBatch:
+    """
+    Calls deferred inside ``RemoteBatcher.batch()``.
+
+    Sent together when the block exits or when a pending outcome is read.
+    """
+
+    def __init__(self, batcher: RemoteBatcher):
+        self.batcher = batcher
+        self._pending: List["PendingOutcome"] = []
+        self._lock = threading.Lock()
+
+    def add(self, command: Any, inputs: Dict[str, Any]) -> "PendingOutcome":
+        outcome = PendingOutcome(self, command, _Call(command.full_name(), inputs))
+        with self._lock:
+            self._pending.append(outcome)
+        return outcome
+
+    def flush(self) -> None:
+        """Send every pending call"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if pending:
+            self.batcher.send([outcome._call for outcome in pending])
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+class PendingOutcome:
+    """
+    Outcome of a call deferred in a batch block.
+
+    Behaves like the CommandOutcome it resolves to; reading any attribute
+    sends the batch first if it has not been sent yet.
+    """
+
+    __slots__ = ("_batch", "_command", "_call", "_outcome")
+
+    def __init__(self, batch: RemoteBatch, command: Any, call: _Call):
+        self._batch = batch
+        self._command = command
+        self._call = call
+        self._outcome: Optional[CommandOutcome] = None
+
+    @property
+    def outcome(self) -> CommandOutcome:
+        if self._outcome is None:
+            if not self._call.done.is_set():
+                self._batch.flush()
+            try:
+                result = _result_from_item(self._command, self._call.value())
+                self._outcome = CommandOutcome.from_result(result)
+            except RemoteCommandError as e:
+                self._outcome = CommandOutcome.from_errors(e)
+            except Exception as e:
+                self._outcome = CommandOutcome.from_errors(
+                    FoobaraError(category="runtime", symbol="execution_error", message=str(e))
+                )
+        return self._outcome
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.outcome, name)
+
+    def __repr__(self) -> str:
+        state = "sent" if self._call.done.is_set() else "pending"
+        return f"<PendingOutcome {self._call.command} ({state})>"
+
+
+_active_batch: ContextVar[Optional[RemoteBatch]] = ContextVar("remote_batch", default=None)
+
+
+def active_batch(command_class: type) -> Optional[RemoteBatch]:
+    """The enclosing batch block for command_class's service, if any"""
+    batch = _active_batch.get()
+    if batch is not None and batch.batcher.accepts(command_class):
+        return batch
+    return None
@@ -7,16 +7,19 @@ from remote services.
 
 import hashlib
 import json
+import os
+import pickle
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
 class CacheEntry:
     """A cached manifest entry."""
 
-    data: Dict[str, Any]
+    data: Optional[Dict[str, Any]]  # None until FileManifestCache reads it from disk
     fetched_at: datetime
     expires_at: datetime
     etag: Optional[str] = None
@@ -74,7 +77,8 @@ class ManifestCache:
         """
         self.ttl_seconds = ttl_seconds
         self.max_entries = max_entries
-        self._entries: Dict[str, CacheEntry] = {}
+        # Oldest first, so eviction pops the front
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
 
     def _cache_key(self, url: str) -> str:
         """Generate cache key from URL."""
@@ -129,6 +133,9 @@ class ManifestCache:
         Returns:
             The created cache entry.
         """
+        key = self._cache_key(url)
+        self._entries.pop(key, None)
+
         # Evict old entries if at capacity
         if len(self._entries) >= self.max_entries:
             self._evict_oldest()
@@ -144,7 +151,6 @@ class ManifestCache:
             url=url,
         )
 
-        key = self._cache_key(url)
         self._entries[key] = entry
 
         return entry
@@ -178,11 +184,8 @@ class ManifestCache:
 
     def _evict_oldest(self) -> None:
         """Evict the oldest cache entry."""
-        if not self._entries:
-            return
-
-        oldest_key = min(self._entries.keys(), key=lambda k: self._entries[k].fetched_at)
-        del self._entries[oldest_key]
+        if self._entries:
+            self._entries.popitem(last=False)
 
     def cleanup_expired(self) -> int:
         """
@@ -222,13 +225,29 @@ class FileManifestCache(ManifestCache):
     Manifest cache with file persistence.
 
     Stores cache entries to disk for persistence across restarts.
+
+    The directory holds one body file per manifest and a small index
+    (``index.json``) with each entry's URL, ETag, timestamps and body size.
+    Only the index is read at startup; a manifest body is read the first
+    time its entry is requested. Expired entries stay in the index so their
+    ETag can still be used for conditional requests.
+
+    Bodies are stored as JSON by default. ``body_format="pickle"`` loads
+    several times faster, but unpickling runs code from the file, so only
+    use it for a ``cache_dir`` no other user can write to. A JSON cache
+    never unpickles bodies, even if an earlier pickle cache listed them.
     """
 
+    INDEX_FILE = "index.json"
+    INDEX_VERSION = 1
+    BODY_FORMATS = ("json", "pickle")
+
     def __init__(
         self,
         cache_dir: str,
         ttl_seconds: int = 300,
         max_entries: int = 100,
+        body_format: str = "json",
     ):
         """
         Initialize file-based manifest cache.
@@ -237,51 +256,170 @@ class FileManifestCache(ManifestCache):
             cache_dir: Directory to store cache files.
             ttl_seconds: Time-to-live for cache entries.
             max_entries: Maximum number of cached manifests.
+            body_format: How manifest bodies are stored, "json" or "pickle".
         """
+        if body_format not in self.BODY_FORMATS:
+            raise ValueError(
+                f"Unknown body format {body_format!r}, expected one of {self.BODY_FORMATS}"
+            )
         super().__init__(ttl_seconds=ttl_seconds, max_entries=max_entries)
         self.cache_dir = cache_dir
+        self.body_format = body_format
+        self._files: Dict[str, Dict[str, Any]] = {}
         self._ensure_cache_dir()
         self._load_from_disk()
 
     def _ensure_cache_dir(self) -> None:
         """Create cache directory if it doesn't exist."""
-        import os
-
         os.makedirs(self.cache_dir, exist_ok=True)
 
-    def _cache_file(self, key: str) -> str:
+    def _cache_file(self, key: str, body_format: Optional[str] = None) -> str:
         """Get file path for a cache key."""
-        import os
+        extension = "pickle" if (body_format or self.body_format) == "pickle" else "json"
+        return os.path.join(self.cache_dir, f"{key}.{extension}")
 
-        return os.path.join(self.cache_dir, f"{key}.json")
+    def _index_file(self) -> str:
+        return os.path.join(self.cache_dir, self.INDEX_FILE)
 
     def _load_from_disk(self) -> None:
-        """Load cached entries from disk."""
+        """Load the index of cached entries; bodies are read on first use."""
+        try:
+            with open(self._index_file(), "r") as f:
+                index = json.load(f)
+            if index.get("version") != self.INDEX_VERSION:
+                raise ValueError(f"Unsupported index version {index.get('version')}")
+            records = index["entries"]
+        except (OSError, KeyError, TypeError, ValueError):
+            records = self._scan_legacy_files()
+            legacy = True
+        else:
+            legacy = False
+
+        entries = []
+        for key, record in records.items():
+            try:
+                entry = CacheEntry(
+                    data=None,
+                    fetched_at=datetime.fromisoformat(record["fetched_at"]),
+                    expires_at=datetime.fromisoformat(record["expires_at"]),
+                    etag=record.get("etag"),
+                    url=record.get("url", ""),
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+            entries.append((key, entry, record))
+
+        entries.sort(key=lambda item: item[1].fetched_at)
+        for key, entry, record in entries:
+            self._files[key] = {
+                "format": record.get("format", "json"),
+                "size": record.get("size", 0),
+            }
+            if len(self._entries) >= self.max_entries:
+                self._evict_oldest()
+            self._entries[key] = entry
+
+        if legacy and self._entries:
+            self._save_index()
+
+    def _scan_legacy_files(self) -> Dict[str, Dict[str, Any]]:
+        """Index ``{key}.json`` files written before the cache kept an index."""
         import glob
-        import os
 
-        pattern = os.path.join(self.cache_dir, "*.json")
-        for filepath in glob.glob(pattern):
+        records = {}
+        for filepath in glob.glob(os.path.join(self.cache_dir, "*.json")):
+            if os.path.basename(filepath) == self.INDEX_FILE:
+                continue
             try:
                 with open(filepath, "r") as f:
                     data = json.load(f)
+                record = {key: data[key] for key in ("fetched_at", "expires_at")}
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # Remove corrupted cache files
+                os.remove(filepath)
+                continue
+            record.update(
+                etag=data.get("etag"),
+                url=data.get("url", ""),
+                format="json",
+                size=os.path.getsize(filepath),
+            )
+            records[os.path.basename(filepath)[:-5]] = record
+        return records
+
+    def _save_index(self) -> None:
+        entries = {}
+        for key, entry in self._entries.items():
+            entries[key] = {
+                "url": entry.url,
+                "etag": entry.etag,
+                "fetched_at": entry.fetched_at.isoformat(),
+                "expires_at": entry.expires_at.isoformat(),
+                **self._files[key],
+            }
+        self._write_atomic(
+            self._index_file(),
+            json.dumps({"version": self.INDEX_VERSION, "entries": entries}).encode(),
+        )
 
-                entry = CacheEntry(
-                    data=data["data"],
-                    fetched_at=datetime.fromisoformat(data["fetched_at"]),
-                    expires_at=datetime.fromisoformat(data["expires_at"]),
-                    etag=data.get("etag"),
-                    url=data.get("url", ""),
-                )
+    def _write_atomic(self, filepath: str, content: bytes) -> None:
+        temp_path = f"{filepath}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, filepath)
+
+    def _read_body(self, key: str) -> Optional[Dict[str, Any]]:
+        body_format = self._files[key]["format"]
+        filepath = self._cache_file(key, body_format)
+        if body_format == "pickle" and self.body_format != "pickle":
+            return None
+        try:
+            if body_format == "pickle":
+                with open(filepath, "rb") as f:
+                    return pickle.load(f)
+            with open(filepath, "r") as f:
+                return json.load(f)["data"]
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, json.JSONDecodeError, KeyError, TypeError):
+            # Remove corrupted cache files
+            os.remove(filepath)
+            return None
 
-                # Skip expired entries
-                if not entry.is_expired:
-                    key = os.path.basename(filepath)[:-5]  # Remove .json
-                    self._entries[key] = entry
+    def _remove_file(self, key: str) -> None:
+        record = self._files.pop(key, None)
+        if record is None:
+            return
+        try:
+            os.remove(self._cache_file(key, record["format"]))
+        except FileNotFoundError:
+            pass
 
-            except (json.JSONDecodeError, KeyError, ValueError):
-                # Remove corrupted cache files
-                os.remove(filepath)
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get cached manifest data if valid, reading it from disk on first use."""
+        entry = super().get_entry(url)
+        if entry is None or entry.is_expired:
+            return None
+        entry = self.get_entry(url)
+        return entry.data if entry else None
+
+    def get_entry(self, url: str) -> Optional[CacheEntry]:
+        """Get cache entry (even if expired), reading its data on first use."""
+        entry = super().get_entry(url)
+        if entry is None or entry.data is not None:
+            return entry
+
+        key = self._cache_key(url)
+        data = self._read_body(key)
+        if data is None:
+            # The body file is gone or unreadable
+            del self._entries[key]
+            self._remove_file(key)
+            self._save_index()
+            return None
+
+        entry.data = data
+        return entry
 
     def set(
         self,
@@ -291,48 +429,68 @@ class FileManifestCache(ManifestCache):
         ttl_seconds: Optional[int] = None,
     ) -> CacheEntry:
         """Cache manifest data and persist to disk."""
+        key = self._cache_key(url)
+        self._remove_file(key)
         entry = super().set(url, data, etag, ttl_seconds)
 
         # Persist to disk
-        key = self._cache_key(url)
-        filepath = self._cache_file(key)
-
-        cache_data = {
-            "data": entry.data,
-            "fetched_at": entry.fetched_at.isoformat(),
-            "expires_at": entry.expires_at.isoformat(),
-            "etag": entry.etag,
-            "url": entry.url,
-        }
-
-        with open(filepath, "w") as f:
-            json.dump(cache_data, f)
+        if self.body_format == "pickle":
+            content = pickle.dumps(entry.data, protocol=pickle.HIGHEST_PROTOCOL)
+        else:
+            content = json.dumps({"data": entry.data}).encode()
+        self._write_atomic(self._cache_file(key), content)
+        self._files[key] = {"format": self.body_format, "size": len(content)}
+        self._save_index()
 
         return entry
 
+    def _evict_oldest(self) -> None:
+        """Evict the oldest cache entry and its file."""
+        if self._entries:
+            key, _ = self._entries.popitem(last=False)
+            self._remove_file(key)
+
     def invalidate(self, url: str) -> bool:
         """Remove manifest from cache and disk."""
-        import os
-
         key = self._cache_key(url)
-        filepath = self._cache_file(key)
+        self._remove_file(key)
 
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        removed = super().invalidate(url)
+        if removed:
+            self._save_index()
+        return removed
 
-        return super().invalidate(url)
+    def cleanup_expired(self) -> int:
+        """Remove all expired entries from memory and disk."""
+        expired_keys: List[str] = [
+            key for key, entry in self._entries.items() if entry.is_expired
+        ]
+        for key in expired_keys:
+            del self._entries[key]
+            self._remove_file(key)
+
+        if expired_keys:
+            self._save_index()
+        return len(expired_keys)
 
     def clear(self) -> int:
         """Clear all cached manifests from memory and disk."""
         import glob
-        import os
 
-        pattern = os.path.join(self.cache_dir, "*.json")
-        for filepath in glob.glob(pattern):
-            os.remove(filepath)
+        for extension in ("json", "pickle"):
+            for filepath in glob.glob(os.path.join(self.cache_dir, f"*.{extension}")):
+                os.remove(filepath)
+        self._files.clear()
 
         return super().clear()
 
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics, including bodies loaded and bytes on disk."""
+        stats = super().stats()
+        stats["loaded_entries"] = sum(1 for e in self._entries.values() if e.data is not None)
+        stats["disk_bytes"] = sum(record["size"] for record in self._files.values())
+        return stats
+
 
 # Global default cache instance
 _default_cache: Optional[ManifestCache] = None
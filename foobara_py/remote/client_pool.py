@@ -0,0 +1,232 @@
+"""
+Pooled HTTP clients for remote commands.
+
+Opening an ``httpx.Client`` per call pays a TCP (and TLS) handshake on every
+remote command. RemoteClientPool keeps one long-lived client per remote
+origin (scheme, host and port), so calls reuse keep-alive connections.
+
+Sync clients are shared by all threads. Async clients are bound to the
+event loop that created them, so the pool keeps one per origin per loop.
+
+Pooled clients never store cookies: a client is shared by every caller of
+an origin, whatever credentials they send, so a cookie set for one caller
+must not be sent on another's requests.
+
+Usage:
+    from foobara_py.remote import RemoteClientConfig, get_client_pool
+
+    pool = get_client_pool()
+    pool.configure("https://api.example.com", RemoteClientConfig(http2=True, timeout=5.0))
+
+    outcome = CreateUser.run(name="John")   # reuses the pooled connection
+
+    pool.close()   # also runs at interpreter exit for the default pool
+"""
+
+import asyncio
+import atexit
+import threading
+import weakref
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+@dataclass
+class RemoteClientConfig:
+    """Connection settings for one remote origin"""
+
+    timeout: Optional[float] = None  # overrides the commands' own timeouts when set
+    connect_timeout: Optional[float] = None  # default: the request timeout
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0  # seconds an idle connection is kept open
+    http2: bool = False  # requires the h2 package (pip install httpx[http2])
+
+
+def _origin(url: str) -> str:
+    """``scheme://host[:port]`` of a URL"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+class _RejectCookies(DefaultCookiePolicy):
+    """Cookie policy that stores no cookies"""
+
+    def set_ok(self, cookie: Any, request: Any) -> bool:
+        return False
+
+
+def _httpx() -> Any:
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "httpx is required for remote commands. "
+            "Install it with: pip install foobara-py[http]"
+        )
+    return httpx
+
+
+class RemoteClientPool:
+    """
+    Long-lived httpx clients keyed by remote origin.
+
+    Each client is created on first use with its origin's RemoteClientConfig
+    (or the pool default) and kept until close() / aclose().
+    """
+
+    def __init__(self, default: Optional[RemoteClientConfig] = None):
+        self.default = default or RemoteClientConfig()
+        self._configs: Dict[str, RemoteClientConfig] = {}
+        self._lock = threading.Lock()
+        self._clients: Dict[str, Tuple[Any, ExitStack]] = {}
+        # event loop -> origin -> (client, exit stack)
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def configure(self, url: str, config: RemoteClientConfig) -> "RemoteClientPool":
+        """
+        Set connection settings for a remote origin.
+
+        Sync clients already open for the origin are closed, async ones are
+        dropped, so the next call connects with the new settings.
+
+        Returns:
+            Self for chaining
+        """
+        origin = _origin(url)
+        with self._lock:
+            self._configs[origin] = config
+            entry = self._clients.pop(origin, None)
+            for clients in self._async_clients.values():
+                clients.pop(origin, None)
+        if entry is not None:
+            entry[1].close()
+        return self
+
+    def config_for(self, url: str) -> RemoteClientConfig:
+        """Connection settings used for a URL's origin"""
+        return self._configs.get(_origin(url), self.default)
+
+    def timeout_for(self, url: str, default: float) -> Any:
+        """Request timeout for a URL: the origin's configured timeout, else ``default``"""
+        httpx = _httpx()
+        config = self.config_for(url)
+        timeout = config.timeout if config.timeout is not None else default
+        return httpx.Timeout(timeout, connect=config.connect_timeout or timeout)
+
+    def _client_kwargs(self, origin: str) -> Dict[str, Any]:
+        httpx = _httpx()
+        config = self._configs.get(origin, self.default)
+        if config.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "http2=True requires the h2 package. "
+                    "Install it with: pip install httpx[http2]"
+                )
+        timeout = config.timeout if config.timeout is not None else 30.0
+        return {
+            "timeout": httpx.Timeout(timeout, connect=config.connect_timeout or timeout),
+            "limits": httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry,
+            ),
+            "http2": config.http2,
+            "cookies": CookieJar(policy=_RejectCookies()),
+        }
+
+    def client(self, url: str) -> Any:
+        """Shared ``httpx.Client`` for a URL's origin"""
+        origin = _origin(url)
+        entry = self._clients.get(origin)
+        if entry is None:
+            httpx = _httpx()
+            with self._lock:
+                entry = self._clients.get(origin)
+                if entry is None:
+                    stack = ExitStack()
+                    client = stack.enter_context(httpx.Client(**self._client_kwargs(origin)))
+                    entry = self._clients[origin] = (client, stack)
+        return entry[0]
+
+    async def async_client(self, url: str) -> Any:
+        """Shared ``httpx.AsyncClient`` for a URL's origin on the running event loop"""
+        origin = _origin(url)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._async_clients.setdefault(loop, {})
+        entry = clients.get(origin)
+        if entry is None:
+            httpx = _httpx()
+            stack = AsyncExitStack()
+            client = await stack.enter_async_context(
+                httpx.AsyncClient(**self._client_kwargs(origin))
+            )
+            # Another task on this loop may have created one while we awaited
+            entry = clients.setdefault(origin, (client, stack))
+            if entry[0] is not client:
+                await stack.aclose()
+        return entry[0]
+
+    def close(self) -> None:
+        """
+        Close all sync clients, and async clients whose event loop is idle.
+
+        Async clients of a running loop are left open; use aclose() there.
+        """
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+            loops = list(self._async_clients.items())
+        for _, stack in clients:
+            stack.close()
+        for loop, async_clients in loops:
+            if loop.is_running():
+                continue
+            with self._lock:
+                self._async_clients.pop(loop, None)
+            if not loop.is_closed():
+                for _, stack in async_clients.values():
+                    loop.run_until_complete(stack.aclose())
+
+    async def aclose(self) -> None:
+        """Close the running loop's async clients, then all sync clients"""
+        with self._lock:
+            clients = self._async_clients.pop(asyncio.get_running_loop(), {})
+        for _, stack in clients.values():
+            await stack.aclose()
+        self.close()
+
+    def __enter__(self) -> "RemoteClientPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+# Global default pool instance
+_default_pool: Optional[RemoteClientPool] = None
+
+
+def get_client_pool() -> RemoteClientPool:
+    """Get the default client pool (closed at interpreter exit)."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = RemoteClientPool()
+    return _default_pool
+
+
+def set_client_pool(pool: RemoteClientPool) -> None:
+    """Set the default client pool."""
+    global _default_pool
+    _default_pool = pool
+
+
+@atexit.register
+def _close_default_pool() -> None:
+    if _default_pool is not None:
+        _default_pool.close()
@@ -5,6 +5,7 @@ Allows importing commands and types from remote Foobara services
 by fetching their manifest and dynamically creating local proxy classes.
 """
 
+from contextlib import AbstractContextManager
 from typing import Any, Dict, List, Optional, Type
 
 from pydantic import BaseModel, create_model
@@ -13,7 +14,10 @@ from pydantic.fields import FieldInfo
 from foobara_py.manifest.command_manifest import CommandManifest
 from foobara_py.manifest.root_manifest import RootManifest
 from foobara_py.persistence.detached_entity import DetachedEntity
+from foobara_py.remote.batching import RemoteBatch, RemoteBatchConfig, RemoteBatcher
 from foobara_py.remote.cache import ManifestCache, get_manifest_cache
+from foobara_py.remote.client_pool import RemoteClientPool, get_client_pool
+from foobara_py.remote.models import RemoteModelFactory, schema_type
 from foobara_py.remote.remote_command import (
     AsyncRemoteCommand,
     RemoteCommand,
@@ -80,6 +84,8 @@ class RemoteImporter:
         cache: Optional[ManifestCache] = None,
         timeout: float = 30.0,
         headers: Optional[Dict[str, str]] = None,
+        client_pool: Optional[RemoteClientPool] = None,
+        batching: Optional[RemoteBatchConfig] = None,
     ):
         """
         Initialize remote importer.
@@ -89,11 +95,17 @@ class RemoteImporter:
             cache: Optional manifest cache (uses default if not provided).
             timeout: HTTP request timeout in seconds.
             headers: Optional HTTP headers for requests.
+            client_pool: HTTP client pool for the manifest and imported
+                commands (uses the default pool if not provided).
+            batching: Batch every call of the imported commands by time
+                window. ``batch()`` blocks work without it and use its
+                protocol and path when given.
         """
         self.manifest_url = manifest_url
         self.cache = cache or get_manifest_cache()
         self.timeout = timeout
         self.headers = headers or {}
+        self.client_pool = client_pool
 
         # Derive base URL from manifest URL
         # e.g., "https://api.example.com/manifest" -> "https://api.example.com"
@@ -106,6 +118,13 @@ class RemoteImporter:
             parsed = urlparse(manifest_url)
             self.base_url = f"{parsed.scheme}://{parsed.netloc}"
 
+        self.batching = batching
+        self.batcher = RemoteBatcher(
+            self.base_url, batching, client_pool, self.headers, self.timeout
+        )
+
+        self.models = RemoteModelFactory()
+
         self._manifest: Optional[RootManifest] = None
         self._imported_commands: Dict[str, Type[RemoteCommand]] = {}
         self._imported_types: Dict[str, Type[BaseModel]] = {}
@@ -138,35 +157,39 @@ class RemoteImporter:
                 "Install it with: pip install foobara-py[http]"
             )
 
+        pool = self.client_pool or get_client_pool()
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                # Check for conditional request support
-                cache_entry = self.cache.get_entry(self.manifest_url)
-                request_headers = dict(self.headers)
+            # Check for conditional request support
+            cache_entry = self.cache.get_entry(self.manifest_url)
+            request_headers = dict(self.headers)
 
-                if cache_entry and cache_entry.etag:
-                    request_headers["If-None-Match"] = cache_entry.etag
+            if cache_entry and cache_entry.etag:
+                request_headers["If-None-Match"] = cache_entry.etag
 
-                response = client.get(self.manifest_url, headers=request_headers)
+            response = pool.client(self.manifest_url).get(
+                self.manifest_url,
+                headers=request_headers,
+                timeout=pool.timeout_for(self.manifest_url, self.timeout),
+            )
 
-                # Handle 304 Not Modified
-                if response.status_code == 304 and cache_entry:
-                    return self._parse_manifest(cache_entry.data)
+            # Handle 304 Not Modified
+            if response.status_code == 304 and cache_entry:
+                return self._parse_manifest(cache_entry.data)
 
-                if response.status_code >= 400:
-                    raise ManifestFetchError(
-                        f"HTTP {response.status_code}: {response.text}",
-                        url=self.manifest_url,
-                        status_code=response.status_code,
-                    )
+            if response.status_code >= 400:
+                raise ManifestFetchError(
+                    f"HTTP {response.status_code}: {response.text}",
+                    url=self.manifest_url,
+                    status_code=response.status_code,
+                )
 
-                data = response.json()
+            data = response.json()
 
-                # Cache the response
-                etag = response.headers.get("etag")
-                self.cache.set(self.manifest_url, data, etag=etag)
+            # Cache the response
+            etag = response.headers.get("etag")
+            self.cache.set(self.manifest_url, data, etag=etag)
 
-                return self._parse_manifest(data)
+            return self._parse_manifest(data)
 
         except httpx.ConnectError as e:
             raise ManifestFetchError(
@@ -203,6 +226,8 @@ class RemoteImporter:
         """
         Convert JSON Schema to Pydantic model.
 
+        Identical schemas share one model class (see RemoteModelFactory).
+
         Args:
             schema: JSON Schema dict.
             name: Model class name.
@@ -210,47 +235,11 @@ class RemoteImporter:
         Returns:
             Dynamically created Pydantic model class.
         """
-        if not schema:
-            return create_model(name)
-
-        # Extract properties and required fields
-        properties = schema.get("properties", {})
-        required = set(schema.get("required", []))
-
-        # Build field definitions
-        fields: Dict[str, Any] = {}
-        for field_name, field_schema in properties.items():
-            field_type = self._schema_type_to_python(field_schema)
-            is_required = field_name in required
-
-            if is_required:
-                fields[field_name] = (field_type, ...)
-            else:
-                default = field_schema.get("default")
-                fields[field_name] = (Optional[field_type], default)
-
-        return create_model(name, **fields)
+        return self.models.model_for(schema, name)
 
     def _schema_type_to_python(self, schema: Dict[str, Any]) -> type:
         """Convert JSON Schema type to Python type."""
-        json_type = schema.get("type", "string")
-
-        type_map = {
-            "string": str,
-            "integer": int,
-            "number": float,
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-            "null": type(None),
-        }
-
-        if json_type == "array":
-            items_schema = schema.get("items", {})
-            items_type = self._schema_type_to_python(items_schema)
-            return List[items_type]
-
-        return type_map.get(json_type, Any)
+        return schema_type(schema)
 
     @property
     def manifest(self) -> RootManifest:
@@ -321,6 +310,8 @@ class RemoteImporter:
                 "_command_name": cmd_manifest.full_name,
                 "_timeout": self.timeout,
                 "_headers": self.headers,
+                "_client_pool": self.client_pool,
+                "_batcher": self.batcher if self.batching is not None else None,
                 "_description": cmd_manifest.description or "",
                 "_domain": cmd_manifest.domain,
                 "_organization": cmd_manifest.organization,
@@ -480,10 +471,28 @@ class RemoteImporter:
         base_type = type_str.lower().split("[")[0]
         return type_map.get(base_type, str)
 
+    def batch(self) -> AbstractContextManager[RemoteBatch]:
+        """
+        Send this service's calls made in the block as one batch request.
+
+        Usage:
+            with importer.batch():
+                outcomes = [GetUser.run(id=user_id) for user_id in user_ids]
+            users = [outcome.unwrap() for outcome in outcomes]
+
+        Sync calls return a PendingOutcome that is resolved when the block
+        exits or when it is first read. Async calls in the block are
+        batched by time window.
+        """
+        return self.batcher.batch()
+
     def as_namespace(self, async_mode: bool = False) -> "RemoteNamespace":
         """
         Create a namespace object with all commands as attributes.
 
+        Commands are imported on first access, so only the commands that
+        are used pay for building their models.
+
         Usage:
             remote = importer.as_namespace()
             outcome = remote.CreateUser.run(name="John", email="john@example.com")
@@ -494,24 +503,28 @@ class RemoteImporter:
         Returns:
             RemoteNamespace with commands as attributes.
         """
-        commands = self.import_all(async_mode=async_mode)
-        return RemoteNamespace(commands, self)
+        return RemoteNamespace({}, self, async_mode=async_mode, lazy=True)
 
 
 class RemoteNamespace:
     """
     Namespace object providing attribute access to remote commands.
 
-    Created by RemoteImporter.as_namespace().
+    Created by RemoteImporter.as_namespace(). A lazy namespace imports
+    each command from the importer the first time it is accessed.
     """
 
     def __init__(
         self,
         commands: Dict[str, Type[RemoteCommand]],
         importer: RemoteImporter,
+        async_mode: bool = False,
+        lazy: bool = False,
     ):
         self._commands = commands
         self._importer = importer
+        self._async_mode = async_mode
+        self._lazy = lazy
 
         # Set commands as attributes
         for name, cmd_class in commands.items():
@@ -531,12 +544,38 @@ class RemoteNamespace:
             if full_name.endswith(f"::{name}") or full_name == name:
                 return cmd_class
 
+        if self.__dict__.get("_lazy") and not name.startswith("_"):
+            cmd_class = self._import(name)
+            if cmd_class is not None:
+                setattr(self, name, cmd_class)
+                return cmd_class
+
         raise AttributeError(f"Command '{name}' not found in remote namespace")
 
+    def _import(self, name: str) -> Optional[Type[RemoteCommand]]:
+        manifest = self._importer.manifest
+        cmd_manifest = manifest.find_command(name)
+        if cmd_manifest is None:
+            cmd_manifest = next(
+                (cmd for cmd in manifest.commands if cmd.full_name.endswith(f"::{name}")),
+                None,
+            )
+        if cmd_manifest is None:
+            return None
+        cmd_class = self._importer.import_command(cmd_manifest.full_name, self._async_mode)
+        self._commands[cmd_manifest.full_name] = cmd_class
+        return cmd_class
+
     def list_commands(self) -> List[str]:
         """List available commands."""
+        if self._lazy:
+            return self._importer.list_commands()
         return list(self._commands.keys())
 
+    def batch(self) -> AbstractContextManager[RemoteBatch]:
+        """Send calls made in the block as one batch request (see RemoteImporter.batch)."""
+        return self._importer.batch()
+
     @property
     def manifest(self) -> RootManifest:
         """Get the remote manifest."""
@@ -0,0 +1,97 @@
+"""
+Pydantic models for remote command schemas.
+
+RemoteImporter turns the JSON Schemas in a remote manifest into Pydantic
+models. RemoteModelFactory keeps that cheap for large manifests:
+
+- Identical schemas share one model class, keyed by a hash of the
+  canonical schema
+- Models are created with ``defer_build=True``, so Pydantic builds a
+  model's validator the first time it is used, not at import
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, create_model
+
+# (field name, Python type, required, default)
+FieldDefinition = Tuple[str, Any, bool, Any]
+
+_JSON_TYPES = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+
+def schema_hash(schema: Optional[Dict[str, Any]]) -> str:
+    """Hash of a JSON Schema's canonical form"""
+    canonical = json.dumps(schema or {}, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def schema_type(schema: Dict[str, Any]) -> Any:
+    """Python type for a JSON Schema"""
+    json_type = schema.get("type", "string")
+    if json_type == "array":
+        return List[schema_type(schema.get("items", {}))]
+    if not isinstance(json_type, str):
+        return Any  # e.g. ["string", "null"]
+    return _JSON_TYPES.get(json_type, Any)
+
+
+def field_definitions(schema: Optional[Dict[str, Any]]) -> List[FieldDefinition]:
+    """Field definitions of an object schema"""
+    if not schema:
+        return []
+    required = set(schema.get("required", []))
+    return [
+        (name, schema_type(field_schema), name in required, field_schema.get("default"))
+        for name, field_schema in schema.get("properties", {}).items()
+    ]
+
+
+def model_from_definitions(name: str, definitions: List[FieldDefinition]) -> Type[BaseModel]:
+    """Create a model whose validator is built on first use"""
+    fields: Dict[str, Any] = {}
+    for field_name, field_type, required, default in definitions:
+        if required:
+            fields[field_name] = (field_type, ...)
+        else:
+            fields[field_name] = (Optional[field_type], default)
+    return create_model(name, __config__=ConfigDict(defer_build=True), **fields)
+
+
+class RemoteModelFactory:
+    """
+    Models for the schemas of one remote manifest.
+
+    Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: Dict[str, Type[BaseModel]] = {}
+
+    def model_for(self, schema: Optional[Dict[str, Any]], name: str) -> Type[BaseModel]:
+        """The model for a schema, shared with every identical schema"""
+        key = schema_hash(schema)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = model_from_definitions(name, field_definitions(schema))
+                self._models[key] = model
+        return model
+
+    def __len__(self) -> int:
+        return len(self._models)
@@ -6,12 +6,16 @@ via HTTP, maintaining the same interface as local commands.
 """
 
 from abc import ABC
-from typing import Any, ClassVar, Dict, Generic, Optional, Type, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Generic, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 
 from foobara_py.core.errors import FoobaraError as BaseFoobaraError
 from foobara_py.core.outcome import CommandOutcome
+from foobara_py.remote.client_pool import RemoteClientPool, get_client_pool
+
+if TYPE_CHECKING:
+    from foobara_py.remote.batching import RemoteBatcher
 
 InputT = TypeVar("InputT", bound=BaseModel)
 ResultT = TypeVar("ResultT")
@@ -50,6 +54,20 @@ class RemoteConnectionError(RemoteCommandError):
 ConnectionError = RemoteConnectionError
 
 
+def _result_from_item(command: Any, item: Dict[str, Any]) -> Any:
+    """Result of one batch result item; raises RemoteCommandError for failures"""
+    if not item.get("success"):
+        errors = item.get("errors") or []
+        first = errors[0] if errors else None
+        message = first.get("message") if isinstance(first, dict) else None
+        raise RemoteCommandError(
+            message=message or "Remote command failed",
+            symbol="remote_error",
+            remote_errors=errors,
+        )
+    return command._convert_result(item.get("result"))
+
+
 class RemoteCommand(ABC, Generic[InputT, ResultT]):
     """
     Proxy command that calls a remote Foobara service.
@@ -78,6 +96,8 @@ class RemoteCommand(ABC, Generic[InputT, ResultT]):
     _command_name: ClassVar[str] = ""
     _timeout: ClassVar[float] = 30.0
     _headers: ClassVar[Dict[str, str]] = {}
+    _client_pool: ClassVar[Optional[RemoteClientPool]] = None  # default: get_client_pool()
+    _batcher: ClassVar[Optional["RemoteBatcher"]] = None  # batch calls by time window
 
     # Metadata from manifest
     _description: ClassVar[str] = ""
@@ -128,6 +148,11 @@ class RemoteCommand(ABC, Generic[InputT, ResultT]):
         """Get full command name."""
         return cls._command_name or cls.__name__
 
+    @classmethod
+    def client_pool(cls) -> RemoteClientPool:
+        """Pool providing the HTTP client for this command's remote service."""
+        return cls._client_pool or get_client_pool()
+
     @classmethod
     def description(cls) -> str:
         """Get command description."""
@@ -176,14 +201,19 @@ class RemoteCommand(ABC, Generic[InputT, ResultT]):
         # Prepare request body
         body = self._inputs.model_dump() if self._inputs else self._raw_inputs
 
-        # Make request
+        # Join a time-window batch when the command is configured for one
+        if self._batcher is not None:
+            return _result_from_item(self, self._batcher.call(self._command_name, body))
+
+        # Make request over the pooled keep-alive client
+        pool = self.client_pool()
         try:
-            with httpx.Client(timeout=self._timeout) as client:
-                response = client.post(
-                    url,
-                    json=body,
-                    headers=self._headers,
-                )
+            response = pool.client(url).post(
+                url,
+                json=body,
+                headers=self._headers,
+                timeout=pool.timeout_for(url, self._timeout),
+            )
         except httpx.ConnectError as e:
             raise RemoteConnectionError(f"Failed to connect to remote service: {e}", url=url)
         except httpx.TimeoutException as e:
@@ -227,6 +257,10 @@ class RemoteCommand(ABC, Generic[InputT, ResultT]):
             elif "data" in data:
                 data = data["data"]
 
+        return self._convert_result(data)
+
+    def _convert_result(self, data: Any) -> ResultT:
+        """Convert result data to the result type."""
         # Convert to result type if it's a model
         result_type = self.result_type()
         if result_type and result_type != Any:
@@ -239,7 +273,9 @@ class RemoteCommand(ABC, Generic[InputT, ResultT]):
         """
         Run this command instance and return outcome.
 
-        Matches the interface of local Command.run_instance().
+        Matches the interface of local Command.run_instance(). Inside a
+        ``batch()`` block for this command's service the call is deferred and
+        a PendingOutcome is returned instead.
         """
         # Validate inputs first
         if not self.validate_inputs():
@@ -249,6 +285,12 @@ class RemoteCommand(ABC, Generic[InputT, ResultT]):
                 )
             )
 
+        from foobara_py.remote.batching import active_batch
+
+        batch = active_batch(type(self))
+        if batch is not None:
+            return batch.add(self, self._inputs.model_dump())
+
         # Execute remote call
         try:
             result = self.execute()
@@ -299,6 +341,8 @@ class AsyncRemoteCommand(ABC, Generic[InputT, ResultT]):
     _command_name: ClassVar[str] = ""
     _timeout: ClassVar[float] = 30.0
     _headers: ClassVar[Dict[str, str]] = {}
+    _client_pool: ClassVar[Optional[RemoteClientPool]] = None  # default: get_client_pool()
+    _batcher: ClassVar[Optional["RemoteBatcher"]] = None  # batch calls by time window
 
     _description: ClassVar[str] = ""
     _domain: ClassVar[Optional[str]] = None
@@ -335,6 +379,10 @@ class AsyncRemoteCommand(ABC, Generic[InputT, ResultT]):
     def full_name(cls) -> str:
         return cls._command_name or cls.__name__
 
+    @classmethod
+    def client_pool(cls) -> RemoteClientPool:
+        return cls._client_pool or get_client_pool()
+
     @classmethod
     def description(cls) -> str:
         return cls._description or cls.__doc__ or ""
@@ -372,13 +420,23 @@ class AsyncRemoteCommand(ABC, Generic[InputT, ResultT]):
         url = f"{self._remote_url.rstrip('/')}/run/{self._command_name}"
         body = self._inputs.model_dump() if self._inputs else self._raw_inputs
 
+        # Join a time-window batch inside a batch() block or when configured
+        from foobara_py.remote.batching import active_batch
+
+        batch = active_batch(type(self))
+        batcher = batch.batcher if batch is not None else self._batcher
+        if batcher is not None:
+            return _result_from_item(self, await batcher.call_async(self._command_name, body))
+
+        pool = self.client_pool()
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.post(
-                    url,
-                    json=body,
-                    headers=self._headers,
-                )
+            client = await pool.async_client(url)
+            response = await client.post(
+                url,
+                json=body,
+                headers=self._headers,
+                timeout=pool.timeout_for(url, self._timeout),
+            )
         except httpx.ConnectError as e:
             raise RemoteConnectionError(f"Failed to connect: {e}", url=url)
         except httpx.TimeoutException as e:
@@ -415,6 +473,10 @@ class AsyncRemoteCommand(ABC, Generic[InputT, ResultT]):
             elif "data" in data:
                 data = data["data"]
 
+        return self._convert_result(data)
+
+    def _convert_result(self, data: Any) -> ResultT:
+        """Convert result data to the result type."""
         result_type = self.result_type()
         if result_type and result_type != Any:
             if isinstance(result_type, type) and issubclass(result_type, BaseModel):
@@ -11,6 +11,7 @@ from foobara_py.serializers.entity_serializers import (
     EntitiesToPrimaryKeysSerializer,
 )
 from foobara_py.serializers.error_serializer import ErrorsSerializer
+from foobara_py.serializers.outcome_encoder import OutcomeEncoder, default_outcome_encoder
 
 __all__ = [
     "Serializer",
@@ -19,4 +20,6 @@ __all__ = [
     "AtomicSerializer",
     "EntitiesToPrimaryKeysSerializer",
     "ErrorsSerializer",
+    "OutcomeEncoder",
+    "default_outcome_encoder",
 ]
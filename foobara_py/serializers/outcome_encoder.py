@@ -0,0 +1,183 @@
+"""
+Outcome encoder for foobara-py connectors.
+
+Serialises command results straight to JSON bytes instead of dumping them to
+Python dicts first and running the stdlib encoder over the result:
+
+- Pydantic model results use ``model_dump_json()``
+- Results with a declared ``result_type`` use a ``TypeAdapter`` built once
+  per command class and cached
+- Anything else (plain dicts, lists, scalars) goes through orjson when it is
+  installed, falling back to the stdlib ``json`` module
+
+Connectors share ``default_outcome_encoder`` so adapters are built once per
+process.
+
+Usage:
+    from foobara_py.serializers import default_outcome_encoder as encoder
+
+    body = encoder.encode_outcome(CreateUser, outcome)
+    # b'{"success":true,"result":{"id":1,"name":"Ann"}}'
+"""
+
+import json
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, TypeAdapter
+
+from foobara_py.core.streaming import as_stream
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for values the JSON backend cannot encode natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "__dict__"):
+        return obj.__dict__
+    return str(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact JSON bytes via orjson, or the stdlib encoder when it is missing"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder handles
+            pass
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode()
+
+
+class RawJSON(bytes):
+    """Marks bytes as an already-encoded JSON value inside a message envelope"""
+
+    __slots__ = ()
+
+
+def splice_json(fields: Dict[str, Any], key: str, raw: bytes) -> bytes:
+    """
+    Encode fields as a JSON object with key set to an already-encoded value.
+
+    Lets connectors wrap an encoded result in an envelope without decoding it.
+    """
+    head = dumps(fields)
+    if head == b"{}":
+        return b'{"' + key.encode() + b'":' + raw + b"}"
+    return head[:-1] + b',"' + key.encode() + b'":' + raw + b"}"
+
+
+def merge_json(fields: Dict[str, Any], raw_object: bytes) -> bytes:
+    """Encode fields followed by the members of an already-encoded JSON object"""
+    head = dumps(fields)
+    if raw_object == b"{}":
+        return head
+    if head == b"{}":
+        return raw_object
+    return head[:-1] + b"," + raw_object[1:]
+
+
+class OutcomeEncoder:
+    """
+    Encodes command results and outcomes to JSON bytes.
+
+    TypeAdapters for declared result types are cached per command class.
+    """
+
+    __slots__ = ("_adapters", "_lock")
+
+    def __init__(self):
+        # Weak keys so dynamically created command classes can be collected
+        self._adapters: "weakref.WeakKeyDictionary[type, Optional[TypeAdapter]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def adapter_for(self, command_class: Optional[type]) -> Optional[TypeAdapter]:
+        """Cached TypeAdapter for the command's result type (None if untyped)"""
+        if command_class is None:
+            return None
+        try:
+            return self._adapters[command_class]
+        except KeyError:
+            pass
+
+        adapter = None
+        result_type = getattr(command_class, "result_type", lambda: Any)()
+        if result_type is not Any and result_type is not None:
+            try:
+                adapter = TypeAdapter(result_type)
+            except Exception:
+                # Types pydantic cannot describe are encoded by the fallback path
+                adapter = None
+
+        with self._lock:
+            self._adapters[command_class] = adapter
+        return adapter
+
+    def encode_result(self, command_class: Optional[type], result: Any) -> bytes:
+        """Encode a command result as JSON bytes"""
+        if isinstance(result, BaseModel):
+            return result.model_dump_json().encode()
+        if isinstance(result, (dict, str, int, float, bool)) or result is None:
+            return dumps(result)
+        stream = as_stream(result)
+        if stream is not None:
+            # Connectors without streaming support get a JSON array
+            if stream.is_async:
+                raise TypeError("Async streaming results need a streaming connector")
+            return b"[" + b",".join(self.encode_result(None, item) for item in stream) + b"]"
+        adapter = self.adapter_for(command_class)
+        if adapter is not None:
+            return adapter.dump_json(result, warnings=False)
+        return dumps(result)
+
+    def to_jsonable(self, command_class: Optional[type], result: Any) -> Any:
+        """JSON-compatible Python value, for transports that serialise themselves"""
+        if isinstance(result, BaseModel):
+            return result.model_dump(mode="json")
+        stream = as_stream(result)
+        if stream is not None:
+            return [self.to_jsonable(None, item) for item in stream]
+        adapter = self.adapter_for(command_class)
+        if adapter is not None:
+            return adapter.dump_python(result, mode="json", warnings=False)
+        return result
+
+    def encode_success(self, command_class: Optional[type], result: Any) -> bytes:
+        """Encode ``{"success": true, "result": ...}``"""
+        return b'{"success":true,"result":' + self.encode_result(command_class, result) + b"}"
+
+    def encode_errors(self, errors: Any) -> bytes:
+        """Encode ``{"success": false, "errors": [...]}``"""
+        return dumps({"success": False, "errors": errors})
+
+    def encode_outcome(self, command_class: Optional[type], outcome: Any) -> bytes:
+        """Encode a CommandOutcome using the same envelope as the HTTP connector"""
+        if outcome.is_success():
+            return self.encode_success(command_class, outcome.unwrap())
+        return self.encode_errors([format_error(error) for error in outcome.errors])
+
+    def clear(self) -> None:
+        """Forget cached adapters (e.g. after redefining command classes in tests)"""
+        with self._lock:
+            self._adapters.clear()
+
+
+def format_error(error: Any) -> Dict[str, Any]:
+    """Error dict shared by connectors: symbol, message and optional path/context"""
+    err_dict = {"symbol": getattr(error, "symbol", "error"), "message": str(error)}
+    if getattr(error, "path", None):
+        err_dict["path"] = error.path
+    if getattr(error, "context", None):
+        err_dict["context"] = error.context
+    return err_dict
+
+
+default_outcome_encoder = OutcomeEncoder()
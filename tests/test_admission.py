@@ -0,0 +1,353 @@
+"""Tests for admission control and load shedding"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Callable, Iterator, List
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from foobara_py import (
+    AdmissionConfig,
+    AdmissionController,
+    AdmissionRejectedError,
+    AsyncCommand,
+    Command,
+)
+from foobara_py.connectors.celery_connector import CeleryTaskFactory
+from foobara_py.connectors.http import HTTPConnector
+from foobara_py.connectors.mcp import JsonRpcErrorCode, MCPConnector
+from foobara_py.connectors.websocket import (
+    WebSocketConnector,
+    WebSocketMessage,
+    WebSocketMessageType,
+)
+from foobara_py.core.admission import AdmissionLimiter
+from foobara_py.core.registry import CommandRegistry
+
+
+class PingInputs(BaseModel):
+    value: int = 1
+
+
+class Ping(Command[PingInputs, int]):
+    """Return the value"""
+
+    def execute(self) -> int:
+        return self.inputs.value
+
+
+class AsyncPing(AsyncCommand[PingInputs, int]):
+    """Return the value asynchronously"""
+
+    async def execute(self) -> int:
+        return self.inputs.value
+
+
+class Charge(Command[PingInputs, int]):
+    """Billing command"""
+
+    _domain = "Billing"
+
+    def execute(self) -> int:
+        return self.inputs.value
+
+
+class Refund(Command[PingInputs, int]):
+    """Billing command"""
+
+    _domain = "Billing"
+
+    def execute(self) -> int:
+        return -self.inputs.value
+
+
+class Countdown(Command[PingInputs, Iterator[int]]):
+    """Stream the value down to 1, calling each probe before an item is produced"""
+
+    probes: List[Callable[[], None]] = []
+
+    def execute(self) -> Iterator[int]:
+        def items():
+            for n in range(self.inputs.value, 0, -1):
+                for probe in self.probes:
+                    probe()
+                yield n
+
+        return items()
+
+
+def saturated(controller: AdmissionController, command_class: type):
+    """Hold command_class's only slot for the duration of a with block"""
+    return controller.limiter_for(command_class).acquire()
+
+
+class TestAdmissionLimiter:
+    def test_admits_up_to_limit_then_rejects_when_queue_full(self):
+        limiter = AdmissionLimiter(AdmissionConfig(max_in_flight=2, max_queue=0, retry_after=3))
+
+        with limiter.acquire(), limiter.acquire():
+            with pytest.raises(AdmissionRejectedError) as exc_info:
+                with limiter.acquire():
+                    pass
+
+        assert exc_info.value.reason == "queue_full"
+        assert exc_info.value.status == 429
+        assert exc_info.value.retry_after_header == "3"
+        assert limiter.metrics()["rejected"] == 1
+        assert limiter.metrics()["in_flight"] == 0
+
+    def test_queue_timeout(self):
+        limiter = AdmissionLimiter(AdmissionConfig(max_in_flight=1, max_queue=1, queue_timeout=0.01))
+
+        with limiter.acquire():
+            with pytest.raises(AdmissionRejectedError) as exc_info:
+                with limiter.acquire():
+                    pass
+
+        assert exc_info.value.status == 503
+        assert limiter.metrics()["timed_out"] == 1
+        assert limiter.metrics()["queued"] == 0
+
+    def test_released_slot_is_handed_to_waiter(self):
+        limiter = AdmissionLimiter(AdmissionConfig(max_in_flight=1, max_queue=1, queue_timeout=5))
+        admitted = []
+
+        def waiter():
+            with limiter.acquire():
+                admitted.append(True)
+
+        with limiter.acquire():
+            thread = threading.Thread(target=waiter)
+            thread.start()
+            while limiter.metrics()["queued"] == 0:
+                time.sleep(0.001)
+        thread.join(timeout=5)
+
+        assert admitted == [True]
+        assert limiter.metrics()["admitted"] == 2
+
+    def test_async_waiters_run_in_order(self):
+        limiter = AdmissionLimiter(AdmissionConfig(max_in_flight=1, max_queue=10, queue_timeout=5))
+        order = []
+
+        async def run(n):
+            async with limiter.acquire_async():
+                order.append(n)
+                await asyncio.sleep(0)
+
+        async def scenario():
+            await asyncio.gather(*(run(n) for n in range(5)))
+
+        asyncio.run(scenario())
+
+        assert order == [0, 1, 2, 3, 4]
+        assert limiter.metrics()["in_flight"] == 0
+
+    def test_cancelled_waiter_leaves_queue(self):
+        limiter = AdmissionLimiter(AdmissionConfig(max_in_flight=1, max_queue=1, queue_timeout=5))
+
+        async def scenario():
+            async with limiter.acquire_async():
+                task = asyncio.ensure_future(limiter.acquire_async().__aenter__())
+                await asyncio.sleep(0.01)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        asyncio.run(scenario())
+
+        assert limiter.metrics()["queued"] == 0
+        assert limiter.metrics()["in_flight"] == 0
+
+    def test_adaptive_limit_shrinks_when_slow_and_recovers(self):
+        limiter = AdmissionLimiter(
+            AdmissionConfig(max_in_flight=10, adaptive=True, target_latency=0.5, backoff=0.5)
+        )
+
+        for _ in range(3):
+            limiter._enter()
+            limiter._exit(1.0)
+        assert limiter.limit == 1
+
+        for _ in range(50):
+            limiter._enter()
+            limiter._exit(0.1)
+        assert limiter.limit == 10
+
+
+class TestAdmissionController:
+    def test_unconfigured_commands_are_unlimited(self):
+        controller = AdmissionController()
+
+        assert controller.limiter_for(Ping) is None
+        assert controller.run(Ping, value=2).result == 2
+
+    def test_command_config_wins_over_domain(self):
+        controller = AdmissionController()
+        controller.limit("Billing", AdmissionConfig(max_in_flight=4))
+        controller.limit(Refund, AdmissionConfig(max_in_flight=1))
+
+        assert controller.limiter_for(Charge).config.max_in_flight == 4
+        assert controller.limiter_for(Refund).config.max_in_flight == 1
+
+    def test_domain_limit_is_shared(self):
+        controller = AdmissionController()
+        controller.limit("Billing", AdmissionConfig(max_in_flight=1, max_queue=0))
+
+        assert controller.limiter_for(Charge) is controller.limiter_for(Refund)
+        with saturated(controller, Charge):
+            with pytest.raises(AdmissionRejectedError):
+                controller.run(Refund, value=1)
+
+    def test_default_config_limits_each_command_separately(self):
+        controller = AdmissionController(default=AdmissionConfig(max_in_flight=1, max_queue=0))
+
+        with saturated(controller, Ping):
+            assert controller.run(Charge, value=1).result == 1
+
+    def test_run_async(self):
+        controller = AdmissionController(default=AdmissionConfig())
+
+        outcome = asyncio.run(controller.run_async(AsyncPing, value=5))
+
+        assert outcome.result == 5
+        assert controller.metrics()["AsyncPing"]["admitted"] == 1
+
+
+@pytest.fixture
+def controller():
+    return AdmissionController().limit(
+        Ping, AdmissionConfig(max_in_flight=1, max_queue=0, retry_after=2.5)
+    )
+
+
+class TestConnectorAdmission:
+    def test_http_rejects_with_retry_after(self, controller):
+        pytest.importorskip("fastapi")
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        HTTPConnector(app, admission=controller).register(Ping)
+        client = TestClient(app)
+
+        with saturated(controller, Ping):
+            response = client.post("/ping", json={"value": 1})
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "3"
+        assert response.json()["errors"][0]["symbol"] == "rate_limit_exceeded"
+        assert client.post("/ping", json={"value": 1}).json() == {"success": True, "result": 1}
+
+    def test_http_stream_holds_slot_until_sent(self, monkeypatch):
+        pytest.importorskip("fastapi")
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        controller = AdmissionController().limit(
+            Countdown, AdmissionConfig(max_in_flight=1, max_queue=0)
+        )
+        app = FastAPI()
+        HTTPConnector(app, admission=controller).register(Countdown)
+        client = TestClient(app)
+        statuses = []
+
+        def probe():
+            statuses.append(client.post("/countdown", json={"value": 0}).status_code)
+
+        monkeypatch.setattr(Countdown, "probes", [probe])
+
+        response = client.post("/countdown", json={"value": 2})
+
+        assert response.text == "2\n1\n"
+        assert statuses == [429, 429]
+        assert controller.metrics()["Countdown"]["in_flight"] == 0
+        monkeypatch.setattr(Countdown, "probes", [])
+        assert client.post("/countdown", json={}).text == "1\n"
+
+    def test_http_queue_timeout_is_503(self):
+        pytest.importorskip("fastapi")
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        controller = AdmissionController().limit(
+            Ping, AdmissionConfig(max_in_flight=1, max_queue=1, queue_timeout=0.01)
+        )
+        app = FastAPI()
+        HTTPConnector(app, admission=controller).register(Ping)
+
+        with saturated(controller, Ping):
+            response = TestClient(app).post("/ping", json={"value": 1})
+
+        assert response.status_code == 503
+
+    def test_http_execute(self, controller):
+        connector = HTTPConnector(admission=controller)
+        connector.register(Ping)
+
+        with saturated(controller, Ping):
+            response = connector.execute("Ping", {"value": 1})
+
+        assert response["success"] is False
+        assert response["errors"][0]["context"]["retry_after"] == 2.5
+
+    def test_mcp_overloaded_error(self, controller):
+        connector = MCPConnector(admission=controller).connect(Ping)
+        request = {
+            "jsonrpc": "2.0",
+            "id": 7,
+            "method": "tools/call",
+            "params": {"name": "Ping", "arguments": {"value": 1}},
+        }
+
+        with saturated(controller, Ping):
+            response = json.loads(connector.run(json.dumps(request)))
+
+        assert response["error"]["code"] == JsonRpcErrorCode.OVERLOADED
+        assert response["error"]["data"]["retry_after"] == 2.5
+
+    def test_websocket_error(self, controller):
+        registry = CommandRegistry()
+        registry.register(Ping)
+        connector = WebSocketConnector(registry, admission=controller)
+        messages = []
+
+        async def send(msg):
+            messages.append(json.loads(msg))
+
+        async def scenario():
+            connection = await connector.connect("conn-1", send)
+            with saturated(controller, Ping):
+                await connector.handle_message(connection, WebSocketMessage(
+                    type=WebSocketMessageType.EXECUTE,
+                    id="exec-1",
+                    command="Ping",
+                    inputs={"value": 1},
+                ).to_json())
+
+        asyncio.run(scenario())
+
+        assert messages[0]["type"] == "error"
+        error = json.loads(messages[0]["error"])[0]
+        assert error["key"] == "rate_limit_exceeded"
+        assert error["retry_after"] == 2.5
+
+    @patch("foobara_py.connectors.celery_connector.CeleryTaskFactory.get_celery_app")
+    def test_celery_retries_after_back_off(self, mock_get_app, controller):
+        mock_app = MagicMock()
+        mock_app.task = MagicMock(return_value=lambda f: f)
+        mock_get_app.return_value = mock_app
+        task = CeleryTaskFactory(admission=controller).create_task(Ping)
+        bound = MagicMock()
+        bound.retry.return_value = RuntimeError("retrying")
+
+        with saturated(controller, Ping):
+            with pytest.raises(RuntimeError):
+                task(bound, {"value": 1})
+
+        assert bound.retry.call_args.kwargs["countdown"] == 2.5
+        assert task(bound, {"value": 1}) == {"status": "success", "result": 1}
@@ -36,6 +36,20 @@ class TestAsyncCommand:
         assert outcome.is_failure()
         assert len(outcome.errors) > 0
 
+    @pytest.mark.asyncio
+    async def test_run_json(self):
+        outcome = await Add.run_json(b'{"a": 5, "b": 3}')
+        assert outcome.unwrap() == 8
+
+        outcome = await Add.run_json(b'{"a": 5}')
+        assert outcome.is_failure()
+        assert outcome.errors[0].path == ("b",)
+
+    @pytest.mark.asyncio
+    async def test_run_validated(self):
+        outcome = await Add.run_validated(AddInputs(a=1, b=2))
+        assert outcome.unwrap() == 3
+
     def test_inputs_type(self):
         assert Add.inputs_type() == AddInputs
 
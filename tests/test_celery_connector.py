@@ -1,5 +1,6 @@
 """Tests for Celery Connector."""
 
+import json
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -9,13 +10,17 @@ from pydantic import BaseModel
 from foobara_py import Command
 from foobara_py.core.registry import CommandRegistry
 from foobara_py.connectors.celery_connector import (
+    BatchJob,
     CeleryConfig,
     CeleryConnector,
     CeleryScheduler,
     CeleryTaskFactory,
     JobResult,
     JobStatus,
+    LocalResultStore,
+    ResultCodec,
     ScheduleConfig,
+    run_many,
 )
 
 
@@ -980,3 +985,149 @@ class TestCeleryErrorHandling:
 
         connector = CeleryConnector(registry)
         assert connector is not None
+
+
+# ==================== Chunked Batch Dispatch ====================
+
+class DoubleInputs(BaseModel):
+    value: int
+
+
+class DoubleCommand(Command[DoubleInputs, int]):
+    """Double a value, refusing negatives."""
+
+    def execute(self) -> int:
+        if self.inputs.value < 0:
+            self.add_runtime_error("negative", "Value must not be negative", halt=False)
+            return None
+        return self.inputs.value * 2
+
+
+class EagerTask:
+    """Stands in for a Celery task in eager mode: apply_async runs it inline."""
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = []
+
+    def apply_async(self, args, **kwargs):
+        self.calls.append((args, kwargs))
+        value = self.func(MagicMock(), *args)
+        result = MagicMock()
+        result.id = f"chunk-{len(self.calls)}"
+        result.get.return_value = value
+        return result
+
+
+class TestResultCodec:
+    def test_round_trip(self):
+        codec = ResultCodec()
+        value = [[True, {"name": "x", "items": [1, 2]}], [False, [["invalid", "bad"]]]]
+
+        payload = codec.encode(value)
+
+        assert set(payload) == {"codec", "data"}
+        assert codec.decode(payload) == value
+
+    def test_large_results_are_compressed_when_zstandard_is_installed(self):
+        pytest.importorskip("zstandard")
+        codec = ResultCodec(compress_min_size=100)
+
+        payload = codec.encode([[True, "x" * 10_000]])
+
+        assert payload["codec"].endswith("+zstd")
+        assert len(payload["data"]) < 1000
+        assert codec.decode(payload) == [[True, "x" * 10_000]]
+
+    def test_spills_to_store_above_threshold(self, tmp_path):
+        store = LocalResultStore(str(tmp_path))
+        codec = ResultCodec(compress=False, spill_threshold=100, store=store)
+
+        small = codec.encode([1])
+        large = codec.encode(list(range(200)))
+
+        assert "data" in small
+        assert "data" not in large
+        assert len(list(tmp_path.iterdir())) == 1
+        assert codec.decode(large) == list(range(200))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_spilled_result_needs_store(self):
+        with pytest.raises(ValueError):
+            ResultCodec().decode({"codec": "json", "ref": "abc"})
+
+    def test_local_store_rejects_paths(self, tmp_path):
+        with pytest.raises(ValueError):
+            LocalResultStore(str(tmp_path)).get("../etc/passwd")
+
+
+class TestExecuteMany:
+    @pytest.fixture
+    def registry(self):
+        reg = CommandRegistry()
+        reg.register(DoubleCommand)
+        return reg
+
+    @pytest.fixture
+    def mock_celery_app(self):
+        mock_app = MagicMock()
+        mock_app.task = MagicMock(return_value=lambda f: f)
+        return mock_app
+
+    def test_run_many_returns_compact_entries(self):
+        entries = run_many(DoubleCommand, [{"value": 2}, {"value": -1}, {"value": "x"}])
+
+        assert entries[0] == [True, 4]
+        assert entries[1] == [False, [["negative", "Value must not be negative"]]]
+        assert entries[2][0] is False
+
+    @patch("foobara_py.connectors.celery_connector.CeleryTaskFactory.get_celery_app")
+    def test_inputs_are_dispatched_in_chunks(self, mock_get_app, registry, mock_celery_app):
+        mock_get_app.return_value = mock_celery_app
+        connector = CeleryConnector(registry)
+        task = EagerTask(connector.task_factory.create_chunk_task(DoubleCommand))
+        connector.task_factory._tasks["foobara.DoubleCommand.chunk"] = task
+        inputs_list = [{"value": n} for n in range(7)] + [{"value": -1}]
+
+        batch = connector.execute_many("DoubleCommand", inputs_list, chunk_size=3, priority=5)
+        results = connector.get_many_results(batch)
+
+        assert isinstance(batch, BatchJob)
+        assert batch.chunk_sizes == [3, 3, 2]
+        assert [len(args[0]) for args, _ in task.calls] == [3, 3, 2]
+        assert task.calls[0][1] == {"priority": 5}
+        assert [r.result for r in results[:7]] == [n * 2 for n in range(7)]
+        assert results[0].job_id == "chunk-1"
+        assert results[7].job_id == "chunk-3"
+        assert results[7].status == JobStatus.FAILURE
+        assert results[7].inputs == {"value": -1}
+        assert json.loads(results[7].error)[0]["key"] == "negative"
+
+    @patch("foobara_py.connectors.celery_connector.CeleryTaskFactory.get_celery_app")
+    def test_chunk_task_is_created_on_demand(self, mock_get_app, registry, mock_celery_app):
+        mock_get_app.return_value = mock_celery_app
+        connector = CeleryConnector(registry, CeleryConfig(chunk_size=2))
+
+        with patch.object(connector.task_factory, "create_chunk_task") as create:
+            create.return_value = MagicMock()
+            batch = connector.execute_many("DoubleCommand", [{"value": 1}] * 5)
+
+        create.assert_called_once_with(DoubleCommand, name="foobara.DoubleCommand.chunk")
+        assert create.return_value.apply_async.call_count == 3
+        assert len(batch.job_ids) == 3
+
+    @patch("foobara_py.connectors.celery_connector.CeleryTaskFactory.get_celery_app")
+    def test_unknown_command(self, mock_get_app, registry, mock_celery_app):
+        mock_get_app.return_value = mock_celery_app
+
+        with pytest.raises(ValueError):
+            CeleryConnector(registry).execute_many("Missing", [{}])
+
+    def test_eager_mode(self, registry):
+        pytest.importorskip("celery")
+        connector = CeleryConnector(registry, CeleryConfig(broker_url="memory://", result_backend="cache+memory://"))
+        connector.get_celery_app().conf.task_always_eager = True
+
+        batch = connector.execute_many("DoubleCommand", [{"value": n} for n in range(5)], chunk_size=2)
+
+        assert [r.result for r in connector.get_many_results(batch)] == [0, 2, 4, 6, 8]
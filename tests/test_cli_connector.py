@@ -0,0 +1,185 @@
+"""Tests for the Typer CLI connector, including lazy command registration"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from pydantic import BaseModel
+
+from foobara_py import Command
+
+typer = pytest.importorskip("typer")
+from typer.testing import CliRunner  # noqa: E402
+
+from foobara_py.connectors.cli import CLIConnector, CommandIndex  # noqa: E402
+
+
+class AddInputs(BaseModel):
+    a: int
+    b: int = 0
+    tags: list = []
+
+
+class AddIt(Command[AddInputs, int]):
+    """Add two numbers"""
+
+    def execute(self) -> int:
+        return self.inputs.a + self.inputs.b + len(self.inputs.tags)
+
+
+LAZY_MODULE = '''
+from pydantic import BaseModel
+
+from foobara_py import Command
+
+
+class GreetInputs(BaseModel):
+    name: str
+
+
+class Greet(Command[GreetInputs, str]):
+    """Say hello"""
+
+    def execute(self) -> str:
+        return "hello " + self.inputs.name
+
+
+class Shout(Command[GreetInputs, str]):
+    """Say hello loudly"""
+
+    def execute(self) -> str:
+        return "HELLO " + self.inputs.name.upper()
+'''
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    """Write a command module into tmp_path and make it importable (not imported)"""
+    name = f"lazy_cli_commands_{abs(hash(tmp_path))}"
+    (tmp_path / f"{name}.py").write_text(textwrap.dedent(LAZY_MODULE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    sys.modules.pop(name, None)
+
+
+runner = CliRunner()
+
+
+class TestEagerCommands:
+    def test_inputs_become_options(self):
+        cli = CLIConnector().register(AddIt)
+
+        result = runner.invoke(cli.app, ["addit", "--a", "2", "--b", "3"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["result"] == 5
+
+    def test_non_cli_types_are_parsed_as_json(self):
+        cli = CLIConnector().register(AddIt)
+
+        result = runner.invoke(cli.app, ["addit", "--a", "1", "--tags", '["x", "y"]'])
+
+        assert json.loads(result.output)["result"] == 3
+
+    def test_missing_required_option(self):
+        cli = CLIConnector().register(AddIt)
+
+        result = runner.invoke(cli.app, ["addit"])
+
+        assert result.exit_code != 0
+        assert "--a" in result.output
+
+
+class TestLazyCommands:
+    def test_help_lists_commands_without_importing(self, lazy_module):
+        cli = CLIConnector().register_lazy(f"{lazy_module}:Greet", name="greet", help="Say hi")
+
+        result = runner.invoke(cli.app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "greet" in result.output
+        assert "Say hi" in result.output
+        assert lazy_module not in sys.modules
+        assert "greet" in cli
+        assert len(cli) == 1
+
+    def test_invoking_imports_the_command(self, lazy_module):
+        cli = CLIConnector().register_lazy(f"{lazy_module}:Greet", name="greet")
+
+        result = runner.invoke(cli.app, ["greet", "--name", "ada"])
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["result"] == "hello ada"
+        assert lazy_module in sys.modules
+        assert "Greet" in cli.commands
+
+    def test_execute_and_manifest(self, lazy_module):
+        cli = CLIConnector().register_lazy(f"{lazy_module}:Greet", name="greet")
+
+        assert json.loads(cli.execute("greet", name="bob"))["result"] == "hello bob"
+        assert "Greet" in cli.get_manifest()["commands"]
+
+    def test_bad_import_path(self):
+        with pytest.raises(ValueError):
+            CLIConnector().register_lazy("no_class_here")
+
+    def test_register_module(self, lazy_module):
+        cli = CLIConnector().register_module(lazy_module)
+
+        result = runner.invoke(cli.app, ["shout", "--name", "ada"])
+
+        assert json.loads(result.output)["result"] == "HELLO ADA"
+        assert len(cli) == 2
+
+
+class TestCommandIndex:
+    def test_cached_index_avoids_import(self, lazy_module, tmp_path):
+        path = tmp_path / "index.json"
+        CommandIndex(path).describe(lazy_module)
+        sys.modules.pop(lazy_module)
+
+        cli = CLIConnector(index_cache=path).register_module(lazy_module)
+        result = runner.invoke(cli.app, ["--help"])
+
+        assert "Say hello loudly" in result.output
+        assert lazy_module not in sys.modules
+
+    def test_changed_module_is_described_again(self, lazy_module, tmp_path):
+        path = tmp_path / "index.json"
+        CommandIndex(path).describe(lazy_module)
+        sys.modules.pop(lazy_module)
+        source = tmp_path / f"{lazy_module}.py"
+        source.write_text(source.read_text().replace("Say hello loudly", "Yell"))
+        os.utime(source, ns=(0, source.stat().st_mtime_ns + 10**9))
+
+        commands = CommandIndex(path).describe(lazy_module)
+
+        assert {c["help"] for c in commands} == {"Say hello", "Yell"}
+        assert lazy_module in sys.modules
+
+    def test_unreadable_cache_is_ignored(self, lazy_module, tmp_path):
+        path = tmp_path / "index.json"
+        path.write_text("not json")
+
+        assert len(CommandIndex(path).describe(lazy_module)) == 2
+        assert json.loads(path.read_text())["version"] == CommandIndex.VERSION
+
+
+def test_package_import_does_not_load_connectors():
+    code = "import sys, foobara_py; print('fastapi' in sys.modules, 'numpy' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.split() == ["False", "False"]
+
+
+@pytest.mark.parametrize("package", ["foobara_py", "foobara_py.connectors"])
+def test_all_lists_every_lazy_export(package):
+    module = __import__(package, fromlist=["_EXPORTS"])
+
+    assert len(module.__all__) == len(set(module.__all__))
+    assert set(module.__all__) - {"__version__"} == set(module._EXPORTS)
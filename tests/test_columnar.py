@@ -0,0 +1,160 @@
+"""
+Tests for columnar export of entity collections
+"""
+
+import pytest
+from typing import Optional
+
+from foobara_py.persistence import (
+    ColumnBatch,
+    EntityBase,
+    InMemoryCRUDDriver,
+    InMemoryRepository,
+)
+
+np = pytest.importorskip("numpy")
+
+
+class Sale(EntityBase):
+    """Test sale entity"""
+    _primary_key_field = 'id'
+
+    id: Optional[int] = None
+    region: str
+    amount: float
+    quantity: int
+    refunded: bool = False
+    discount: Optional[float] = None
+
+
+@pytest.fixture
+def sales_table():
+    driver = InMemoryCRUDDriver()
+    table = driver.table_for(Sale)
+    table.insert({"region": "eu", "amount": 10.5, "quantity": 2, "refunded": False, "discount": None})
+    table.insert({"region": "us", "amount": 20.0, "quantity": 1, "refunded": True, "discount": 0.1})
+    table.insert({"region": "eu", "amount": 5.0, "quantity": 4, "refunded": False, "discount": None})
+    return table
+
+
+class TestColumnBatch:
+    def test_from_rows_numeric_columns_are_arrays(self):
+        rows = [
+            {"id": 1, "region": "eu", "amount": 1.5, "quantity": 3},
+            {"id": 2, "region": "us", "amount": 2.5, "quantity": 4},
+        ]
+        batch = ColumnBatch.from_rows(rows, ["amount", "quantity", "region"], Sale)
+
+        assert len(batch) == 2
+        assert batch["amount"].dtype == np.float64
+        assert batch["quantity"].dtype == np.int64
+        assert batch["region"] == ["eu", "us"]
+        assert batch["quantity"].sum() == 7
+
+    def test_from_rows_without_entity_class_uses_first_row_keys(self):
+        batch = ColumnBatch.from_rows([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}])
+
+        assert batch.field_names == ["a", "b"]
+        # No type information, so columns stay as lists
+        assert batch["a"] == [1, 2]
+
+    def test_from_rows_empty(self):
+        batch = ColumnBatch.from_rows([], ["amount"], Sale)
+
+        assert len(batch) == 0
+        assert len(batch["amount"]) == 0
+
+    def test_missing_numeric_values_become_nan(self):
+        batch = ColumnBatch.from_rows(
+            [{"discount": 0.5}, {"discount": None}], ["discount"], Sale
+        )
+
+        assert batch["discount"].dtype == np.float64
+        assert np.isnan(batch["discount"][1])
+
+    def test_from_tuples(self):
+        batch = ColumnBatch.from_tuples([(1, "eu"), (2, "us")], ["quantity", "region"], Sale)
+
+        assert list(batch["quantity"]) == [1, 2]
+        assert batch["region"] == ["eu", "us"]
+
+    def test_to_dicts_round_trip(self):
+        rows = [{"region": "eu", "quantity": 1}, {"region": "us", "quantity": 2}]
+        batch = ColumnBatch.from_rows(rows, ["region", "quantity"], Sale)
+
+        assert batch.to_dicts() == rows
+
+    def test_to_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+        batch = ColumnBatch.from_rows(
+            [{"region": "eu", "amount": 1.0}, {"region": "us", "amount": 2.0}],
+            ["region", "amount"],
+            Sale,
+        )
+
+        arrow_table = batch.to_arrow()
+
+        assert isinstance(arrow_table, pa.Table)
+        assert arrow_table.num_rows == 2
+        assert arrow_table.column("amount").to_pylist() == [1.0, 2.0]
+
+
+class TestSelectColumnar:
+    def test_select_columnar_all_fields(self, sales_table):
+        batch = sales_table.select_columnar()
+
+        assert set(batch.field_names) == set(Sale.model_fields)
+        assert len(batch) == 3
+
+    def test_select_columnar_with_where(self, sales_table):
+        batch = sales_table.select_columnar(["amount", "quantity"], where={"region": "eu"})
+
+        assert len(batch) == 2
+        assert batch["amount"].sum() == pytest.approx(15.5)
+        assert (batch["amount"] * batch["quantity"]).sum() == pytest.approx(41.0)
+
+    def test_select_columnar_order_and_limit(self, sales_table):
+        batch = sales_table.select_columnar(["amount"], order_by="-amount", limit=2)
+
+        assert list(batch["amount"]) == [20.0, 10.5]
+
+    def test_select_columnar_bool_column(self, sales_table):
+        batch = sales_table.select_columnar(["refunded"])
+
+        assert batch["refunded"].dtype == np.bool_
+        assert batch["refunded"].sum() == 1
+
+    def test_select_columnar_sqlalchemy(self):
+        pytest.importorskip("sqlalchemy")
+        from sqlalchemy import create_engine
+
+        from foobara_py.persistence.mapping import entity_to_sqlalchemy_table
+        from foobara_py.persistence.sqlalchemy_driver import SQLAlchemyDriver, SQLAlchemyTable
+
+        engine = create_engine("sqlite:///:memory:")
+        driver = SQLAlchemyDriver(engine)
+        sa_table = entity_to_sqlalchemy_table(Sale, driver.metadata, "sales")
+        sa_table.create(engine)
+        table = SQLAlchemyTable(Sale, driver, sa_table=sa_table)
+        table.insert({"region": "eu", "amount": 1.0, "quantity": 2, "refunded": False})
+        table.insert({"region": "us", "amount": 3.0, "quantity": 5, "refunded": False})
+
+        batch = table.select_columnar(["region", "quantity"], order_by="-quantity")
+
+        assert batch["region"] == ["us", "eu"]
+        assert batch["quantity"].dtype == np.int64
+        assert list(batch["quantity"]) == [5, 2]
+
+
+class TestRepositoryScanColumns:
+    def test_scan_columns(self):
+        repo = InMemoryRepository()
+        repo.save(Sale(region="eu", amount=1.0, quantity=1))
+        repo.save(Sale(region="eu", amount=2.0, quantity=2))
+        repo.save(Sale(region="us", amount=4.0, quantity=3))
+
+        batch = repo.scan_columns(Sale, ["amount", "quantity"])
+        assert batch["amount"].sum() == pytest.approx(7.0)
+
+        eu = repo.scan_columns(Sale, ["quantity"], where={"region": "eu"})
+        assert list(eu["quantity"]) == [1, 2]
@@ -1,7 +1,7 @@
 """Tests for Command module"""
 
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from foobara_py.core.command import Command, command, SimpleCommand, simple_command
 from foobara_py.core.errors import FoobaraError
 
@@ -109,6 +109,55 @@ class TestCommandWithErrors:
         assert outcome.errors[0].path == ("email",)
 
 
+
+class TestPrevalidatedInputs:
+    def test_run_json(self):
+        outcome = Add.run_json(b'{"a": 2, "b": 3}')
+        assert outcome.unwrap() == 5
+
+    def test_run_json_maps_validation_errors(self):
+        outcome = Add.run_json('{"a": "x", "b": 3}')
+        assert outcome.is_failure()
+        error = outcome.errors[0]
+        assert error.category == "data"
+        assert error.path == ("a",)
+        assert error.symbol == "int_parsing"
+
+    def test_run_json_malformed_body(self):
+        outcome = Add.run_json(b"{not json")
+        assert outcome.is_failure()
+        assert outcome.errors[0].symbol == "json_invalid"
+        assert outcome.errors[0].context["input"] == "{not json"
+
+    def test_run_validated_skips_revalidation(self):
+        calls = []
+
+        class CountingInputs(BaseModel):
+            a: int
+
+            @field_validator("a")
+            @classmethod
+            def count(cls, value):
+                calls.append(value)
+                return value
+
+        class Double(Command[CountingInputs, int]):
+            def execute(self) -> int:
+                return self.inputs.a * 2
+
+        inputs = CountingInputs(a=4)
+        outcome = Double.run_validated(inputs)
+
+        assert outcome.unwrap() == 8
+        assert calls == [4]
+
+    def test_run_validated_rejects_other_models(self):
+        class Other(BaseModel):
+            a: int
+
+        with pytest.raises(TypeError):
+            Add.run_validated(Other(a=1))
+
 class TestSimpleCommand:
     def test_simple_command_decorator(self):
         @simple_command
@@ -172,6 +172,45 @@ class TestEntityBase:
         user.mark_persisted()  # Clears dirty tracking
         assert not user.is_dirty
 
+    def test_entity_original_values(self):
+        user = User(id=1, name="John", email="john@example.com")
+        user.mark_persisted()
+        user.name = "Jane"
+        user.name = "Janet"
+
+        assert user.original_values == {"name": "John"}
+        assert user.dirty_attributes == {"name"}
+
+    def test_entity_reverting_value_is_not_dirty(self):
+        user = User(id=1, name="John", email="john@example.com")
+        user.mark_persisted()
+        user.name = "Jane"
+        user.name = "John"
+
+        assert not user.is_dirty
+        assert user.dirty_attributes == set()
+
+    def test_entity_new_entity_is_not_tracked(self):
+        user = User(name="John", email="john@example.com")
+        user.name = "Jane"
+
+        assert not user.is_dirty
+
+    def test_entity_from_persisted_tracks_changes(self):
+        user = User.from_persisted(id=1, name="John", email="john@example.com")
+        assert not user.is_dirty
+
+        user.email = "jane@example.com"
+        assert user.dirty_attributes == {"email"}
+
+    def test_entity_mark_dirty_explicitly(self):
+        user = User(id=1, name="John", email="john@example.com")
+        user.mark_persisted()
+        user.mark_dirty("email")
+
+        assert user.is_dirty
+        assert user.dirty_attributes == {"email"}
+
 
 # ==================== Repository Tests ====================
 
@@ -309,6 +348,14 @@ class TestEntityClassMethods:
         assert user is not None
         assert user.name == "John"
 
+    def test_find_many_class_method(self, repo):
+        User.create(name="John", email="john@example.com")
+        User.create(name="Jane", email="jane@example.com")
+
+        users = User.find_many([2, 1, 99])
+        assert sorted(users) == [1, 2]
+        assert users[2].name == "Jane"
+
     def test_find_all_class_method(self, repo):
         User.create(name="John", email="john@example.com")
         User.create(name="Jane", email="jane@example.com")
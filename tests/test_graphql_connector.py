@@ -1,9 +1,15 @@
 """Tests for GraphQL Connector."""
 
+import threading
+from hashlib import sha256
+from typing import List, Optional
+from uuid import UUID, uuid4
+from unittest.mock import patch
+
 import pytest
 from pydantic import BaseModel
 
-from foobara_py import Command
+from foobara_py import AsyncCommand, Command, InMemoryCache
 from foobara_py.core.registry import CommandRegistry
 from foobara_py.connectors.graphql import (
     GraphQLConfig,
@@ -16,6 +22,12 @@ from foobara_py.connectors.graphql import (
     generate_graphql_schema,
     python_type_to_graphql,
 )
+from foobara_py.persistence import (
+    EntityBase,
+    InMemoryRepository,
+    RepositoryRegistry,
+    belongs_to,
+)
 
 
 # Test models
@@ -224,7 +236,7 @@ class TestGraphQLConnector:
     async def test_execute_mutation(self, connector):
         query = """
         mutation {
-            createUser(input: {name: "Test", email: "test@example.com", age: 25})
+            createUser(input: {name: "Test", email: "test@example.com", age: 25}) { id name email }
         }
         """
         result = await connector.execute(query, {"input": {"name": "Test", "email": "test@example.com", "age": 25}})
@@ -608,3 +620,446 @@ class TestGraphQLSchemaErrors:
         schema = generator.generate_schema()
         # Should handle non-existent command gracefully
         assert schema is not None
+
+
+# ==================== graphql-core Execution ====================
+
+class Author(EntityBase):
+    """Article author"""
+    _primary_key_field = 'id'
+
+    id: int
+    name: str
+
+
+class Article(EntityBase):
+    """Article written by an author"""
+    _primary_key_field = 'id'
+
+    id: int
+    title: str
+    author_id: Optional[int] = None
+
+    author = belongs_to(Author, foreign_key="author_id")
+
+
+class Remark(EntityBase):
+    """Remark on an article"""
+    _primary_key_field = 'id'
+
+    id: int
+    text: str
+    article_id: int
+
+    article = belongs_to(Article, foreign_key="article_id")
+
+
+class Editor(EntityBase):
+    """Editor keyed by UUID"""
+    _primary_key_field = 'id'
+
+    id: UUID
+    name: str
+
+
+class Draft(EntityBase):
+    """Draft belonging to a UUID-keyed editor"""
+    _primary_key_field = 'id'
+
+    id: int
+    editor_id: UUID
+
+    editor = belongs_to(Editor, foreign_key="editor_id")
+
+
+class CountingRepository(InMemoryRepository):
+    """Records every lookup made against it"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def find(self, entity_class, pk):
+        self.calls.append(("find", entity_class.__name__))
+        return super().find(entity_class, pk)
+
+    def find_many(self, entity_class, pks):
+        self.calls.append(("find_many", entity_class.__name__))
+        return super().find_many(entity_class, pks)
+
+
+class NoInputs(BaseModel):
+    pass
+
+
+class ListRemarks(Command[NoInputs, List[Remark]]):
+    """All remarks"""
+
+    def execute(self) -> List[Remark]:
+        return Remark.find_all()
+
+
+class ListDrafts(Command[NoInputs, List[Draft]]):
+    """All drafts"""
+
+    def execute(self) -> List[Draft]:
+        return Draft.find_all()
+
+
+_barrier = threading.Barrier(2, timeout=5)
+
+
+class WaitA(Command[NoInputs, int]):
+    def execute(self) -> int:
+        _barrier.wait()
+        return 1
+
+
+class WaitB(Command[NoInputs, int]):
+    def execute(self) -> int:
+        _barrier.wait()
+        return 2
+
+
+class AsyncGetUser(AsyncCommand[GetUserInputs, UserResult]):
+    """Get a user by ID asynchronously."""
+
+    Inputs = GetUserInputs
+    Result = UserResult
+
+    async def execute(self) -> UserResult:
+        return UserResult(id=self.inputs.id, name="Async", email="a@example.com")
+
+
+class FailingCommand(Command[GetUserInputs, UserResult]):
+    """Always fails."""
+
+    Inputs = GetUserInputs
+    Result = UserResult
+
+    def execute(self) -> UserResult:
+        self.add_runtime_error("not_found", "No such user", halt=False)
+        return None
+
+
+class TestGraphQLCoreExecution:
+    """Tests for execution on graphql-core"""
+
+    @pytest.fixture(autouse=True)
+    def graphql_core(self):
+        pytest.importorskip("graphql")
+
+    @pytest.fixture
+    def repo(self):
+        r = CountingRepository()
+        RepositoryRegistry.set_default(r)
+        for author_id in (1, 2):
+            r.save(Author(id=author_id, name=f"Author {author_id}"))
+        for article_id in (1, 2, 3):
+            r.save(
+                Article(id=article_id, title=f"Article {article_id}", author_id=article_id % 2 + 1)
+            )
+        for remark_id in range(1, 7):
+            r.save(Remark(id=remark_id, text=f"Remark {remark_id}", article_id=remark_id % 3 + 1))
+        r.calls.clear()
+        yield r
+        RepositoryRegistry.clear()
+
+    @pytest.fixture
+    def connector(self):
+        registry = CommandRegistry()
+        queries = [GetUser, AsyncGetUser, FailingCommand, ListRemarks, WaitA, WaitB]
+        for command in [CreateUser, *queries]:
+            registry.register(command)
+        config = GraphQLConfig(query_commands=[command.__name__ for command in queries])
+        return GraphQLConnector(registry, config)
+
+    def test_entity_types_expose_associations(self, connector):
+        schema = connector.get_schema()
+        assert "listRemarks: [Remark]" in schema
+        assert "  article: Article" in schema
+        assert "  author: Author" in schema
+
+    def test_nested_model_types_are_defined(self):
+        class Address(BaseModel):
+            city: str
+
+        class PersonInputs(BaseModel):
+            address: Address
+
+        class CreatePerson(Command[PersonInputs, BaseModel]):
+            Inputs = PersonInputs
+
+            def execute(self):
+                return {}
+
+        registry = CommandRegistry()
+        registry.register(CreatePerson)
+        schema = GraphQLSchemaGenerator(registry).generate_schema()
+
+        assert "input AddressInput {\n  city: String!\n}" in schema
+        assert "address: AddressInput!" in schema
+
+    @pytest.mark.asyncio
+    async def test_associations_load_one_batch_per_level(self, connector, repo):
+        query = "{ listRemarks { id text article { title author { name } } } }"
+
+        result = await connector.execute(query)
+
+        assert "errors" not in result
+        remarks = result["data"]["listRemarks"]
+        assert len(remarks) == 6
+        assert remarks[0] == {
+            "id": 1,
+            "text": "Remark 1",
+            "article": {"title": "Article 2", "author": {"name": "Author 1"}},
+        }
+        assert repo.calls == [("find_many", "Article"), ("find_many", "Author")]
+
+    @pytest.mark.asyncio
+    async def test_association_with_uuid_foreign_key(self, repo):
+        editor_id = uuid4()
+        repo.save(Editor(id=editor_id, name="Ed"))
+        repo.save(Draft(id=1, editor_id=editor_id))
+        registry = CommandRegistry()
+        registry.register(ListDrafts)
+        connector = GraphQLConnector(registry, GraphQLConfig(query_commands=["ListDrafts"]))
+
+        result = await connector.execute("{ listDrafts { id editor { name } } }")
+
+        assert result == {"data": {"listDrafts": [{"id": 1, "editor": {"name": "Ed"}}]}}
+
+    @pytest.mark.asyncio
+    async def test_root_fields_run_concurrently(self, connector):
+        result = await connector.execute("{ waitA waitB }")
+
+        assert result == {"data": {"waitA": 1, "waitB": 2}}
+
+    @pytest.mark.asyncio
+    async def test_async_command_and_variables(self, connector):
+        query = "query Get($id: Int!) { asyncGetUser(input: {id: $id}) { id name } }"
+
+        result = await connector.execute(query, {"id": 7})
+
+        assert result == {"data": {"asyncGetUser": {"id": 7, "name": "Async"}}}
+
+    @pytest.mark.asyncio
+    async def test_command_errors(self, connector):
+        result = await connector.execute("{ failingCommand(input: {id: 1}) { id } }")
+
+        assert result["data"] == {"failingCommand": None}
+        error = result["errors"][0]
+        assert error["message"] == "No such user"
+        assert error["path"] == ["failingCommand"]
+        assert error["extensions"]["code"] == "not_found"
+
+    @pytest.mark.asyncio
+    async def test_documents_and_schema_are_cached(self, connector):
+        from graphql import parse
+
+        query = "{ getUser(input: {id: 1}) { name } }"
+
+        with patch("foobara_py.connectors.graphql.parse", wraps=parse) as parse_spy:
+            await connector.execute(query)
+            schema = connector._executable_schema()
+            result = await connector.execute(query)
+
+        assert parse_spy.call_count == 1
+        assert connector._executable_schema() is schema
+        assert connector.register_resolvers() is connector.register_resolvers()
+        assert result == {"data": {"getUser": {"name": "Test"}}}
+
+    @pytest.mark.asyncio
+    async def test_document_cache_is_bounded(self):
+        registry = CommandRegistry()
+        registry.register(GetUser)
+        connector = GraphQLConnector(
+            registry, GraphQLConfig(query_commands=["GetUser"], document_cache_size=2)
+        )
+
+        for user_id in range(4):
+            await connector.execute(f"{{ getUser(input: {{id: {user_id}}}) {{ id }} }}")
+
+        assert list(connector._documents) == [
+            sha256(f"{{ getUser(input: {{id: {user_id}}}) {{ id }} }}".encode()).hexdigest()
+            for user_id in (2, 3)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_depth_limit(self, repo):
+        registry = CommandRegistry()
+        registry.register(ListRemarks)
+        connector = GraphQLConnector(
+            registry, GraphQLConfig(query_commands=["ListRemarks"], max_depth=3)
+        )
+
+        ok = await connector.execute("{ listRemarks { article { title } } }")
+        too_deep = await connector.execute(
+            "{ listRemarks { ...R } } fragment R on Remark { article { author { name } } }"
+        )
+
+        assert "errors" not in ok
+        assert "depth 4 exceeds the maximum of 3" in too_deep["errors"][0]["message"]
+        assert repo.calls == [("find_many", "Article")]
+
+    @pytest.mark.asyncio
+    async def test_complexity_limit(self, connector):
+        connector.config.max_complexity = 3
+        connector._schema = None
+
+        ok = await connector.execute("{ getUser(input: {id: 1}) { id name } }")
+        too_complex = await connector.execute("{ getUser(input: {id: 1}) { id name email } }")
+
+        assert "errors" not in ok
+        assert "complexity 4 exceeds the maximum of 3" in too_complex["errors"][0]["message"]
+
+    @pytest.mark.asyncio
+    async def test_introspection_can_be_disabled(self):
+        registry = CommandRegistry()
+        registry.register(GetUser)
+        config = GraphQLConfig(query_commands=["GetUser"], enable_introspection=False)
+
+        result = await GraphQLConnector(registry, config).execute("{ __schema { types { name } } }")
+
+        assert "introspection" in result["errors"][0]["message"]
+
+
+_lookups = []
+
+
+class LookUpUser(Command[GetUserInputs, UserResult]):
+    """Get a user by ID, recording each run."""
+
+    Inputs = GetUserInputs
+    Result = UserResult
+
+    def execute(self) -> UserResult:
+        _lookups.append(self.inputs.id)
+        if self.inputs.id < 0:
+            self.add_runtime_error("not_found", "No such user", halt=False)
+            return None
+        return UserResult(id=self.inputs.id, name="Cached", email="c@example.com")
+
+
+class TestPersistedQueriesAndResultCache:
+    """Tests for automatic persisted queries and cached query results"""
+
+    QUERY = "query Look($id: Int!) { lookUpUser(input: {id: $id}) { id name } }"
+
+    @pytest.fixture(autouse=True)
+    def graphql_core(self):
+        pytest.importorskip("graphql")
+        _lookups.clear()
+
+    @pytest.fixture
+    def cache(self):
+        return InMemoryCache()
+
+    @pytest.fixture
+    def connector(self, cache):
+        registry = CommandRegistry()
+        registry.register(LookUpUser)
+        registry.register(CreateUser)
+        config = GraphQLConfig(
+            query_commands=["LookUpUser"],
+            cacheable_queries={"LookUpUser": 60},
+            result_cache=cache,
+            cache_scope=lambda context: context.get("auth_scope", "public"),
+        )
+        return GraphQLConnector(registry, config)
+
+    @staticmethod
+    def persisted(query):
+        return {"persistedQuery": {"version": 1, "sha256Hash": sha256(query.encode()).hexdigest()}}
+
+    @pytest.mark.asyncio
+    async def test_hash_only_request_after_registration(self, connector):
+        extensions = self.persisted(self.QUERY)
+
+        missing = await connector.execute(None, {"id": 1}, extensions=extensions)
+        registered = await connector.execute(self.QUERY, {"id": 1}, extensions=extensions)
+        hash_only = await connector.execute(None, {"id": 2}, extensions=extensions)
+
+        assert missing["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+        assert registered == {"data": {"lookUpUser": {"id": 1, "name": "Cached"}}}
+        assert hash_only == {"data": {"lookUpUser": {"id": 2, "name": "Cached"}}}
+
+    @pytest.mark.asyncio
+    async def test_hash_mismatch_is_rejected(self, connector):
+        result = await connector.execute(
+            self.QUERY, {"id": 1}, extensions=self.persisted("{ other }")
+        )
+
+        assert result["errors"][0]["message"] == "provided sha does not match query"
+        assert _lookups == []
+
+    @pytest.mark.asyncio
+    async def test_persisted_queries_can_be_disabled(self, connector):
+        connector.config.persisted_queries = False
+
+        result = await connector.execute(
+            self.QUERY, {"id": 1}, extensions=self.persisted(self.QUERY)
+        )
+
+        assert result["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_SUPPORTED"
+
+    @pytest.mark.asyncio
+    async def test_cacheable_query_results_are_reused(self, connector):
+        first = await connector.execute(self.QUERY, {"id": 1})
+        second = await connector.execute(self.QUERY, {"id": 1})
+        other = await connector.execute(self.QUERY, {"id": 2})
+
+        assert first == second == {"data": {"lookUpUser": {"id": 1, "name": "Cached"}}}
+        assert other["data"]["lookUpUser"]["id"] == 2
+        assert _lookups == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_cache_is_scoped_per_auth_scope(self, connector):
+        await connector.execute(self.QUERY, {"id": 1}, context={"auth_scope": "alice"})
+        await connector.execute(self.QUERY, {"id": 1}, context={"auth_scope": "bob"})
+        await connector.execute(self.QUERY, {"id": 1}, context={"auth_scope": "alice"})
+
+        assert _lookups == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_failures_and_mutations_are_not_cached(self, connector, cache):
+        await connector.execute(self.QUERY, {"id": -1})
+        await connector.execute(self.QUERY, {"id": -1})
+        mutation = (
+            'mutation { createUser(input: {name: "A", email: "a@example.com", age: 1}) { id } }'
+        )
+        await connector.execute(mutation)
+
+        assert _lookups == [-1, -1]
+        assert cache.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_partially_cacheable_queries_serve_cached_fields(self, connector):
+        connector.config.query_commands.append("GetUser")
+        connector.registry.register(GetUser)
+        query = (
+            "{ user: getUser(input: {id: 1}) { name }"
+            " a: lookUpUser(input: {id: 1}) { id } b: lookUpUser(input: {id: 2}) { id } }"
+        )
+
+        first = await connector.execute(query)
+        second = await connector.execute(query)
+
+        assert first == second
+        assert list(second["data"]) == ["user", "a", "b"]
+        assert second["data"]["user"] == {"name": "Test"}
+        assert _lookups == [1, 2]
+
+    def test_cacheable_queries_require_a_scope(self):
+        with pytest.raises(ValueError):
+            GraphQLConfig(query_commands=["LookUpUser"], cacheable_queries={"LookUpUser": 60})
+
+    @pytest.mark.asyncio
+    async def test_requests_without_scope_are_not_cached(self, connector, cache):
+        connector.config.cache_scope = lambda context: context.get("user_id")
+
+        await connector.execute(self.QUERY, {"id": 1})
+        await connector.execute(self.QUERY, {"id": 1})
+
+        assert _lookups == [1, 1]
+        assert cache.size() == 0
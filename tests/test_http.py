@@ -4,13 +4,16 @@ import pytest
 from pydantic import BaseModel, Field
 from typing import Optional, List
 
-from foobara_py import Command, Domain
+from foobara_py import AsyncCommand, Command, Domain
 from foobara_py.connectors.http import (
     HTTPConnector,
     HTTPStatus,
     RouteConfig,
     AuthConfig,
+    BatchConfig,
     CommandRoute,
+    SyncWorkerPool,
+    WorkerPoolConfig,
     create_http_app,
 )
 
@@ -342,6 +345,49 @@ class TestFastAPIIntegration:
         # FastAPI returns 422 for validation errors
         assert response.status_code == 422
 
+    def test_invalid_input_maps_to_foobara_errors(self, client):
+        response = client.post("/add", json={"a": "not_a_number", "b": 5})
+
+        data = response.json()
+        assert data["success"] is False
+        assert data["errors"][0]["symbol"] == "int_parsing"
+        assert data["errors"][0]["path"] == ["a"]
+
+    def test_inputs_validated_once_per_request(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from pydantic import field_validator
+
+        calls = []
+
+        class EchoInputs(BaseModel):
+            text: str
+
+            @field_validator("text")
+            @classmethod
+            def count(cls, value):
+                calls.append(value)
+                return value
+
+        class Echo(Command[EchoInputs, str]):
+            def execute(self) -> str:
+                return self.inputs.text
+
+        app = FastAPI()
+        HTTPConnector(app).register(Echo)
+
+        response = TestClient(app).post("/echo", json={"text": "hi"})
+
+        assert response.json()["result"] == "hi"
+        assert calls == ["hi"]
+
+    def test_openapi_keeps_request_schema(self, client):
+        schema = client.get("/openapi.json").json()
+
+        body = schema["paths"]["/add"]["post"]["requestBody"]
+        properties = body["content"]["application/json"]["schema"]["properties"]
+        assert set(properties) == {"a", "b"}
+
 
 class TestCreateHttpApp:
     """Tests for create_http_app convenience function"""
@@ -608,3 +654,249 @@ class TestHTTPConcurrency:
         # All should succeed
         for response in responses:
             assert response.status_code == 200
+
+
+class ThreadNameInputs(BaseModel):
+    """Inputs for ThreadName command"""
+    tag: str = ""
+
+
+class ThreadName(Command[ThreadNameInputs, str]):
+    """Report the thread the command ran on"""
+
+    def execute(self) -> str:
+        import threading
+        return threading.current_thread().name
+
+
+class TestSyncWorkerPool:
+    """Tests for running sync commands off the event loop"""
+
+    def make_client(self, worker_pool=None, config=None):
+        pytest.importorskip("fastapi")
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        connector = HTTPConnector(app, worker_pool=worker_pool)
+        connector.register(ThreadName, config=config)
+        return connector, TestClient(app)
+
+    def test_sync_commands_run_on_worker_pool(self):
+        connector, client = self.make_client()
+
+        response = client.post("/threadname", json={})
+
+        assert response.json()["result"].startswith("foobara-http")
+        metrics = connector.worker_metrics()
+        assert metrics["routes"]["ThreadName"]["completed"] == 1
+        assert metrics["queued"] == 0
+        connector.shutdown()
+
+    def test_starlette_mode_registers_plain_def_handler(self):
+        connector, client = self.make_client(WorkerPoolConfig(mode="starlette"))
+
+        response = client.post("/threadname", json={})
+
+        assert response.status_code == 200
+        assert not response.json()["result"].startswith("foobara-http")
+        assert connector.worker_metrics()["routes"]["ThreadName"]["completed"] == 0
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            HTTPConnector(worker_pool=WorkerPoolConfig(mode="fibers"))
+
+    def test_route_limit_overrides_pool_default(self):
+        connector = HTTPConnector(worker_pool=WorkerPoolConfig(max_concurrency=4))
+        connector.register(Add)
+        connector.register(Greet, config=RouteConfig(path="/greet", max_concurrency=1))
+
+        routes = connector.worker_metrics()["routes"]
+        assert routes["Add"]["limit"] == 4
+        assert routes["Greet"]["limit"] == 1
+
+    def test_per_route_limit_queues_excess_calls(self):
+        import asyncio
+        import threading
+
+        pool = SyncWorkerPool(max_workers=4)
+        pool.add_route("slow", limit=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        async def scenario():
+            tasks = [asyncio.ensure_future(pool.run("slow", slow)) for _ in range(3)]
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            during = pool.metrics()["routes"]["slow"]
+            release.set()
+            return during, await asyncio.gather(*tasks)
+
+        during, results = asyncio.run(scenario())
+
+        assert during["in_flight"] == 1
+        assert during["queued"] == 2
+        assert results == ["done"] * 3
+        after = pool.metrics()["routes"]["slow"]
+        assert (after["queued"], after["in_flight"], after["completed"]) == (0, 0, 3)
+        assert after["max_queued"] >= 2
+        pool.shutdown()
+
+    def test_execute_async_uses_pool_for_sync_commands(self):
+        import asyncio
+
+        connector = HTTPConnector()
+        connector.register(ThreadName)
+
+        result = asyncio.run(connector.execute_async("ThreadName", {}))
+
+        assert result["result"].startswith("foobara-http")
+        connector.shutdown()
+
+
+class RendezvousInputs(BaseModel):
+    """Inputs for Rendezvous command"""
+    expected: int = 2
+
+
+class Rendezvous(AsyncCommand[RendezvousInputs, int]):
+    """Wait until `expected` instances are running at the same time"""
+    arrived = 0
+    event = None
+
+    async def execute(self) -> int:
+        import asyncio
+        Rendezvous.arrived += 1
+        if Rendezvous.arrived >= self.inputs.expected:
+            Rendezvous.event.set()
+        await asyncio.wait_for(Rendezvous.event.wait(), 2)
+        return Rendezvous.arrived
+
+
+class SleepInputs(BaseModel):
+    """Inputs for Sleep command"""
+    seconds: float
+
+
+class Sleep(Command[SleepInputs, float]):
+    """Block for a while"""
+
+    def execute(self) -> float:
+        import time
+        time.sleep(self.inputs.seconds)
+        return self.inputs.seconds
+
+
+class TestBatchEndpoint:
+    """Tests for POST /batch"""
+
+    def make_client(self, batch=None, auth_config=None):
+        pytest.importorskip("fastapi")
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        connector = HTTPConnector(
+            app, batch=batch or BatchConfig(max_batch_size=5), auth_config=auth_config
+        )
+        connector.register(Add)
+        connector.register(FailingCommand)
+        return connector, TestClient(app)
+
+    def test_runs_items_in_order(self):
+        _, client = self.make_client()
+
+        response = client.post("/batch", json=[
+            {"id": "a", "command": "Add", "inputs": {"a": 1, "b": 2}},
+            {"id": "b", "command": "FailingCommand", "inputs": {"value": "fail"}},
+            {"command": "Add", "inputs": {"a": "x", "b": 2}},
+        ])
+
+        assert response.status_code == 200
+        first, second, third = response.json()["results"]
+        assert first == {"id": "a", "command": "Add", "success": True, "result": {"sum": 3}}
+        assert second["id"] == "b"
+        assert second["success"] is False
+        assert third["id"] == 2
+        assert third["errors"][0]["path"] == ["a"]
+
+    def test_invalid_items(self):
+        _, client = self.make_client()
+
+        results = client.post("/batch", json=[
+            {"command": "Nope"},
+            {"inputs": {}},
+            {"command": "Add", "inputs": [1, 2]},
+        ]).json()["results"]
+
+        assert [r["errors"][0]["symbol"] for r in results] == [
+            "not_found", "invalid_request", "invalid_request"
+        ]
+
+    def test_rejects_oversized_and_malformed_batches(self):
+        _, client = self.make_client()
+
+        too_many = [{"command": "Add", "inputs": {"a": 1, "b": 1}}] * 6
+        assert client.post("/batch", json=too_many).status_code == 413
+        assert client.post("/batch", json={"command": "Add"}).status_code == 400
+        assert client.post("/batch", content=b"[{").status_code == 400
+
+    def test_disabled_by_default(self, client):
+        assert client.post("/batch", json=[]).status_code in (404, 405)
+
+    def test_async_commands_run_concurrently(self):
+        import asyncio
+
+        connector, client = self.make_client()
+        connector.register(Rendezvous)
+        Rendezvous.arrived = 0
+        Rendezvous.event = asyncio.Event()
+
+        results = client.post("/batch", json=[
+            {"command": "Rendezvous", "inputs": {"expected": 2}},
+            {"command": "Rendezvous", "inputs": {"expected": 2}},
+        ]).json()["results"]
+
+        assert [r["success"] for r in results] == [True, True]
+
+    def test_time_budget(self):
+        connector, client = self.make_client(BatchConfig(timeout=0.2))
+        connector.register(Sleep)
+
+        results = client.post("/batch", json=[
+            {"command": "Add", "inputs": {"a": 1, "b": 1}},
+            {"command": "Sleep", "inputs": {"seconds": 1}},
+            {"command": "Add", "inputs": {"a": 2, "b": 2}},
+        ]).json()["results"]
+
+        assert results[0]["success"] is True
+        assert results[1]["errors"][0]["symbol"] == "timeout"
+        assert results[2]["errors"][0]["symbol"] == "timeout"
+
+    def test_authenticates_once_and_guards_other_dependencies(self):
+        calls = []
+
+        def default_auth():
+            calls.append("default")
+
+        def admin_auth():
+            calls.append("admin")
+
+        connector, client = self.make_client(
+            auth_config=AuthConfig(enabled=True, dependency=default_auth)
+        )
+        connector.register(Greet, auth_config=AuthConfig(enabled=True, dependency=admin_auth))
+
+        results = client.post("/batch", json=[
+            {"command": "Add", "inputs": {"a": 1, "b": 1}},
+            {"command": "Add", "inputs": {"a": 2, "b": 2}},
+            {"command": "Greet", "inputs": {"name": "x"}},
+        ]).json()["results"]
+
+        assert calls == ["default"]
+        assert [r["success"] for r in results] == [True, True, False]
+        assert results[2]["errors"][0]["symbol"] == "forbidden"
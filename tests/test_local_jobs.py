@@ -0,0 +1,296 @@
+"""Tests for the in-process LocalJobConnector"""
+
+import json
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel
+
+from foobara_py import AsyncCommand, Command
+from foobara_py.connectors.celery_connector import JobStatus
+from foobara_py.connectors.local_jobs import (
+    LocalJobConfig,
+    LocalJobConnector,
+    LocalScheduler,
+    _next_cron_time,
+)
+from foobara_py.core.error_recovery import RetryConfig
+from foobara_py.core.errors import Symbols
+from foobara_py.core.registry import CommandRegistry
+
+
+class AddInputs(BaseModel):
+    a: int
+    b: int = 0
+
+
+class Add(Command[AddInputs, int]):
+    """Add two numbers"""
+
+    def execute(self) -> int:
+        return self.inputs.a + self.inputs.b
+
+
+class AsyncAdd(AsyncCommand[AddInputs, int]):
+    """Add two numbers asynchronously"""
+
+    async def execute(self) -> int:
+        return self.inputs.a + self.inputs.b
+
+
+_flaky_calls = []
+_gate = threading.Event()
+_order = []
+
+
+class Flaky(Command[AddInputs, int]):
+    """Fail with a retryable error until called ``b`` times"""
+
+    def execute(self) -> int:
+        _flaky_calls.append(self.inputs.a)
+        if len(_flaky_calls) < self.inputs.b:
+            self.add_runtime_error(Symbols.CONNECTION_FAILED, "try again", halt=False)
+            return None
+        return self.inputs.a
+
+
+class Crash(Command[AddInputs, int]):
+    """Raise from execute"""
+
+    def execute(self) -> int:
+        _flaky_calls.append(self.inputs.a)
+        raise RuntimeError("boom")
+
+
+class Timeout(Command[AddInputs, int]):
+    """Fail with a retryable error"""
+
+    def execute(self) -> int:
+        _flaky_calls.append(self.inputs.a)
+        self.add_runtime_error(Symbols.TIMEOUT, "upstream timed out", halt=False)
+        return None
+
+
+class Invalid(Command[AddInputs, int]):
+    """Fail with an error that is not retryable"""
+
+    def execute(self) -> int:
+        _flaky_calls.append(self.inputs.a)
+        self.add_runtime_error("invalid", "bad value", halt=False)
+        return None
+
+
+class Gated(Command[AddInputs, int]):
+    """Block until the gate opens, recording the order of runs"""
+
+    def execute(self) -> int:
+        _gate.wait(5)
+        _order.append(self.inputs.a)
+        return self.inputs.a
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    _flaky_calls.clear()
+    _order.clear()
+    _gate.clear()
+    yield
+    _gate.set()
+
+
+@pytest.fixture
+def registry():
+    reg = CommandRegistry()
+    for command in (Add, AsyncAdd, Flaky, Crash, Timeout, Invalid, Gated):
+        reg.register(command)
+    return reg
+
+
+FAST_RETRY = RetryConfig(max_attempts=3, initial_delay=0.001, jitter=False)
+
+
+def connector_for(registry, **config):
+    config.setdefault("retry", FAST_RETRY)
+    return LocalJobConnector(registry, LocalJobConfig(**config))
+
+
+class TestExecution:
+    @pytest.mark.parametrize("executor", ["thread", "asyncio", "process"])
+    def test_executors(self, registry, executor):
+        with connector_for(registry, executor=executor, workers=2) as connector:
+            jobs = [connector.execute_async("Add", {"a": n, "b": 1}) for n in range(5)]
+            results = [connector.wait(job.job_id, timeout=10) for job in jobs]
+
+        assert [r.status for r in results] == [JobStatus.SUCCESS] * 5
+        assert [r.result for r in results] == [1, 2, 3, 4, 5]
+        assert all(r.started_at and r.completed_at for r in results)
+
+    @pytest.mark.parametrize("executor", ["thread", "asyncio"])
+    def test_async_commands(self, registry, executor):
+        with connector_for(registry, executor=executor) as connector:
+            job = connector.execute_async("AsyncAdd", {"a": 2, "b": 3})
+            assert connector.wait(job.job_id, timeout=5).result == 5
+
+    def test_unknown_command(self, registry):
+        with connector_for(registry) as connector:
+            with pytest.raises(ValueError):
+                connector.execute_async("Missing", {})
+
+    def test_unknown_executor(self, registry):
+        with pytest.raises(ValueError):
+            LocalJobConnector(registry, LocalJobConfig(executor="fiber"))
+
+    def test_unknown_job_is_pending(self, registry):
+        with connector_for(registry) as connector:
+            assert connector.get_result("nope").status == JobStatus.PENDING
+
+    def test_priority_order(self, registry):
+        with connector_for(registry, workers=1) as connector:
+            blocker = connector.execute_async("Gated", {"a": 0})
+            while connector.get_result(blocker.job_id).status != JobStatus.STARTED:
+                time.sleep(0.001)
+            jobs = [
+                connector.execute_async("Gated", {"a": n}, priority=n % 3)
+                for n in range(1, 7)
+            ]
+            _gate.set()
+            for job in jobs:
+                connector.wait(job.job_id, timeout=5)
+
+        assert _order == [0, 2, 5, 1, 4, 3, 6]
+
+    def test_countdown(self, registry):
+        with connector_for(registry) as connector:
+            start = time.time()
+            job = connector.execute_async("Add", {"a": 1}, countdown=0.05)
+            assert connector.get_result(job.job_id).status == JobStatus.PENDING
+            result = connector.wait(job.job_id, timeout=5)
+
+        assert result.status == JobStatus.SUCCESS
+        assert result.started_at.timestamp() - start >= 0.05
+
+    def test_revoke_pending_job(self, registry):
+        with connector_for(registry, workers=1) as connector:
+            blocker = connector.execute_async("Gated", {"a": 0})
+            job = connector.execute_async("Gated", {"a": 1})
+
+            assert connector.revoke(job.job_id) is True
+            assert connector.revoke(job.job_id) is False
+            _gate.set()
+            connector.wait(blocker.job_id, timeout=5)
+
+        assert connector.get_result(job.job_id).status == JobStatus.REVOKED
+        assert _order == [0]
+
+    def test_expired_job_is_revoked(self, registry):
+        with connector_for(registry, workers=1) as connector:
+            blocker = connector.execute_async("Gated", {"a": 0})
+            job = connector.execute_async("Gated", {"a": 1}, expires=0.01)
+            time.sleep(0.03)
+            _gate.set()
+
+            assert connector.wait(job.job_id, timeout=5).status == JobStatus.REVOKED
+            assert connector.wait(blocker.job_id, timeout=5).status == JobStatus.SUCCESS
+
+
+class TestRetries:
+    def test_retryable_failures_are_retried(self, registry):
+        with connector_for(registry) as connector:
+            job = connector.execute_async("Flaky", {"a": 7, "b": 3})
+            result = connector.wait(job.job_id, timeout=5)
+
+        assert result.status == JobStatus.SUCCESS
+        assert result.result == 7
+        assert result.retries == 2
+
+    def test_gives_up_after_max_attempts(self, registry):
+        with connector_for(registry) as connector:
+            job = connector.execute_async("Timeout", {"a": 1})
+            result = connector.wait(job.job_id, timeout=5)
+
+        assert result.status == JobStatus.FAILURE
+        assert result.retries == 2
+        assert json.loads(result.error)[0]["key"] == Symbols.TIMEOUT
+        assert len(_flaky_calls) == 3
+
+    def test_retryable_symbols_come_from_retry_config(self, registry):
+        retry = RetryConfig(
+            max_attempts=2, initial_delay=0.001, jitter=False, retryable_symbols=["execution_error"]
+        )
+        with connector_for(registry, retry=retry) as connector:
+            job = connector.execute_async("Crash", {"a": 1})
+            result = connector.wait(job.job_id, timeout=5)
+
+        assert json.loads(result.error)[0]["message"] == "boom"
+        assert len(_flaky_calls) == 2
+
+    def test_other_errors_are_not_retried(self, registry):
+        with connector_for(registry) as connector:
+            job = connector.execute_async("Invalid", {"a": 1})
+            result = connector.wait(job.job_id, timeout=5)
+
+        assert json.loads(result.error) == [{"key": "invalid", "message": "bad value"}]
+        assert len(_flaky_calls) == 1
+
+
+class TestPersistence:
+    def test_results_survive_restart(self, registry, tmp_path):
+        path = str(tmp_path / "jobs.db")
+        with connector_for(registry, persistence_path=path) as connector:
+            job = connector.execute_async("Add", {"a": 2, "b": 2})
+            connector.wait(job.job_id, timeout=5)
+
+        with connector_for(registry, persistence_path=path) as connector:
+            result = connector.get_result(job.job_id)
+
+        assert result.status == JobStatus.SUCCESS
+        assert result.result == 4
+        assert result.inputs == {"a": 2, "b": 2}
+
+    def test_queued_jobs_resume_after_restart(self, registry, tmp_path):
+        path = str(tmp_path / "jobs.db")
+        connector = connector_for(registry, persistence_path=path)
+        job = connector.execute_async("Add", {"a": 1}, countdown=60)
+        connector.shutdown()
+
+        with connector_for(registry, persistence_path=path) as restarted:
+            assert restarted.stats()["delayed"] == 1
+            assert restarted.revoke(job.job_id) is True
+
+
+class TestScheduler:
+    def test_interval_schedule(self, registry):
+        with connector_for(registry) as connector:
+            scheduler = LocalScheduler(connector)
+            name = scheduler.schedule("Flaky", inputs={"a": 1}, interval=0.01)
+            time.sleep(0.1)
+            assert scheduler.unschedule(name) is True
+            runs = len(_flaky_calls)
+
+        assert runs >= 3
+        assert scheduler.list_schedules() == {}
+        assert scheduler.unschedule(name) is False
+
+    def test_schedule_requires_interval_or_crontab(self, registry):
+        with connector_for(registry) as connector:
+            with pytest.raises(ValueError):
+                LocalScheduler(connector).schedule("Add")
+
+    def test_crontab_next_time(self):
+        after = datetime(2026, 3, 4, 10, 30).timestamp()  # a Wednesday
+
+        def next_time(**crontab):
+            return datetime.fromtimestamp(_next_cron_time(crontab, after))
+
+        assert next_time() == datetime(2026, 3, 4, 10, 31)
+        assert next_time(minute=0) == datetime(2026, 3, 4, 11, 0)
+        assert next_time(minute=0, hour=0) == datetime(2026, 3, 5, 0, 0)
+        assert next_time(minute="*/15") == datetime(2026, 3, 4, 10, 45)
+        assert next_time(minute=0, hour=9, day_of_week=1) == datetime(2026, 3, 9, 9, 0)
+        assert next_time(minute=0, hour=0, day_of_month=1, month_of_year="1,7") == datetime(
+            2026, 7, 1, 0, 0
+        )
+        with pytest.raises(ValueError):
+            next_time(second=0)
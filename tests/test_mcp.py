@@ -1,10 +1,13 @@
 """Tests for MCP Connector module"""
 
+import asyncio
+import time
+
 import pytest
 import json
 from pydantic import BaseModel
 from foobara_py.connectors.mcp import MCPConnector, JsonRpcErrorCode, create_mcp_server
-from foobara_py.core.command import Command
+from foobara_py.core.command import AsyncCommand, Command
 from foobara_py.domain.domain import Domain
 
 
@@ -689,3 +692,204 @@ class TestMCPProtocolEdgeCases:
         response = json.loads(connector.run(json.dumps(request)))
         # Should handle validation error
         assert "result" in response
+
+
+# ==================== Concurrent Batches ====================
+
+class NapInputs(BaseModel):
+    seconds: float
+
+
+class Nap(Command[NapInputs, float]):
+    """Sleep, then echo the duration"""
+
+    def execute(self) -> float:
+        time.sleep(self.inputs.seconds)
+        return self.inputs.seconds
+
+
+class AsyncNap(AsyncCommand[NapInputs, float]):
+    """Sleep asynchronously, then echo the duration"""
+
+    async def execute(self) -> float:
+        await asyncio.sleep(self.inputs.seconds)
+        return self.inputs.seconds
+
+
+def tool_call(request_id, name, seconds):
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": {"seconds": seconds}},
+    }
+
+
+class TestMCPConcurrentBatch:
+    @pytest.fixture
+    def connector(self):
+        conn = MCPConnector(max_workers=4).connect_all(Nap, AsyncNap)
+        yield conn
+        conn.shutdown()
+
+    def test_sync_tools_run_concurrently_in_order(self, connector):
+        batch = [tool_call(i, "Nap", seconds) for i, seconds in enumerate([0.2, 0.15, 0.1])]
+        batch.append({"jsonrpc": "2.0", "method": "notifications/progress"})
+
+        start = time.perf_counter()
+        responses = json.loads(connector.run(json.dumps(batch)))
+
+        assert time.perf_counter() - start < 0.4
+        assert [r["id"] for r in responses] == [0, 1, 2]
+        assert [r["result"]["content"][0]["text"] for r in responses] == ["0.2", "0.15", "0.1"]
+
+    def test_async_commands_in_sync_run(self, connector):
+        response = json.loads(connector.run(json.dumps(tool_call(1, "AsyncNap", 0))))
+
+        assert response["result"]["content"][0]["text"] == "0.0"
+
+    def test_run_async_gathers_mixed_batch(self, connector):
+        batch = [
+            tool_call(1, "AsyncNap", 0.2),
+            tool_call(2, "Nap", 0.2),
+            tool_call(3, "AsyncNap", 0.2),
+            {"jsonrpc": "2.0", "id": 4, "method": "ping"},
+        ]
+
+        start = time.perf_counter()
+        responses = json.loads(asyncio.run(connector.run_async(json.dumps(batch))))
+
+        assert time.perf_counter() - start < 0.4
+        assert [r["id"] for r in responses] == [1, 2, 3, 4]
+        assert responses[3]["result"] == {}
+
+    def test_run_async_errors(self, connector):
+        assert asyncio.run(connector.run_async("[]"))  # empty batch is an error
+        response = json.loads(asyncio.run(connector.run_async(json.dumps(tool_call(1, "Missing", 0)))))
+
+        assert response["error"]["code"] == JsonRpcErrorCode.NOT_FOUND
+
+
+# ==================== Async stdio transport ====================
+
+class LineWriter:
+    """Collects written lines, like a StreamWriter on stdout"""
+
+    def __init__(self):
+        self.lines = []
+
+    def write(self, data: bytes) -> None:
+        self.lines.extend(json.loads(line) for line in data.decode().splitlines())
+
+    async def drain(self) -> None:
+        pass
+
+
+def serve(connector, *messages, **kwargs):
+    """Run the async stdio server over the given input lines; returns written lines"""
+    writer = LineWriter()
+
+    async def scenario():
+        reader = asyncio.StreamReader()
+        for message in messages:
+            raw = message if isinstance(message, str) else json.dumps(message)
+            reader.feed_data(raw.encode() + b"\n")
+        reader.feed_eof()
+        await connector.run_stdio_async(reader, writer, **kwargs)
+
+    asyncio.run(scenario())
+    return writer.lines
+
+
+class TestMCPStdioAsync:
+    @pytest.fixture
+    def connector(self):
+        conn = MCPConnector(max_workers=4).connect_all(Nap, AsyncNap)
+        yield conn
+        conn.shutdown()
+
+    def test_responses_are_written_as_they_finish(self, connector):
+        lines = serve(
+            connector,
+            tool_call(1, "Nap", 0.2),
+            tool_call(2, "AsyncNap", 0.05),
+            {"jsonrpc": "2.0", "id": 3, "method": "ping"},
+        )
+
+        assert [line["id"] for line in lines] == [3, 2, 1]
+
+    def test_cancelled_request_gets_no_response(self, connector):
+        start = time.perf_counter()
+        lines = serve(
+            connector,
+            tool_call(1, "AsyncNap", 5),
+            {"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 1}},
+            tool_call(2, "AsyncNap", 0),
+        )
+
+        assert time.perf_counter() - start < 1
+        assert [line["id"] for line in lines] == [2]
+
+    def test_concurrency_limit(self, connector):
+        start = time.perf_counter()
+        lines = serve(connector, *(tool_call(i, "AsyncNap", 0.1) for i in range(4)), max_concurrency=2)
+
+        assert time.perf_counter() - start >= 0.2
+        assert sorted(line["id"] for line in lines) == [0, 1, 2, 3]
+
+    def test_parse_errors_and_batches(self, connector):
+        lines = serve(connector, "{not json", [tool_call(1, "Nap", 0), tool_call(2, "AsyncNap", 0)])
+
+        assert lines[0]["error"]["code"] == JsonRpcErrorCode.PARSE_ERROR
+        assert [r["id"] for r in lines[1]] == [1, 2]
+
+    def test_over_os_pipes(self, connector):
+        import os
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            read_fd, write_fd = os.pipe()
+            os.write(write_fd, (json.dumps(tool_call(1, "AsyncNap", 0)) + "\n").encode())
+            os.close(write_fd)
+
+            reader = asyncio.StreamReader()
+            with os.fdopen(read_fd, "rb") as pipe:
+                await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+                writer = LineWriter()
+                await connector.run_stdio_async(reader, writer)
+            return writer.lines
+
+        assert asyncio.run(scenario())[0]["result"]["content"][0]["text"] == "0.0"
+
+
+# ==================== Tool catalog ====================
+
+class TestMCPToolCatalog:
+    def test_tools_list_is_built_once_per_change(self, monkeypatch):
+        calls = []
+        original = Add.inputs_schema.__func__
+
+        def counting_schema(cls):
+            calls.append(cls)
+            return original(cls)
+
+        monkeypatch.setattr(Add, "inputs_schema", classmethod(counting_schema))
+        connector = MCPConnector().connect(Add)
+        request = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+
+        first = connector.run(request)
+        assert connector.run(request) == first
+        assert connector._registry.tools_json() is connector._registry.tools_json()
+        assert len(calls) == 1
+
+        connector.connect(Nap)
+        tools = json.loads(connector.run(request))["result"]["tools"]
+        assert [tool["name"] for tool in tools] == ["Add", "Nap"]
+        assert tools[0]["inputSchema"]["properties"]["a"]["type"] == "integer"
+
+    def test_find_by_alias(self):
+        connector = MCPConnector().connect(Add)
+
+        assert connector._registry.find("Add") is Add
+        assert connector._registry.find(Add.full_command_symbol()) is Add
+        assert connector._registry.find("Missing") is None
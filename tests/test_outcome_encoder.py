@@ -0,0 +1,107 @@
+"""Tests for the shared outcome encoder"""
+
+import json
+from datetime import date
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from foobara_py import Command
+from foobara_py.connectors.websocket import WebSocketMessage, WebSocketMessageType
+from foobara_py.serializers import OutcomeEncoder
+from foobara_py.serializers.outcome_encoder import RawJSON, dumps, splice_json
+
+
+class ItemInputs(BaseModel):
+    count: int = 2
+
+
+class Item(BaseModel):
+    name: str
+    added: date
+
+
+class ListItems(Command[ItemInputs, List[Item]]):
+    """Return typed items"""
+
+    def execute(self) -> List[Item]:
+        return [Item(name=f"item-{i}", added=date(2024, 1, i + 1)) for i in range(self.inputs.count)]
+
+
+class Untyped(Command[ItemInputs, dict]):
+    """Return a plain dict"""
+
+    def execute(self) -> dict:
+        return {"count": self.inputs.count, 1: "int key"}
+
+
+class Failing(Command[ItemInputs, int]):
+    """Always fails"""
+
+    def execute(self) -> int:
+        self.add_runtime_error(symbol="nope", message="No way", halt=False)
+        return 0
+
+
+@pytest.fixture
+def encoder():
+    return OutcomeEncoder()
+
+
+class TestOutcomeEncoder:
+    def test_typed_list_result_uses_cached_adapter(self, encoder):
+        outcome = ListItems.run(count=2)
+
+        body = encoder.encode_outcome(ListItems, outcome)
+
+        assert json.loads(body) == {
+            "success": True,
+            "result": [
+                {"name": "item-0", "added": "2024-01-01"},
+                {"name": "item-1", "added": "2024-01-02"},
+            ],
+        }
+        assert encoder.adapter_for(ListItems) is encoder.adapter_for(ListItems)
+
+    def test_model_result(self, encoder):
+        body = encoder.encode_result(None, Item(name="a", added=date(2024, 5, 1)))
+
+        assert json.loads(body) == {"name": "a", "added": "2024-05-01"}
+
+    def test_plain_dict_fallback(self, encoder):
+        body = encoder.encode_outcome(Untyped, Untyped.run(count=3))
+
+        assert json.loads(body) == {"success": True, "result": {"count": 3, "1": "int key"}}
+
+    def test_large_integers(self, encoder):
+        assert json.loads(encoder.encode_result(None, {"n": 10**30})) == {"n": 10**30}
+
+    def test_failure_envelope(self, encoder):
+        body = encoder.encode_outcome(Failing, Failing.run())
+
+        data = json.loads(body)
+        assert data["success"] is False
+        assert data["errors"][0]["symbol"] == "nope"
+
+    def test_to_jsonable(self, encoder):
+        result = encoder.to_jsonable(ListItems, ListItems.run(count=1).result)
+
+        assert result == [{"name": "item-0", "added": "2024-01-01"}]
+
+
+class TestJSONHelpers:
+    def test_splice_json(self):
+        assert splice_json({"a": 1}, "result", b"[1,2]") == b'{"a":1,"result":[1,2]}'
+        assert splice_json({}, "result", b"null") == b'{"result":null}'
+
+    def test_dumps_is_compact(self):
+        assert dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_websocket_message_with_raw_result(self):
+        message = WebSocketMessage(
+            type=WebSocketMessageType.RESULT, id="m-1", result=RawJSON(b'{"x":1}')
+        )
+
+        assert json.loads(message.to_json()) == {"type": "result", "id": "m-1", "result": {"x": 1}}
+        assert message.to_dict()["result"] == {"x": 1}
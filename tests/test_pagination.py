@@ -0,0 +1,378 @@
+"""
+Tests for cursor pagination across CRUD drivers and repositories
+"""
+
+import pytest
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID, uuid4
+
+from foobara_py.persistence import (
+    EntityBase,
+    InMemoryCRUDDriver,
+    InMemoryRepository,
+    InvalidCursorError,
+    LocalFilesCRUDDriver,
+    Page,
+    RedisCRUDDriver,
+    RepositoryRegistry,
+    TransactionalInMemoryRepository,
+)
+
+
+class Member(EntityBase):
+    """Test member entity"""
+    _primary_key_field = 'id'
+
+    id: Optional[int] = None
+    name: str
+    score: int = 0
+
+
+@pytest.fixture
+def temp_dir():
+    temp_path = tempfile.mkdtemp()
+    yield temp_path
+    shutil.rmtree(temp_path, ignore_errors=True)
+
+
+@pytest.fixture
+def sqlite_table():
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy import create_engine
+
+    from foobara_py.persistence.mapping import entity_to_sqlalchemy_table
+    from foobara_py.persistence.sqlalchemy_driver import SQLAlchemyDriver, SQLAlchemyTable
+
+    engine = create_engine("sqlite:///:memory:")
+    driver = SQLAlchemyDriver(engine)
+    sa_table = entity_to_sqlalchemy_table(Member, driver.metadata, "members")
+    sa_table.create(engine)
+    return SQLAlchemyTable(Member, driver, sa_table=sa_table)
+
+
+@pytest.fixture
+def redis_table():
+    try:
+        import fakeredis
+    except ImportError:
+        pytest.skip("fakeredis not installed")
+    return RedisCRUDDriver(fakeredis.FakeRedis()).table_for(Member)
+
+
+@pytest.fixture(params=["in_memory", "local_files", "sqlite", "redis"])
+def table(request, temp_dir):
+    if request.param == "in_memory":
+        table = InMemoryCRUDDriver().table_for(Member)
+    elif request.param == "local_files":
+        table = LocalFilesCRUDDriver(base_path=temp_dir).table_for(Member)
+    elif request.param == "sqlite":
+        table = request.getfixturevalue("sqlite_table")
+    else:
+        table = request.getfixturevalue("redis_table")
+
+    # Scores repeat so ordering by score needs the primary key tie-breaker
+    for i in range(1, 24):
+        table.insert({"name": f"member-{i:02d}", "score": i % 5})
+    return table
+
+
+def collect_pages(fetch, limit, order_by=None):
+    pages = []
+    cursor = None
+    while True:
+        page = fetch(cursor, limit, order_by)
+        pages.append(page)
+        if not page.has_more:
+            return pages
+        cursor = page.next_cursor
+
+
+class TestCRUDTablePagination:
+    def test_pages_cover_all_records_once(self, table):
+        pages = collect_pages(table.find_page, 5)
+
+        ids = [record["id"] for page in pages for record in page]
+        assert sorted(ids) == list(range(1, 24))
+        assert all(len(page) <= 5 for page in pages)
+
+    def test_iter_all(self, table):
+        ids = [record["id"] for record in table.iter_all(batch_size=4)]
+
+        assert sorted(ids) == list(range(1, 24))
+
+    def test_order_by_field_with_ties(self, table):
+        pages = collect_pages(table.find_page, 4, "score")
+
+        records = [record for page in pages for record in page]
+        keys = [(record["score"], record["id"]) for record in records]
+        assert keys == sorted(keys)
+        assert len(records) == 23
+
+    def test_order_by_descending(self, table):
+        pages = collect_pages(table.find_page, 6, "-score")
+
+        keys = [(record["score"], record["id"]) for page in pages for record in page]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_empty_table(self):
+        table = InMemoryCRUDDriver().table_for(Member)
+
+        page = table.find_page(limit=10)
+
+        assert page.items == []
+        assert not page.has_more
+
+    def test_cursor_for_other_ordering_is_rejected(self, table):
+        page = table.find_page(limit=5, order_by="score")
+
+        with pytest.raises(InvalidCursorError):
+            table.find_page(page.next_cursor, limit=5, order_by="name")
+
+    def test_malformed_cursor_is_rejected(self, table):
+        with pytest.raises(InvalidCursorError):
+            table.find_page("not-a-cursor", limit=5)
+
+
+class TestInMemoryKeyset:
+    def test_pages_are_stable_across_inserts(self):
+        table = InMemoryCRUDDriver().table_for(Member)
+        for i in range(1, 11):
+            table.insert({"name": f"m{i}"})
+
+        first = table.find_page(limit=5)
+        table.insert({"id": 0, "name": "early"})
+        second = table.find_page(first.next_cursor, limit=5)
+
+        assert [r["id"] for r in second] == [6, 7, 8, 9, 10]
+
+
+class TestRepositoryPagination:
+    @pytest.fixture
+    def repo(self):
+        repo = InMemoryRepository()
+        for i in range(12):
+            repo.save(Member(name=f"m{i}", score=i % 3))
+        return repo
+
+    def test_find_page(self, repo):
+        page = repo.find_page(Member, limit=5)
+
+        assert isinstance(page, Page)
+        assert [m.id for m in page] == [1, 2, 3, 4, 5]
+        assert page.has_more
+
+    def test_iter_all_ordered(self, repo):
+        members = list(repo.iter_all(Member, batch_size=5, order_by="-score"))
+
+        keys = [(m.score, m.id) for m in members]
+        assert keys == sorted(keys, reverse=True)
+        assert len(members) == 12
+
+    def test_entity_each_and_find_page(self, repo):
+        RepositoryRegistry.register(Member, repo)
+        try:
+            assert [m.id for m in Member.each(batch_size=5)] == list(range(1, 13))
+
+            page = Member.find_page(limit=10)
+            assert len(page) == 10
+            assert len(Member.find_page(page.next_cursor, limit=10)) == 2
+        finally:
+            RepositoryRegistry.clear()
+
+    def test_pages_use_sorted_index(self, repo, monkeypatch):
+        list(repo.iter_all(Member, batch_size=5, order_by="score"))
+        monkeypatch.setattr(repo, "find_all", None, raising=False)
+
+        members = list(repo.iter_all(Member, batch_size=5, order_by="score"))
+
+        assert len(members) == 12
+        assert list(repo.iter_all(Member, batch_size=5))[0].id == 1
+
+    def test_index_follows_saves_and_deletes(self, repo):
+        list(repo.iter_all(Member, order_by="score"))
+        list(repo.iter_all(Member))
+
+        top = repo.find(Member, 1)
+        top.score = 10
+        repo.save(top)
+        repo.save(Member(name="new", score=-1))
+        repo.delete(repo.find(Member, 2))
+
+        by_score = [m.id for m in repo.iter_all(Member, batch_size=5, order_by="score")]
+        by_id = [m.id for m in repo.iter_all(Member, batch_size=5)]
+        assert by_score[0] == 13 and by_score[-1] == 1
+        assert by_id == [1] + list(range(3, 14))
+
+    @pytest.fixture
+    def tx_repo(self):
+        repo = TransactionalInMemoryRepository()
+        for i in range(3):
+            repo.save(Member(name=f"m{i}"))
+        repo.find_page(Member)
+        repo.begin_transaction()
+        return repo
+
+    def test_index_follows_transactional_save(self, tx_repo):
+        tx_repo.save(Member(id=9, name="new"))
+
+        assert [m.id for m in tx_repo.find_page(Member)] == [1, 2, 3, 9]
+
+    def test_index_follows_transactional_delete(self, tx_repo):
+        tx_repo.delete(tx_repo.find(Member, 2))
+
+        assert [m.id for m in tx_repo.find_page(Member)] == [1, 3]
+
+    def test_index_follows_rollback(self, tx_repo):
+        tx_repo.save(Member(id=9, name="new"))
+        tx_repo.delete(tx_repo.find(Member, 2))
+        assert [m.id for m in tx_repo.find_page(Member)] == [1, 3, 9]
+
+        tx_repo.rollback_transaction()
+
+        assert [m.id for m in tx_repo.find_page(Member)] == [1, 2, 3]
+
+    def test_local_files_driver_pages_by_index(self, temp_dir):
+        pytest.importorskip("yaml")
+        from foobara_py.drivers import LocalFilesDriver
+
+        driver = LocalFilesDriver(base_path=temp_dir, format="json")
+        for i in range(1, 12):
+            driver.save(Member(id=i, name=f"m{i}"))
+
+        pages = collect_pages(
+            lambda cursor, limit, order_by: driver.find_page(Member, cursor, limit, order_by), 5
+        )
+
+        assert [[m.id for m in page] for page in pages] == [
+            [1, 2, 3, 4, 5],
+            [6, 7, 8, 9, 10],
+            [11],
+        ]
+
+
+class Event(EntityBase):
+    """Test entity ordered by timestamp"""
+    _primary_key_field = 'id'
+
+    id: Optional[int] = None
+    created_at: datetime
+
+
+class Token(EntityBase):
+    """Test entity with a UUID primary key"""
+    _primary_key_field = 'id'
+
+    id: UUID
+    name: str
+
+
+class TestTypedCursorValues:
+    START = datetime(2024, 1, 1, 12, 0)
+
+    def events(self, count):
+        # Timestamps repeat so the primary key breaks ties
+        return [{"created_at": self.START + timedelta(hours=i % 4)} for i in range(count)]
+
+    @pytest.fixture(params=["in_memory", "sqlite"])
+    def event_table(self, request):
+        if request.param == "in_memory":
+            table = InMemoryCRUDDriver().table_for(Event)
+        else:
+            pytest.importorskip("sqlalchemy")
+            from sqlalchemy import create_engine
+
+            from foobara_py.persistence.mapping import entity_to_sqlalchemy_table
+            from foobara_py.persistence.sqlalchemy_driver import SQLAlchemyDriver, SQLAlchemyTable
+
+            engine = create_engine("sqlite:///:memory:")
+            driver = SQLAlchemyDriver(engine)
+            sa_table = entity_to_sqlalchemy_table(Event, driver.metadata, "events")
+            sa_table.create(engine)
+            table = SQLAlchemyTable(Event, driver, sa_table=sa_table)
+        for record in self.events(10):
+            table.insert(record)
+        return table
+
+    @pytest.mark.parametrize("order_by", ["created_at", "-created_at"])
+    def test_table_datetime_ordering(self, event_table, order_by):
+        pages = collect_pages(event_table.find_page, 3, order_by)
+
+        keys = [(r["created_at"], r["id"]) for page in pages for r in page]
+        assert keys == sorted(keys, reverse=order_by.startswith("-"))
+        assert len(keys) == 10
+
+    def test_repository_datetime_ordering(self):
+        repo = InMemoryRepository()
+        for record in self.events(10):
+            repo.save(Event(**record))
+
+        events = list(repo.iter_all(Event, batch_size=3, order_by="created_at"))
+
+        keys = [(e.created_at, e.id) for e in events]
+        assert keys == sorted(keys)
+        assert len(keys) == 10
+
+    def test_table_uuid_primary_key(self):
+        table = InMemoryCRUDDriver().table_for(Token)
+        ids = sorted(uuid4() for _ in range(7))
+        for token_id in ids:
+            table.insert({"id": token_id, "name": str(token_id)})
+
+        pages = collect_pages(table.find_page, 3)
+
+        assert [r["id"] for page in pages for r in page] == ids
+
+    def test_repository_uuid_primary_key(self):
+        repo = InMemoryRepository()
+        ids = sorted(uuid4() for _ in range(7))
+        for token_id in ids:
+            repo.save(Token(id=token_id, name=str(token_id)))
+
+        assert [t.id for t in repo.iter_all(Token, batch_size=3)] == ids
+
+
+class Entry(EntityBase):
+    """Test entity with a nullable order field"""
+    _primary_key_field = 'id'
+
+    id: Optional[int] = None
+    score: Optional[int] = None
+
+
+class TestNullOrderValues:
+    SCORES = [None, 2, None, 1, 1, None, 3]
+
+    @pytest.fixture(params=["in_memory", "sqlite"])
+    def entry_table(self, request):
+        if request.param == "in_memory":
+            table = InMemoryCRUDDriver().table_for(Entry)
+        else:
+            pytest.importorskip("sqlalchemy")
+            from sqlalchemy import create_engine
+
+            from foobara_py.persistence.mapping import entity_to_sqlalchemy_table
+            from foobara_py.persistence.sqlalchemy_driver import SQLAlchemyDriver, SQLAlchemyTable
+
+            engine = create_engine("sqlite:///:memory:")
+            driver = SQLAlchemyDriver(engine)
+            sa_table = entity_to_sqlalchemy_table(Entry, driver.metadata, "entries")
+            sa_table.create(engine)
+            table = SQLAlchemyTable(Entry, driver, sa_table=sa_table)
+        for score in self.SCORES:
+            table.insert({"score": score})
+        return table
+
+    def test_nulls_sort_last(self, entry_table):
+        pages = collect_pages(entry_table.find_page, 2, "score")
+
+        ids = [r["id"] for page in pages for r in page]
+        assert ids == [4, 5, 2, 7, 1, 3, 6]
+
+    def test_nulls_sort_first_descending(self, entry_table):
+        pages = collect_pages(entry_table.find_page, 2, "-score")
+
+        ids = [r["id"] for page in pages for r in page]
+        assert ids == [6, 3, 1, 7, 2, 5, 4]
@@ -0,0 +1,304 @@
+"""Tests for client-side batching of remote command calls"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from pydantic import BaseModel
+
+pytest.importorskip("httpx")
+pytest.importorskip("fastapi")
+uvicorn = pytest.importorskip("uvicorn")
+
+from fastapi import FastAPI  # noqa: E402
+
+from foobara_py import Command  # noqa: E402
+from foobara_py.connectors.http import BatchConfig, HTTPConnector  # noqa: E402
+from foobara_py.connectors.mcp import MCPConnector  # noqa: E402
+from foobara_py.remote import (  # noqa: E402
+    AsyncRemoteCommand,
+    PendingOutcome,
+    RemoteBatchConfig,
+    RemoteBatcher,
+    RemoteClientPool,
+    RemoteCommand,
+)
+
+
+class UserInputs(BaseModel):
+    id: int
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+class GetUser(Command[UserInputs, User]):
+    """Look up a user"""
+
+    def execute(self) -> User:
+        if self.inputs.id < 0:
+            self.add_runtime_error("not_found", f"No user {self.inputs.id}", halt=False)
+            return None
+        return User(id=self.inputs.id, name=f"user-{self.inputs.id}")
+
+
+class Server:
+    """Real HTTPConnector app served by uvicorn, counting requests per path"""
+
+    def __init__(self):
+        app = FastAPI()
+        HTTPConnector(app, batch=BatchConfig()).register(GetUser)
+        self.requests = []
+
+        @app.middleware("http")
+        async def count(request, call_next):
+            self.requests.append(request.url.path)
+            return await call_next(request)
+
+        self.server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+        )
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        port = self.server.servers[0].sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.should_exit = True
+        self.thread.join(5)
+
+
+@pytest.fixture(scope="module")
+def server():
+    with Server() as server:
+        yield server
+
+
+@pytest.fixture
+def pool():
+    with RemoteClientPool() as pool:
+        yield pool
+
+
+def remote_commands(server, pool, **config):
+    batcher = RemoteBatcher(server.url, RemoteBatchConfig(**config), pool)
+
+    class RemoteGetUser(RemoteCommand[UserInputs, User]):
+        _remote_url = server.url
+        _command_name = "GetUser"
+        _client_pool = pool
+
+    class AsyncRemoteGetUser(AsyncRemoteCommand[UserInputs, User]):
+        _remote_url = server.url
+        _command_name = "GetUser"
+        _client_pool = pool
+
+    server.requests.clear()
+    return batcher, RemoteGetUser, AsyncRemoteGetUser
+
+
+class TestBatchBlock:
+    def test_calls_in_block_are_sent_together(self, server, pool):
+        batcher, RemoteGetUser, _ = remote_commands(server, pool)
+
+        with batcher.batch() as batch:
+            outcomes = [RemoteGetUser.run(id=n) for n in range(5)]
+            assert len(batch) == 5
+            assert server.requests == []
+
+        assert server.requests == ["/batch"]
+        assert [o.unwrap() for o in outcomes] == [User(id=n, name=f"user-{n}") for n in range(5)]
+        assert all(isinstance(o, PendingOutcome) for o in outcomes)
+
+    def test_reading_an_outcome_sends_the_batch(self, server, pool):
+        batcher, RemoteGetUser, _ = remote_commands(server, pool)
+
+        with batcher.batch():
+            first = RemoteGetUser.run(id=1)
+            assert first.is_success()
+            second = RemoteGetUser.run(id=2)
+
+        assert second.unwrap().id == 2
+        assert server.requests == ["/batch", "/batch"]
+
+    def test_failures_are_per_call(self, server, pool):
+        batcher, RemoteGetUser, _ = remote_commands(server, pool)
+
+        with batcher.batch():
+            ok, missing = RemoteGetUser.run(id=1), RemoteGetUser.run(id=-1)
+
+        assert ok.is_success()
+        assert missing.is_failure()
+        assert missing.errors[0].remote_errors[0]["symbol"] == "not_found"
+
+    def test_invalid_inputs_fail_without_a_request(self, server, pool):
+        batcher, RemoteGetUser, _ = remote_commands(server, pool)
+
+        with batcher.batch():
+            outcome = RemoteGetUser.run(id="nope")
+
+        assert outcome.is_failure()
+        assert server.requests == []
+
+    def test_large_batches_are_split(self, server, pool):
+        batcher, RemoteGetUser, _ = remote_commands(server, pool, max_batch_size=2)
+
+        with batcher.batch():
+            outcomes = [RemoteGetUser.run(id=n) for n in range(5)]
+
+        assert [o.unwrap().id for o in outcomes] == list(range(5))
+        assert server.requests == ["/batch"] * 3
+
+    def test_other_services_are_not_batched(self, server, pool):
+        _, RemoteGetUser, _ = remote_commands(server, pool)
+        other = RemoteBatcher("http://other.example", client_pool=pool)
+
+        with other.batch():
+            outcome = RemoteGetUser.run(id=1)
+
+        assert not isinstance(outcome, PendingOutcome)
+        assert server.requests == ["/run/GetUser"]
+
+    def test_async_calls_in_block(self, server, pool):
+        batcher, _, AsyncRemoteGetUser = remote_commands(server, pool)
+
+        async def scenario():
+            with batcher.batch():
+                calls = [AsyncRemoteGetUser.run(id=n) for n in range(4)]
+                outcomes = await asyncio.gather(*calls)
+            await pool.aclose()
+            return outcomes
+
+        outcomes = asyncio.run(scenario())
+
+        assert [o.unwrap().id for o in outcomes] == list(range(4))
+        assert server.requests == ["/batch"]
+
+
+class TestWindowBatching:
+    def test_concurrent_threads_share_a_batch(self, server, pool):
+        batcher, RemoteGetUser, _ = remote_commands(server, pool, window=0.5)
+        RemoteGetUser._batcher = batcher
+        barrier = threading.Barrier(6)
+        results = {}
+
+        def call(n):
+            barrier.wait()
+            results[n] = RemoteGetUser.run(id=n).unwrap().id
+
+        threads = [threading.Thread(target=call, args=(n,)) for n in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        assert results == {n: n for n in range(6)}
+        assert server.requests == ["/batch"]
+
+    def test_full_window_is_sent_early(self, server, pool):
+        batcher, _, AsyncRemoteGetUser = remote_commands(
+            server, pool, window=30, max_batch_size=3
+        )
+        AsyncRemoteGetUser._batcher = batcher
+
+        async def scenario():
+            outcomes = await asyncio.gather(*(AsyncRemoteGetUser.run(id=n) for n in range(6)))
+            await pool.aclose()
+            return outcomes
+
+        outcomes = asyncio.run(asyncio.wait_for(scenario(), 5))
+
+        assert [o.unwrap().id for o in outcomes] == list(range(6))
+        assert server.requests == ["/batch", "/batch"]
+
+    def test_connection_error_fails_every_call(self, pool):
+        batcher = RemoteBatcher("http://127.0.0.1:9", RemoteBatchConfig(window=0.01), pool)
+
+        class Unreachable(RemoteCommand[UserInputs, User]):
+            _remote_url = "http://127.0.0.1:9"
+            _command_name = "GetUser"
+            _batcher = batcher
+
+        outcome = Unreachable.run(id=1)
+
+        assert outcome.is_failure()
+        assert outcome.errors[0].symbol == "connection_error"
+
+
+class TestJsonRpcProtocol:
+    def test_mcp_tools_call_batch(self, pool):
+        connector = MCPConnector().connect(GetUser)
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                data = connector.run(body.decode()).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{httpd.server_port}"
+        batcher = RemoteBatcher(url, RemoteBatchConfig(protocol="jsonrpc", path="/mcp"), pool)
+
+        class RemoteGetUser(RemoteCommand[UserInputs, User]):
+            _remote_url = url
+            _command_name = "GetUser"
+
+        try:
+            with batcher.batch():
+                ok, missing = RemoteGetUser.run(id=3), RemoteGetUser.run(id=-1)
+            assert ok.unwrap() == User(id=3, name="user-3")
+            assert missing.is_failure()
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+    def test_unknown_protocol(self):
+        with pytest.raises(ValueError):
+            RemoteBatchConfig(protocol="grpc")
+
+
+def test_importer_batch(server, pool):
+    from foobara_py.remote import ManifestCache, RemoteImporter
+
+    manifest_url = f"{server.url}/manifest"
+    cache = ManifestCache()
+    cache.set(
+        manifest_url,
+        {
+            "commands": [
+                {
+                    "name": "GetUser",
+                    "full_name": "GetUser",
+                    "inputs_schema": UserInputs.model_json_schema(),
+                }
+            ]
+        },
+    )
+    importer = RemoteImporter(manifest_url, cache=cache, client_pool=pool)
+    remote = importer.as_namespace()
+    server.requests.clear()
+
+    with remote.batch():
+        outcomes = [remote.GetUser.run(id=n) for n in range(3)]
+
+    assert [o.unwrap()["id"] for o in outcomes] == [0, 1, 2]
+    assert server.requests == ["/batch"]
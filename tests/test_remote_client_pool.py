@@ -0,0 +1,171 @@
+"""Tests for pooled HTTP clients used by remote commands"""
+
+import asyncio
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from pydantic import BaseModel
+
+httpx = pytest.importorskip("httpx")
+
+from foobara_py.remote import (  # noqa: E402
+    AsyncRemoteCommand,
+    ManifestCache,
+    RemoteClientConfig,
+    RemoteClientPool,
+    RemoteCommand,
+    RemoteImporter,
+)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON server that echoes command inputs"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1  # one write per response
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.cookies.append(self.headers.get("Cookie"))
+        self._reply({"result": json.loads(body)})
+
+    def do_GET(self):
+        self._reply({"commands": [{"name": "Echo", "full_name": "Echo"}]})
+
+    def _reply(self, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if "Authorization" in self.headers:
+            self.send_header("Set-Cookie", f"session={self.headers['Authorization']}")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.daemon_threads = True
+    httpd.connections = 0
+    httpd.cookies = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def pool():
+    with RemoteClientPool() as pool:
+        yield pool
+
+
+class EchoInputs(BaseModel):
+    value: int
+
+
+def echo_command(base, server, pool):
+    class Echo(base[EchoInputs, dict]):
+        _remote_url = f"http://127.0.0.1:{server.server_port}"
+        _command_name = "Echo"
+        _client_pool = pool
+
+    return Echo
+
+
+class TestRemoteClientPool:
+    def test_calls_reuse_one_connection(self, server, pool):
+        Echo = echo_command(RemoteCommand, server, pool)
+
+        outcomes = [Echo.run(value=n) for n in range(5)]
+
+        assert [o.unwrap() for o in outcomes] == [{"value": n} for n in range(5)]
+        assert server.connections == 1
+
+    def test_async_calls_reuse_one_connection(self, server, pool):
+        Echo = echo_command(AsyncRemoteCommand, server, pool)
+
+        async def scenario():
+            outcomes = [await Echo.run(value=n) for n in range(5)]
+            await pool.aclose()
+            return outcomes
+
+        outcomes = asyncio.run(scenario())
+
+        assert [o.unwrap() for o in outcomes] == [{"value": n} for n in range(5)]
+        assert server.connections == 1
+
+    def test_cookies_are_not_shared_between_callers(self, server, pool):
+        Echo = echo_command(RemoteCommand, server, pool)
+
+        class AsAlice(Echo):
+            _headers = {"Authorization": "alice"}
+
+        class AsBob(Echo):
+            _headers = {"Authorization": "bob"}
+
+        AsAlice.run(value=1)
+        AsBob.run(value=2)
+
+        assert server.cookies == [None, None]
+        assert server.connections == 1
+
+    def test_close_opens_new_connection(self, server, pool):
+        Echo = echo_command(RemoteCommand, server, pool)
+
+        Echo.run(value=1)
+        pool.close()
+        Echo.run(value=2)
+
+        assert server.connections == 2
+
+    def test_clients_are_per_origin(self, pool):
+        assert pool.client("http://a.example/x") is pool.client("http://A.example/y")
+        assert pool.client("http://a.example") is not pool.client("http://a.example:8080")
+
+    def test_origin_config(self, pool):
+        pool.configure("https://api.example.com/manifest", RemoteClientConfig(timeout=2.5))
+
+        assert pool.timeout_for("https://api.example.com/run/X", 30.0).read == 2.5
+        assert pool.timeout_for("https://other.example.com/run/X", 30.0).read == 30.0
+
+    def test_configure_replaces_open_client(self, pool):
+        client = pool.client("http://a.example")
+        pool.configure("http://a.example", RemoteClientConfig(max_connections=1))
+
+        assert client.is_closed
+        assert pool.client("http://a.example") is not client
+
+    def test_http2_requires_h2(self, pool, monkeypatch):
+        monkeypatch.setitem(sys.modules, "h2", None)
+        pool.configure("http://a.example", RemoteClientConfig(http2=True))
+
+        with pytest.raises(ImportError):
+            pool.client("http://a.example")
+
+    def test_importer_uses_pool_for_manifest_and_commands(self, server, pool):
+        importer = RemoteImporter(
+            f"http://127.0.0.1:{server.server_port}/manifest",
+            cache=ManifestCache(),
+            client_pool=pool,
+        )
+
+        Echo = importer.import_command("Echo")
+        outcome = Echo.run()
+
+        assert outcome.is_success()
+        assert Echo._client_pool is pool
+        assert server.connections == 1
@@ -21,9 +21,19 @@ from foobara_py.remote import (
     CacheEntry,
     get_manifest_cache,
     set_manifest_cache,
+    RemoteClientPool,
+    set_client_pool,
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_client_pool():
+    """Pooled clients would outlive each test's patched httpx.Client"""
+    set_client_pool(RemoteClientPool())
+    yield
+    set_client_pool(RemoteClientPool())
+
+
 class TestManifestCache:
     """Test ManifestCache"""
 
@@ -136,6 +146,131 @@ class TestManifestCache:
         assert removed == 1
         assert cache.size == 1
 
+    def test_updating_entry_does_not_evict(self):
+        """Should replace an existing entry in place when at capacity"""
+        cache = ManifestCache(max_entries=2)
+        cache.set("https://a.com/manifest", {"a": 1})
+        cache.set("https://b.com/manifest", {"b": 2})
+
+        cache.set("https://a.com/manifest", {"a": 2})
+        cache.set("https://c.com/manifest", {"c": 3})
+
+        assert cache.get("https://a.com/manifest") == {"a": 2}
+        assert cache.get("https://b.com/manifest") is None
+
+
+class TestFileManifestCache:
+    """Test FileManifestCache"""
+
+    MANIFEST = {"commands": [{"name": "Test", "full_name": "Test"}]}
+
+    def test_persists_across_instances(self, tmp_path):
+        """Should read entries written by an earlier instance"""
+        FileManifestCache(str(tmp_path)).set("https://a.com/manifest", self.MANIFEST, etag="v1")
+
+        cache = FileManifestCache(str(tmp_path))
+
+        assert cache.get("https://a.com/manifest") == self.MANIFEST
+        assert cache.get_entry("https://a.com/manifest").etag == "v1"
+
+    def test_bodies_are_loaded_on_first_get(self, tmp_path):
+        """Should read only the index at startup"""
+        writer = FileManifestCache(str(tmp_path))
+        writer.set("https://a.com/manifest", {"a": 1})
+        writer.set("https://b.com/manifest", {"b": 2})
+
+        cache = FileManifestCache(str(tmp_path))
+
+        assert cache.size == 2
+        assert cache.stats()["loaded_entries"] == 0
+        assert cache.stats()["disk_bytes"] > 0
+        assert cache.get("https://a.com/manifest") == {"a": 1}
+        assert cache.stats()["loaded_entries"] == 1
+
+    @staticmethod
+    def body_files(path):
+        return [p for p in path.iterdir() if p.name != "index.json"]
+
+    def test_pickle_body_format_is_opt_in(self, tmp_path):
+        """Should pickle bodies only when asked, and never unpickle otherwise"""
+        FileManifestCache(str(tmp_path), body_format="pickle").set(
+            "https://a.com/manifest", self.MANIFEST
+        )
+
+        assert [p.suffix for p in self.body_files(tmp_path)] == [".pickle"]
+        pickled = FileManifestCache(str(tmp_path), body_format="pickle")
+        assert pickled.get("https://a.com/manifest") == self.MANIFEST
+        assert FileManifestCache(str(tmp_path)).get("https://a.com/manifest") is None
+        with pytest.raises(ValueError):
+            FileManifestCache(str(tmp_path), body_format="msgpack")
+
+    def test_eviction_removes_files(self, tmp_path):
+        """Should delete the body file of an evicted entry"""
+        cache = FileManifestCache(str(tmp_path), max_entries=2)
+        for name in "abc":
+            cache.set(f"https://{name}.com/manifest", {name: 1})
+
+        assert len(self.body_files(tmp_path)) == 2
+        reloaded = FileManifestCache(str(tmp_path), max_entries=2)
+        assert reloaded.get("https://a.com/manifest") is None
+        assert reloaded.get("https://c.com/manifest") == {"c": 1}
+
+    def test_expired_entries_keep_etag(self, tmp_path):
+        """Should keep expired entries for conditional requests"""
+        FileManifestCache(str(tmp_path), ttl_seconds=-1).set(
+            "https://a.com/manifest", self.MANIFEST, etag="v1"
+        )
+
+        cache = FileManifestCache(str(tmp_path))
+
+        assert cache.get("https://a.com/manifest") is None
+        assert cache.get_entry("https://a.com/manifest").data == self.MANIFEST
+        assert cache.cleanup_expired() == 1
+        assert self.body_files(tmp_path) == []
+
+    def test_missing_body_drops_entry(self, tmp_path):
+        """Should drop an entry whose body file is corrupt"""
+        FileManifestCache(str(tmp_path)).set("https://a.com/manifest", self.MANIFEST)
+        for path in self.body_files(tmp_path):
+            path.write_bytes(b"corrupt")
+
+        cache = FileManifestCache(str(tmp_path))
+
+        assert cache.get("https://a.com/manifest") is None
+        assert cache.size == 0
+
+    def test_reads_files_without_index(self, tmp_path):
+        """Should index cache files written before the index existed"""
+        import json
+
+        key = ManifestCache()._cache_key("https://a.com/manifest")
+        now = datetime.now()
+        (tmp_path / f"{key}.json").write_text(
+            json.dumps(
+                {
+                    "data": self.MANIFEST,
+                    "fetched_at": now.isoformat(),
+                    "expires_at": (now + timedelta(minutes=5)).isoformat(),
+                    "etag": "v1",
+                    "url": "https://a.com/manifest",
+                }
+            )
+        )
+
+        cache = FileManifestCache(str(tmp_path))
+
+        assert cache.get("https://a.com/manifest") == self.MANIFEST
+        assert (tmp_path / "index.json").exists()
+
+    def test_clear_removes_files(self, tmp_path):
+        """Should clear memory and disk"""
+        cache = FileManifestCache(str(tmp_path))
+        cache.set("https://a.com/manifest", self.MANIFEST)
+
+        assert cache.clear() == 1
+        assert list(tmp_path.iterdir()) == []
+        assert FileManifestCache(str(tmp_path)).size == 0
+
 
 class TestRemoteCommand:
     """Test RemoteCommand"""
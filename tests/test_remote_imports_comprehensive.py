@@ -29,9 +29,19 @@ from foobara_py.remote import (
     import_remote,
     ManifestCache,
     CacheEntry,
+    RemoteClientPool,
+    set_client_pool,
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_client_pool():
+    """Pooled clients would outlive each test's patched httpx.Client"""
+    set_client_pool(RemoteClientPool())
+    yield
+    set_client_pool(RemoteClientPool())
+
+
 # ============================================================================
 # RemoteCommand HTTP Execution Tests (15+ tests)
 # ============================================================================
@@ -330,8 +340,9 @@ class TestRemoteCommandHTTPExecution:
             cmd.validate_inputs()
             cmd.execute()
 
-            # Verify timeout was passed to client
-            assert mock_client_class.call_args[1]["timeout"] == 60.0
+            # Verify timeout was passed with the request
+            post = mock_client.__enter__.return_value.post
+            assert post.call_args[1]["timeout"].read == 60.0
 
     def test_response_with_data_envelope(self):
         """Should handle response with 'data' envelope"""
@@ -0,0 +1,109 @@
+"""Tests for lazy remote namespaces and shared remote models"""
+
+import pytest
+
+from foobara_py.remote import ManifestCache, RemoteImporter, RemoteModelFactory
+from foobara_py.remote import models as remote_models
+
+MANIFEST_URL = "http://api.example.com/manifest"
+
+USER_ID_SCHEMA = {
+    "type": "object",
+    "properties": {"id": {"type": "integer"}},
+    "required": ["id"],
+}
+
+USER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "nickname": {"type": ["string", "null"], "default": None},
+    },
+    "required": ["id", "name"],
+}
+
+
+def manifest(*names):
+    return {
+        "commands": [
+            {
+                "name": name,
+                "full_name": f"Users::{name}",
+                "inputs_schema": USER_ID_SCHEMA,
+                "result_schema": USER_SCHEMA,
+            }
+            for name in names
+        ]
+    }
+
+
+def importer_for(data, etag="v1", **kwargs):
+    cache = ManifestCache()
+    cache.set(MANIFEST_URL, data, etag=etag)
+    return RemoteImporter(MANIFEST_URL, cache=cache, **kwargs)
+
+
+@pytest.fixture
+def count_schema_walks(monkeypatch):
+    walks = []
+    original = remote_models.field_definitions
+
+    def counting(schema):
+        walks.append(schema)
+        return original(schema)
+
+    monkeypatch.setattr(remote_models, "field_definitions", counting)
+    return walks
+
+
+class TestLazyNamespace:
+    def test_commands_are_imported_on_first_access(self, count_schema_walks):
+        importer = importer_for(manifest("GetUser", "DeleteUser"))
+
+        remote = importer.as_namespace()
+
+        assert count_schema_walks == []
+        assert remote.list_commands() == ["Users::GetUser", "Users::DeleteUser"]
+
+        GetUser = remote.GetUser
+
+        assert GetUser._command_name == "Users::GetUser"
+        assert remote.GetUser is GetUser
+        assert remote.list_commands() == ["Users::GetUser", "Users::DeleteUser"]
+        assert len(count_schema_walks) == 2
+
+    def test_full_name_access(self):
+        remote = importer_for(manifest("GetUser")).as_namespace(async_mode=True)
+
+        assert getattr(remote, "Users::GetUser") is remote.GetUser
+
+    def test_unknown_command(self):
+        remote = importer_for(manifest("GetUser")).as_namespace()
+
+        with pytest.raises(AttributeError):
+            remote.Missing
+
+
+class TestSharedModels:
+    def test_identical_schemas_share_a_class(self):
+        importer = importer_for(manifest("GetUser", "DeleteUser"))
+
+        GetUser = importer.import_command("GetUser")
+        DeleteUser = importer.import_command("DeleteUser")
+
+        assert GetUser.inputs_type() is DeleteUser.inputs_type()
+        assert GetUser.result_type() is DeleteUser.result_type()
+        assert len(importer.models) == 2
+
+    def test_models_validate(self):
+        User = RemoteModelFactory().model_for(USER_SCHEMA, "User")
+
+        user = User(id=1, name="Ada", tags=["admin"])
+
+        assert user.nickname is None
+        assert User.model_json_schema()["required"] == ["id", "name"]
+        with pytest.raises(ValueError):
+            User(id="one", name="Ada")
+
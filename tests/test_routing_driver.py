@@ -0,0 +1,238 @@
+"""
+Tests for RoutingCRUDDriver read/write splitting and sharding
+"""
+
+import pytest
+from typing import Optional
+
+from pydantic import BaseModel
+
+from foobara_py import Command
+from foobara_py.core.transactions import TransactionConfig, transaction
+from foobara_py.persistence import (
+    EntityBase,
+    InMemoryCRUDDriver,
+    RoutingCRUDDriver,
+    ShardedCRUDTable,
+)
+
+
+class Account(EntityBase):
+    """Test account entity"""
+    _primary_key_field = 'id'
+
+    id: Optional[int] = None
+    name: str
+
+
+class Invoice(EntityBase):
+    """Test invoice entity sharded by tenant"""
+    _primary_key_field = 'id'
+
+    id: Optional[int] = None
+    tenant: str
+    total: float = 0.0
+
+
+@pytest.fixture
+def drivers():
+    return InMemoryCRUDDriver(), InMemoryCRUDDriver(), InMemoryCRUDDriver()
+
+
+@pytest.fixture
+def router(drivers):
+    primary, replica1, replica2 = drivers
+    return RoutingCRUDDriver(primary, replicas=[replica1, replica2])
+
+
+def seed_replicas(drivers, record):
+    # Replication is out of scope; copy rows by hand so reads can be traced
+    for replica in drivers[1:]:
+        replica.table_for(Account).insert({**record})
+
+
+class TestReadWriteSplitting:
+    def test_writes_go_to_primary(self, router, drivers):
+        primary, replica1, replica2 = drivers
+
+        router.table_for(Account).insert({"name": "Alice"})
+
+        assert primary.table_for(Account).count() == 1
+        assert replica1.table_for(Account).count() == 0
+        assert replica2.table_for(Account).count() == 0
+
+    def test_reads_round_robin_across_replicas(self, router, drivers):
+        _, replica1, replica2 = drivers
+        replica1.table_for(Account).insert({"id": 1, "name": "from-replica-1"})
+        replica2.table_for(Account).insert({"id": 1, "name": "from-replica-2"})
+        table = router.table_for(Account)
+
+        names = [table.find(1)["name"] for _ in range(4)]
+
+        assert names == ["from-replica-1", "from-replica-2"] * 2
+
+    def test_least_loaded_strategy(self, drivers):
+        primary, replica1, replica2 = drivers
+        router = RoutingCRUDDriver(primary, [replica1, replica2], strategy="least_loaded")
+        replica1.table_for(Account).insert({"id": 1, "name": "r1"})
+        replica2.table_for(Account).insert({"id": 1, "name": "r2"})
+
+        router._in_flight[0] = 5  # replica1 busy
+
+        assert router.table_for(Account).find(1)["name"] == "r2"
+        assert router._in_flight == [5, 0]
+
+    def test_unknown_strategy(self, drivers):
+        with pytest.raises(ValueError):
+            RoutingCRUDDriver(drivers[0], drivers[1:], strategy="random")
+
+    def test_without_replicas_reads_primary(self, drivers):
+        router = RoutingCRUDDriver(drivers[0])
+        router.table_for(Account).insert({"name": "Alice"})
+
+        assert router.table_for(Account).find(1)["name"] == "Alice"
+
+    def test_reads_after_write_pinned_in_driver_transaction(self, router, drivers):
+        seed_replicas(drivers, {"id": 1, "name": "stale"})
+        table = router.table_for(Account)
+
+        raw_tx = router.begin_transaction()
+        assert table.find(1)["name"] == "stale"  # no write yet
+        table.insert({"id": 1, "name": "fresh"})
+        assert table.find(1)["name"] == "fresh"
+        router.commit_transaction(raw_tx)
+
+        assert table.find(1)["name"] == "stale"
+
+    def test_reads_after_write_pinned_in_transaction_context(self, router, drivers):
+        seed_replicas(drivers, {"id": 1, "name": "stale"})
+        table = router.table_for(Account)
+
+        with transaction():
+            table.insert({"id": 1, "name": "fresh"})
+            assert table.find(1)["name"] == "fresh"
+
+        assert table.find(1)["name"] == "stale"
+
+    def test_writes_outside_transaction_do_not_pin(self, router, drivers):
+        seed_replicas(drivers, {"id": 1, "name": "stale"})
+        table = router.table_for(Account)
+
+        table.insert({"id": 1, "name": "fresh"})
+
+        assert table.find(1)["name"] == "stale"
+
+    def test_command_transaction_pins_reads(self, router, drivers):
+        seed_replicas(drivers, {"id": 1, "name": "stale"})
+        table = router.table_for(Account)
+
+        class RenameInputs(BaseModel):
+            name: str
+
+        class Rename(Command[RenameInputs, str]):
+            _transaction_config = TransactionConfig.with_handler(router.transaction_handler)
+
+            def execute(self) -> str:
+                table.insert({"id": 1, "name": self.inputs.name})
+                return table.find(1)["name"]
+
+        outcome = Rename.run(name="fresh")
+
+        assert outcome.is_success()
+        assert outcome.result == "fresh"
+        assert table.find(1)["name"] == "stale"
+
+
+class TestSharding:
+    @pytest.fixture
+    def shards(self):
+        return {"eu": InMemoryCRUDDriver(), "us": InMemoryCRUDDriver()}
+
+    @pytest.fixture
+    def sharded_router(self, shards):
+        router = RoutingCRUDDriver(InMemoryCRUDDriver())
+        router.shard(Invoice, shards, key=lambda record: record["tenant"])
+        return router
+
+    def test_inserts_routed_by_shard_key(self, sharded_router, shards):
+        table = sharded_router.table_for(Invoice)
+        assert isinstance(table, ShardedCRUDTable)
+
+        table.insert({"id": 1, "tenant": "eu", "total": 10.0})
+        table.insert({"id": 2, "tenant": "us", "total": 20.0})
+        table.insert({"id": 3, "tenant": "eu", "total": 30.0})
+
+        assert shards["eu"].table_for(Invoice).count() == 2
+        assert shards["us"].table_for(Invoice).count() == 1
+
+    def test_pk_operations_fan_out(self, sharded_router):
+        table = sharded_router.table_for(Invoice)
+        table.insert({"id": 1, "tenant": "eu"})
+        table.insert({"id": 2, "tenant": "us"})
+
+        assert table.find(2)["tenant"] == "us"
+        assert table.update(2, {"total": 5.0})["total"] == 5.0
+        assert table.delete(1) is True
+        assert table.find(1) is None
+        assert table.count() == 1
+
+    def test_pk_key_routes_directly(self, shards):
+        router = RoutingCRUDDriver(InMemoryCRUDDriver())
+        router.shard(
+            Invoice,
+            shards,
+            key=lambda record: "eu" if record["id"] % 2 else "us",
+            pk_key=lambda pk: "eu" if pk % 2 else "us",
+        )
+        table = router.table_for(Invoice)
+        table.insert({"id": 1, "tenant": "x"})
+        table.insert({"id": 2, "tenant": "y"})
+
+        assert table.find(2)["tenant"] == "y"
+        assert shards["us"].table_for(Invoice).find(2) is not None
+
+    def test_unknown_shard_key_is_hashed_stably(self, sharded_router):
+        table = sharded_router.table_for(Invoice)
+
+        first = table.shard_name_for("tenant-42")
+
+        assert first in ("eu", "us")
+        assert table.shard_name_for("tenant-42") == first
+
+    def test_select_merges_shards(self, sharded_router):
+        table = sharded_router.table_for(Invoice)
+        for i, tenant in enumerate(["eu", "us", "eu", "us", "eu"], start=1):
+            table.insert({"id": i, "tenant": tenant, "total": float(i)})
+
+        results = table.select(order_by="-total", limit=2, offset=1)
+
+        assert [r["id"] for r in results] == [4, 3]
+        assert [r["id"] for r in table.iter_all(batch_size=2)] == [1, 2, 3, 4, 5]
+
+    def test_unsharded_entities_use_primary(self, sharded_router):
+        assert sharded_router.table_for(Account).insert({"name": "A"})["id"] == 1
+
+
+class TestSQLiteRouting:
+    def test_primary_and_replica_sqlite(self):
+        pytest.importorskip("sqlalchemy")
+        from sqlalchemy import create_engine
+
+        from foobara_py.persistence.mapping import entity_to_sqlalchemy_table
+        from foobara_py.persistence.sqlalchemy_driver import SQLAlchemyDriver, SQLAlchemyTable
+
+        def sqlite_driver():
+            driver = SQLAlchemyDriver(create_engine("sqlite:///:memory:"))
+            sa_table = entity_to_sqlalchemy_table(Account, driver.metadata, "accounts")
+            sa_table.create(driver.engine)
+            driver._tables["Account"] = SQLAlchemyTable(Account, driver, sa_table=sa_table)
+            return driver
+
+        primary, replica = sqlite_driver(), sqlite_driver()
+        router = RoutingCRUDDriver(primary, [replica])
+        table = router.table_for(Account)
+
+        table.insert({"name": "Alice"})
+
+        assert primary.table_for(Account).count() == 1
+        assert table.count() == 0  # replica has not caught up
@@ -0,0 +1,222 @@
+"""
+Tests for cached statements in SQL-backed CRUD tables
+"""
+
+import pytest
+from typing import Optional
+
+from foobara_py.persistence import EntityBase, PostgreSQLCRUDTable
+from foobara_py.persistence.statement_cache import StatementCache, statement_shape
+
+
+class Person(EntityBase):
+    """Test person entity"""
+    _primary_key_field = 'id'
+
+    id: Optional[int] = None
+    name: str
+    age: int = 0
+
+
+class TestStatementCache:
+    def test_builds_once_per_key(self):
+        cache = StatementCache()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return object()
+
+        first = cache.get_or_build("k", build)
+        second = cache.get_or_build("k", build)
+
+        assert first is second
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = StatementCache(max_size=2)
+        cache.get_or_build("a", lambda: "A")
+        cache.get_or_build("b", lambda: "B")
+        cache.get_or_build("a", lambda: "A")
+        cache.get_or_build("c", lambda: "C")
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_statement_shape_ignores_values(self):
+        assert statement_shape("select", {"name": "a"}, "age", 10, None) == statement_shape(
+            "select", {"name": "b"}, ["age"], 99, None
+        )
+        assert statement_shape("select", {"name": "a"}, None, 10, None) != statement_shape(
+            "select", {"name": "a"}, None, None, None
+        )
+        assert statement_shape("select", {"name": "a"}) != statement_shape(
+            "select", {"name": None}
+        )
+
+
+class TestSQLAlchemyStatementCache:
+    @pytest.fixture
+    def table(self):
+        pytest.importorskip("sqlalchemy")
+        from sqlalchemy import create_engine
+
+        from foobara_py.persistence.mapping import entity_to_sqlalchemy_table
+        from foobara_py.persistence.sqlalchemy_driver import SQLAlchemyDriver, SQLAlchemyTable
+
+        driver = SQLAlchemyDriver(create_engine("sqlite:///:memory:"))
+        sa_table = entity_to_sqlalchemy_table(Person, driver.metadata, "people")
+        sa_table.create(driver.engine)
+        return SQLAlchemyTable(Person, driver, sa_table=sa_table)
+
+    def test_select_reuses_statement_for_same_shape(self, table):
+        for i in range(5):
+            table.insert({"name": f"p{i}", "age": i % 2})
+
+        first = table.select(where={"age": 0}, order_by="-name", limit=2)
+        misses = table.statements.misses
+        second = table.select(where={"age": 1}, order_by="-name", limit=1)
+
+        assert [r["name"] for r in first] == ["p4", "p2"]
+        assert [r["name"] for r in second] == ["p3"]
+        assert table.statements.misses == misses
+        assert table.statements.hits >= 1
+
+    def test_select_where_none_matches_null(self, table):
+        table.insert({"name": "Ann", "age": 30})
+        table.insert({"name": "Bob", "age": None})
+
+        assert [r["name"] for r in table.select(where={"age": None})] == ["Bob"]
+        assert [r["name"] for r in table.select(where={"age": 30})] == ["Ann"]
+
+    def test_crud_operations_use_bound_parameters(self, table):
+        created = table.insert({"name": "Ann", "age": 30})
+        table.insert({"name": "Bob"})
+
+        assert table.find(created["id"])["name"] == "Ann"
+        assert table.update(created["id"], {"age": 31})["age"] == 31
+        assert table.update(created["id"], {"age": 32})["age"] == 32
+        assert table.count() == 2
+        assert table.delete(created["id"]) is True
+        assert table.find(created["id"]) is None
+        assert ("update", ("age",)) in table.statements
+
+    def test_clear_statement_cache(self, table):
+        table.count()
+        table.clear_statement_cache()
+
+        assert len(table.statements) == 0
+
+
+class FakeCursor:
+    def __init__(self, log, rows):
+        self.log = log
+        self.rows = rows
+        self.description = [("id",), ("name",), ("age",)]
+        self.rowcount = len(rows)
+
+    def execute(self, sql, values, prepare=None):
+        self.log.append((" ".join(sql.split()), list(values), prepare))
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return list(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class FakeConnection:
+    def __init__(self, log, rows):
+        self.log = log
+        self.rows = rows
+
+    def cursor(self):
+        return FakeCursor(self.log, self.rows)
+
+    def commit(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class FakePool:
+    def __init__(self, rows):
+        self.log = []
+        self.rows = rows
+
+    def connection(self):
+        return FakeConnection(self.log, self.rows)
+
+
+class FakeDriver:
+    def __init__(self, rows, prepare=True):
+        self.pool = FakePool(rows)
+        self.prepare = prepare
+
+
+class TestPostgreSQLStatementCache:
+    @pytest.fixture
+    def driver(self):
+        return FakeDriver([(1, "Ann", 30)])
+
+    @pytest.fixture
+    def table(self, driver):
+        return PostgreSQLCRUDTable(Person, driver, "people")
+
+    def test_select_uses_prepared_parameterized_sql(self, table, driver):
+        list(table.select(where={"age": 30}, order_by="name", limit=5, offset=10))
+        list(table.select(where={"age": 40}, order_by="name", limit=1, offset=2))
+
+        first, second = driver.pool.log
+        assert first[0] == "SELECT * FROM people WHERE age = %s ORDER BY name LIMIT %s OFFSET %s"
+        assert first[0] == second[0]
+        assert first[1] == [30, 5, 10]
+        assert second[1] == [40, 1, 2]
+        assert first[2] is True
+        assert table.statements.hits == 1
+
+    def test_select_where_none_uses_is_null(self, table, driver):
+        list(table.select(where={"age": None, "name": "Ann"}))
+
+        sql, values, _ = driver.pool.log[0]
+        assert sql == "SELECT * FROM people WHERE age IS NULL AND name = %s"
+        assert values == ["Ann"]
+
+    def test_find_caches_columns(self, table):
+        assert table.find(1) == {"id": 1, "name": "Ann", "age": 30}
+        assert table.find(1) == {"id": 1, "name": "Ann", "age": 30}
+
+        assert table._columns[("find",)] == ["id", "name", "age"]
+        assert table.statements.misses == 1
+
+    def test_insert_cached_per_column_set(self, table, driver):
+        table.insert({"name": "Ann", "age": 30})
+        table.insert({"name": "Bob", "age": 31})
+        table.insert({"name": "Cy"})
+
+        sqls = [entry[0] for entry in driver.pool.log]
+        assert sqls[0] == sqls[1] != sqls[2]
+        assert len(table.statements) == 2
+
+    def test_prepare_can_be_disabled(self):
+        driver = FakeDriver([], prepare=False)
+        table = PostgreSQLCRUDTable(Person, driver, "people")
+
+        table.count()
+
+        assert driver.pool.log[0][2] is False
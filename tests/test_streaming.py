@@ -0,0 +1,174 @@
+"""Tests for streaming command results across connectors"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Iterator
+
+import pytest
+from pydantic import BaseModel
+
+from foobara_py import AsyncCommand, Command, StreamingResult
+from foobara_py.connectors.cli import CommandCLI, OutputFormat
+from foobara_py.connectors.http import HTTPConnector, RouteConfig
+from foobara_py.connectors.websocket import (
+    WebSocketConnector,
+    WebSocketMessage,
+    WebSocketMessageType,
+)
+from foobara_py.core.registry import CommandRegistry
+from foobara_py.core.streaming import as_stream
+
+
+class RangeInputs(BaseModel):
+    count: int
+
+
+class Row(BaseModel):
+    n: int
+
+
+class ExportRows(Command[RangeInputs, Iterator[Row]]):
+    """Yield rows lazily"""
+
+    def execute(self) -> Iterator[Row]:
+        return (Row(n=i) for i in range(self.inputs.count))
+
+
+class ExportNumbers(AsyncCommand[RangeInputs, AsyncIterator[int]]):
+    """Yield numbers from an async generator"""
+
+    async def execute(self) -> AsyncIterator[int]:
+        async def numbers():
+            for i in range(self.inputs.count):
+                await asyncio.sleep(0)
+                yield i
+
+        return numbers()
+
+
+class TestStreamingResult:
+    def test_as_stream_only_wraps_iterators(self):
+        assert as_stream([1, 2]) is None
+        assert as_stream({"a": 1}) is None
+        assert as_stream(Row(n=1)) is None
+        assert isinstance(as_stream(iter([1])), StreamingResult)
+
+    def test_sync_iteration_of_async_source(self):
+        outcome = asyncio.run(ExportNumbers.run(count=3))
+
+        assert list(as_stream(outcome.result)) == [0, 1, 2]
+
+    def test_chunks_pull_sync_source_off_loop(self):
+        stream = StreamingResult(iter(range(5)))
+
+        async def collect():
+            return [chunk async for chunk in stream.aiter_chunks(chunk_size=2)]
+
+        assert asyncio.run(collect()) == [[0, 1], [2, 3], [4]]
+
+    def test_close_closes_generator(self):
+        closed = []
+
+        def rows():
+            try:
+                yield 1
+                yield 2
+            finally:
+                closed.append(True)
+
+        stream = StreamingResult(rows())
+        next(iter(stream))
+        stream.close()
+
+        assert closed == [True]
+
+
+class TestHTTPStreaming:
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip("fastapi")
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        connector = HTTPConnector(app)
+        connector.register(ExportRows)
+        connector.register(ExportNumbers)
+        connector.register(
+            ExportRows, config=RouteConfig(path="/rows-array", stream_format="json")
+        )
+        return TestClient(app)
+
+    def test_ndjson(self, client):
+        response = client.post("/exportrows", json={"count": 3})
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert [json.loads(line) for line in lines] == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+    def test_async_generator(self, client):
+        response = client.post("/exportnumbers", json={"count": 130})
+
+        assert [int(line) for line in response.text.splitlines()] == list(range(130))
+
+    def test_chunked_json_array(self, client):
+        response = client.post("/rows-array", json={"count": 100})
+
+        assert response.json() == [{"n": i} for i in range(100)]
+
+    def test_empty_stream_as_array(self, client):
+        assert client.post("/rows-array", json={"count": 0}).json() == []
+
+    def test_validation_errors_are_not_streamed(self, client):
+        response = client.post("/exportrows", json={"count": "many"})
+
+        assert response.status_code == 422
+        assert response.json()["success"] is False
+
+    def test_non_streaming_connectors_get_arrays(self):
+        connector = HTTPConnector()
+        connector.register(ExportRows)
+
+        route = connector.routes["ExportRows"]
+        success, body = route.execute_encoded({"count": 2})
+
+        assert success
+        assert json.loads(body)["result"] == [{"n": 0}, {"n": 1}]
+
+
+class TestWebSocketStreaming:
+    def test_stream_messages_then_end(self):
+        registry = CommandRegistry()
+        registry.register(ExportRows)
+        connector = WebSocketConnector(registry)
+        messages = []
+
+        async def send(msg):
+            messages.append(json.loads(msg))
+
+        async def scenario():
+            connection = await connector.connect("conn-1", send)
+            await connector.handle_message(connection, WebSocketMessage(
+                type=WebSocketMessageType.EXECUTE,
+                id="exec-1",
+                command="ExportRows",
+                inputs={"count": 2},
+            ).to_json())
+
+        asyncio.run(scenario())
+
+        assert [m["type"] for m in messages] == ["stream", "stream", "stream_end"]
+        assert [m.get("result") for m in messages] == [{"n": 0}, {"n": 1}, None]
+        assert all(m["id"] == "exec-1" for m in messages)
+
+
+class TestCLIStreaming:
+    def test_json_lines(self):
+        cli = CommandCLI(ExportRows)
+
+        assert list(cli.stream(count=2)) == ['{"n":0}', '{"n":1}']
+
+    def test_plain_lines(self):
+        cli = CommandCLI(ExportRows, output_format=OutputFormat.PLAIN)
+
+        assert cli.execute(count=2) == "n: 0\nn: 1"
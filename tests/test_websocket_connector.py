@@ -891,3 +891,287 @@ class TestWebSocketReconnection:
         assert len(connection.subscriptions) == 0 or all(
             not sub.active for sub in connection.subscriptions.values()
         )
+
+
+class StatusInputs(BaseModel):
+    key: str = "a"
+
+
+_status_runs = []
+_status_value = {"value": 1}
+
+
+class StatusCommand(Command[StatusInputs, dict]):
+    """Return a status that rarely changes."""
+
+    def execute(self) -> dict:
+        _status_runs.append(self.inputs.key)
+        return {"key": self.inputs.key, **_status_value}
+
+
+class TestSharedSubscriptions:
+    """Subscriptions with the same command and inputs share one execution."""
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        _status_runs.clear()
+        _status_value["value"] = 1
+
+    @pytest.fixture
+    def connector(self):
+        registry = CommandRegistry()
+        registry.register(StatusCommand)
+        return WebSocketConnector(registry, WebSocketConfig(subscription_interval=0.01))
+
+    async def subscribe(self, connector, connection_id, inputs, inbox):
+        async def send(msg):
+            inbox.append(json.loads(msg))
+
+        connection = await connector.connect(connection_id, send)
+        await connector.handle_message(connection, WebSocketMessage(
+            type=WebSocketMessageType.SUBSCRIBE,
+            id=f"{connection_id}-sub",
+            command="StatusCommand",
+            inputs=inputs,
+        ).to_json())
+        return connection
+
+    @staticmethod
+    def streamed(inbox):
+        return [m["result"] for m in inbox if m["type"] == "stream"]
+
+    @pytest.mark.asyncio
+    async def test_one_execution_fans_out_and_pushes_only_changes(self, connector):
+        first, second = [], []
+        conn_1 = await self.subscribe(connector, "c1", {"key": "a"}, first)
+        conn_2 = await self.subscribe(connector, "c2", {"key": "a"}, second)
+        await asyncio.sleep(0.1)
+
+        assert len(connector._shared) == 1
+        assert self.streamed(first) == [{"key": "a", "value": 1}]
+        assert self.streamed(second) == [{"key": "a", "value": 1}]
+
+        _status_value["value"] = 2
+        await asyncio.sleep(0.05)
+        assert self.streamed(first)[-1] == {"key": "a", "value": 2}
+        assert len(self.streamed(second)) == 2
+
+        await connector.disconnect(conn_1)
+        await connector.disconnect(conn_2)
+        assert connector._shared == {}
+
+    @pytest.mark.asyncio
+    async def test_different_inputs_are_separate(self, connector):
+        inbox = []
+        connection = await self.subscribe(connector, "c1", {"key": "a"}, inbox)
+        await connector.handle_message(connection, WebSocketMessage(
+            type=WebSocketMessageType.SUBSCRIBE, id="s2", command="StatusCommand", inputs={"key": "b"},
+        ).to_json())
+        await asyncio.sleep(0.05)
+
+        assert len(connector._shared) == 2
+        assert {r["key"] for r in self.streamed(inbox)} == {"a", "b"}
+        await connector.disconnect(connection)
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_execution(self, connector):
+        inbox = []
+        connection = await self.subscribe(connector, "c1", {}, inbox)
+        await asyncio.sleep(0.03)
+        subscription_id = inbox[0]["subscription_id"]
+
+        await connector.handle_message(connection, WebSocketMessage(
+            type=WebSocketMessageType.UNSUBSCRIBE, id="u1", subscription_id=subscription_id,
+        ).to_json())
+        await asyncio.sleep(0.02)
+        runs = len(_status_runs)
+        await asyncio.sleep(0.05)
+
+        assert connector._shared == {}
+        assert len(_status_runs) == runs
+
+    @pytest.mark.asyncio
+    async def test_entity_changes_trigger_runs(self, connector):
+        from typing import Optional as Opt
+
+        from foobara_py.persistence import (
+            EntityBase,
+            EntityCallbackRegistry,
+            InMemoryRepository,
+            RepositoryRegistry,
+        )
+
+        class Status(EntityBase):
+            _primary_key_field = "id"
+            id: Opt[int] = None
+            value: int
+
+        repository = InMemoryRepository()
+        RepositoryRegistry.set_default(repository)
+        Status._repository = repository
+        connector.config.subscription_interval = 60
+        connector.watch_entities(StatusCommand, Status)
+        try:
+            inbox = []
+            connection = await self.subscribe(connector, "c1", {}, inbox)
+            await asyncio.sleep(0.05)
+            assert len(_status_runs) == 1
+
+            _status_value["value"] = 5
+            Status(value=5).save()
+            await asyncio.sleep(0.05)
+
+            assert len(_status_runs) == 2
+            assert self.streamed(inbox)[-1]["value"] == 5
+            await connector.disconnect(connection)
+        finally:
+            EntityCallbackRegistry.clear(Status)
+            RepositoryRegistry.clear()
+
+
+class TestBroadcastBackpressure:
+    """Pushed messages go through bounded per-connection queues."""
+
+    @staticmethod
+    def message(n):
+        return WebSocketMessage(type=WebSocketMessageType.STREAM, id=f"m{n}", result={"n": n})
+
+    @staticmethod
+    def stalled_client(inbox, gate):
+        async def send(msg):
+            await gate.wait()
+            inbox.append(json.loads(msg))
+
+        return send
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_others(self):
+        connector = WebSocketConnector()
+        fast, other, slow, gate = [], [], [], asyncio.Event()
+
+        async def send_fast(msg):
+            fast.append(msg)
+
+        async def send_other(msg):
+            other.append(msg)
+
+        await connector.connect("fast", send_fast)
+        await connector.connect("other", send_other)
+        await connector.connect("slow", self.stalled_client(slow, gate))
+
+        for n in range(3):
+            assert await connector.broadcast(self.message(n)) == 3
+
+        assert len(fast) == 3
+        assert fast[0] is other[0]  # encoded once, shared between recipients
+        assert slow == []
+        gate.set()
+        await asyncio.sleep(0.01)
+        assert [m["result"]["n"] for m in slow] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_drops_new_messages(self):
+        connector = WebSocketConnector(config=WebSocketConfig(send_queue_size=2))
+        inbox, gate = [], asyncio.Event()
+        connection = await connector.connect("slow", self.stalled_client(inbox, gate))
+
+        for n in range(5):
+            await connector.broadcast(self.message(n))
+        gate.set()
+        await asyncio.sleep(0.01)
+
+        # The first message was already being written when the queue filled
+        assert [m["result"]["n"] for m in inbox] == [0, 1, 2]
+        assert connection.dropped == 2
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy_keeps_latest_per_key(self):
+        config = WebSocketConfig(send_queue_size=2, slow_consumer_policy="coalesce")
+        connector = WebSocketConnector(config=config)
+        inbox, gate = [], asyncio.Event()
+        connection = await connector.connect("slow", self.stalled_client(inbox, gate))
+
+        connection.enqueue('{"n": 0}', key="sub-1")
+        await asyncio.sleep(0)
+        for n in range(1, 4):
+            connection.enqueue(json.dumps({"n": n}), key="sub-1")
+        connection.enqueue('{"n": 10}', key="sub-2")
+        connection.enqueue('{"n": 20}', key="sub-3")
+        gate.set()
+        await asyncio.sleep(0.01)
+
+        # sub-1's updates collapsed into one, then the oldest made room for sub-3
+        assert [m["n"] for m in inbox] == [0, 10, 20]
+        assert connection.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_evicts_client(self):
+        config = WebSocketConfig(send_queue_size=1, slow_consumer_policy="disconnect")
+        connector = WebSocketConnector(config=config)
+        closed, gate = [], asyncio.Event()
+
+        async def close():
+            closed.append(True)
+
+        connection = await connector.connect("slow", self.stalled_client([], gate), close)
+        connector.join_topic(connection, "news")
+        for n in range(3):
+            await connector.broadcast(self.message(n))
+        await asyncio.sleep(0.01)
+
+        assert closed == [True]
+        assert connector.get_connection("slow") is None
+        assert connector._topics == {}
+        assert connection.enqueue("{}") is False
+
+    @pytest.mark.asyncio
+    async def test_failed_send_evicts_client(self):
+        connector = WebSocketConnector()
+
+        async def send(msg):
+            raise ConnectionError("gone")
+
+        await connector.connect("gone", send)
+        await connector.broadcast(self.message(1))
+        await asyncio.sleep(0.01)
+
+        assert connector.get_all_connections() == []
+
+    @pytest.mark.asyncio
+    async def test_broadcast_to_topic_command_and_filter(self):
+        registry = CommandRegistry()
+        registry.register(EchoCommand)
+        connector = WebSocketConnector(registry, WebSocketConfig(subscription_interval=60))
+        inboxes = {name: [] for name in ("a", "b", "c")}
+        connections = {}
+        for name, inbox in inboxes.items():
+            async def send(msg, inbox=inbox):
+                inbox.append(json.loads(msg))
+
+            connections[name] = await connector.connect(name, send)
+
+        connector.join_topic(connections["a"], "news")
+        connector.join_topic(connections["b"], "news")
+        await connector.handle_message(connections["b"], WebSocketMessage(
+            type=WebSocketMessageType.SUBSCRIBE,
+            id="s1",
+            command="EchoCommand",
+            inputs={"message": "hi"},
+        ).to_json())
+        await asyncio.sleep(0.01)
+        for inbox in inboxes.values():
+            inbox.clear()
+
+        assert await connector.broadcast_to(self.message(1), topic="news") == 2
+        assert await connector.broadcast_to(self.message(2), command="EchoCommand") == 1
+        assert await connector.broadcast_to(
+            self.message(3), topic="news", where=lambda c: c.connection_id == "a"
+        ) == 1
+        assert await connector.broadcast_to(self.message(4), topic="sports") == 0
+
+        assert [m["id"] for m in inboxes["a"]] == ["m1", "m3"]
+        assert [m["id"] for m in inboxes["b"]] == ["m1", "m2"]
+        assert inboxes["c"] == []
+
+        for connection in connections.values():
+            await connector.disconnect(connection)